@@ -25,7 +25,7 @@ import { apiSlice } from '../api/apiSlice';
 
 export const agentsApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
-    listAgents: builder.query<AgentMetadata[], ListAgentsRequest>({
+    listAgents: builder.query<AgentMetadata[], Partial<ListAgentsRequest>>({
       query: (request) => ({
         url: '/grpc/listAgents',
         method: 'POST',
@@ -110,7 +110,7 @@ export const agentsApi = apiSlice.injectEndpoints({
       },
       providesTags: [{type: 'AgentTemplate', id: 'GLOBAL'}],
     }),
-    listAgentTemplates: builder.query<AgentTemplateMetadata[], ListAgentTemplatesRequest>({
+    listAgentTemplates: builder.query<AgentTemplateMetadata[], Partial<ListAgentTemplatesRequest>>({
       query: (request) => ({
         url: '/grpc/listAgentTemplates',
         method: 'POST',
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
+import * as agentStudio from '@/studio/proto/agent_studio';
 import { AgentStudioClient } from '@/studio/proto/agent_studio';
 import { credentials } from '@grpc/grpc-js';
 
@@ -95,6 +96,16 @@ async function handleRequest(request: NextRequest, method: string): Promise<Next
       });
     }
 
+    /*
+      Fill in defaults for the request fields the client left out. The generated
+      encoders expect every field to be present, e.g. the optional paging and
+      field mask fields of the List* requests.
+    */
+    const requestType = (agentStudio as any)[`${slug.charAt(0).toUpperCase()}${slug.slice(1)}Request`];
+    if (requestType?.fromPartial) {
+      body = requestType.fromPartial(body);
+    }
+
     const grpcMethod = (client as any)[slug].bind(client);
 
     const grpcResponse = await new Promise((resolve, reject) => {
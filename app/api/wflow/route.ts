@@ -157,6 +157,7 @@ export async function GET(request: NextRequest) {
       application_status: '',
       application_deep_link: '',
       model_deep_link: '',
+      status_age: 0,
     };
 
     return NextResponse.json({
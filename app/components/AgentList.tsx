@@ -21,7 +21,10 @@ import {
   ExperimentOutlined,
 } from '@ant-design/icons';
 import { AgentTemplateMetadata } from '@/studio/proto/agent_studio';
-import { useListGlobalToolTemplatesQuery } from '@/app/tools/toolTemplatesApi';
+import {
+  TOOL_TEMPLATE_SUMMARY_FIELDS,
+  useListGlobalToolTemplatesQuery,
+} from '@/app/tools/toolTemplatesApi';
 import { useRouter } from 'next/navigation';
 import { useImageAssetsData } from '@/app/lib/hooks/useAssetData';
 
@@ -49,7 +52,9 @@ const AgentList: React.FC<AgentTemplateListProps> = ({
   const [searchTerm, setSearchTerm] = useState<string>('');
   const [toolTemplateCache, setToolTemplateCache] = useState<Record<string, any>>({});
   const [loading, setLoading] = useState(false);
-  const { data: toolTemplates = [] } = useListGlobalToolTemplatesQuery({});
+  const { data: toolTemplates = [] } = useListGlobalToolTemplatesQuery({
+    fields: TOOL_TEMPLATE_SUMMARY_FIELDS,
+  });
   const router = useRouter();
 
   const { imageData: toolIconsData } = useImageAssetsData(
@@ -56,7 +56,10 @@ import {
   updatedEditorAgentViewAgent,
 } from '../../workflows/editorSlice';
 import { AgentTemplateMetadata, Model, ToolInstance } from '@/studio/proto/agent_studio';
-import { useListGlobalToolTemplatesQuery } from '@/app/tools/toolTemplatesApi';
+import {
+  TOOL_TEMPLATE_SUMMARY_FIELDS,
+  useListGlobalToolTemplatesQuery,
+} from '@/app/tools/toolTemplatesApi';
 import { useImageAssetsData } from '@/app/lib/hooks/useAssetData';
 import WorkflowAddToolModal from './WorkflowAddToolModal';
 import { useSelector } from 'react-redux';
@@ -460,7 +463,9 @@ const SelectAgentComponent: React.FC<SelectAgentComponentProps> = ({
   setIsLoading,
 }) => {
   const { data: defaultModel } = useGetDefaultModelQuery();
-  const { data: toolTemplates = [] } = useListGlobalToolTemplatesQuery({});
+  const { data: toolTemplates = [] } = useListGlobalToolTemplatesQuery({
+    fields: TOOL_TEMPLATE_SUMMARY_FIELDS,
+  });
   const { imageData: toolIconsData } = useImageAssetsData(
     toolTemplates.map((tool) => tool.tool_image_uri),
   );
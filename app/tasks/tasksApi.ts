@@ -19,7 +19,7 @@ import { apiSlice } from '../api/apiSlice';
 
 export const tasksApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
-    listTasks: builder.query<CrewAITaskMetadata[], ListTasksRequest>({
+    listTasks: builder.query<CrewAITaskMetadata[], Partial<ListTasksRequest>>({
       query: (request) => ({
         url: '/grpc/listTasks',
         method: 'POST',
@@ -74,7 +74,7 @@ export const tasksApi = apiSlice.injectEndpoints({
       }),
       invalidatesTags: ['Task'],
     }),
-    listTaskTemplates: builder.query<TaskTemplateMetadata[], ListTaskTemplatesRequest>({
+    listTaskTemplates: builder.query<TaskTemplateMetadata[], Partial<ListTaskTemplatesRequest>>({
       query: (request) => ({
         url: '/grpc/listTaskTemplates',
         method: 'POST',
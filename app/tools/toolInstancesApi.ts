@@ -17,7 +17,7 @@ import { apiSlice } from '../api/apiSlice';
 export const toolInstancesApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
     // List Tool Instances
-    listToolInstances: builder.query<ToolInstance[], ListToolInstancesRequest>({
+    listToolInstances: builder.query<ToolInstance[], Partial<ListToolInstancesRequest>>({
       query: (request) => ({
         url: '/grpc/listToolInstances',
         method: 'POST',
@@ -13,10 +13,14 @@ import {
 
 import { apiSlice } from '../api/apiSlice';
 
+// Field mask for listing tool templates without their Python code and
+// requirements. workflow_template_id is needed to filter global templates.
+export const TOOL_TEMPLATE_SUMMARY_FIELDS = ['id', 'name', 'tool_image_uri', 'workflow_template_id'];
+
 export const toolsApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
     // List Tool Templates
-    listGlobalToolTemplates: builder.query<ToolTemplate[], ListToolTemplatesRequest>({
+    listGlobalToolTemplates: builder.query<ToolTemplate[], Partial<ListToolTemplatesRequest>>({
       query: (request) => ({
         url: '/grpc/listToolTemplates',
         method: 'POST',
@@ -28,7 +32,7 @@ export const toolsApi = apiSlice.injectEndpoints({
       providesTags: [{type: 'ToolTemplate', id: 'LIST'}],
     }),
 
-    listToolTemplates: builder.query<ToolTemplate[], ListToolTemplatesRequest>({
+    listToolTemplates: builder.query<ToolTemplate[], Partial<ListToolTemplatesRequest>>({
       query: (request) => ({
         url: '/grpc/listToolTemplates',
         method: 'POST',
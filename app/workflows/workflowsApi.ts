@@ -30,7 +30,7 @@ import { apiSlice } from '../api/apiSlice';
 
 export const workflowsApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
-    listWorkflows: builder.query<Workflow[], ListWorkflowsRequest>({
+    listWorkflows: builder.query<Workflow[], Partial<ListWorkflowsRequest>>({
       query: (request) => ({
         url: '/grpc/listWorkflows',
         method: 'POST',
@@ -117,7 +117,7 @@ export const workflowsApi = apiSlice.injectEndpoints({
         { type: 'DeployedWorkflow', id: 'LIST' }
       ]
     }),
-    listWorkflowTemplates: builder.query<WorkflowTemplateMetadata[], ListWorkflowTemplatesRequest>({
+    listWorkflowTemplates: builder.query<WorkflowTemplateMetadata[], Partial<ListWorkflowTemplatesRequest>>({
       query: (request) => ({
         url: '/grpc/listWorkflowTemplates',
         method: 'POST',
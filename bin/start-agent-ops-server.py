@@ -4,33 +4,40 @@ import os
 from typing import Dict 
 import json
 from studio.consts import DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT
+from studio.ops_events import (
+    TraceEventLog,
+    is_terminal_event,
+    get_event_log_location,
+    get_max_events_per_trace,
+    get_trace_ttl,
+    get_max_total_event_bytes,
+)
 import http.server
 import http.client
+import threading
+import time
 import urllib.parse
-from kombu import Connection, Exchange
-from kombu.simple import SimpleQueue
 
 # ---------------------------
-# Kombu Initialization
+# Event Log Initialization
 # ---------------------------
 
-# Create a Kombu connection using the in-memory transport
-kombu_connection = Connection("memory://")
-# Ensure the connection is established
-kombu_connection.connect()
-# Global dictionary to store per-trace queues
-trace_queues = {}
+# Per-trace log of the events posted by running workflows.
+trace_events = TraceEventLog(
+    location=get_event_log_location(),
+    max_events_per_trace=get_max_events_per_trace(),
+    trace_ttl=get_trace_ttl(),
+    max_total_bytes=get_max_total_event_bytes(),
+)
+# How often inactive traces are looked for and evicted.
+TRACE_EXPIRY_INTERVAL_SECONDS = 60
 
-
-def get_or_create_queue(trace_id):
-    """
-    Retrieve or create a SimpleQueue for a given trace_id.
-    The queue is bound to the 'crew_events' exchange using the trace_id as routing key.
-    """
-    if trace_id not in trace_queues:
-        simple_queue = kombu_connection.SimpleQueue(name=trace_id)
-        trace_queues[trace_id] = simple_queue
-    return trace_queues[trace_id]
+# Longest time a long-poll GET /events?since=... request is held open.
+MAX_EVENTS_LONG_POLL_SECONDS = 30
+# Interval of keep-alive comments on idle event streams, and the longest
+# time an event stream is kept open before the client has to reconnect.
+EVENTS_STREAM_HEARTBEAT_SECONDS = 15
+MAX_EVENTS_STREAM_SECONDS = 300
 
 
 def start_phoenix_server():
@@ -71,6 +78,67 @@ def set_ops_server_discovery():
 # Define the target server to forward requests to
 TARGET_SERVER = "0.0.0.0"
 
+# Maximum number of requests forwarded to the phoenix server at the same
+# time. Event posts and reads are handled outside of this limit, so slow
+# trace uploads or GraphQL queries never hold up workflow events.
+MAX_CONCURRENT_FORWARDS = int(os.getenv("AGENT_STUDIO_OPS_PROXY_MAX_FORWARDS", 32))
+FORWARD_QUEUE_TIMEOUT_SECONDS = 30
+FORWARD_UPSTREAM_TIMEOUT_SECONDS = 300
+# Request bodies up to this size are buffered, so that the request can be
+# retried on a fresh connection if a pooled connection turns out to be
+# closed. Larger bodies are streamed to the phoenix server.
+MAX_BUFFERED_REQUEST_BODY = 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Hop-by-hop headers only apply to a single connection and are not forwarded.
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+
+
+class UpstreamConnectionPool:
+    """
+    Pool of keep-alive connections to the phoenix server, so forwarded
+    requests do not open a new TCP connection every time.
+    """
+
+    def __init__(self, host: str, port: int, max_idle: int):
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Returns a connection, and whether it was reused from the pool.
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self.new(), False
+
+    def new(self):
+        return http.client.HTTPConnection(self.host, self.port, timeout=FORWARD_UPSTREAM_TIMEOUT_SECONDS)
+
+    def put(self, conn) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+
+upstream_pool = UpstreamConnectionPool(TARGET_SERVER, int(DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT), MAX_CONCURRENT_FORWARDS)
+forward_slots = threading.BoundedSemaphore(MAX_CONCURRENT_FORWARDS)
+
 
 # ---------------------------
 # HTTP Server Handler
@@ -92,7 +160,11 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
     
 
     def do_GET(self):
-        if self.path.startswith("/events"):
+        if self.path.startswith("/events/stream"):
+            self.handle_events_stream()
+        elif self.path.startswith("/admin/events"):
+            self.handle_admin_events_get()
+        elif self.path.startswith("/events"):
             self.handle_events_get()
         else:
             self.forward_request()
@@ -110,25 +182,38 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(b"Invalid JSON")
             return
 
-        trace_id = data.get("trace_id")
-        event_content = data.get("event")
-        if not trace_id or not event_content:
+        # Events are either posted one at a time as {"trace_id", "event"},
+        # or in batches as {"events": [{"trace_id", "event"}, ...]}.
+        events = data.get("events") if isinstance(data, dict) and "events" in data else [data]
+        if not isinstance(events, list) or not all(
+            isinstance(e, dict) and e.get("trace_id") and e.get("event") for e in events
+        ):
             self.send_response(400)
             self.end_headers()
             self.wfile.write(b"Missing trace_id or event")
             return
 
-        # Get (or create) the queue associated with this trace_id
-        queue = get_or_create_queue(trace_id)
-        # Publish the message to the Kombu queue
-        queue.put(event_content)
+        # Append the whole batch in one transaction, grouped by trace in
+        # order of arrival.
+        batches: Dict[str, list] = {}
+        for e in events:
+            batches.setdefault(e["trace_id"], []).append(e["event"])
+        trace_events.append_many(list(batches.items()))
 
         self.send_response(200)
         self.end_headers()
-        self.wfile.write(b'{"status": "200"}')
+        self.wfile.write(json.dumps({"status": "200", "accepted": len(events)}).encode("utf-8"))
 
 
     def handle_events_get(self):
+        """
+        Without a cursor, returns the events posted since the last such
+        read of the trace. With "offset=<offset>" (or "since=<offset>"),
+        returns {"events": [...], "next_since": <offset>} from that offset
+        on, holding the request open for up to "wait" seconds until there
+        are events at or after the offset. Cursor reads are idempotent and
+        can be made by any number of readers.
+        """
         # Parse query parameters to extract trace_id
         parsed_url = urllib.parse.urlparse(self.path)
         params = urllib.parse.parse_qs(parsed_url.query)
@@ -140,55 +225,165 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(b"Missing trace_id")
             return
 
-        queue = get_or_create_queue(trace_id)
-        messages = []
-        # Retrieve and flush all messages from the queue
-        while True:
+        cursor = params.get("offset") or params.get("since")
+        if cursor:
             try:
-                message = queue.get_nowait()  # non-blocking
-                messages.append(message.payload)
-                message.ack()  # Acknowledge to remove the message
-            except Exception:
-                # No more messages in the queue
-                break
+                since = max(int(cursor[0]), 0)
+                wait = min(max(float(params.get("wait", [0])[0]), 0), MAX_EVENTS_LONG_POLL_SECONDS)
+            except ValueError:
+                self.send_response(400)
+                self.end_headers()
+                self.wfile.write(b"Invalid offset or wait")
+                return
+            events, next_since = trace_events.read(trace_id, since, timeout=wait)
+            body = {"events": events, "next_since": next_since}
+        else:
+            body = trace_events.drain(trace_id)
 
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
-        self.wfile.write(json.dumps(messages).encode("utf-8"))
-
-
-
-    def forward_request(self):
+        self.wfile.write(json.dumps(body).encode("utf-8"))
 
-        # The target URL is where the phoenix server resides
-        target_url = f"http://{TARGET_SERVER}:{DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT}{self.path}"
+    def handle_admin_events_get(self):
+        """
+        Report the number and size of the events held per trace.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps(trace_events.stats()).encode("utf-8"))
+
+    def handle_events_stream(self):
+        """
+        Server-Sent Events stream of a trace's events, starting after the
+        "since" offset (or the Last-Event-ID of a reconnecting client).
+        The id of every event is the offset to resume from. The stream ends
+        after the workflow's final event, or after MAX_EVENTS_STREAM_SECONDS,
+        in which case the client reconnects with its Last-Event-ID.
+        """
+        parsed_url = urllib.parse.urlparse(self.path)
+        params = urllib.parse.parse_qs(parsed_url.query)
+        trace_id = params.get("trace_id", [None])[0]
+        try:
+            since = max(int(self.headers.get("Last-Event-ID") or params.get("since", [0])[0]), 0)
+        except ValueError:
+            since = -1
+        if not trace_id or since < 0:
+            self.send_response(400)
+            self.end_headers()
+            self.wfile.write(b"Missing trace_id or invalid since")
+            return
 
-        # Forward the request to the target server
-        url = urllib.parse.urlparse(target_url)
-        conn = http.client.HTTPConnection(url.hostname, url.port)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
 
-        # Forward the headers
-        headers = {key: value for key, value in self.headers.items()}
+        deadline = time.monotonic() + MAX_EVENTS_STREAM_SECONDS
+        try:
+            while time.monotonic() < deadline:
+                events, next_since = trace_events.read(trace_id, since, timeout=EVENTS_STREAM_HEARTBEAT_SECONDS)
+                if not events:
+                    self.wfile.write(b": keep-alive\n\n")
+                # Dropped events are skipped, so count from the returned offset.
+                first_offset = next_since - len(events)
+                for i, event in enumerate(events):
+                    self.wfile.write(f"id: {first_offset + i + 1}\ndata: {json.dumps(event)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                since = next_since
+                if events and is_terminal_event(events[-1]):
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away.
+            pass
 
-        # Read the body (for POST requests)
+    def forward_request(self):
+        if not forward_slots.acquire(timeout=FORWARD_QUEUE_TIMEOUT_SECONDS):
+            self.send_response(503)
+            self.end_headers()
+            self.wfile.write(b"Too many concurrent requests to the ops platform")
+            return
+        try:
+            self._forward_request()
+        except (OSError, http.client.HTTPException) as e:
+            print(f"Failed to forward {self.command} {self.path}: {e}")
+            self.send_response(502)
+            self.end_headers()
+        finally:
+            forward_slots.release()
+
+    def _send_upstream_request(self, conn, headers, body, content_length):
+        conn.putrequest(self.command, self.path, skip_host=True, skip_accept_encoding=True)
+        for key, value in headers:
+            conn.putheader(key, value)
+        conn.endheaders()
+        if body:
+            conn.send(body)
+        elif content_length:
+            # Stream large request bodies (like trace batches) to the target.
+            remaining = content_length
+            while remaining > 0:
+                chunk = self.rfile.read(min(STREAM_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                conn.send(chunk)
+                remaining -= len(chunk)
+        return conn.getresponse()
+
+    def _forward_request(self):
+        # Forward the end-to-end headers
+        headers = [(key, value) for key, value in self.headers.items() if key.lower() not in HOP_BY_HOP_HEADERS]
+        content_length = int(self.headers.get("Content-Length") or 0)
         body = None
-        if self.command == "POST":
-            content_length = self.headers.get("Content-Length")
-            if content_length:
-                body = self.rfile.read(int(content_length))
-
-        # Send the request to the target server
-        conn.request(self.command, url.path + ("?" + url.query if url.query else ""), body, headers)
-        response = conn.getresponse()
+        if content_length and content_length <= MAX_BUFFERED_REQUEST_BODY:
+            body = self.rfile.read(content_length)
 
-        # Send the response back to the client
+        conn, reused = upstream_pool.get()
+        try:
+            response = self._send_upstream_request(conn, headers, body, content_length)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            # A pooled connection may have been closed by the target in the
+            # meantime. Retry once on a fresh connection if we still can.
+            if not reused or (content_length and body is None):
+                raise
+            conn = upstream_pool.new()
+            response = self._send_upstream_request(conn, headers, body, content_length)
+
+        # Send the response back to the client, streaming the body through.
         self.send_response(response.status)
         for key, value in response.getheaders():
-            self.send_header(key, value)
+            if key.lower() not in HOP_BY_HOP_HEADERS:
+                self.send_header(key, value)
         self.end_headers()
-        self.wfile.write(response.read())
-        
+        try:
+            while True:
+                chunk = response.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; the upstream connection is in an
+            # unknown state, so do not reuse it.
+            conn.close()
+            return
+        if response.will_close:
+            conn.close()
+        else:
+            upstream_pool.put(conn)
+
+
+def run_trace_expiry():
+    """
+    Periodically evict the event logs of inactive traces.
+    """
+    while True:
+        time.sleep(TRACE_EXPIRY_INTERVAL_SECONDS)
+        expired = trace_events.expire_traces()
+        if expired:
+            print(f"Evicted the events of {expired} inactive traces")
+
 
 def run_proxy_server():
     """
@@ -198,10 +393,14 @@ def run_proxy_server():
     """
     server_address = ("127.0.0.1", int(os.getenv("CDSW_APP_PORT")))
     print(f"Starting proxy server on {server_address[0]}:{server_address[1]}, forwarding to {TARGET_SERVER}")
-    httpd = http.server.HTTPServer(server_address, ProxyHandler)
+    # Event streams and long-polls hold their request open, so every
+    # request is handled on its own thread.
+    httpd = http.server.ThreadingHTTPServer(server_address, ProxyHandler)
+    httpd.daemon_threads = True
     httpd.serve_forever()
 
 
 set_ops_server_discovery()
 start_phoenix_server()
+threading.Thread(target=run_trace_expiry, name="trace_expiry", daemon=True).start()
 run_proxy_server()
\ No newline at end of file
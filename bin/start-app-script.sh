@@ -28,6 +28,9 @@ export AGENT_STUDIO_OPS_PROVIDER=phoenix
 # Number of agent studio workflow runners to spin up for workflow testing purposes.
 export AGENT_STUDIO_NUM_WORKFLOW_RUNNERS=${AGENT_STUDIO_NUM_WORKFLOW_RUNNERS:-5}
 
+# Number of workflows each workflow runner can execute concurrently.
+export AGENT_STUDIO_WORKFLOW_RUNNER_SLOTS=${AGENT_STUDIO_WORKFLOW_RUNNER_SLOTS:-1}
+
 # Array to hold runner process IDs.
 declare -a RUNNER_PIDS=()
 
@@ -65,7 +68,7 @@ for (( i=0; i<AGENT_STUDIO_NUM_WORKFLOW_RUNNERS; i++ )); do
   
   # Launch the runner using the virtual environment's python
   studio/workflow_engine/.venv/bin/python -m uvicorn \
-    studio.workflow_engine.src.engine.entry.fastapi:app \
+    studio.workflow_engine.src.engine.entry.runner:app \
     --port "$PORT_NUM" &
   
   # Save the process PID.
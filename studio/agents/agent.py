@@ -1,7 +1,7 @@
 import os
 import shutil
 from uuid import uuid4
-from typing import List, Optional
+from typing import Dict, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from studio import consts
 from studio.db.dao import AgentStudioDao
@@ -10,8 +10,8 @@ from studio.api import *
 from studio.tools.tool_instance import get_tool_instance
 from studio.tools.tool_template import get_tool_template
 from cmlapi import CMLServiceApi
-from studio.workflow.utils import invalidate_workflow
-from studio.proto.utils import is_field_set
+from studio.workflow.utils import invalidate_collated_input_on_commit, invalidate_workflow
+from studio.proto.utils import apply_field_mask, is_field_set, paginate_query
 from studio.tools.tool_instance import create_tool_instance, remove_tool_instance
 
 
@@ -25,19 +25,26 @@ def list_agents(
         if not request.workflow_id:
             raise ValueError("Every ListAgents request must specify a workflow ID.")
             
-        with dao.get_session() as session:
+        with dao.get_read_session() as session:
             
-            agents: List[db_model.Agent] = session.query(db_model.Agent).filter_by(workflow_id=request.workflow_id).all()
-            if not agents:
-                return ListAgentsResponse(agents=[])
+            query = session.query(db_model.Agent).filter_by(workflow_id=request.workflow_id)
+            if request.ids:
+                query = query.filter(db_model.Agent.id.in_(request.ids))
+            agents, next_page_token = paginate_query(query, request, db_model.Agent.id)
+
+            # Check which llm_provider_model_ids exist in models table, all at once
+            existing_model_ids = set()
+            if agents:
+                existing_model_ids = {
+                    model_id
+                    for (model_id,) in session.query(db_model.Model.model_id)
+                    .filter(db_model.Model.model_id.in_({agent.llm_provider_model_id for agent in agents}))
+                    .all()
+                }
 
             agent_list = []
             for agent in agents:
-                # Check if llm_provider_model_id exists in models table
-                is_valid = (
-                    session.query(db_model.Model).filter_by(model_id=agent.llm_provider_model_id).one_or_none()
-                    is not None
-                )
+                is_valid = agent.llm_provider_model_id in existing_model_ids
 
                 agent_image_uri = ""
                 if agent.agent_image_path:
@@ -65,7 +72,8 @@ def list_agents(
                     )
                 )
 
-            return ListAgentsResponse(agents=agent_list)
+            apply_field_mask(agent_list, AgentMetadata, request.fields)
+            return ListAgentsResponse(agents=agent_list, next_page_token=next_page_token)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to list agents: {str(e)}")
 
@@ -78,7 +86,7 @@ def get_agent(request: GetAgentRequest, cml: CMLServiceApi = None, dao: AgentStu
         if not request.agent_id:
             raise ValueError("Agent ID is required.")
 
-        with dao.get_session() as session:
+        with dao.get_read_session() as session:
             agent = session.query(db_model.Agent).filter_by(id=request.agent_id).one_or_none()
             if not agent:
                 raise ValueError(f"Agent with ID '{request.agent_id}' not found.")
@@ -136,23 +144,35 @@ def get_agent(request: GetAgentRequest, cml: CMLServiceApi = None, dao: AgentStu
 
 
 def _add_agent_from_template(
-    request: AddAgentRequest, cml: CMLServiceApi = None, db_session: DbSession = None
+    request: AddAgentRequest,
+    cml: CMLServiceApi = None,
+    db_session: DbSession = None,
+    agent_template: Optional[db_model.AgentTemplate] = None,
+    tool_templates: Optional[Dict[str, db_model.ToolTemplate]] = None,
 ) -> AddAgentResponse:
     """
-    Add a new agent based on the request parameters.
+    Add a new agent based on the request parameters. Callers adding many
+    agents at once can pass in the agent template and its tool templates
+    (keyed by ID), fetched up front, instead of having them queried here.
     """
     new_agent_id = str(uuid4())
-    agent_template: db_model.AgentTemplate = (
-        db_session.query(db_model.AgentTemplate).filter_by(id=request.template_id).one_or_none()
-    )
+    if agent_template is None:
+        agent_template = db_session.query(db_model.AgentTemplate).filter_by(id=request.template_id).one_or_none()
     if not agent_template:
         raise ValueError(f"Agent template with ID '{request.template_id}' not found.")
 
+    tool_template_ids = list(agent_template.tool_template_ids or [])
+    if tool_templates is None:
+        tool_templates = {
+            tool_template.id: tool_template
+            for tool_template in db_session.query(db_model.ToolTemplate)
+            .filter(db_model.ToolTemplate.id.in_(tool_template_ids))
+            .all()
+        }
+
     tool_instance_ids: list[str] = []
-    for tool_template_id in list(agent_template.tool_template_ids or []):
-        tool_template: db_model.ToolTemplate = (
-            db_session.query(db_model.ToolTemplate).filter_by(id=tool_template_id).one()
-        )
+    for tool_template_id in tool_template_ids:
+        tool_template = tool_templates.get(tool_template_id)
         if not tool_template:
             raise ValueError(f"Tool template with ID '{tool_template_id}' not found.")
         response: CreateToolInstanceResponse = create_tool_instance(
@@ -406,6 +426,8 @@ def _update_agent_impl(request: UpdateAgentRequest, cml: CMLServiceApi, session:
                 agent.crew_ai_max_iter = metadata.max_iter
 
         invalidate_workflow(session, db_model.Workflow.crew_ai_agents.contains([agent.id]))
+        # Also covers the workflow's manager agent, which is not one of its crew agents.
+        invalidate_collated_input_on_commit(session, agent.workflow_id)
 
         return UpdateAgentResponse()
     except SQLAlchemyError as e:
@@ -450,6 +472,7 @@ def remove_agent(
                 raise ValueError(f"Agent with ID '{request.agent_id}' not found.")
 
             invalidate_workflow(session, db_model.Workflow.crew_ai_agents.contains([agent.id]))
+            invalidate_collated_input_on_commit(session, agent.workflow_id)
 
             # Try to remove tool instances but continue even if they fail
             for tool_instance_id in agent.tool_ids:
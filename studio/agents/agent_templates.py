@@ -1,4 +1,3 @@
-from typing import List
 from uuid import uuid4
 from google.protobuf.json_format import MessageToDict
 import os
@@ -9,7 +8,7 @@ from cmlapi import CMLServiceApi
 from studio.db.dao import AgentStudioDao
 from studio.api import *
 from studio.db import model as db_model
-from studio.proto.utils import is_field_set
+from studio.proto.utils import apply_field_mask, is_field_set, paginate_query
 from studio import consts
 
 
@@ -17,17 +16,18 @@ def list_agent_templates(
     request: ListAgentTemplatesRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> ListAgentTemplatesResponse:
     with dao.get_session() as session:
-        agent_templates: List[db_model.AgentTemplate] = session.query(db_model.AgentTemplate).all()
+        query = session.query(db_model.AgentTemplate)
 
         # Filter by specific agent template
         if is_field_set(request, "workflow_template_id"):
-            agent_templates = list(
-                filter(lambda x: x.workflow_template_id == request.workflow_template_id, agent_templates)
-            )
-
-        return ListAgentTemplatesResponse(
-            agent_templates=[agent_template.to_protobuf() for agent_template in agent_templates]
-        )
+            query = query.filter_by(workflow_template_id=request.workflow_template_id)
+        if request.ids:
+            query = query.filter(db_model.AgentTemplate.id.in_(request.ids))
+        agent_templates, next_page_token = paginate_query(query, request, db_model.AgentTemplate.id)
+
+        agent_template_list = [agent_template.to_protobuf() for agent_template in agent_templates]
+        apply_field_mask(agent_template_list, AgentTemplateMetadata, request.fields)
+        return ListAgentTemplatesResponse(agent_templates=agent_template_list, next_page_token=next_page_token)
 
 
 def get_agent_template(
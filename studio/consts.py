@@ -1,12 +1,24 @@
 from enum import Enum
+from types import MappingProxyType
 
 DEFAULT_LITELLM_CONFIG_STORAGE_LOCATION = "/tmp/litellm_config.yaml"
 DEFAULT_LITELLM_SERVER_PORT = "7198"
 DEFAULT_SQLITE_DB_LOCATION = ".app/state.db"
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 15000
+DEFAULT_SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_SQLITE_POOL_SIZE = 10
+DEFAULT_SQLITE_MAX_OVERFLOW = 20
 DEFAULT_AS_GRPC_PORT = "50051"
 DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT = "50051"
 DEFAULT_AS_OPS_PROXY_PORT = "8123"
 DEFAULT_AS_WORKFLOW_RUNNER_STARTING_PORT = "51000"
+DEFAULT_AS_WORKFLOW_DISPATCHER_PORT = "50999"
+DEFAULT_WORKFLOW_RUNNER_QUEUE_DEPTH = 20
+DEFAULT_WORKFLOW_RUNNER_QUEUE_TIMEOUT_SECONDS = 600
+DEFAULT_WORKFLOW_RUNNER_LEASE_TTL_SECONDS = 3600
+DEFAULT_DEPLOYED_WORKFLOW_STATUS_TTL_SECONDS = 15
+DEFAULT_DEPLOYED_WORKFLOW_STATUS_MAX_AGE_SECONDS = 300
+DEFAULT_DEPLOYED_WORKFLOW_STATUS_WORKERS = 8
 DEFAULT_PROJECT_DEFAULTS_LOCATION = "data/project_defaults.json"
 
 
@@ -34,12 +46,15 @@ WORKFLOWS_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/workflows"
 WORKFLOW_MODEL_FILE_PATH = f"./studio/workflow/deploy_workflow_model_v2.py"
 
 
-DEFAULT_GENERATION_CONFIG = {
-    "do_sample": True,
-    "temperature": 0.7,
-    "max_new_tokens": 4096,
-    "top_p": 1,
-    "top_k": 50,
-    "num_beams": 1,
-    "max_length": None,  # Explicity set max_length to Null to compensate for max_new_tokens
-}
+# Read-only, copy it to build the generation config of a request.
+DEFAULT_GENERATION_CONFIG = MappingProxyType(
+    {
+        "do_sample": True,
+        "temperature": 0.7,
+        "max_new_tokens": 4096,
+        "top_p": 1,
+        "top_k": 50,
+        "num_beams": 1,
+        "max_length": None,  # Explicity set max_length to Null to compensate for max_new_tokens
+    }
+)
@@ -6,6 +6,7 @@ import cmlapi
 import requests
 from typing import Tuple, Annotated, Any, Union
 from pydantic import Field
+from engine.application_directory import get_application_directory, invalidate_application_directory
 from studio import consts
 from studio.db.dao import AgentStudioDao
 from studio.db import model as db_model
@@ -248,23 +249,14 @@ def get_application_by_name(cml: cmlapi.CMLServiceApi, name: str, only_running:
     Raises:
         ValueError: If no running application is found
     """
-    applications: list[cmlapi.Application] = cml.list_applications(
-        project_id=os.getenv("CDSW_PROJECT_ID"),
-        page_size=5000,
-    ).applications
-
     # Filter for applications that:
     # 1. Match the base name
     # 2. Have "running" in their status
-    if only_running:
-        running_apps = [
-            app
-            for app in applications
-            if ((app.name == name) or (name + " v") in app.name)
-            and "running" in app.status.lower()  # Changed to check if "running" is in status
-        ]
-    else:
-        running_apps = [app for app in applications if ((app.name == name) or (name + " v") in app.name)]
+    running_apps = get_application_directory().find(
+        cml,
+        name,
+        accept=(lambda app: "running" in app.status.lower()) if only_running else None,
+    )
 
     if not running_apps:
         raise ValueError(f"No running applications found matching '{name}'")
@@ -348,6 +340,7 @@ def get_deployed_workflows_with_applications(cml: cmlapi.CMLServiceApi, dao: Age
         result = []
         with dao.get_session() as session:
             deployed_workflows = session.query(db_model.DeployedWorkflowInstance).all()
+            directory = get_application_directory()
             
             for workflow in deployed_workflows:
                 try:
@@ -359,8 +352,8 @@ def get_deployed_workflows_with_applications(cml: cmlapi.CMLServiceApi, dao: Age
                     
                     # Find matching application
                     app_name = f"Workflow: {workflow_data['name']}"
-                    apps = cml.list_applications(os.getenv("CDSW_PROJECT_ID"), page_size=5000).applications
-                    app = next((a for a in apps if a.name == app_name), None)
+                    apps = directory.find(cml, app_name, versions=False)
+                    app = next(iter(apps), None)
                     
                     if app:
                         result.append((workflow_data, app))
@@ -380,6 +373,7 @@ def restart_workflow_application(cml: cmlapi.CMLServiceApi, application: cmlapi.
     """
     try:
         cml.restart_application(os.getenv("CDSW_PROJECT_ID"), application.id)
+        invalidate_application_directory()
         return True
     except Exception as e:
         print(f"Error restarting application {application.id}: {str(e)}")
@@ -1,10 +1,17 @@
 
 from studio.db.model import Base
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
-from studio.consts import DEFAULT_SQLITE_DB_LOCATION
+from studio.consts import (
+    DEFAULT_SQLITE_DB_LOCATION,
+    DEFAULT_SQLITE_BUSY_TIMEOUT_MS,
+    DEFAULT_SQLITE_MMAP_SIZE,
+    DEFAULT_SQLITE_POOL_SIZE,
+    DEFAULT_SQLITE_MAX_OVERFLOW,
+)
 import os
 
 
@@ -17,6 +24,49 @@ def get_sqlite_db_location():
     return DEFAULT_SQLITE_DB_LOCATION
 
 
+def get_sqlite_busy_timeout_ms() -> int:
+    return int(os.getenv("AGENT_STUDIO_SQLITE_BUSY_TIMEOUT_MS", DEFAULT_SQLITE_BUSY_TIMEOUT_MS))
+
+
+def get_sqlite_mmap_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_SQLITE_MMAP_SIZE", DEFAULT_SQLITE_MMAP_SIZE))
+
+
+def get_sqlite_pool_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_SQLITE_POOL_SIZE", DEFAULT_SQLITE_POOL_SIZE))
+
+
+def get_sqlite_max_overflow() -> int:
+    return int(os.getenv("AGENT_STUDIO_SQLITE_MAX_OVERFLOW", DEFAULT_SQLITE_MAX_OVERFLOW))
+
+
+def _is_sqlite_file_url(engine_url: str) -> bool:
+    url = make_url(engine_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def _configure_sqlite_connections(engine: Engine, read_only: bool = False) -> None:
+    """
+    Apply the studio's SQLite tuning to every new connection of an engine.
+    WAL lets readers and the writer work concurrently, and the busy timeout
+    makes writers wait for each other instead of failing with "database is
+    locked". Connections of a read-only engine refuse to write.
+    """
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if not read_only:
+            # WAL mode is persisted in the database file.
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={get_sqlite_busy_timeout_ms()}")
+        cursor.execute(f"PRAGMA mmap_size={get_sqlite_mmap_size()}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
 def delete_database() -> None:
     """
     Delete the currently existing database. Note that this only deletes
@@ -44,13 +94,34 @@ class AgentStudioDao():
         if engine_url is None:
             engine_url = f"sqlite+pysqlite:///{get_sqlite_db_location()}"
 
+        is_sqlite_file = _is_sqlite_file_url(engine_url)
+        if is_sqlite_file:
+            # The gRPC server and the global thread pool share the database,
+            # so size the connection pool for both.
+            engine_args = {
+                "pool_size": get_sqlite_pool_size(),
+                "max_overflow": get_sqlite_max_overflow(),
+                **engine_args,
+            }
+
         self.engine = create_engine(
             engine_url,
             echo=echo,
             **engine_args,
         )
+        if is_sqlite_file:
+            _configure_sqlite_connections(self.engine)
+            self.read_engine = create_engine(engine_url, echo=echo, **engine_args)
+            _configure_sqlite_connections(self.read_engine, read_only=True)
+        else:
+            # In-memory databases only exist within their own connections,
+            # so reads have to go through the same engine.
+            self.read_engine = self.engine
+
         self.Session = sessionmaker(
             bind=self.engine, autoflush=True, autocommit=False)
+        self.ReadSession = sessionmaker(
+            bind=self.read_engine, autoflush=False, autocommit=False)
 
         # Create all of our required tables if they do not yet exist.
         Base.metadata.create_all(self.engine)
@@ -72,3 +143,18 @@ class AgentStudioDao():
             raise e
         finally:
             session.close()
+
+    @contextmanager
+    def get_read_session(self):
+        """
+        Provides a context manager for a read-only session, for RPCs that only
+        list or get rows. Read sessions use their own connection pool, so with
+        WAL they never wait for writers. They are never committed, and any
+        attempt to write through them fails.
+        """
+        session = self.ReadSession()
+        try:
+            yield session
+        finally:
+            session.rollback()
+            session.close()
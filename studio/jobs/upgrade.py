@@ -8,6 +8,7 @@ from studio.consts import (
     AGENT_STUDIO_UPGRADE_JOB_NAME,
 )
 from studio.cross_cutting.utils import get_application_by_name, get_job_by_name
+from engine.application_directory import invalidate_application_directory
 from studio.api import *
 from studio.cross_cutting.upgrades import (
     is_on_a_semantic_version,
@@ -55,6 +56,7 @@ def upgrade_studio(cml: CMLServiceApi = None) -> UpgradeStudioResponse:
             print(f"Application '{application.name}' is already stopped!")
         else:
             cml.stop_application(project_id=os.getenv("CDSW_PROJECT_ID"), application_id=application.id)
+            invalidate_application_directory()
             print(f"Application '{application.name}' stopped.")
 
     # Always stash before doing any git operation, so we can safely switch versions/branches
@@ -131,11 +133,14 @@ def upgrade_studio(cml: CMLServiceApi = None) -> UpgradeStudioResponse:
     for application in [studio_application, ops_application]:
         print(f"Starting the '{application.name}' application...")
         cml.restart_application(os.getenv("CDSW_PROJECT_ID"), application.id)
+        invalidate_application_directory()
         print(f"Application '{application.name}' restart request sent.")
 
     print("Waiting for applications to spin up...")
     while True:
         time.sleep(5)
+        # Poll the actual status of the applications instead of a cached listing.
+        invalidate_application_directory()
         studio_application: cmlapi.Application = get_application_by_name(
             cml, AGENT_STUDIO_SERVICE_APPLICATION_NAME, only_running=False
         )
@@ -8,6 +8,7 @@ import logging
 from studio.db.dao import AgentStudioDao
 from studio.db import model as db_model
 from studio.api import *
+from studio.workflow.utils import invalidate_collated_input
 
 # Import engine code manually. Eventually when this code becomes
 # a separate git repo, or a custom runtime image, this path call
@@ -33,7 +34,7 @@ def list_models(
     """
     List all models. Future extensions may include filtering based on request attributes.
     """
-    with dao.get_session() as session:
+    with dao.get_read_session() as session:
         models: List[db_model.Model] = session.query(db_model.Model).all()
         return ListModelsResponse(model_details=[model.to_protobuf(Model) for model in models])
 
@@ -42,7 +43,7 @@ def get_model(request: GetModelRequest, cml: CMLServiceApi = None, dao: AgentStu
     """
     Get details of a specific model by its ID.
     """
-    with dao.get_session() as session:
+    with dao.get_read_session() as session:
         model = session.query(db_model.Model).filter_by(model_id=request.model_id).one_or_none()
         if not model:
             raise ValueError(f"Model with ID '{request.model_id}' not found.")
@@ -133,6 +134,8 @@ def remove_model(
             logger.warning(f"Failed to remove API key for model {request.model_id} during deletion: {str(e)}")
             
         session.commit()
+    # Language models may be used by any workflow.
+    invalidate_collated_input()
 
     return RemoveModelResponse()
 
@@ -159,6 +162,7 @@ def update_model(
             update_model_api_key_in_env(m_.model_id, request.api_key, cml)
         model_id = m_.model_id
         session.commit()
+    invalidate_collated_input()
 
     return UpdateModelResponse(model_id=model_id)
 
@@ -217,6 +221,7 @@ def set_studio_default_model(
             raise ValueError(f"Model with ID '{request.model_id}' not found.")
         m_.is_studio_default = True
         session.commit()
+    invalidate_collated_input()
     return SetStudioDefaultModelResponse()
 
 
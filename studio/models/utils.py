@@ -1,6 +1,6 @@
 # No top level studio.db imports allowed to support wokrflow model deployment
 
-from typing import Tuple, Annotated, Union
+from typing import Dict, List, Optional, Tuple, Annotated, Union
 from pydantic import Field
 from cmlapi import CMLServiceApi
 import os
@@ -54,28 +54,38 @@ def _get_env_key(model_id: str) -> str:
     encoded_id = _encode_value(model_id)
     return f"MODEL_API_KEY_{encoded_id}"
 
+def _get_project_environment(cml: CMLServiceApi) -> dict:
+    """Get the environment variables of the studio's project"""
+    project_id = os.getenv("CDSW_PROJECT_ID")
+    if not project_id:
+        raise ValueError("CDSW_PROJECT_ID environment variable not found")
+
+    # Get project details
+    project = cml.get_project(project_id)
+    try:
+        return json.loads(project.environment) if project.environment else {}
+    except (json.JSONDecodeError, TypeError):
+        return {}
+
 def get_model_api_key_from_env(model_id: str, cml: CMLServiceApi) -> str:
     """Get model API key from project environment variables"""
     try:
-        project_id = os.getenv("CDSW_PROJECT_ID")
-        if not project_id:
-            raise ValueError("CDSW_PROJECT_ID environment variable not found")
-            
-        # Get project details
-        project = cml.get_project(project_id)
-        try:
-            environment = json.loads(project.environment) if project.environment else {}
-        except (json.JSONDecodeError, TypeError):
-            environment = {}
-            
+        environment = _get_project_environment(cml)
         # Use encoded model ID for environment variable
-        env_key = _get_env_key(model_id)
-        encoded_key = environment.get(env_key)
+        encoded_key = environment.get(_get_env_key(model_id))
         return _decode_value(encoded_key)
-        
+
     except Exception as e:
         raise ValueError(f"Failed to get API key for model {model_id}: {str(e)}")
 
+def get_model_api_keys_from_env(model_ids: List[str], cml: CMLServiceApi) -> Dict[str, Optional[str]]:
+    """Get the API keys of several models with a single read of the project environment"""
+    try:
+        environment = _get_project_environment(cml)
+    except Exception as e:
+        raise ValueError(f"Failed to get API keys for models {', '.join(model_ids)}: {str(e)}")
+    return {model_id: _decode_value(environment.get(_get_env_key(model_id))) for model_id in model_ids}
+
 def update_model_api_key_in_env(model_id: str, api_key: str, cml: CMLServiceApi) -> None:
     """Update/Store model API key in project environment variables"""
     try:
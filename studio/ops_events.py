@@ -0,0 +1,324 @@
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Event types after which a workflow run produces no more events.
+TERMINAL_EVENT_TYPES = ("crew_kickoff_completed", "crew_kickoff_failed")
+
+DEFAULT_EVENT_LOG_LOCATION = ".app/ops_events.db"
+DEFAULT_MAX_EVENTS_PER_TRACE = 5000
+DEFAULT_TRACE_TTL_SECONDS = 3600
+DEFAULT_MAX_TOTAL_EVENT_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_EVENTS_PER_READ = 1000
+
+
+def get_event_log_location() -> str:
+    return os.getenv("AGENT_STUDIO_OPS_EVENT_LOG_LOCATION", DEFAULT_EVENT_LOG_LOCATION)
+
+
+def get_max_events_per_trace() -> int:
+    return int(os.getenv("AGENT_STUDIO_OPS_MAX_EVENTS_PER_TRACE", DEFAULT_MAX_EVENTS_PER_TRACE))
+
+
+def get_trace_ttl() -> float:
+    return float(os.getenv("AGENT_STUDIO_OPS_TRACE_TTL", DEFAULT_TRACE_TTL_SECONDS))
+
+
+def get_max_total_event_bytes() -> int:
+    return int(os.getenv("AGENT_STUDIO_OPS_MAX_EVENT_BYTES", DEFAULT_MAX_TOTAL_EVENT_BYTES))
+
+
+class TraceEventLog:
+    """
+    Append-only, per-trace log of the workflow events received by the ops
+    server, stored in SQLite (in WAL mode) so that it survives restarts of
+    the ops server.
+
+    Every event of a trace gets an offset (its index in the trace's log).
+    Reads never remove events: readers pass the offset they have read up
+    to (``since``), so any number of consumers can read the same trace,
+    and retried reads return the same events. Readers can also block until
+    newer events arrive, which lets the ops server push events to
+    streaming clients as soon as they are posted.
+
+    Retention is bounded:
+
+      - a trace keeps at most ``max_events_per_trace`` events, dropping
+        the oldest ones (offsets of the remaining events do not change),
+      - traces without any activity for ``trace_ttl`` seconds are evicted,
+      - once all traces together hold more than ``max_total_bytes`` of
+        events, the least recently active traces are evicted.
+
+    The legacy ``drain`` read is kept for clients that poll
+    GET /events?trace_id=... and expect every event only once. It is a
+    per-trace cursor over the same log and does not delete anything.
+    """
+
+    def __init__(
+        self,
+        location: str = ":memory:",
+        max_events_per_trace: int = DEFAULT_MAX_EVENTS_PER_TRACE,
+        trace_ttl: float = DEFAULT_TRACE_TTL_SECONDS,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_EVENT_BYTES,
+    ):
+        self.location = location
+        self.max_events_per_trace = max_events_per_trace
+        self.trace_ttl = trace_ttl
+        self.max_total_bytes = max_total_bytes
+        self._overflowed_events = 0
+        self._expired_traces = 0
+        self._evicted_traces = 0
+        self._condition = threading.Condition()
+
+        if location != ":memory:" and os.path.dirname(location):
+            os.makedirs(os.path.dirname(location), exist_ok=True)
+        self._db = sqlite3.connect(location, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS trace_events ("
+            "trace_id TEXT NOT NULL, event_offset INTEGER NOT NULL, event TEXT NOT NULL, "
+            "PRIMARY KEY (trace_id, event_offset)) WITHOUT ROWID"
+        )
+        # "base" is the offset of the first event still in the log and
+        # "next" the offset the next event will get.
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS traces ("
+            "trace_id TEXT PRIMARY KEY, base INTEGER NOT NULL, next INTEGER NOT NULL, drained INTEGER NOT NULL, "
+            "bytes INTEGER NOT NULL, overflow INTEGER NOT NULL, last_activity REAL NOT NULL)"
+        )
+
+        # In-memory copy of the traces table, in order of last activity
+        # (oldest first), so that appends and reads only touch SQLite for
+        # the events themselves.
+        self._traces: Dict[str, Dict[str, Any]] = {}
+        rows = self._db.execute(
+            "SELECT trace_id, base, next, drained, bytes, overflow, last_activity FROM traces ORDER BY last_activity"
+        ).fetchall()
+        for trace_id, base, next_offset, drained, size, overflow, last_activity in rows:
+            self._traces[trace_id] = {
+                "base": base,
+                "next": next_offset,
+                "drained": drained,
+                "bytes": size,
+                "overflow": overflow,
+                "last_activity": last_activity,
+            }
+        self._total_bytes = sum(trace["bytes"] for trace in self._traces.values())
+
+    def close(self) -> None:
+        with self._condition:
+            self._db.close()
+
+    def _new_trace(self) -> Dict[str, Any]:
+        return {"base": 0, "next": 0, "drained": 0, "bytes": 0, "overflow": 0, "last_activity": time.time()}
+
+    def _set_trace(self, trace_id: str, trace: Dict[str, Any]) -> None:
+        # Move the trace to the end, as the most recently active one.
+        self._traces.pop(trace_id, None)
+        self._traces[trace_id] = trace
+
+    def _save_trace(self, trace_id: str, trace: Dict[str, Any]) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO traces (trace_id, base, next, drained, bytes, overflow, last_activity) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                trace_id,
+                trace["base"],
+                trace["next"],
+                trace["drained"],
+                trace["bytes"],
+                trace["overflow"],
+                trace["last_activity"],
+            ),
+        )
+
+    def _delete_trace(self, trace_id: str) -> None:
+        self._db.execute("DELETE FROM trace_events WHERE trace_id = ?", (trace_id,))
+        self._db.execute("DELETE FROM traces WHERE trace_id = ?", (trace_id,))
+
+    def append(self, trace_id: str, events: List[Dict[str, Any]]) -> None:
+        self.append_many([(trace_id, events)])
+
+    def append_many(self, batches: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        """
+        Append events to traces, given as (trace ID, events) pairs, in one
+        transaction. The in-memory state is only updated once the
+        transaction is committed, so a failed append leaves both untouched.
+        """
+        with self._condition:
+            now = time.time()
+            total_bytes = self._total_bytes
+            overflowed_events = 0
+            # New state of the appended traces, in order of last activity.
+            updated: Dict[str, Dict[str, Any]] = {}
+            evicted: List[str] = []
+            self._db.execute("BEGIN")
+            try:
+                for trace_id, events in batches:
+                    trace = dict(updated.pop(trace_id, None) or self._traces.get(trace_id) or self._new_trace())
+                    trace["last_activity"] = now
+                    rows = []
+                    for event in events:
+                        serialized = json.dumps(event)
+                        rows.append((trace_id, trace["next"] + len(rows), serialized))
+                        trace["bytes"] += len(serialized)
+                        total_bytes += len(serialized)
+                    trace["next"] += len(rows)
+                    self._db.executemany(
+                        "INSERT INTO trace_events (trace_id, event_offset, event) VALUES (?, ?, ?)", rows
+                    )
+
+                    overflow = trace["next"] - trace["base"] - self.max_events_per_trace
+                    if overflow > 0:
+                        new_base = trace["base"] + overflow
+                        (dropped_bytes,) = self._db.execute(
+                            "SELECT COALESCE(SUM(LENGTH(event)), 0) FROM trace_events "
+                            "WHERE trace_id = ? AND event_offset < ?",
+                            (trace_id, new_base),
+                        ).fetchone()
+                        self._db.execute(
+                            "DELETE FROM trace_events WHERE trace_id = ? AND event_offset < ?", (trace_id, new_base)
+                        )
+                        trace["base"] = new_base
+                        trace["bytes"] -= dropped_bytes
+                        trace["overflow"] += overflow
+                        total_bytes -= dropped_bytes
+                        overflowed_events += overflow
+                    self._save_trace(trace_id, trace)
+                    updated[trace_id] = trace
+
+                # Evict the least recently active traces, but keep the most
+                # recently appended trace even if it alone is over the cap.
+                if total_bytes > self.max_total_bytes:
+                    untouched = ((t, trace) for t, trace in self._traces.items() if t not in updated)
+                    appended = list(updated.items())[:-1]
+                    for other_id, other in itertools.chain(untouched, appended):
+                        if total_bytes <= self.max_total_bytes:
+                            break
+                        self._delete_trace(other_id)
+                        total_bytes -= other["bytes"]
+                        evicted.append(other_id)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+            for trace_id, trace in updated.items():
+                self._set_trace(trace_id, trace)
+            for trace_id in evicted:
+                del self._traces[trace_id]
+            self._total_bytes = total_bytes
+            self._overflowed_events += overflowed_events
+            self._evicted_traces += len(evicted)
+            self._condition.notify_all()
+
+    def _read_events(self, trace_id: str, since: int, limit: int) -> List[Dict[str, Any]]:
+        rows = self._db.execute(
+            "SELECT event FROM trace_events WHERE trace_id = ? AND event_offset >= ? ORDER BY event_offset LIMIT ?",
+            (trace_id, since, limit),
+        ).fetchall()
+        return [json.loads(event) for (event,) in rows]
+
+    def read(
+        self, trace_id: str, since: int = 0, timeout: float = 0, limit: int = DEFAULT_MAX_EVENTS_PER_READ
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Return up to ``limit`` events of a trace from offset ``since`` on,
+        and the offset to read from next. If there are no such events yet,
+        wait up to ``timeout`` seconds for some to arrive. Events that were
+        already dropped from the trace are skipped.
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                trace = self._traces.get(trace_id)
+                events = []
+                if trace:
+                    since = max(since, trace["base"])
+                    if since < trace["next"]:
+                        events = self._read_events(trace_id, since, limit)
+                remaining = deadline - time.monotonic()
+                if events or remaining <= 0:
+                    return events, since + len(events)
+                self._condition.wait(timeout=remaining)
+
+    def drain(self, trace_id: str) -> List[Dict[str, Any]]:
+        """
+        Return the events of a trace that have not been drained before.
+        Draining an unknown trace returns no events and does not create it.
+        """
+        with self._condition:
+            if trace_id not in self._traces:
+                return []
+            trace = dict(self._traces[trace_id])
+            drained = max(trace["drained"], trace["base"])
+            events = self._read_events(trace_id, drained, trace["next"] - drained) if drained < trace["next"] else []
+            trace["drained"] = trace["next"]
+            trace["last_activity"] = time.time()
+            self._save_trace(trace_id, trace)
+            self._set_trace(trace_id, trace)
+            return events
+
+    def expire_traces(self) -> int:
+        """
+        Evict the traces that have been inactive for longer than the TTL.
+        Returns the number of evicted traces.
+        """
+        cutoff = time.time() - self.trace_ttl
+        with self._condition:
+            expired = [trace_id for trace_id, trace in self._traces.items() if trace["last_activity"] < cutoff]
+            if expired:
+                self._db.execute("BEGIN")
+                try:
+                    for trace_id in expired:
+                        self._delete_trace(trace_id)
+                    self._db.execute("COMMIT")
+                except Exception:
+                    self._db.execute("ROLLBACK")
+                    raise
+                for trace_id in expired:
+                    self._total_bytes -= self._traces.pop(trace_id)["bytes"]
+            self._expired_traces += len(expired)
+            return len(expired)
+
+    def stats(self, top: int = 20) -> Dict[str, Any]:
+        """
+        Event counts and sizes, overall and for the ``top`` largest traces.
+        """
+        now = time.time()
+        with self._condition:
+            largest = sorted(self._traces.items(), key=lambda t: t[1]["bytes"], reverse=True)[:top]
+            return {
+                "traces": len(self._traces),
+                "events": sum(trace["next"] - trace["base"] for trace in self._traces.values()),
+                "bytes": self._total_bytes,
+                "overflowed_events": self._overflowed_events,
+                "expired_traces": self._expired_traces,
+                "evicted_traces": self._evicted_traces,
+                "limits": {
+                    "max_events_per_trace": self.max_events_per_trace,
+                    "trace_ttl": self.trace_ttl,
+                    "max_total_bytes": self.max_total_bytes,
+                },
+                "largest_traces": [
+                    {
+                        "trace_id": trace_id,
+                        "events": trace["next"] - trace["base"],
+                        "bytes": trace["bytes"],
+                        "overflow": trace["overflow"],
+                        "next_offset": trace["next"],
+                        "idle_seconds": round(now - trace["last_activity"], 1),
+                    }
+                    for trace_id, trace in largest
+                ],
+            }
+
+
+def is_terminal_event(event: Optional[Dict[str, Any]]) -> bool:
+    return bool(event) and event.get("type") in TERMINAL_EVENT_TYPES
@@ -144,11 +144,24 @@ export interface GetStudioDefaultModelResponse {
 export interface ListToolTemplatesRequest {
   /** Optional workflow template */
   workflow_template_id?: string | undefined;
+  /** Maximum number of tool templates to return. All tool templates are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the tool templates with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListToolTemplatesResponse {
   /** List of tool templates */
   templates: ToolTemplate[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 /** Messages for GetToolTemplate */
@@ -202,10 +215,23 @@ export interface RemoveToolTemplateResponse {
 export interface ListToolInstancesRequest {
   /** Mandatory workflow id */
   workflow_id: string;
+  /** Maximum number of tool instances to return. All tool instances are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the tool instances with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListToolInstancesResponse {
   tool_instances: ToolInstance[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 /** Messages for GetToolInstance */
@@ -310,11 +336,24 @@ export interface ToolInstance {
 export interface ListAgentsRequest {
   /** Mandatory workflow id */
   workflow_id: string;
+  /** Maximum number of agents to return. All agents are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the agents with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListAgentsResponse {
   /** A list of agents with metadata */
   agents: AgentMetadata[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 export interface GetAgentRequest {
@@ -473,11 +512,24 @@ export interface AddWorkflowResponse {
 
 /** Messages for listing workflows */
 export interface ListWorkflowsRequest {
+  /** Maximum number of workflows to return. All workflows are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the workflows with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListWorkflowsResponse {
   /** List of workflows */
   workflows: Workflow[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 /** Messages for retrieving a single workflow */
@@ -553,6 +605,11 @@ export interface TestWorkflowResponse {
   message: string;
   /** Trace ID of the test */
   trace_id: string;
+  /**
+   * Position of the test run in the workflow runner queue. 0 if the
+   * test run was dispatched to a workflow runner right away.
+   */
+  queue_position: number;
 }
 
 /** Messages for deploying workflows */
@@ -642,6 +699,8 @@ export interface DeployedWorkflow {
   application_deep_link: string;
   /** Deep link to the CML model */
   model_deep_link: string;
+  /** Seconds since the application and model status were fetched from CML */
+  status_age: number;
 }
 
 /** Workflow metadata */
@@ -703,11 +762,24 @@ export interface AddTaskResponse {
 export interface ListTasksRequest {
   /** Mandatory workflow id */
   workflow_id: string;
+  /** Maximum number of tasks to return. All tasks are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the tasks with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListTasksResponse {
   /** List of tasks */
   tasks: CrewAITaskMetadata[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 export interface GetTaskRequest {
@@ -821,10 +893,23 @@ export interface GetParentProjectDetailsResponse {
 export interface ListAgentTemplatesRequest {
   /** Optional workflow template id */
   workflow_template_id?: string | undefined;
+  /** Maximum number of agent templates to return. All agent templates are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the agent templates with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListAgentTemplatesResponse {
   agent_templates: AgentTemplateMetadata[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 export interface GetAgentTemplateRequest {
@@ -929,10 +1014,23 @@ export interface AgentTemplateMetadata {
 }
 
 export interface ListWorkflowTemplatesRequest {
+  /** Maximum number of workflow templates to return. All workflow templates are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the workflow templates with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListWorkflowTemplatesResponse {
   workflow_templates: WorkflowTemplateMetadata[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 export interface GetWorkflowTemplateRequest {
@@ -1026,10 +1124,23 @@ export interface ImportWorkflowTemplateResponse {
 export interface ListTaskTemplatesRequest {
   /** optional workflow id */
   workflow_template_id?: string | undefined;
+  /** Maximum number of task templates to return. All task templates are returned if 0. */
+  page_size: number;
+  /** next_page_token of the previous page, to get the page after it. */
+  page_token: string;
+  /** Only return the task templates with these IDs. */
+  ids: string[];
+  /**
+   * Field mask: names of the fields to set on every returned item. All
+   * fields are set if empty.
+   */
+  fields: string[];
 }
 
 export interface ListTaskTemplatesResponse {
   task_templates: TaskTemplateMetadata[];
+  /** Token to request the next page with, empty on the last page. */
+  next_page_token: string;
 }
 
 export interface GetTaskTemplateRequest {
@@ -2357,7 +2468,7 @@ export const GetStudioDefaultModelResponse: MessageFns<GetStudioDefaultModelResp
 };
 
 function createBaseListToolTemplatesRequest(): ListToolTemplatesRequest {
-  return { workflow_template_id: undefined };
+  return { workflow_template_id: undefined, page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
@@ -2365,6 +2476,18 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
     if (message.workflow_template_id !== undefined) {
       writer.uint32(10).string(message.workflow_template_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(34).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(42).string(v!);
+    }
     return writer;
   },
 
@@ -2383,6 +2506,38 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
           message.workflow_template_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -2397,6 +2552,10 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
       workflow_template_id: isSet(object.workflow_template_id)
         ? globalThis.String(object.workflow_template_id)
         : undefined,
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
     };
   },
 
@@ -2405,6 +2564,18 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
     if (message.workflow_template_id !== undefined) {
       obj.workflow_template_id = message.workflow_template_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
@@ -2414,12 +2585,16 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
   fromPartial(object: DeepPartial<ListToolTemplatesRequest>): ListToolTemplatesRequest {
     const message = createBaseListToolTemplatesRequest();
     message.workflow_template_id = object.workflow_template_id ?? undefined;
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListToolTemplatesResponse(): ListToolTemplatesResponse {
-  return { templates: [] };
+  return { templates: [], next_page_token: "" };
 }
 
 export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> = {
@@ -2427,6 +2602,9 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
     for (const v of message.templates) {
       ToolTemplate.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -2445,6 +2623,14 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
           message.templates.push(ToolTemplate.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -2459,6 +2645,7 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
       templates: globalThis.Array.isArray(object?.templates)
         ? object.templates.map((e: any) => ToolTemplate.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -2467,6 +2654,9 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
     if (message.templates?.length) {
       obj.templates = message.templates.map((e) => ToolTemplate.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -2476,6 +2666,7 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
   fromPartial(object: DeepPartial<ListToolTemplatesResponse>): ListToolTemplatesResponse {
     const message = createBaseListToolTemplatesResponse();
     message.templates = object.templates?.map((e) => ToolTemplate.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -3002,7 +3193,7 @@ export const RemoveToolTemplateResponse: MessageFns<RemoveToolTemplateResponse>
 };
 
 function createBaseListToolInstancesRequest(): ListToolInstancesRequest {
-  return { workflow_id: "" };
+  return { workflow_id: "", page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
@@ -3010,6 +3201,18 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
     if (message.workflow_id !== "") {
       writer.uint32(10).string(message.workflow_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(34).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(42).string(v!);
+    }
     return writer;
   },
 
@@ -3028,6 +3231,38 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
           message.workflow_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -3038,7 +3273,13 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
   },
 
   fromJSON(object: any): ListToolInstancesRequest {
-    return { workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "" };
+    return {
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "",
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
+    };
   },
 
   toJSON(message: ListToolInstancesRequest): unknown {
@@ -3046,6 +3287,18 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
     if (message.workflow_id !== "") {
       obj.workflow_id = message.workflow_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
@@ -3055,12 +3308,16 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
   fromPartial(object: DeepPartial<ListToolInstancesRequest>): ListToolInstancesRequest {
     const message = createBaseListToolInstancesRequest();
     message.workflow_id = object.workflow_id ?? "";
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListToolInstancesResponse(): ListToolInstancesResponse {
-  return { tool_instances: [] };
+  return { tool_instances: [], next_page_token: "" };
 }
 
 export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> = {
@@ -3068,6 +3325,9 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
     for (const v of message.tool_instances) {
       ToolInstance.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -3086,6 +3346,14 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
           message.tool_instances.push(ToolInstance.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -3100,6 +3368,7 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
       tool_instances: globalThis.Array.isArray(object?.tool_instances)
         ? object.tool_instances.map((e: any) => ToolInstance.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -3108,6 +3377,9 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
     if (message.tool_instances?.length) {
       obj.tool_instances = message.tool_instances.map((e) => ToolInstance.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -3117,6 +3389,7 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
   fromPartial(object: DeepPartial<ListToolInstancesResponse>): ListToolInstancesResponse {
     const message = createBaseListToolInstancesResponse();
     message.tool_instances = object.tool_instances?.map((e) => ToolInstance.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -4158,7 +4431,7 @@ export const ToolInstance: MessageFns<ToolInstance> = {
 };
 
 function createBaseListAgentsRequest(): ListAgentsRequest {
-  return { workflow_id: "" };
+  return { workflow_id: "", page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
@@ -4166,6 +4439,18 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
     if (message.workflow_id !== "") {
       writer.uint32(10).string(message.workflow_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(34).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(42).string(v!);
+    }
     return writer;
   },
 
@@ -4184,6 +4469,38 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
           message.workflow_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -4194,7 +4511,13 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
   },
 
   fromJSON(object: any): ListAgentsRequest {
-    return { workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "" };
+    return {
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "",
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
+    };
   },
 
   toJSON(message: ListAgentsRequest): unknown {
@@ -4202,6 +4525,18 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
     if (message.workflow_id !== "") {
       obj.workflow_id = message.workflow_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
@@ -4211,12 +4546,16 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
   fromPartial(object: DeepPartial<ListAgentsRequest>): ListAgentsRequest {
     const message = createBaseListAgentsRequest();
     message.workflow_id = object.workflow_id ?? "";
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListAgentsResponse(): ListAgentsResponse {
-  return { agents: [] };
+  return { agents: [], next_page_token: "" };
 }
 
 export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
@@ -4224,6 +4563,9 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
     for (const v of message.agents) {
       AgentMetadata.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -4242,6 +4584,14 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
           message.agents.push(AgentMetadata.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -4254,6 +4604,7 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
   fromJSON(object: any): ListAgentsResponse {
     return {
       agents: globalThis.Array.isArray(object?.agents) ? object.agents.map((e: any) => AgentMetadata.fromJSON(e)) : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -4262,6 +4613,9 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
     if (message.agents?.length) {
       obj.agents = message.agents.map((e) => AgentMetadata.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -4271,6 +4625,7 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
   fromPartial(object: DeepPartial<ListAgentsResponse>): ListAgentsResponse {
     const message = createBaseListAgentsResponse();
     message.agents = object.agents?.map((e) => AgentMetadata.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -5667,11 +6022,23 @@ export const AddWorkflowResponse: MessageFns<AddWorkflowResponse> = {
 };
 
 function createBaseListWorkflowsRequest(): ListWorkflowsRequest {
-  return {};
+  return { page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListWorkflowsRequest: MessageFns<ListWorkflowsRequest> = {
-  encode(_: ListWorkflowsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+  encode(message: ListWorkflowsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.page_size !== 0) {
+      writer.uint32(8).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(18).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(26).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(34).string(v!);
+    }
     return writer;
   },
 
@@ -5682,6 +6049,38 @@ export const ListWorkflowsRequest: MessageFns<ListWorkflowsRequest> = {
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -5691,26 +6090,47 @@ export const ListWorkflowsRequest: MessageFns<ListWorkflowsRequest> = {
     return message;
   },
 
-  fromJSON(_: any): ListWorkflowsRequest {
-    return {};
+  fromJSON(object: any): ListWorkflowsRequest {
+    return {
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
+    };
   },
 
-  toJSON(_: ListWorkflowsRequest): unknown {
+  toJSON(message: ListWorkflowsRequest): unknown {
     const obj: any = {};
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
   create(base?: DeepPartial<ListWorkflowsRequest>): ListWorkflowsRequest {
     return ListWorkflowsRequest.fromPartial(base ?? {});
   },
-  fromPartial(_: DeepPartial<ListWorkflowsRequest>): ListWorkflowsRequest {
+  fromPartial(object: DeepPartial<ListWorkflowsRequest>): ListWorkflowsRequest {
     const message = createBaseListWorkflowsRequest();
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListWorkflowsResponse(): ListWorkflowsResponse {
-  return { workflows: [] };
+  return { workflows: [], next_page_token: "" };
 }
 
 export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
@@ -5718,6 +6138,9 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
     for (const v of message.workflows) {
       Workflow.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -5736,6 +6159,14 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
           message.workflows.push(Workflow.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -5750,6 +6181,7 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
       workflows: globalThis.Array.isArray(object?.workflows)
         ? object.workflows.map((e: any) => Workflow.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -5758,6 +6190,9 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
     if (message.workflows?.length) {
       obj.workflows = message.workflows.map((e) => Workflow.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -5767,6 +6202,7 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
   fromPartial(object: DeepPartial<ListWorkflowsResponse>): ListWorkflowsResponse {
     const message = createBaseListWorkflowsResponse();
     message.workflows = object.workflows?.map((e) => Workflow.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -6540,7 +6976,7 @@ export const TestWorkflowRequest_ToolUserParametersEntry: MessageFns<TestWorkflo
 };
 
 function createBaseTestWorkflowResponse(): TestWorkflowResponse {
-  return { message: "", trace_id: "" };
+  return { message: "", trace_id: "", queue_position: 0 };
 }
 
 export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
@@ -6551,6 +6987,9 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     if (message.trace_id !== "") {
       writer.uint32(18).string(message.trace_id);
     }
+    if (message.queue_position !== 0) {
+      writer.uint32(24).int32(message.queue_position);
+    }
     return writer;
   },
 
@@ -6577,6 +7016,14 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
           message.trace_id = reader.string();
           continue;
         }
+        case 3: {
+          if (tag !== 24) {
+            break;
+          }
+
+          message.queue_position = reader.int32();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -6590,6 +7037,7 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     return {
       message: isSet(object.message) ? globalThis.String(object.message) : "",
       trace_id: isSet(object.trace_id) ? globalThis.String(object.trace_id) : "",
+      queue_position: isSet(object.queue_position) ? globalThis.Number(object.queue_position) : 0,
     };
   },
 
@@ -6601,6 +7049,9 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     if (message.trace_id !== "") {
       obj.trace_id = message.trace_id;
     }
+    if (message.queue_position !== 0) {
+      obj.queue_position = Math.round(message.queue_position);
+    }
     return obj;
   },
 
@@ -6611,6 +7062,7 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
     const message = createBaseTestWorkflowResponse();
     message.message = object.message ?? "";
     message.trace_id = object.trace_id ?? "";
+    message.queue_position = object.queue_position ?? 0;
     return message;
   },
 };
@@ -7379,6 +7831,7 @@ function createBaseDeployedWorkflow(): DeployedWorkflow {
     application_status: "",
     application_deep_link: "",
     model_deep_link: "",
+    status_age: 0,
   };
 }
 
@@ -7414,6 +7867,9 @@ export const DeployedWorkflow: MessageFns<DeployedWorkflow> = {
     if (message.model_deep_link !== "") {
       writer.uint32(82).string(message.model_deep_link);
     }
+    if (message.status_age !== 0) {
+      writer.uint32(88).int32(message.status_age);
+    }
     return writer;
   },
 
@@ -7504,6 +7960,14 @@ export const DeployedWorkflow: MessageFns<DeployedWorkflow> = {
           message.model_deep_link = reader.string();
           continue;
         }
+        case 11: {
+          if (tag !== 88) {
+            break;
+          }
+
+          message.status_age = reader.int32();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -7527,6 +7991,7 @@ export const DeployedWorkflow: MessageFns<DeployedWorkflow> = {
       application_status: isSet(object.application_status) ? globalThis.String(object.application_status) : "",
       application_deep_link: isSet(object.application_deep_link) ? globalThis.String(object.application_deep_link) : "",
       model_deep_link: isSet(object.model_deep_link) ? globalThis.String(object.model_deep_link) : "",
+      status_age: isSet(object.status_age) ? globalThis.Number(object.status_age) : 0,
     };
   },
 
@@ -7562,6 +8027,9 @@ export const DeployedWorkflow: MessageFns<DeployedWorkflow> = {
     if (message.model_deep_link !== "") {
       obj.model_deep_link = message.model_deep_link;
     }
+    if (message.status_age !== 0) {
+      obj.status_age = Math.round(message.status_age);
+    }
     return obj;
   },
 
@@ -7580,6 +8048,7 @@ export const DeployedWorkflow: MessageFns<DeployedWorkflow> = {
     message.application_status = object.application_status ?? "";
     message.application_deep_link = object.application_deep_link ?? "";
     message.model_deep_link = object.model_deep_link ?? "";
+    message.status_age = object.status_age ?? 0;
     return message;
   },
 };
@@ -8085,7 +8554,7 @@ export const AddTaskResponse: MessageFns<AddTaskResponse> = {
 };
 
 function createBaseListTasksRequest(): ListTasksRequest {
-  return { workflow_id: "" };
+  return { workflow_id: "", page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListTasksRequest: MessageFns<ListTasksRequest> = {
@@ -8093,6 +8562,18 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
     if (message.workflow_id !== "") {
       writer.uint32(10).string(message.workflow_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(34).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(42).string(v!);
+    }
     return writer;
   },
 
@@ -8111,6 +8592,38 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
           message.workflow_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -8121,7 +8634,13 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
   },
 
   fromJSON(object: any): ListTasksRequest {
-    return { workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "" };
+    return {
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "",
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
+    };
   },
 
   toJSON(message: ListTasksRequest): unknown {
@@ -8129,6 +8648,18 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
     if (message.workflow_id !== "") {
       obj.workflow_id = message.workflow_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
@@ -8138,12 +8669,16 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
   fromPartial(object: DeepPartial<ListTasksRequest>): ListTasksRequest {
     const message = createBaseListTasksRequest();
     message.workflow_id = object.workflow_id ?? "";
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListTasksResponse(): ListTasksResponse {
-  return { tasks: [] };
+  return { tasks: [], next_page_token: "" };
 }
 
 export const ListTasksResponse: MessageFns<ListTasksResponse> = {
@@ -8151,6 +8686,9 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
     for (const v of message.tasks) {
       CrewAITaskMetadata.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -8169,6 +8707,14 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
           message.tasks.push(CrewAITaskMetadata.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -8183,6 +8729,7 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
       tasks: globalThis.Array.isArray(object?.tasks)
         ? object.tasks.map((e: any) => CrewAITaskMetadata.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -8191,6 +8738,9 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
     if (message.tasks?.length) {
       obj.tasks = message.tasks.map((e) => CrewAITaskMetadata.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -8200,6 +8750,7 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
   fromPartial(object: DeepPartial<ListTasksResponse>): ListTasksResponse {
     const message = createBaseListTasksResponse();
     message.tasks = object.tasks?.map((e) => CrewAITaskMetadata.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -9555,7 +10106,7 @@ export const GetParentProjectDetailsResponse: MessageFns<GetParentProjectDetails
 };
 
 function createBaseListAgentTemplatesRequest(): ListAgentTemplatesRequest {
-  return { workflow_template_id: undefined };
+  return { workflow_template_id: undefined, page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListAgentTemplatesRequest: MessageFns<ListAgentTemplatesRequest> = {
@@ -9563,6 +10114,18 @@ export const ListAgentTemplatesRequest: MessageFns<ListAgentTemplatesRequest> =
     if (message.workflow_template_id !== undefined) {
       writer.uint32(10).string(message.workflow_template_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(34).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(42).string(v!);
+    }
     return writer;
   },
 
@@ -9581,6 +10144,38 @@ export const ListAgentTemplatesRequest: MessageFns<ListAgentTemplatesRequest> =
           message.workflow_template_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -9595,6 +10190,10 @@ export const ListAgentTemplatesRequest: MessageFns<ListAgentTemplatesRequest> =
       workflow_template_id: isSet(object.workflow_template_id)
         ? globalThis.String(object.workflow_template_id)
         : undefined,
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
     };
   },
 
@@ -9603,6 +10202,18 @@ export const ListAgentTemplatesRequest: MessageFns<ListAgentTemplatesRequest> =
     if (message.workflow_template_id !== undefined) {
       obj.workflow_template_id = message.workflow_template_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
@@ -9612,12 +10223,16 @@ export const ListAgentTemplatesRequest: MessageFns<ListAgentTemplatesRequest> =
   fromPartial(object: DeepPartial<ListAgentTemplatesRequest>): ListAgentTemplatesRequest {
     const message = createBaseListAgentTemplatesRequest();
     message.workflow_template_id = object.workflow_template_id ?? undefined;
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListAgentTemplatesResponse(): ListAgentTemplatesResponse {
-  return { agent_templates: [] };
+  return { agent_templates: [], next_page_token: "" };
 }
 
 export const ListAgentTemplatesResponse: MessageFns<ListAgentTemplatesResponse> = {
@@ -9625,6 +10240,9 @@ export const ListAgentTemplatesResponse: MessageFns<ListAgentTemplatesResponse>
     for (const v of message.agent_templates) {
       AgentTemplateMetadata.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -9643,6 +10261,14 @@ export const ListAgentTemplatesResponse: MessageFns<ListAgentTemplatesResponse>
           message.agent_templates.push(AgentTemplateMetadata.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -9657,6 +10283,7 @@ export const ListAgentTemplatesResponse: MessageFns<ListAgentTemplatesResponse>
       agent_templates: globalThis.Array.isArray(object?.agent_templates)
         ? object.agent_templates.map((e: any) => AgentTemplateMetadata.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -9665,6 +10292,9 @@ export const ListAgentTemplatesResponse: MessageFns<ListAgentTemplatesResponse>
     if (message.agent_templates?.length) {
       obj.agent_templates = message.agent_templates.map((e) => AgentTemplateMetadata.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -9674,6 +10304,7 @@ export const ListAgentTemplatesResponse: MessageFns<ListAgentTemplatesResponse>
   fromPartial(object: DeepPartial<ListAgentTemplatesResponse>): ListAgentTemplatesResponse {
     const message = createBaseListAgentTemplatesResponse();
     message.agent_templates = object.agent_templates?.map((e) => AgentTemplateMetadata.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -10860,11 +11491,23 @@ export const AgentTemplateMetadata: MessageFns<AgentTemplateMetadata> = {
 };
 
 function createBaseListWorkflowTemplatesRequest(): ListWorkflowTemplatesRequest {
-  return {};
+  return { page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListWorkflowTemplatesRequest: MessageFns<ListWorkflowTemplatesRequest> = {
-  encode(_: ListWorkflowTemplatesRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+  encode(message: ListWorkflowTemplatesRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.page_size !== 0) {
+      writer.uint32(8).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(18).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(26).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(34).string(v!);
+    }
     return writer;
   },
 
@@ -10875,6 +11518,38 @@ export const ListWorkflowTemplatesRequest: MessageFns<ListWorkflowTemplatesReque
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -10884,26 +11559,47 @@ export const ListWorkflowTemplatesRequest: MessageFns<ListWorkflowTemplatesReque
     return message;
   },
 
-  fromJSON(_: any): ListWorkflowTemplatesRequest {
-    return {};
+  fromJSON(object: any): ListWorkflowTemplatesRequest {
+    return {
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
+    };
   },
 
-  toJSON(_: ListWorkflowTemplatesRequest): unknown {
+  toJSON(message: ListWorkflowTemplatesRequest): unknown {
     const obj: any = {};
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
   create(base?: DeepPartial<ListWorkflowTemplatesRequest>): ListWorkflowTemplatesRequest {
     return ListWorkflowTemplatesRequest.fromPartial(base ?? {});
   },
-  fromPartial(_: DeepPartial<ListWorkflowTemplatesRequest>): ListWorkflowTemplatesRequest {
+  fromPartial(object: DeepPartial<ListWorkflowTemplatesRequest>): ListWorkflowTemplatesRequest {
     const message = createBaseListWorkflowTemplatesRequest();
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListWorkflowTemplatesResponse(): ListWorkflowTemplatesResponse {
-  return { workflow_templates: [] };
+  return { workflow_templates: [], next_page_token: "" };
 }
 
 export const ListWorkflowTemplatesResponse: MessageFns<ListWorkflowTemplatesResponse> = {
@@ -10911,6 +11607,9 @@ export const ListWorkflowTemplatesResponse: MessageFns<ListWorkflowTemplatesResp
     for (const v of message.workflow_templates) {
       WorkflowTemplateMetadata.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -10929,6 +11628,14 @@ export const ListWorkflowTemplatesResponse: MessageFns<ListWorkflowTemplatesResp
           message.workflow_templates.push(WorkflowTemplateMetadata.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -10943,6 +11650,7 @@ export const ListWorkflowTemplatesResponse: MessageFns<ListWorkflowTemplatesResp
       workflow_templates: globalThis.Array.isArray(object?.workflow_templates)
         ? object.workflow_templates.map((e: any) => WorkflowTemplateMetadata.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -10951,6 +11659,9 @@ export const ListWorkflowTemplatesResponse: MessageFns<ListWorkflowTemplatesResp
     if (message.workflow_templates?.length) {
       obj.workflow_templates = message.workflow_templates.map((e) => WorkflowTemplateMetadata.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -10960,6 +11671,7 @@ export const ListWorkflowTemplatesResponse: MessageFns<ListWorkflowTemplatesResp
   fromPartial(object: DeepPartial<ListWorkflowTemplatesResponse>): ListWorkflowTemplatesResponse {
     const message = createBaseListWorkflowTemplatesResponse();
     message.workflow_templates = object.workflow_templates?.map((e) => WorkflowTemplateMetadata.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -11905,7 +12617,7 @@ export const ImportWorkflowTemplateResponse: MessageFns<ImportWorkflowTemplateRe
 };
 
 function createBaseListTaskTemplatesRequest(): ListTaskTemplatesRequest {
-  return { workflow_template_id: undefined };
+  return { workflow_template_id: undefined, page_size: 0, page_token: "", ids: [], fields: [] };
 }
 
 export const ListTaskTemplatesRequest: MessageFns<ListTaskTemplatesRequest> = {
@@ -11913,6 +12625,18 @@ export const ListTaskTemplatesRequest: MessageFns<ListTaskTemplatesRequest> = {
     if (message.workflow_template_id !== undefined) {
       writer.uint32(10).string(message.workflow_template_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.ids) {
+      writer.uint32(34).string(v!);
+    }
+    for (const v of message.fields) {
+      writer.uint32(42).string(v!);
+    }
     return writer;
   },
 
@@ -11931,6 +12655,38 @@ export const ListTaskTemplatesRequest: MessageFns<ListTaskTemplatesRequest> = {
           message.workflow_template_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.ids.push(reader.string());
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.fields.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -11945,6 +12701,10 @@ export const ListTaskTemplatesRequest: MessageFns<ListTaskTemplatesRequest> = {
       workflow_template_id: isSet(object.workflow_template_id)
         ? globalThis.String(object.workflow_template_id)
         : undefined,
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      ids: globalThis.Array.isArray(object?.ids) ? object.ids.map((e: any) => globalThis.String(e)) : [],
+      fields: globalThis.Array.isArray(object?.fields) ? object.fields.map((e: any) => globalThis.String(e)) : [],
     };
   },
 
@@ -11953,6 +12713,18 @@ export const ListTaskTemplatesRequest: MessageFns<ListTaskTemplatesRequest> = {
     if (message.workflow_template_id !== undefined) {
       obj.workflow_template_id = message.workflow_template_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.ids?.length) {
+      obj.ids = message.ids;
+    }
+    if (message.fields?.length) {
+      obj.fields = message.fields;
+    }
     return obj;
   },
 
@@ -11962,12 +12734,16 @@ export const ListTaskTemplatesRequest: MessageFns<ListTaskTemplatesRequest> = {
   fromPartial(object: DeepPartial<ListTaskTemplatesRequest>): ListTaskTemplatesRequest {
     const message = createBaseListTaskTemplatesRequest();
     message.workflow_template_id = object.workflow_template_id ?? undefined;
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.ids = object.ids?.map((e) => e) || [];
+    message.fields = object.fields?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListTaskTemplatesResponse(): ListTaskTemplatesResponse {
-  return { task_templates: [] };
+  return { task_templates: [], next_page_token: "" };
 }
 
 export const ListTaskTemplatesResponse: MessageFns<ListTaskTemplatesResponse> = {
@@ -11975,6 +12751,9 @@ export const ListTaskTemplatesResponse: MessageFns<ListTaskTemplatesResponse> =
     for (const v of message.task_templates) {
       TaskTemplateMetadata.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -11993,6 +12772,14 @@ export const ListTaskTemplatesResponse: MessageFns<ListTaskTemplatesResponse> =
           message.task_templates.push(TaskTemplateMetadata.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -12007,6 +12794,7 @@ export const ListTaskTemplatesResponse: MessageFns<ListTaskTemplatesResponse> =
       task_templates: globalThis.Array.isArray(object?.task_templates)
         ? object.task_templates.map((e: any) => TaskTemplateMetadata.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -12015,6 +12803,9 @@ export const ListTaskTemplatesResponse: MessageFns<ListTaskTemplatesResponse> =
     if (message.task_templates?.length) {
       obj.task_templates = message.task_templates.map((e) => TaskTemplateMetadata.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -12024,6 +12815,7 @@ export const ListTaskTemplatesResponse: MessageFns<ListTaskTemplatesResponse> =
   fromPartial(object: DeepPartial<ListTaskTemplatesResponse>): ListTaskTemplatesResponse {
     const message = createBaseListTaskTemplatesResponse();
     message.task_templates = object.task_templates?.map((e) => TaskTemplateMetadata.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x1fstudio/proto/agent_studio.proto\x12\x0c\x61gent_studio"\x86\x01\n\x05Model\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x12\n\nmodel_type\x18\x04 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x05 \x01(\t\x12\x19\n\x11is_studio_default\x18\x06 \x01(\x08"\x13\n\x11ListModelsRequest"@\n\x12ListModelsResponse\x12*\n\rmodel_details\x18\x01 \x03(\x0b\x32\x13.agent_studio.Model"#\n\x0fGetModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t">\n\x10GetModelResponse\x12*\n\rmodel_details\x18\x01 \x01(\x0b\x32\x13.agent_studio.Model"t\n\x0f\x41\x64\x64ModelRequest\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x16\n\x0eprovider_model\x18\x02 \x01(\t\x12\x12\n\nmodel_type\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"$\n\x10\x41\x64\x64ModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"&\n\x12RemoveModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x15\n\x13RemoveModelResponse"u\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"\'\n\x13UpdateModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x93\x01\n\x10TestModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ompletion_role\x18\x02 \x01(\t\x12\x1a\n\x12\x63ompletion_content\x18\x03 \x01(\t\x12\x13\n\x0btemperature\x18\x04 \x01(\x02\x12\x12\n\nmax_tokens\x18\x05 \x01(\x05\x12\x0f\n\x07timeout\x18\x06 \x01(\x05"%\n\x11TestModelResponse\x12\x10\n\x08response\x18\x01 \x01(\t"0\n\x1cSetStudioDefaultModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x1f\n\x1dSetStudioDefaultModelResponse"\x1e\n\x1cGetStudioDefaultModelRequest"p\n\x1dGetStudioDefaultModelResponse\x12#\n\x1bis_default_model_configured\x18\x01 \x01(\x08\x12*\n\rmodel_details\x18\x02 \x01(\x0b\x32\x13.agent_studio.Model"V\n\x18ListToolTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"J\n\x19ListToolTemplatesResponse\x12-\n\ttemplates\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolTemplate"2\n\x16GetToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"G\n\x17GetToolTemplateResponse\x12,\n\x08template\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolTemplate"\x8d\x01\n\x16\x41\x64\x64ToolTemplateRequest\x12\x1a\n\x12tool_template_name\x18\x01 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x02 \x01(\t\x12!\n\x14workflow_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"3\n\x17\x41\x64\x64ToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"n\n\x19UpdateToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t\x12\x1a\n\x12tool_template_name\x18\x02 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x03 \x01(\t"6\n\x1aUpdateToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"5\n\x19RemoveToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolTemplateResponse"D\n\x18ListToolInstancesRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"O\n\x19ListToolInstancesResponse\x12\x32\n\x0etool_instances\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolInstance"2\n\x16GetToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"L\n\x17GetToolInstanceResponse\x12\x31\n\rtool_instance\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolInstance"r\n\x19\x43reateToolInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x10tool_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x13\n\x11_tool_template_id"R\n\x1a\x43reateToolInstanceResponse\x12\x1a\n\x12tool_instance_name\x18\x01 \x01(\t\x12\x18\n\x10tool_instance_id\x18\x02 \x01(\t"u\n\x19UpdateToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x04 \x01(\t"6\n\x1aUpdateToolInstanceResponse\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"5\n\x19RemoveToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolInstanceResponse"\xb6\x02\n\x0cToolTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bpython_code\x18\x03 \x01(\t\x12\x1b\n\x13python_requirements\x18\x04 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x05 \x01(\t\x12\x15\n\rtool_metadata\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x11\n\tpre_built\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12!\n\x14workflow_template_id\x18\x0b \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cis_venv_tool\x18\x0c \x01(\x08\x42\x17\n\x15_workflow_template_id"\xfc\x01\n\x0cToolInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x13\n\x0bpython_code\x18\x04 \x01(\t\x12\x1b\n\x13python_requirements\x18\x05 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x06 \x01(\t\x12\x15\n\rtool_metadata\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12\x14\n\x0cis_venv_tool\x18\x0b \x01(\x08"=\n\x11ListAgentsRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"A\n\x12ListAgentsResponse\x12+\n\x06\x61gents\x18\x01 \x03(\x0b\x32\x1b.agent_studio.AgentMetadata"#\n\x0fGetAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t">\n\x10GetAgentResponse\x12*\n\x05\x61gent\x18\x01 \x01(\x0b\x32\x1b.agent_studio.AgentMetadata"\x8b\x02\n\x0f\x41\x64\x64\x41gentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x02 \x01(\t\x12\x10\n\x08tools_id\x18\x03 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x04 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x18\n\x0btemplate_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x0bworkflow_id\x18\x06 \x01(\t\x12\x1c\n\x14tmp_agent_image_path\x18\x07 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x08 \x03(\tB\x0e\n\x0c_template_id"$\n\x10\x41\x64\x64\x41gentResponse\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\xe1\x01\n\x12UpdateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x1c\n\x14tmp_agent_image_path\x18\x06 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x07 \x03(\t"\x15\n\x13UpdateAgentResponse"&\n\x12RemoveAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\x15\n\x13RemoveAgentResponse"\xdd\x01\n\rAgentMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x17\n\x0f\x61gent_image_uri\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x13\n\x0bworkflow_id\x18\x08 \x01(\t"\xa5\x01\n\x13\x43rewAIAgentMetadata\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x11\n\tbackstory\x18\x02 \x01(\t\x12\x0c\n\x04goal\x18\x03 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x04 \x01(\x08\x12\x0f\n\x07verbose\x18\x05 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x06 \x01(\x08\x12\x13\n\x0btemperature\x18\x07 \x01(\x02\x12\x10\n\x08max_iter\x18\x08 \x01(\x05"I\n\x10TestAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x12\n\nuser_input\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t"%\n\x11TestAgentResponse\x12\x10\n\x08response\x18\x01 \x01(\t"\xb8\x02\n\x12\x41\x64\x64WorkflowRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12L\n\x19\x63rew_ai_workflow_metadata\x18\x02 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadataH\x01\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12!\n\x14workflow_template_id\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x05 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x1c\n\x1a_crew_ai_workflow_metadataB\x14\n\x12_is_conversationalB\x17\n\x15_workflow_template_idB\x0e\n\x0c_description"*\n\x13\x41\x64\x64WorkflowResponse\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x16\n\x14ListWorkflowsRequest"B\n\x15ListWorkflowsResponse\x12)\n\tworkflows\x18\x01 \x03(\x0b\x32\x16.agent_studio.Workflow")\n\x12GetWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"?\n\x13GetWorkflowResponse\x12(\n\x08workflow\x18\x01 \x01(\x0b\x32\x16.agent_studio.Workflow"\xb3\x01\n\x15UpdateWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x19\n\x11is_conversational\x18\x04 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t"\x18\n\x16UpdateWorkflowResponse"\xa5\x01\n\x1eTestWorkflowToolUserParameters\x12P\n\nparameters\x18\x01 \x03(\x0b\x32<.agent_studio.TestWorkflowToolUserParameters.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\xf5\x02\n\x13TestWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12=\n\x06inputs\x18\x02 \x03(\x0b\x32-.agent_studio.TestWorkflowRequest.InputsEntry\x12W\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.ToolUserParametersEntry\x12\x19\n\x11generation_config\x18\x04 \x01(\t\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"9\n\x14TestWorkflowResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t"\xc6\x03\n\x15\x44\x65ployWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12]\n\x16\x65nv_variable_overrides\x18\x02 \x03(\x0b\x32=.agent_studio.DeployWorkflowRequest.EnvVariableOverridesEntry\x12Y\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.ToolUserParametersEntry\x12\x1d\n\x15\x62ypass_authentication\x18\x04 \x01(\x08\x12\x19\n\x11generation_config\x18\x05 \x01(\t\x1a;\n\x19\x45nvVariableOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"u\n\x16\x44\x65ployWorkflowResponse\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x02 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x03 \x01(\t"7\n\x17UndeployWorkflowRequest\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t"\x1a\n\x18UndeployWorkflowResponse"\x1e\n\x1cListDeployedWorkflowsRequest"[\n\x1dListDeployedWorkflowsResponse\x12:\n\x12\x64\x65ployed_workflows\x18\x01 \x03(\x0b\x32\x1e.agent_studio.DeployedWorkflow",\n\x15RemoveWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x18\n\x16RemoveWorkflowResponse"\x9a\x02\n\x10\x44\x65ployedWorkflow\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x02 \x01(\t\x12\x15\n\rworkflow_name\x18\x03 \x01(\t\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x04 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x05 \x01(\t\x12\x10\n\x08is_stale\x18\x06 \x01(\x08\x12\x17\n\x0f\x61pplication_url\x18\x07 \x01(\t\x12\x1a\n\x12\x61pplication_status\x18\x08 \x01(\t\x12\x1d\n\x15\x61pplication_deep_link\x18\t \x01(\t\x12\x17\n\x0fmodel_deep_link\x18\n \x01(\t"\x82\x02\n\x08Workflow\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x10\n\x08is_valid\x18\x04 \x01(\x08\x12\x10\n\x08is_ready\x18\x05 \x01(\x08\x12\x19\n\x11is_conversational\x18\x06 \x01(\x08\x12\x10\n\x08is_draft\x18\x07 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\x16\n\tdirectory\x18\t \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_directory"\xb4\x01\n\x16\x43rewAIWorkflowMetadata\x12\x10\n\x08\x61gent_id\x18\x01 \x03(\t\x12\x0f\n\x07task_id\x18\x02 \x03(\t\x12\x18\n\x10manager_agent_id\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12*\n\x1dmanager_llm_model_provider_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42 \n\x1e_manager_llm_model_provider_id"\xa3\x01\n\x0e\x41\x64\x64TaskRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\x18\x61\x64\x64_crew_ai_task_request\x18\x02 \x01(\x0b\x32".agent_studio.AddCrewAITaskRequest\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x18\n\x0btemplate_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_template_id""\n\x0f\x41\x64\x64TaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t"<\n\x10ListTasksRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"D\n\x11ListTasksResponse\x12/\n\x05tasks\x18\x01 \x03(\x0b\x32 .agent_studio.CrewAITaskMetadata"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"A\n\x0fGetTaskResponse\x12.\n\x04task\x18\x01 \x01(\x0b\x32 .agent_studio.CrewAITaskMetadata"l\n\x11UpdateTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x46\n\x17UpdateCrewAITaskRequest\x18\x02 \x01(\x0b\x32%.agent_studio.UpdateCrewAITaskRequest"\x14\n\x12UpdateTaskResponse"$\n\x11RemoveTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\x14\n\x12RemoveTaskResponse"\xa5\x01\n\x12\x43rewAITaskMetadata\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x04 \x01(\t\x12\x10\n\x08is_valid\x18\x05 \x01(\x08\x12\x0e\n\x06inputs\x18\x06 \x03(\t\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t"b\n\x17UpdateCrewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"_\n\x14\x41\x64\x64\x43rewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"-\n\x13GetAssetDataRequest\x12\x16\n\x0e\x61sset_uri_list\x18\x01 \x03(\t"\xab\x01\n\x14GetAssetDataResponse\x12\x45\n\nasset_data\x18\x01 \x03(\x0b\x32\x31.agent_studio.GetAssetDataResponse.AssetDataEntry\x12\x1a\n\x12unavailable_assets\x18\x02 \x03(\t\x1a\x30\n\x0e\x41ssetDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01"F\n\tFileChunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x15\n\ris_last_chunk\x18\x03 \x01(\x08"Q\n&NonStreamingTemporaryFileUploadRequest\x12\x14\n\x0c\x66ull_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t"8\n\x12\x46ileUploadResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t"1\n\x1c\x44ownloadTemporaryFileRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t" \n\x1eGetParentProjectDetailsRequest"T\n\x1fGetParentProjectDetailsResponse\x12\x14\n\x0cproject_base\x18\x01 \x01(\t\x12\x1b\n\x13studio_subdirectory\x18\x02 \x01(\t"W\n\x19ListAgentTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"Z\n\x1aListAgentTemplatesResponse\x12<\n\x0f\x61gent_templates\x18\x01 \x03(\x0b\x32#.agent_studio.AgentTemplateMetadata"%\n\x17GetAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"W\n\x18GetAgentTemplateResponse\x12;\n\x0e\x61gent_template\x18\x01 \x01(\x0b\x32#.agent_studio.AgentTemplateMetadata"\xc1\x02\n\x17\x41\x64\x64\x41gentTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x03 \x03(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x11\n\tbackstory\x18\x05 \x01(\t\x12\x0c\n\x04goal\x18\x06 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x07 \x01(\x08\x12\x0f\n\x07verbose\x18\x08 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\t \x01(\x08\x12\x13\n\x0btemperature\x18\n \x01(\x02\x12\x10\n\x08max_iter\x18\x0b \x01(\x05\x12\x1c\n\x14tmp_agent_image_path\x18\x0c \x01(\t\x12!\n\x14workflow_template_id\x18\r \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"&\n\x18\x41\x64\x64\x41gentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xf4\x03\n\x1aUpdateAgentTemplateRequest\x12\x19\n\x11\x61gent_template_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x11\n\x04role\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x16\n\tbackstory\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04goal\x18\x07 \x01(\tH\x04\x88\x01\x01\x12\x1d\n\x10\x61llow_delegation\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x14\n\x07verbose\x18\t \x01(\x08H\x06\x88\x01\x01\x12\x12\n\x05\x63\x61\x63he\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x18\n\x0btemperature\x18\x0b \x01(\x02H\x08\x88\x01\x01\x12\x15\n\x08max_iter\x18\x0c \x01(\x05H\t\x88\x01\x01\x12!\n\x14tmp_agent_image_path\x18\r \x01(\tH\n\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\x07\n\x05_roleB\x0c\n\n_backstoryB\x07\n\x05_goalB\x13\n\x11_allow_delegationB\n\n\x08_verboseB\x08\n\x06_cacheB\x0e\n\x0c_temperatureB\x0b\n\t_max_iterB\x17\n\x15_tmp_agent_image_path")\n\x1bUpdateAgentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"(\n\x1aRemoveAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1d\n\x1bRemoveAgentTemplateResponse"\xdc\x02\n\x15\x41gentTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x0c\n\x04role\x18\x05 \x01(\t\x12\x11\n\tbackstory\x18\x06 \x01(\t\x12\x0c\n\x04goal\x18\x07 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x08 \x01(\x08\x12\x0f\n\x07verbose\x18\t \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\n \x01(\x08\x12\x13\n\x0btemperature\x18\x0b \x01(\x02\x12\x10\n\x08max_iter\x18\x0c \x01(\x05\x12\x17\n\x0f\x61gent_image_uri\x18\r \x01(\t\x12!\n\x14workflow_template_id\x18\x0e \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cpre_packaged\x18\x0f \x01(\x08\x42\x17\n\x15_workflow_template_id"\x1e\n\x1cListWorkflowTemplatesRequest"c\n\x1dListWorkflowTemplatesResponse\x12\x42\n\x12workflow_templates\x18\x01 \x03(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"(\n\x1aGetWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"`\n\x1bGetWorkflowTemplateResponse\x12\x41\n\x11workflow_template\x18\x01 \x01(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"\x9b\x03\n\x1a\x41\x64\x64WorkflowTemplateRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07process\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x1a\n\x12\x61gent_template_ids\x18\x04 \x03(\t\x12\x19\n\x11task_template_ids\x18\x05 \x03(\t\x12&\n\x19manager_agent_template_id\x18\x06 \x01(\tH\x03\x88\x01\x01\x12 \n\x13use_default_manager\x18\x07 \x01(\x08H\x04\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x18\n\x0bworkflow_id\x18\t \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\n\n\x08_processB\x1c\n\x1a_manager_agent_template_idB\x16\n\x14_use_default_managerB\x14\n\x12_is_conversationalB\x0e\n\x0c_workflow_id")\n\x1b\x41\x64\x64WorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"+\n\x1dRemoveWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t" \n\x1eRemoveWorkflowTemplateResponse"\x82\x02\n\x18WorkflowTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12\x1a\n\x12\x61gent_template_ids\x18\x05 \x03(\t\x12\x19\n\x11task_template_ids\x18\x06 \x03(\t\x12!\n\x19manager_agent_template_id\x18\x07 \x01(\t\x12\x1b\n\x13use_default_manager\x18\x08 \x01(\x08\x12\x19\n\x11is_conversational\x18\t \x01(\x08\x12\x14\n\x0cpre_packaged\x18\n \x01(\x08"+\n\x1d\x45xportWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"3\n\x1e\x45xportWorkflowTemplateResponse\x12\x11\n\tfile_path\x18\x01 \x01(\t"2\n\x1dImportWorkflowTemplateRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t",\n\x1eImportWorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"V\n\x18ListTaskTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"W\n\x19ListTaskTemplatesResponse\x12:\n\x0etask_templates\x18\x01 \x03(\x0b\x32".agent_studio.TaskTemplateMetadata"$\n\x16GetTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"T\n\x17GetTaskTemplateResponse\x12\x39\n\rtask_template\x18\x01 \x01(\x0b\x32".agent_studio.TaskTemplateMetadata"\xb4\x01\n\x16\x41\x64\x64TaskTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x04 \x01(\t\x12!\n\x14workflow_template_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"%\n\x17\x41\x64\x64TaskTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\'\n\x19RemoveTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1c\n\x1aRemoveTaskTemplateResponse"\xbe\x01\n\x14TaskTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x04 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"!\n\x1f\x43heckStudioUpgradeStatusRequest"Q\n CheckStudioUpgradeStatusResponse\x12\x15\n\rlocal_version\x18\x01 \x01(\t\x12\x16\n\x0enewest_version\x18\x02 \x01(\t"\x16\n\x14UpgradeStudioRequest"\x17\n\x15UpgradeStudioResponse"\x14\n\x12HealthCheckRequest"&\n\x13HealthCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t2\xc9.\n\x0b\x41gentStudio\x12Q\n\nListModels\x12\x1f.agent_studio.ListModelsRequest\x1a .agent_studio.ListModelsResponse"\x00\x12K\n\x08GetModel\x12\x1d.agent_studio.GetModelRequest\x1a\x1e.agent_studio.GetModelResponse"\x00\x12K\n\x08\x41\x64\x64Model\x12\x1d.agent_studio.AddModelRequest\x1a\x1e.agent_studio.AddModelResponse"\x00\x12T\n\x0bRemoveModel\x12 .agent_studio.RemoveModelRequest\x1a!.agent_studio.RemoveModelResponse"\x00\x12T\n\x0bUpdateModel\x12 .agent_studio.UpdateModelRequest\x1a!.agent_studio.UpdateModelResponse"\x00\x12N\n\tTestModel\x12\x1e.agent_studio.TestModelRequest\x1a\x1f.agent_studio.TestModelResponse"\x00\x12r\n\x15SetStudioDefaultModel\x12*.agent_studio.SetStudioDefaultModelRequest\x1a+.agent_studio.SetStudioDefaultModelResponse"\x00\x12r\n\x15GetStudioDefaultModel\x12*.agent_studio.GetStudioDefaultModelRequest\x1a+.agent_studio.GetStudioDefaultModelResponse"\x00\x12\x66\n\x11ListToolTemplates\x12&.agent_studio.ListToolTemplatesRequest\x1a\'.agent_studio.ListToolTemplatesResponse"\x00\x12`\n\x0fGetToolTemplate\x12$.agent_studio.GetToolTemplateRequest\x1a%.agent_studio.GetToolTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64ToolTemplate\x12$.agent_studio.AddToolTemplateRequest\x1a%.agent_studio.AddToolTemplateResponse"\x00\x12i\n\x12UpdateToolTemplate\x12\'.agent_studio.UpdateToolTemplateRequest\x1a(.agent_studio.UpdateToolTemplateResponse"\x00\x12i\n\x12RemoveToolTemplate\x12\'.agent_studio.RemoveToolTemplateRequest\x1a(.agent_studio.RemoveToolTemplateResponse"\x00\x12\x66\n\x11ListToolInstances\x12&.agent_studio.ListToolInstancesRequest\x1a\'.agent_studio.ListToolInstancesResponse"\x00\x12`\n\x0fGetToolInstance\x12$.agent_studio.GetToolInstanceRequest\x1a%.agent_studio.GetToolInstanceResponse"\x00\x12i\n\x12\x43reateToolInstance\x12\'.agent_studio.CreateToolInstanceRequest\x1a(.agent_studio.CreateToolInstanceResponse"\x00\x12i\n\x12UpdateToolInstance\x12\'.agent_studio.UpdateToolInstanceRequest\x1a(.agent_studio.UpdateToolInstanceResponse"\x00\x12i\n\x12RemoveToolInstance\x12\'.agent_studio.RemoveToolInstanceRequest\x1a(.agent_studio.RemoveToolInstanceResponse"\x00\x12Q\n\nListAgents\x12\x1f.agent_studio.ListAgentsRequest\x1a .agent_studio.ListAgentsResponse"\x00\x12K\n\x08GetAgent\x12\x1d.agent_studio.GetAgentRequest\x1a\x1e.agent_studio.GetAgentResponse"\x00\x12K\n\x08\x41\x64\x64\x41gent\x12\x1d.agent_studio.AddAgentRequest\x1a\x1e.agent_studio.AddAgentResponse"\x00\x12T\n\x0bUpdateAgent\x12 .agent_studio.UpdateAgentRequest\x1a!.agent_studio.UpdateAgentResponse"\x00\x12T\n\x0bRemoveAgent\x12 .agent_studio.RemoveAgentRequest\x1a!.agent_studio.RemoveAgentResponse"\x00\x12N\n\tTestAgent\x12\x1e.agent_studio.TestAgentRequest\x1a\x1f.agent_studio.TestAgentResponse"\x00\x12H\n\x07\x41\x64\x64Task\x12\x1c.agent_studio.AddTaskRequest\x1a\x1d.agent_studio.AddTaskResponse"\x00\x12N\n\tListTasks\x12\x1e.agent_studio.ListTasksRequest\x1a\x1f.agent_studio.ListTasksResponse"\x00\x12H\n\x07GetTask\x12\x1c.agent_studio.GetTaskRequest\x1a\x1d.agent_studio.GetTaskResponse"\x00\x12Q\n\nUpdateTask\x12\x1f.agent_studio.UpdateTaskRequest\x1a .agent_studio.UpdateTaskResponse"\x00\x12Q\n\nRemoveTask\x12\x1f.agent_studio.RemoveTaskRequest\x1a .agent_studio.RemoveTaskResponse"\x00\x12Z\n\rListWorkflows\x12".agent_studio.ListWorkflowsRequest\x1a#.agent_studio.ListWorkflowsResponse"\x00\x12T\n\x0bGetWorkflow\x12 .agent_studio.GetWorkflowRequest\x1a!.agent_studio.GetWorkflowResponse"\x00\x12T\n\x0b\x41\x64\x64Workflow\x12 .agent_studio.AddWorkflowRequest\x1a!.agent_studio.AddWorkflowResponse"\x00\x12]\n\x0eUpdateWorkflow\x12#.agent_studio.UpdateWorkflowRequest\x1a$.agent_studio.UpdateWorkflowResponse"\x00\x12W\n\x0cTestWorkflow\x12!.agent_studio.TestWorkflowRequest\x1a".agent_studio.TestWorkflowResponse"\x00\x12]\n\x0eRemoveWorkflow\x12#.agent_studio.RemoveWorkflowRequest\x1a$.agent_studio.RemoveWorkflowResponse"\x00\x12]\n\x0e\x44\x65ployWorkflow\x12#.agent_studio.DeployWorkflowRequest\x1a$.agent_studio.DeployWorkflowResponse"\x00\x12\x63\n\x10UndeployWorkflow\x12%.agent_studio.UndeployWorkflowRequest\x1a&.agent_studio.UndeployWorkflowResponse"\x00\x12r\n\x15ListDeployedWorkflows\x12*.agent_studio.ListDeployedWorkflowsRequest\x1a+.agent_studio.ListDeployedWorkflowsResponse"\x00\x12T\n\x13TemporaryFileUpload\x12\x17.agent_studio.FileChunk\x1a .agent_studio.FileUploadResponse"\x00(\x01\x12{\n\x1fNonStreamingTemporaryFileUpload\x12\x34.agent_studio.NonStreamingTemporaryFileUploadRequest\x1a .agent_studio.FileUploadResponse"\x00\x12`\n\x15\x44ownloadTemporaryFile\x12*.agent_studio.DownloadTemporaryFileRequest\x1a\x17.agent_studio.FileChunk"\x00\x30\x01\x12W\n\x0cGetAssetData\x12!.agent_studio.GetAssetDataRequest\x1a".agent_studio.GetAssetDataResponse"\x00\x12x\n\x17GetParentProjectDetails\x12,.agent_studio.GetParentProjectDetailsRequest\x1a-.agent_studio.GetParentProjectDetailsResponse"\x00\x12{\n\x18\x43heckStudioUpgradeStatus\x12-.agent_studio.CheckStudioUpgradeStatusRequest\x1a..agent_studio.CheckStudioUpgradeStatusResponse"\x00\x12Z\n\rUpgradeStudio\x12".agent_studio.UpgradeStudioRequest\x1a#.agent_studio.UpgradeStudioResponse"\x00\x12T\n\x0bHealthCheck\x12 .agent_studio.HealthCheckRequest\x1a!.agent_studio.HealthCheckResponse"\x00\x12i\n\x12ListAgentTemplates\x12\'.agent_studio.ListAgentTemplatesRequest\x1a(.agent_studio.ListAgentTemplatesResponse"\x00\x12\x63\n\x10GetAgentTemplate\x12%.agent_studio.GetAgentTemplateRequest\x1a&.agent_studio.GetAgentTemplateResponse"\x00\x12\x63\n\x10\x41\x64\x64\x41gentTemplate\x12%.agent_studio.AddAgentTemplateRequest\x1a&.agent_studio.AddAgentTemplateResponse"\x00\x12l\n\x13UpdateAgentTemplate\x12(.agent_studio.UpdateAgentTemplateRequest\x1a).agent_studio.UpdateAgentTemplateResponse"\x00\x12l\n\x13RemoveAgentTemplate\x12(.agent_studio.RemoveAgentTemplateRequest\x1a).agent_studio.RemoveAgentTemplateResponse"\x00\x12r\n\x15ListWorkflowTemplates\x12*.agent_studio.ListWorkflowTemplatesRequest\x1a+.agent_studio.ListWorkflowTemplatesResponse"\x00\x12l\n\x13GetWorkflowTemplate\x12(.agent_studio.GetWorkflowTemplateRequest\x1a).agent_studio.GetWorkflowTemplateResponse"\x00\x12l\n\x13\x41\x64\x64WorkflowTemplate\x12(.agent_studio.AddWorkflowTemplateRequest\x1a).agent_studio.AddWorkflowTemplateResponse"\x00\x12u\n\x16RemoveWorkflowTemplate\x12+.agent_studio.RemoveWorkflowTemplateRequest\x1a,.agent_studio.RemoveWorkflowTemplateResponse"\x00\x12u\n\x16\x45xportWorkflowTemplate\x12+.agent_studio.ExportWorkflowTemplateRequest\x1a,.agent_studio.ExportWorkflowTemplateResponse"\x00\x12u\n\x16ImportWorkflowTemplate\x12+.agent_studio.ImportWorkflowTemplateRequest\x1a,.agent_studio.ImportWorkflowTemplateResponse"\x00\x12\x66\n\x11ListTaskTemplates\x12&.agent_studio.ListTaskTemplatesRequest\x1a\'.agent_studio.ListTaskTemplatesResponse"\x00\x12`\n\x0fGetTaskTemplate\x12$.agent_studio.GetTaskTemplateRequest\x1a%.agent_studio.GetTaskTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64TaskTemplate\x12$.agent_studio.AddTaskTemplateRequest\x1a%.agent_studio.AddTaskTemplateResponse"\x00\x12i\n\x12RemoveTaskTemplate\x12\'.agent_studio.RemoveTaskTemplateRequest\x1a(.agent_studio.RemoveTaskTemplateResponse"\x00\x62\x06proto3'
+    b'\n\x1fstudio/proto/agent_studio.proto\x12\x0c\x61gent_studio"\x86\x01\n\x05Model\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x12\n\nmodel_type\x18\x04 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x05 \x01(\t\x12\x19\n\x11is_studio_default\x18\x06 \x01(\x08"\x13\n\x11ListModelsRequest"@\n\x12ListModelsResponse\x12*\n\rmodel_details\x18\x01 \x03(\x0b\x32\x13.agent_studio.Model"#\n\x0fGetModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t">\n\x10GetModelResponse\x12*\n\rmodel_details\x18\x01 \x01(\x0b\x32\x13.agent_studio.Model"t\n\x0f\x41\x64\x64ModelRequest\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x16\n\x0eprovider_model\x18\x02 \x01(\t\x12\x12\n\nmodel_type\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"$\n\x10\x41\x64\x64ModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"&\n\x12RemoveModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x15\n\x13RemoveModelResponse"u\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"\'\n\x13UpdateModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x93\x01\n\x10TestModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ompletion_role\x18\x02 \x01(\t\x12\x1a\n\x12\x63ompletion_content\x18\x03 \x01(\t\x12\x13\n\x0btemperature\x18\x04 \x01(\x02\x12\x12\n\nmax_tokens\x18\x05 \x01(\x05\x12\x0f\n\x07timeout\x18\x06 \x01(\x05"%\n\x11TestModelResponse\x12\x10\n\x08response\x18\x01 \x01(\t"0\n\x1cSetStudioDefaultModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x1f\n\x1dSetStudioDefaultModelResponse"\x1e\n\x1cGetStudioDefaultModelRequest"p\n\x1dGetStudioDefaultModelResponse\x12#\n\x1bis_default_model_configured\x18\x01 \x01(\x08\x12*\n\rmodel_details\x18\x02 \x01(\x0b\x32\x13.agent_studio.Model"\x9a\x01\n\x18ListToolTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x0b\n\x03ids\x18\x04 \x03(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\tB\x17\n\x15_workflow_template_id"c\n\x19ListToolTemplatesResponse\x12-\n\ttemplates\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolTemplate\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"2\n\x16GetToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"G\n\x17GetToolTemplateResponse\x12,\n\x08template\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolTemplate"\x8d\x01\n\x16\x41\x64\x64ToolTemplateRequest\x12\x1a\n\x12tool_template_name\x18\x01 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x02 \x01(\t\x12!\n\x14workflow_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"3\n\x17\x41\x64\x64ToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"n\n\x19UpdateToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t\x12\x1a\n\x12tool_template_name\x18\x02 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x03 \x01(\t"6\n\x1aUpdateToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"5\n\x19RemoveToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolTemplateResponse"s\n\x18ListToolInstancesRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x0b\n\x03ids\x18\x04 \x03(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t"h\n\x19ListToolInstancesResponse\x12\x32\n\x0etool_instances\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolInstance\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"2\n\x16GetToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"L\n\x17GetToolInstanceResponse\x12\x31\n\rtool_instance\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolInstance"r\n\x19\x43reateToolInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x10tool_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x13\n\x11_tool_template_id"R\n\x1a\x43reateToolInstanceResponse\x12\x1a\n\x12tool_instance_name\x18\x01 \x01(\t\x12\x18\n\x10tool_instance_id\x18\x02 \x01(\t"u\n\x19UpdateToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x04 \x01(\t"6\n\x1aUpdateToolInstanceResponse\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"5\n\x19RemoveToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolInstanceResponse"\xb6\x02\n\x0cToolTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bpython_code\x18\x03 \x01(\t\x12\x1b\n\x13python_requirements\x18\x04 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x05 \x01(\t\x12\x15\n\rtool_metadata\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x11\n\tpre_built\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12!\n\x14workflow_template_id\x18\x0b \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cis_venv_tool\x18\x0c \x01(\x08\x42\x17\n\x15_workflow_template_id"\xfc\x01\n\x0cToolInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x13\n\x0bpython_code\x18\x04 \x01(\t\x12\x1b\n\x13python_requirements\x18\x05 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x06 \x01(\t\x12\x15\n\rtool_metadata\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12\x14\n\x0cis_venv_tool\x18\x0b \x01(\x08"l\n\x11ListAgentsRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x0b\n\x03ids\x18\x04 \x03(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t"Z\n\x12ListAgentsResponse\x12+\n\x06\x61gents\x18\x01 \x03(\x0b\x32\x1b.agent_studio.AgentMetadata\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"#\n\x0fGetAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t">\n\x10GetAgentResponse\x12*\n\x05\x61gent\x18\x01 \x01(\x0b\x32\x1b.agent_studio.AgentMetadata"\x8b\x02\n\x0f\x41\x64\x64\x41gentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x02 \x01(\t\x12\x10\n\x08tools_id\x18\x03 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x04 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x18\n\x0btemplate_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x0bworkflow_id\x18\x06 \x01(\t\x12\x1c\n\x14tmp_agent_image_path\x18\x07 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x08 \x03(\tB\x0e\n\x0c_template_id"$\n\x10\x41\x64\x64\x41gentResponse\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\xe1\x01\n\x12UpdateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x1c\n\x14tmp_agent_image_path\x18\x06 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x07 \x03(\t"\x15\n\x13UpdateAgentResponse"&\n\x12RemoveAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\x15\n\x13RemoveAgentResponse"\xdd\x01\n\rAgentMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x17\n\x0f\x61gent_image_uri\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x13\n\x0bworkflow_id\x18\x08 \x01(\t"\xa5\x01\n\x13\x43rewAIAgentMetadata\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x11\n\tbackstory\x18\x02 \x01(\t\x12\x0c\n\x04goal\x18\x03 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x04 \x01(\x08\x12\x0f\n\x07verbose\x18\x05 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x06 \x01(\x08\x12\x13\n\x0btemperature\x18\x07 \x01(\x02\x12\x10\n\x08max_iter\x18\x08 \x01(\x05"I\n\x10TestAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x12\n\nuser_input\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t"%\n\x11TestAgentResponse\x12\x10\n\x08response\x18\x01 \x01(\t"\xb8\x02\n\x12\x41\x64\x64WorkflowRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12L\n\x19\x63rew_ai_workflow_metadata\x18\x02 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadataH\x01\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12!\n\x14workflow_template_id\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x05 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x1c\n\x1a_crew_ai_workflow_metadataB\x14\n\x12_is_conversationalB\x17\n\x15_workflow_template_idB\x0e\n\x0c_description"*\n\x13\x41\x64\x64WorkflowResponse\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"Z\n\x14ListWorkflowsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x0b\n\x03ids\x18\x03 \x03(\t\x12\x0e\n\x06\x66ields\x18\x04 \x03(\t"[\n\x15ListWorkflowsResponse\x12)\n\tworkflows\x18\x01 \x03(\x0b\x32\x16.agent_studio.Workflow\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t")\n\x12GetWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"?\n\x13GetWorkflowResponse\x12(\n\x08workflow\x18\x01 \x01(\x0b\x32\x16.agent_studio.Workflow"\xb3\x01\n\x15UpdateWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x19\n\x11is_conversational\x18\x04 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t"\x18\n\x16UpdateWorkflowResponse"\xa5\x01\n\x1eTestWorkflowToolUserParameters\x12P\n\nparameters\x18\x01 \x03(\x0b\x32<.agent_studio.TestWorkflowToolUserParameters.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\xf5\x02\n\x13TestWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12=\n\x06inputs\x18\x02 \x03(\x0b\x32-.agent_studio.TestWorkflowRequest.InputsEntry\x12W\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.ToolUserParametersEntry\x12\x19\n\x11generation_config\x18\x04 \x01(\t\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"Q\n\x14TestWorkflowResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t\x12\x16\n\x0equeue_position\x18\x03 \x01(\x05"\xc6\x03\n\x15\x44\x65ployWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12]\n\x16\x65nv_variable_overrides\x18\x02 \x03(\x0b\x32=.agent_studio.DeployWorkflowRequest.EnvVariableOverridesEntry\x12Y\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.ToolUserParametersEntry\x12\x1d\n\x15\x62ypass_authentication\x18\x04 \x01(\x08\x12\x19\n\x11generation_config\x18\x05 \x01(\t\x1a;\n\x19\x45nvVariableOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"u\n\x16\x44\x65ployWorkflowResponse\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x02 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x03 \x01(\t"7\n\x17UndeployWorkflowRequest\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t"\x1a\n\x18UndeployWorkflowResponse"\x1e\n\x1cListDeployedWorkflowsRequest"[\n\x1dListDeployedWorkflowsResponse\x12:\n\x12\x64\x65ployed_workflows\x18\x01 \x03(\x0b\x32\x1e.agent_studio.DeployedWorkflow",\n\x15RemoveWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x18\n\x16RemoveWorkflowResponse"\xae\x02\n\x10\x44\x65ployedWorkflow\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x02 \x01(\t\x12\x15\n\rworkflow_name\x18\x03 \x01(\t\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x04 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x05 \x01(\t\x12\x10\n\x08is_stale\x18\x06 \x01(\x08\x12\x17\n\x0f\x61pplication_url\x18\x07 \x01(\t\x12\x1a\n\x12\x61pplication_status\x18\x08 \x01(\t\x12\x1d\n\x15\x61pplication_deep_link\x18\t \x01(\t\x12\x17\n\x0fmodel_deep_link\x18\n \x01(\t\x12\x12\n\nstatus_age\x18\x0b \x01(\x05"\x82\x02\n\x08Workflow\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x10\n\x08is_valid\x18\x04 \x01(\x08\x12\x10\n\x08is_ready\x18\x05 \x01(\x08\x12\x19\n\x11is_conversational\x18\x06 \x01(\x08\x12\x10\n\x08is_draft\x18\x07 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\x16\n\tdirectory\x18\t \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_directory"\xb4\x01\n\x16\x43rewAIWorkflowMetadata\x12\x10\n\x08\x61gent_id\x18\x01 \x03(\t\x12\x0f\n\x07task_id\x18\x02 \x03(\t\x12\x18\n\x10manager_agent_id\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12*\n\x1dmanager_llm_model_provider_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42 \n\x1e_manager_llm_model_provider_id"\xa3\x01\n\x0e\x41\x64\x64TaskRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\x18\x61\x64\x64_crew_ai_task_request\x18\x02 \x01(\x0b\x32".agent_studio.AddCrewAITaskRequest\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x18\n\x0btemplate_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_template_id""\n\x0f\x41\x64\x64TaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t"k\n\x10ListTasksRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x0b\n\x03ids\x18\x04 \x03(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\t"]\n\x11ListTasksResponse\x12/\n\x05tasks\x18\x01 \x03(\x0b\x32 .agent_studio.CrewAITaskMetadata\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"A\n\x0fGetTaskResponse\x12.\n\x04task\x18\x01 \x01(\x0b\x32 .agent_studio.CrewAITaskMetadata"l\n\x11UpdateTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x46\n\x17UpdateCrewAITaskRequest\x18\x02 \x01(\x0b\x32%.agent_studio.UpdateCrewAITaskRequest"\x14\n\x12UpdateTaskResponse"$\n\x11RemoveTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\x14\n\x12RemoveTaskResponse"\xa5\x01\n\x12\x43rewAITaskMetadata\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x04 \x01(\t\x12\x10\n\x08is_valid\x18\x05 \x01(\x08\x12\x0e\n\x06inputs\x18\x06 \x03(\t\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t"b\n\x17UpdateCrewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"_\n\x14\x41\x64\x64\x43rewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"-\n\x13GetAssetDataRequest\x12\x16\n\x0e\x61sset_uri_list\x18\x01 \x03(\t"\xab\x01\n\x14GetAssetDataResponse\x12\x45\n\nasset_data\x18\x01 \x03(\x0b\x32\x31.agent_studio.GetAssetDataResponse.AssetDataEntry\x12\x1a\n\x12unavailable_assets\x18\x02 \x03(\t\x1a\x30\n\x0e\x41ssetDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01"F\n\tFileChunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x15\n\ris_last_chunk\x18\x03 \x01(\x08"Q\n&NonStreamingTemporaryFileUploadRequest\x12\x14\n\x0c\x66ull_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t"8\n\x12\x46ileUploadResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t"1\n\x1c\x44ownloadTemporaryFileRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t" \n\x1eGetParentProjectDetailsRequest"T\n\x1fGetParentProjectDetailsResponse\x12\x14\n\x0cproject_base\x18\x01 \x01(\t\x12\x1b\n\x13studio_subdirectory\x18\x02 \x01(\t"\x9b\x01\n\x19ListAgentTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x0b\n\x03ids\x18\x04 \x03(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\tB\x17\n\x15_workflow_template_id"s\n\x1aListAgentTemplatesResponse\x12<\n\x0f\x61gent_templates\x18\x01 \x03(\x0b\x32#.agent_studio.AgentTemplateMetadata\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"%\n\x17GetAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"W\n\x18GetAgentTemplateResponse\x12;\n\x0e\x61gent_template\x18\x01 \x01(\x0b\x32#.agent_studio.AgentTemplateMetadata"\xc1\x02\n\x17\x41\x64\x64\x41gentTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x03 \x03(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x11\n\tbackstory\x18\x05 \x01(\t\x12\x0c\n\x04goal\x18\x06 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x07 \x01(\x08\x12\x0f\n\x07verbose\x18\x08 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\t \x01(\x08\x12\x13\n\x0btemperature\x18\n \x01(\x02\x12\x10\n\x08max_iter\x18\x0b \x01(\x05\x12\x1c\n\x14tmp_agent_image_path\x18\x0c \x01(\t\x12!\n\x14workflow_template_id\x18\r \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"&\n\x18\x41\x64\x64\x41gentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xf4\x03\n\x1aUpdateAgentTemplateRequest\x12\x19\n\x11\x61gent_template_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x11\n\x04role\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x16\n\tbackstory\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04goal\x18\x07 \x01(\tH\x04\x88\x01\x01\x12\x1d\n\x10\x61llow_delegation\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x14\n\x07verbose\x18\t \x01(\x08H\x06\x88\x01\x01\x12\x12\n\x05\x63\x61\x63he\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x18\n\x0btemperature\x18\x0b \x01(\x02H\x08\x88\x01\x01\x12\x15\n\x08max_iter\x18\x0c \x01(\x05H\t\x88\x01\x01\x12!\n\x14tmp_agent_image_path\x18\r \x01(\tH\n\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\x07\n\x05_roleB\x0c\n\n_backstoryB\x07\n\x05_goalB\x13\n\x11_allow_delegationB\n\n\x08_verboseB\x08\n\x06_cacheB\x0e\n\x0c_temperatureB\x0b\n\t_max_iterB\x17\n\x15_tmp_agent_image_path")\n\x1bUpdateAgentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"(\n\x1aRemoveAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1d\n\x1bRemoveAgentTemplateResponse"\xdc\x02\n\x15\x41gentTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x0c\n\x04role\x18\x05 \x01(\t\x12\x11\n\tbackstory\x18\x06 \x01(\t\x12\x0c\n\x04goal\x18\x07 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x08 \x01(\x08\x12\x0f\n\x07verbose\x18\t \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\n \x01(\x08\x12\x13\n\x0btemperature\x18\x0b \x01(\x02\x12\x10\n\x08max_iter\x18\x0c \x01(\x05\x12\x17\n\x0f\x61gent_image_uri\x18\r \x01(\t\x12!\n\x14workflow_template_id\x18\x0e \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cpre_packaged\x18\x0f \x01(\x08\x42\x17\n\x15_workflow_template_id"b\n\x1cListWorkflowTemplatesRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x0b\n\x03ids\x18\x03 \x03(\t\x12\x0e\n\x06\x66ields\x18\x04 \x03(\t"|\n\x1dListWorkflowTemplatesResponse\x12\x42\n\x12workflow_templates\x18\x01 \x03(\x0b\x32&.agent_studio.WorkflowTemplateMetadata\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"(\n\x1aGetWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"`\n\x1bGetWorkflowTemplateResponse\x12\x41\n\x11workflow_template\x18\x01 \x01(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"\x9b\x03\n\x1a\x41\x64\x64WorkflowTemplateRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07process\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x1a\n\x12\x61gent_template_ids\x18\x04 \x03(\t\x12\x19\n\x11task_template_ids\x18\x05 \x03(\t\x12&\n\x19manager_agent_template_id\x18\x06 \x01(\tH\x03\x88\x01\x01\x12 \n\x13use_default_manager\x18\x07 \x01(\x08H\x04\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x18\n\x0bworkflow_id\x18\t \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\n\n\x08_processB\x1c\n\x1a_manager_agent_template_idB\x16\n\x14_use_default_managerB\x14\n\x12_is_conversationalB\x0e\n\x0c_workflow_id")\n\x1b\x41\x64\x64WorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"+\n\x1dRemoveWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t" \n\x1eRemoveWorkflowTemplateResponse"\x82\x02\n\x18WorkflowTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12\x1a\n\x12\x61gent_template_ids\x18\x05 \x03(\t\x12\x19\n\x11task_template_ids\x18\x06 \x03(\t\x12!\n\x19manager_agent_template_id\x18\x07 \x01(\t\x12\x1b\n\x13use_default_manager\x18\x08 \x01(\x08\x12\x19\n\x11is_conversational\x18\t \x01(\x08\x12\x14\n\x0cpre_packaged\x18\n \x01(\x08"+\n\x1d\x45xportWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"3\n\x1e\x45xportWorkflowTemplateResponse\x12\x11\n\tfile_path\x18\x01 \x01(\t"2\n\x1dImportWorkflowTemplateRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t",\n\x1eImportWorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\x9a\x01\n\x18ListTaskTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x0b\n\x03ids\x18\x04 \x03(\t\x12\x0e\n\x06\x66ields\x18\x05 \x03(\tB\x17\n\x15_workflow_template_id"p\n\x19ListTaskTemplatesResponse\x12:\n\x0etask_templates\x18\x01 \x03(\x0b\x32".agent_studio.TaskTemplateMetadata\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"$\n\x16GetTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"T\n\x17GetTaskTemplateResponse\x12\x39\n\rtask_template\x18\x01 \x01(\x0b\x32".agent_studio.TaskTemplateMetadata"\xb4\x01\n\x16\x41\x64\x64TaskTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x04 \x01(\t\x12!\n\x14workflow_template_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"%\n\x17\x41\x64\x64TaskTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\'\n\x19RemoveTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1c\n\x1aRemoveTaskTemplateResponse"\xbe\x01\n\x14TaskTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x04 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"!\n\x1f\x43heckStudioUpgradeStatusRequest"Q\n CheckStudioUpgradeStatusResponse\x12\x15\n\rlocal_version\x18\x01 \x01(\t\x12\x16\n\x0enewest_version\x18\x02 \x01(\t"\x16\n\x14UpgradeStudioRequest"\x17\n\x15UpgradeStudioResponse"\x14\n\x12HealthCheckRequest"&\n\x13HealthCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\x14\n\x12\x43mlApiCheckRequest"&\n\x13\x43mlApiCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"\x15\n\x13RotateCmlApiRequest"\'\n\x14RotateCmlApiResponse\x12\x0f\n\x07message\x18\x01 \x01(\t2\xf8/\n\x0b\x41gentStudio\x12Q\n\nListModels\x12\x1f.agent_studio.ListModelsRequest\x1a .agent_studio.ListModelsResponse"\x00\x12K\n\x08GetModel\x12\x1d.agent_studio.GetModelRequest\x1a\x1e.agent_studio.GetModelResponse"\x00\x12K\n\x08\x41\x64\x64Model\x12\x1d.agent_studio.AddModelRequest\x1a\x1e.agent_studio.AddModelResponse"\x00\x12T\n\x0bRemoveModel\x12 .agent_studio.RemoveModelRequest\x1a!.agent_studio.RemoveModelResponse"\x00\x12T\n\x0bUpdateModel\x12 .agent_studio.UpdateModelRequest\x1a!.agent_studio.UpdateModelResponse"\x00\x12N\n\tTestModel\x12\x1e.agent_studio.TestModelRequest\x1a\x1f.agent_studio.TestModelResponse"\x00\x12r\n\x15SetStudioDefaultModel\x12*.agent_studio.SetStudioDefaultModelRequest\x1a+.agent_studio.SetStudioDefaultModelResponse"\x00\x12r\n\x15GetStudioDefaultModel\x12*.agent_studio.GetStudioDefaultModelRequest\x1a+.agent_studio.GetStudioDefaultModelResponse"\x00\x12\x66\n\x11ListToolTemplates\x12&.agent_studio.ListToolTemplatesRequest\x1a\'.agent_studio.ListToolTemplatesResponse"\x00\x12`\n\x0fGetToolTemplate\x12$.agent_studio.GetToolTemplateRequest\x1a%.agent_studio.GetToolTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64ToolTemplate\x12$.agent_studio.AddToolTemplateRequest\x1a%.agent_studio.AddToolTemplateResponse"\x00\x12i\n\x12UpdateToolTemplate\x12\'.agent_studio.UpdateToolTemplateRequest\x1a(.agent_studio.UpdateToolTemplateResponse"\x00\x12i\n\x12RemoveToolTemplate\x12\'.agent_studio.RemoveToolTemplateRequest\x1a(.agent_studio.RemoveToolTemplateResponse"\x00\x12\x66\n\x11ListToolInstances\x12&.agent_studio.ListToolInstancesRequest\x1a\'.agent_studio.ListToolInstancesResponse"\x00\x12`\n\x0fGetToolInstance\x12$.agent_studio.GetToolInstanceRequest\x1a%.agent_studio.GetToolInstanceResponse"\x00\x12i\n\x12\x43reateToolInstance\x12\'.agent_studio.CreateToolInstanceRequest\x1a(.agent_studio.CreateToolInstanceResponse"\x00\x12i\n\x12UpdateToolInstance\x12\'.agent_studio.UpdateToolInstanceRequest\x1a(.agent_studio.UpdateToolInstanceResponse"\x00\x12i\n\x12RemoveToolInstance\x12\'.agent_studio.RemoveToolInstanceRequest\x1a(.agent_studio.RemoveToolInstanceResponse"\x00\x12Q\n\nListAgents\x12\x1f.agent_studio.ListAgentsRequest\x1a .agent_studio.ListAgentsResponse"\x00\x12K\n\x08GetAgent\x12\x1d.agent_studio.GetAgentRequest\x1a\x1e.agent_studio.GetAgentResponse"\x00\x12K\n\x08\x41\x64\x64\x41gent\x12\x1d.agent_studio.AddAgentRequest\x1a\x1e.agent_studio.AddAgentResponse"\x00\x12T\n\x0bUpdateAgent\x12 .agent_studio.UpdateAgentRequest\x1a!.agent_studio.UpdateAgentResponse"\x00\x12T\n\x0bRemoveAgent\x12 .agent_studio.RemoveAgentRequest\x1a!.agent_studio.RemoveAgentResponse"\x00\x12N\n\tTestAgent\x12\x1e.agent_studio.TestAgentRequest\x1a\x1f.agent_studio.TestAgentResponse"\x00\x12H\n\x07\x41\x64\x64Task\x12\x1c.agent_studio.AddTaskRequest\x1a\x1d.agent_studio.AddTaskResponse"\x00\x12N\n\tListTasks\x12\x1e.agent_studio.ListTasksRequest\x1a\x1f.agent_studio.ListTasksResponse"\x00\x12H\n\x07GetTask\x12\x1c.agent_studio.GetTaskRequest\x1a\x1d.agent_studio.GetTaskResponse"\x00\x12Q\n\nUpdateTask\x12\x1f.agent_studio.UpdateTaskRequest\x1a .agent_studio.UpdateTaskResponse"\x00\x12Q\n\nRemoveTask\x12\x1f.agent_studio.RemoveTaskRequest\x1a .agent_studio.RemoveTaskResponse"\x00\x12Z\n\rListWorkflows\x12".agent_studio.ListWorkflowsRequest\x1a#.agent_studio.ListWorkflowsResponse"\x00\x12T\n\x0bGetWorkflow\x12 .agent_studio.GetWorkflowRequest\x1a!.agent_studio.GetWorkflowResponse"\x00\x12T\n\x0b\x41\x64\x64Workflow\x12 .agent_studio.AddWorkflowRequest\x1a!.agent_studio.AddWorkflowResponse"\x00\x12]\n\x0eUpdateWorkflow\x12#.agent_studio.UpdateWorkflowRequest\x1a$.agent_studio.UpdateWorkflowResponse"\x00\x12W\n\x0cTestWorkflow\x12!.agent_studio.TestWorkflowRequest\x1a".agent_studio.TestWorkflowResponse"\x00\x12]\n\x0eRemoveWorkflow\x12#.agent_studio.RemoveWorkflowRequest\x1a$.agent_studio.RemoveWorkflowResponse"\x00\x12]\n\x0e\x44\x65ployWorkflow\x12#.agent_studio.DeployWorkflowRequest\x1a$.agent_studio.DeployWorkflowResponse"\x00\x12\x63\n\x10UndeployWorkflow\x12%.agent_studio.UndeployWorkflowRequest\x1a&.agent_studio.UndeployWorkflowResponse"\x00\x12r\n\x15ListDeployedWorkflows\x12*.agent_studio.ListDeployedWorkflowsRequest\x1a+.agent_studio.ListDeployedWorkflowsResponse"\x00\x12T\n\x13TemporaryFileUpload\x12\x17.agent_studio.FileChunk\x1a .agent_studio.FileUploadResponse"\x00(\x01\x12{\n\x1fNonStreamingTemporaryFileUpload\x12\x34.agent_studio.NonStreamingTemporaryFileUploadRequest\x1a .agent_studio.FileUploadResponse"\x00\x12`\n\x15\x44ownloadTemporaryFile\x12*.agent_studio.DownloadTemporaryFileRequest\x1a\x17.agent_studio.FileChunk"\x00\x30\x01\x12W\n\x0cGetAssetData\x12!.agent_studio.GetAssetDataRequest\x1a".agent_studio.GetAssetDataResponse"\x00\x12x\n\x17GetParentProjectDetails\x12,.agent_studio.GetParentProjectDetailsRequest\x1a-.agent_studio.GetParentProjectDetailsResponse"\x00\x12{\n\x18\x43heckStudioUpgradeStatus\x12-.agent_studio.CheckStudioUpgradeStatusRequest\x1a..agent_studio.CheckStudioUpgradeStatusResponse"\x00\x12Z\n\rUpgradeStudio\x12".agent_studio.UpgradeStudioRequest\x1a#.agent_studio.UpgradeStudioResponse"\x00\x12T\n\x0bHealthCheck\x12 .agent_studio.HealthCheckRequest\x1a!.agent_studio.HealthCheckResponse"\x00\x12T\n\x0b\x43mlApiCheck\x12 .agent_studio.CmlApiCheckRequest\x1a!.agent_studio.CmlApiCheckResponse"\x00\x12W\n\x0cRotateCmlApi\x12!.agent_studio.RotateCmlApiRequest\x1a".agent_studio.RotateCmlApiResponse"\x00\x12i\n\x12ListAgentTemplates\x12\'.agent_studio.ListAgentTemplatesRequest\x1a(.agent_studio.ListAgentTemplatesResponse"\x00\x12\x63\n\x10GetAgentTemplate\x12%.agent_studio.GetAgentTemplateRequest\x1a&.agent_studio.GetAgentTemplateResponse"\x00\x12\x63\n\x10\x41\x64\x64\x41gentTemplate\x12%.agent_studio.AddAgentTemplateRequest\x1a&.agent_studio.AddAgentTemplateResponse"\x00\x12l\n\x13UpdateAgentTemplate\x12(.agent_studio.UpdateAgentTemplateRequest\x1a).agent_studio.UpdateAgentTemplateResponse"\x00\x12l\n\x13RemoveAgentTemplate\x12(.agent_studio.RemoveAgentTemplateRequest\x1a).agent_studio.RemoveAgentTemplateResponse"\x00\x12r\n\x15ListWorkflowTemplates\x12*.agent_studio.ListWorkflowTemplatesRequest\x1a+.agent_studio.ListWorkflowTemplatesResponse"\x00\x12l\n\x13GetWorkflowTemplate\x12(.agent_studio.GetWorkflowTemplateRequest\x1a).agent_studio.GetWorkflowTemplateResponse"\x00\x12l\n\x13\x41\x64\x64WorkflowTemplate\x12(.agent_studio.AddWorkflowTemplateRequest\x1a).agent_studio.AddWorkflowTemplateResponse"\x00\x12u\n\x16RemoveWorkflowTemplate\x12+.agent_studio.RemoveWorkflowTemplateRequest\x1a,.agent_studio.RemoveWorkflowTemplateResponse"\x00\x12u\n\x16\x45xportWorkflowTemplate\x12+.agent_studio.ExportWorkflowTemplateRequest\x1a,.agent_studio.ExportWorkflowTemplateResponse"\x00\x12u\n\x16ImportWorkflowTemplate\x12+.agent_studio.ImportWorkflowTemplateRequest\x1a,.agent_studio.ImportWorkflowTemplateResponse"\x00\x12\x66\n\x11ListTaskTemplates\x12&.agent_studio.ListTaskTemplatesRequest\x1a\'.agent_studio.ListTaskTemplatesResponse"\x00\x12`\n\x0fGetTaskTemplate\x12$.agent_studio.GetTaskTemplateRequest\x1a%.agent_studio.GetTaskTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64TaskTemplate\x12$.agent_studio.AddTaskTemplateRequest\x1a%.agent_studio.AddTaskTemplateResponse"\x00\x12i\n\x12RemoveTaskTemplate\x12\'.agent_studio.RemoveTaskTemplateRequest\x1a(.agent_studio.RemoveTaskTemplateResponse"\x00\x62\x06proto3'
 )
 
 _globals = globals()
@@ -74,254 +74,262 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_GETSTUDIODEFAULTMODELREQUEST"]._serialized_end = 1055
     _globals["_GETSTUDIODEFAULTMODELRESPONSE"]._serialized_start = 1057
     _globals["_GETSTUDIODEFAULTMODELRESPONSE"]._serialized_end = 1169
-    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_start = 1171
-    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_end = 1257
-    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_start = 1259
-    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_end = 1333
-    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_start = 1335
-    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_end = 1385
-    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_start = 1387
-    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_end = 1458
-    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_start = 1461
-    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_end = 1602
-    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_start = 1604
-    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_end = 1655
-    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_start = 1657
-    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_end = 1767
-    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_start = 1769
-    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_end = 1823
-    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_start = 1825
-    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_end = 1878
-    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_start = 1880
-    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_end = 1908
-    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_start = 1910
-    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_end = 1978
-    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_start = 1980
-    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_end = 2059
-    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_start = 2061
-    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_end = 2111
-    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_start = 2113
-    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_end = 2189
-    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_start = 2191
-    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_end = 2305
-    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_start = 2307
-    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_end = 2389
-    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_start = 2391
-    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_end = 2508
-    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_start = 2510
-    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_end = 2564
-    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_start = 2566
-    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_end = 2619
-    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_start = 2621
-    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_end = 2649
-    _globals["_TOOLTEMPLATE"]._serialized_start = 2652
-    _globals["_TOOLTEMPLATE"]._serialized_end = 2962
-    _globals["_TOOLINSTANCE"]._serialized_start = 2965
-    _globals["_TOOLINSTANCE"]._serialized_end = 3217
-    _globals["_LISTAGENTSREQUEST"]._serialized_start = 3219
-    _globals["_LISTAGENTSREQUEST"]._serialized_end = 3280
-    _globals["_LISTAGENTSRESPONSE"]._serialized_start = 3282
-    _globals["_LISTAGENTSRESPONSE"]._serialized_end = 3347
-    _globals["_GETAGENTREQUEST"]._serialized_start = 3349
-    _globals["_GETAGENTREQUEST"]._serialized_end = 3384
-    _globals["_GETAGENTRESPONSE"]._serialized_start = 3386
-    _globals["_GETAGENTRESPONSE"]._serialized_end = 3448
-    _globals["_ADDAGENTREQUEST"]._serialized_start = 3451
-    _globals["_ADDAGENTREQUEST"]._serialized_end = 3718
-    _globals["_ADDAGENTRESPONSE"]._serialized_start = 3720
-    _globals["_ADDAGENTRESPONSE"]._serialized_end = 3756
-    _globals["_UPDATEAGENTREQUEST"]._serialized_start = 3759
-    _globals["_UPDATEAGENTREQUEST"]._serialized_end = 3984
-    _globals["_UPDATEAGENTRESPONSE"]._serialized_start = 3986
-    _globals["_UPDATEAGENTRESPONSE"]._serialized_end = 4007
-    _globals["_REMOVEAGENTREQUEST"]._serialized_start = 4009
-    _globals["_REMOVEAGENTREQUEST"]._serialized_end = 4047
-    _globals["_REMOVEAGENTRESPONSE"]._serialized_start = 4049
-    _globals["_REMOVEAGENTRESPONSE"]._serialized_end = 4070
-    _globals["_AGENTMETADATA"]._serialized_start = 4073
-    _globals["_AGENTMETADATA"]._serialized_end = 4294
-    _globals["_CREWAIAGENTMETADATA"]._serialized_start = 4297
-    _globals["_CREWAIAGENTMETADATA"]._serialized_end = 4462
-    _globals["_TESTAGENTREQUEST"]._serialized_start = 4464
-    _globals["_TESTAGENTREQUEST"]._serialized_end = 4537
-    _globals["_TESTAGENTRESPONSE"]._serialized_start = 4539
-    _globals["_TESTAGENTRESPONSE"]._serialized_end = 4576
-    _globals["_ADDWORKFLOWREQUEST"]._serialized_start = 4579
-    _globals["_ADDWORKFLOWREQUEST"]._serialized_end = 4891
-    _globals["_ADDWORKFLOWRESPONSE"]._serialized_start = 4893
-    _globals["_ADDWORKFLOWRESPONSE"]._serialized_end = 4935
-    _globals["_LISTWORKFLOWSREQUEST"]._serialized_start = 4937
-    _globals["_LISTWORKFLOWSREQUEST"]._serialized_end = 4959
-    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_start = 4961
-    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_end = 5027
-    _globals["_GETWORKFLOWREQUEST"]._serialized_start = 5029
-    _globals["_GETWORKFLOWREQUEST"]._serialized_end = 5070
-    _globals["_GETWORKFLOWRESPONSE"]._serialized_start = 5072
-    _globals["_GETWORKFLOWRESPONSE"]._serialized_end = 5135
-    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_start = 5138
-    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_end = 5317
-    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_start = 5319
-    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_end = 5343
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_start = 5346
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_end = 5511
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_start = 5462
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_end = 5511
-    _globals["_TESTWORKFLOWREQUEST"]._serialized_start = 5514
-    _globals["_TESTWORKFLOWREQUEST"]._serialized_end = 5887
-    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_start = 5737
-    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_end = 5782
-    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 5784
-    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 5887
-    _globals["_TESTWORKFLOWRESPONSE"]._serialized_start = 5889
-    _globals["_TESTWORKFLOWRESPONSE"]._serialized_end = 5946
-    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_start = 5949
-    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_end = 6403
-    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_start = 6239
-    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_end = 6298
-    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 5784
-    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 5887
-    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_start = 6405
-    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_end = 6522
-    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_start = 6524
-    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_end = 6579
-    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_start = 6581
-    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_end = 6607
-    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_start = 6609
-    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_end = 6639
-    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_start = 6641
-    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_end = 6732
-    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_start = 6734
-    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_end = 6778
-    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_start = 6780
-    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_end = 6804
-    _globals["_DEPLOYEDWORKFLOW"]._serialized_start = 6807
-    _globals["_DEPLOYEDWORKFLOW"]._serialized_end = 7089
-    _globals["_WORKFLOW"]._serialized_start = 7092
-    _globals["_WORKFLOW"]._serialized_end = 7350
-    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_start = 7353
-    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_end = 7533
-    _globals["_ADDTASKREQUEST"]._serialized_start = 7536
-    _globals["_ADDTASKREQUEST"]._serialized_end = 7699
-    _globals["_ADDTASKRESPONSE"]._serialized_start = 7701
-    _globals["_ADDTASKRESPONSE"]._serialized_end = 7735
-    _globals["_LISTTASKSREQUEST"]._serialized_start = 7737
-    _globals["_LISTTASKSREQUEST"]._serialized_end = 7797
-    _globals["_LISTTASKSRESPONSE"]._serialized_start = 7799
-    _globals["_LISTTASKSRESPONSE"]._serialized_end = 7867
-    _globals["_GETTASKREQUEST"]._serialized_start = 7869
-    _globals["_GETTASKREQUEST"]._serialized_end = 7902
-    _globals["_GETTASKRESPONSE"]._serialized_start = 7904
-    _globals["_GETTASKRESPONSE"]._serialized_end = 7969
-    _globals["_UPDATETASKREQUEST"]._serialized_start = 7971
-    _globals["_UPDATETASKREQUEST"]._serialized_end = 8079
-    _globals["_UPDATETASKRESPONSE"]._serialized_start = 8081
-    _globals["_UPDATETASKRESPONSE"]._serialized_end = 8101
-    _globals["_REMOVETASKREQUEST"]._serialized_start = 8103
-    _globals["_REMOVETASKREQUEST"]._serialized_end = 8139
-    _globals["_REMOVETASKRESPONSE"]._serialized_start = 8141
-    _globals["_REMOVETASKRESPONSE"]._serialized_end = 8161
-    _globals["_CREWAITASKMETADATA"]._serialized_start = 8164
-    _globals["_CREWAITASKMETADATA"]._serialized_end = 8329
-    _globals["_UPDATECREWAITASKREQUEST"]._serialized_start = 8331
-    _globals["_UPDATECREWAITASKREQUEST"]._serialized_end = 8429
-    _globals["_ADDCREWAITASKREQUEST"]._serialized_start = 8431
-    _globals["_ADDCREWAITASKREQUEST"]._serialized_end = 8526
-    _globals["_GETASSETDATAREQUEST"]._serialized_start = 8528
-    _globals["_GETASSETDATAREQUEST"]._serialized_end = 8573
-    _globals["_GETASSETDATARESPONSE"]._serialized_start = 8576
-    _globals["_GETASSETDATARESPONSE"]._serialized_end = 8747
-    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_start = 8699
-    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_end = 8747
-    _globals["_FILECHUNK"]._serialized_start = 8749
-    _globals["_FILECHUNK"]._serialized_end = 8819
-    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_start = 8821
-    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_end = 8902
-    _globals["_FILEUPLOADRESPONSE"]._serialized_start = 8904
-    _globals["_FILEUPLOADRESPONSE"]._serialized_end = 8960
-    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_start = 8962
-    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_end = 9011
-    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_start = 9013
-    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_end = 9045
-    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_start = 9047
-    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_end = 9131
-    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_start = 9133
-    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_end = 9220
-    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_start = 9222
-    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_end = 9312
-    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_start = 9314
-    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_end = 9351
-    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_start = 9353
-    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_end = 9440
-    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_start = 9443
-    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_end = 9764
-    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_start = 9766
-    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_end = 9804
-    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_start = 9807
-    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_end = 10307
-    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_start = 10309
-    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_end = 10350
-    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_start = 10352
-    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_end = 10392
-    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_start = 10394
-    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_end = 10423
-    _globals["_AGENTTEMPLATEMETADATA"]._serialized_start = 10426
-    _globals["_AGENTTEMPLATEMETADATA"]._serialized_end = 10774
-    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_start = 10776
-    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_end = 10806
-    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_start = 10808
-    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_end = 10907
-    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_start = 10909
-    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_end = 10949
-    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_start = 10951
-    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11047
-    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11050
-    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11461
-    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11463
-    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11504
-    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11506
-    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11549
-    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11551
-    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11583
-    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_start = 11586
-    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_end = 11844
-    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11846
-    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11889
-    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11891
-    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11942
-    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11944
-    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11994
-    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11996
-    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 12040
-    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_start = 12042
-    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_end = 12128
-    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_start = 12130
-    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_end = 12217
-    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_start = 12219
-    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_end = 12255
-    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_start = 12257
-    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_end = 12341
-    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_start = 12344
-    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_end = 12524
-    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_start = 12526
-    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_end = 12563
-    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_start = 12565
-    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_end = 12604
-    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_start = 12606
-    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_end = 12634
-    _globals["_TASKTEMPLATEMETADATA"]._serialized_start = 12637
-    _globals["_TASKTEMPLATEMETADATA"]._serialized_end = 12827
-    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_start = 12829
-    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_end = 12862
-    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_start = 12864
-    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_end = 12945
-    _globals["_UPGRADESTUDIOREQUEST"]._serialized_start = 12947
-    _globals["_UPGRADESTUDIOREQUEST"]._serialized_end = 12969
-    _globals["_UPGRADESTUDIORESPONSE"]._serialized_start = 12971
-    _globals["_UPGRADESTUDIORESPONSE"]._serialized_end = 12994
-    _globals["_HEALTHCHECKREQUEST"]._serialized_start = 12996
-    _globals["_HEALTHCHECKREQUEST"]._serialized_end = 13016
-    _globals["_HEALTHCHECKRESPONSE"]._serialized_start = 13018
-    _globals["_HEALTHCHECKRESPONSE"]._serialized_end = 13056
-    _globals["_AGENTSTUDIO"]._serialized_start = 13059
-    _globals["_AGENTSTUDIO"]._serialized_end = 19020
+    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_start = 1172
+    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_end = 1326
+    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_start = 1328
+    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_end = 1427
+    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_start = 1429
+    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_end = 1479
+    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_start = 1481
+    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_end = 1552
+    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_start = 1555
+    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_end = 1696
+    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_start = 1698
+    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_end = 1749
+    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_start = 1751
+    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_end = 1861
+    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_start = 1863
+    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_end = 1917
+    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_start = 1919
+    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_end = 1972
+    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_start = 1974
+    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_end = 2002
+    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_start = 2004
+    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_end = 2119
+    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_start = 2121
+    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_end = 2225
+    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_start = 2227
+    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_end = 2277
+    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_start = 2279
+    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_end = 2355
+    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_start = 2357
+    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_end = 2471
+    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_start = 2473
+    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_end = 2555
+    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_start = 2557
+    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_end = 2674
+    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_start = 2676
+    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_end = 2730
+    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_start = 2732
+    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_end = 2785
+    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_start = 2787
+    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_end = 2815
+    _globals["_TOOLTEMPLATE"]._serialized_start = 2818
+    _globals["_TOOLTEMPLATE"]._serialized_end = 3128
+    _globals["_TOOLINSTANCE"]._serialized_start = 3131
+    _globals["_TOOLINSTANCE"]._serialized_end = 3383
+    _globals["_LISTAGENTSREQUEST"]._serialized_start = 3385
+    _globals["_LISTAGENTSREQUEST"]._serialized_end = 3493
+    _globals["_LISTAGENTSRESPONSE"]._serialized_start = 3495
+    _globals["_LISTAGENTSRESPONSE"]._serialized_end = 3585
+    _globals["_GETAGENTREQUEST"]._serialized_start = 3587
+    _globals["_GETAGENTREQUEST"]._serialized_end = 3622
+    _globals["_GETAGENTRESPONSE"]._serialized_start = 3624
+    _globals["_GETAGENTRESPONSE"]._serialized_end = 3686
+    _globals["_ADDAGENTREQUEST"]._serialized_start = 3689
+    _globals["_ADDAGENTREQUEST"]._serialized_end = 3956
+    _globals["_ADDAGENTRESPONSE"]._serialized_start = 3958
+    _globals["_ADDAGENTRESPONSE"]._serialized_end = 3994
+    _globals["_UPDATEAGENTREQUEST"]._serialized_start = 3997
+    _globals["_UPDATEAGENTREQUEST"]._serialized_end = 4222
+    _globals["_UPDATEAGENTRESPONSE"]._serialized_start = 4224
+    _globals["_UPDATEAGENTRESPONSE"]._serialized_end = 4245
+    _globals["_REMOVEAGENTREQUEST"]._serialized_start = 4247
+    _globals["_REMOVEAGENTREQUEST"]._serialized_end = 4285
+    _globals["_REMOVEAGENTRESPONSE"]._serialized_start = 4287
+    _globals["_REMOVEAGENTRESPONSE"]._serialized_end = 4308
+    _globals["_AGENTMETADATA"]._serialized_start = 4311
+    _globals["_AGENTMETADATA"]._serialized_end = 4532
+    _globals["_CREWAIAGENTMETADATA"]._serialized_start = 4535
+    _globals["_CREWAIAGENTMETADATA"]._serialized_end = 4700
+    _globals["_TESTAGENTREQUEST"]._serialized_start = 4702
+    _globals["_TESTAGENTREQUEST"]._serialized_end = 4775
+    _globals["_TESTAGENTRESPONSE"]._serialized_start = 4777
+    _globals["_TESTAGENTRESPONSE"]._serialized_end = 4814
+    _globals["_ADDWORKFLOWREQUEST"]._serialized_start = 4817
+    _globals["_ADDWORKFLOWREQUEST"]._serialized_end = 5129
+    _globals["_ADDWORKFLOWRESPONSE"]._serialized_start = 5131
+    _globals["_ADDWORKFLOWRESPONSE"]._serialized_end = 5173
+    _globals["_LISTWORKFLOWSREQUEST"]._serialized_start = 5175
+    _globals["_LISTWORKFLOWSREQUEST"]._serialized_end = 5265
+    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_start = 5267
+    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_end = 5358
+    _globals["_GETWORKFLOWREQUEST"]._serialized_start = 5360
+    _globals["_GETWORKFLOWREQUEST"]._serialized_end = 5401
+    _globals["_GETWORKFLOWRESPONSE"]._serialized_start = 5403
+    _globals["_GETWORKFLOWRESPONSE"]._serialized_end = 5466
+    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_start = 5469
+    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_end = 5648
+    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_start = 5650
+    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_end = 5674
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_start = 5677
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_end = 5842
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_start = 5793
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_end = 5842
+    _globals["_TESTWORKFLOWREQUEST"]._serialized_start = 5845
+    _globals["_TESTWORKFLOWREQUEST"]._serialized_end = 6218
+    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_start = 6068
+    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_end = 6113
+    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 6115
+    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 6218
+    _globals["_TESTWORKFLOWRESPONSE"]._serialized_start = 6220
+    _globals["_TESTWORKFLOWRESPONSE"]._serialized_end = 6301
+    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_start = 6304
+    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_end = 6758
+    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_start = 6594
+    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_end = 6653
+    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 6115
+    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 6218
+    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_start = 6760
+    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_end = 6877
+    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_start = 6879
+    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_end = 6934
+    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_start = 6936
+    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_end = 6962
+    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_start = 6964
+    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_end = 6994
+    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_start = 6996
+    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_end = 7087
+    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_start = 7089
+    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_end = 7133
+    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_start = 7135
+    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_end = 7159
+    _globals["_DEPLOYEDWORKFLOW"]._serialized_start = 7162
+    _globals["_DEPLOYEDWORKFLOW"]._serialized_end = 7464
+    _globals["_WORKFLOW"]._serialized_start = 7467
+    _globals["_WORKFLOW"]._serialized_end = 7725
+    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_start = 7728
+    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_end = 7908
+    _globals["_ADDTASKREQUEST"]._serialized_start = 7911
+    _globals["_ADDTASKREQUEST"]._serialized_end = 8074
+    _globals["_ADDTASKRESPONSE"]._serialized_start = 8076
+    _globals["_ADDTASKRESPONSE"]._serialized_end = 8110
+    _globals["_LISTTASKSREQUEST"]._serialized_start = 8112
+    _globals["_LISTTASKSREQUEST"]._serialized_end = 8219
+    _globals["_LISTTASKSRESPONSE"]._serialized_start = 8221
+    _globals["_LISTTASKSRESPONSE"]._serialized_end = 8314
+    _globals["_GETTASKREQUEST"]._serialized_start = 8316
+    _globals["_GETTASKREQUEST"]._serialized_end = 8349
+    _globals["_GETTASKRESPONSE"]._serialized_start = 8351
+    _globals["_GETTASKRESPONSE"]._serialized_end = 8416
+    _globals["_UPDATETASKREQUEST"]._serialized_start = 8418
+    _globals["_UPDATETASKREQUEST"]._serialized_end = 8526
+    _globals["_UPDATETASKRESPONSE"]._serialized_start = 8528
+    _globals["_UPDATETASKRESPONSE"]._serialized_end = 8548
+    _globals["_REMOVETASKREQUEST"]._serialized_start = 8550
+    _globals["_REMOVETASKREQUEST"]._serialized_end = 8586
+    _globals["_REMOVETASKRESPONSE"]._serialized_start = 8588
+    _globals["_REMOVETASKRESPONSE"]._serialized_end = 8608
+    _globals["_CREWAITASKMETADATA"]._serialized_start = 8611
+    _globals["_CREWAITASKMETADATA"]._serialized_end = 8776
+    _globals["_UPDATECREWAITASKREQUEST"]._serialized_start = 8778
+    _globals["_UPDATECREWAITASKREQUEST"]._serialized_end = 8876
+    _globals["_ADDCREWAITASKREQUEST"]._serialized_start = 8878
+    _globals["_ADDCREWAITASKREQUEST"]._serialized_end = 8973
+    _globals["_GETASSETDATAREQUEST"]._serialized_start = 8975
+    _globals["_GETASSETDATAREQUEST"]._serialized_end = 9020
+    _globals["_GETASSETDATARESPONSE"]._serialized_start = 9023
+    _globals["_GETASSETDATARESPONSE"]._serialized_end = 9194
+    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_start = 9146
+    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_end = 9194
+    _globals["_FILECHUNK"]._serialized_start = 9196
+    _globals["_FILECHUNK"]._serialized_end = 9266
+    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_start = 9268
+    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_end = 9349
+    _globals["_FILEUPLOADRESPONSE"]._serialized_start = 9351
+    _globals["_FILEUPLOADRESPONSE"]._serialized_end = 9407
+    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_start = 9409
+    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_end = 9458
+    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_start = 9460
+    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_end = 9492
+    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_start = 9494
+    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_end = 9578
+    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_start = 9581
+    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_end = 9736
+    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_start = 9738
+    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_end = 9853
+    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_start = 9855
+    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_end = 9892
+    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_start = 9894
+    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_end = 9981
+    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_start = 9984
+    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_end = 10305
+    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_start = 10307
+    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_end = 10345
+    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_start = 10348
+    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_end = 10848
+    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_start = 10850
+    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_end = 10891
+    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_start = 10893
+    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_end = 10933
+    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_start = 10935
+    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_end = 10964
+    _globals["_AGENTTEMPLATEMETADATA"]._serialized_start = 10967
+    _globals["_AGENTTEMPLATEMETADATA"]._serialized_end = 11315
+    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_start = 11317
+    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_end = 11415
+    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_start = 11417
+    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_end = 11541
+    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11543
+    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11583
+    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11585
+    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11681
+    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11684
+    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_end = 12095
+    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_start = 12097
+    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_end = 12138
+    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_start = 12140
+    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_end = 12183
+    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_start = 12185
+    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_end = 12217
+    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_start = 12220
+    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_end = 12478
+    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 12480
+    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 12523
+    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 12525
+    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 12576
+    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 12578
+    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 12628
+    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 12630
+    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 12674
+    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_start = 12677
+    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_end = 12831
+    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_start = 12833
+    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_end = 12945
+    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_start = 12947
+    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_end = 12983
+    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_start = 12985
+    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_end = 13069
+    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_start = 13072
+    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_end = 13252
+    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_start = 13254
+    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_end = 13291
+    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_start = 13293
+    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_end = 13332
+    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_start = 13334
+    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_end = 13362
+    _globals["_TASKTEMPLATEMETADATA"]._serialized_start = 13365
+    _globals["_TASKTEMPLATEMETADATA"]._serialized_end = 13555
+    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_start = 13557
+    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_end = 13590
+    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_start = 13592
+    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_end = 13673
+    _globals["_UPGRADESTUDIOREQUEST"]._serialized_start = 13675
+    _globals["_UPGRADESTUDIOREQUEST"]._serialized_end = 13697
+    _globals["_UPGRADESTUDIORESPONSE"]._serialized_start = 13699
+    _globals["_UPGRADESTUDIORESPONSE"]._serialized_end = 13722
+    _globals["_HEALTHCHECKREQUEST"]._serialized_start = 13724
+    _globals["_HEALTHCHECKREQUEST"]._serialized_end = 13744
+    _globals["_HEALTHCHECKRESPONSE"]._serialized_start = 13746
+    _globals["_HEALTHCHECKRESPONSE"]._serialized_end = 13784
+    _globals["_CMLAPICHECKREQUEST"]._serialized_start = 13786
+    _globals["_CMLAPICHECKREQUEST"]._serialized_end = 13806
+    _globals["_CMLAPICHECKRESPONSE"]._serialized_start = 13808
+    _globals["_CMLAPICHECKRESPONSE"]._serialized_end = 13846
+    _globals["_ROTATECMLAPIREQUEST"]._serialized_start = 13848
+    _globals["_ROTATECMLAPIREQUEST"]._serialized_end = 13869
+    _globals["_ROTATECMLAPIRESPONSE"]._serialized_start = 13871
+    _globals["_ROTATECMLAPIRESPONSE"]._serialized_end = 13910
+    _globals["_AGENTSTUDIO"]._serialized_start = 13913
+    _globals["_AGENTSTUDIO"]._serialized_end = 20049
 # @@protoc_insertion_point(module_scope)
@@ -176,16 +176,37 @@ class GetStudioDefaultModelResponse(_message.Message):
     ) -> None: ...
 
 class ListToolTemplatesRequest(_message.Message):
-    __slots__ = ("workflow_template_id",)
+    __slots__ = ("workflow_template_id", "page_size", "page_token", "ids", "fields")
     WORKFLOW_TEMPLATE_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
     workflow_template_id: str
-    def __init__(self, workflow_template_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_template_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListToolTemplatesResponse(_message.Message):
-    __slots__ = ("templates",)
+    __slots__ = ("templates", "next_page_token")
     TEMPLATES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     templates: _containers.RepeatedCompositeFieldContainer[ToolTemplate]
-    def __init__(self, templates: _Optional[_Iterable[_Union[ToolTemplate, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self,
+        templates: _Optional[_Iterable[_Union[ToolTemplate, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
+    ) -> None: ...
 
 class GetToolTemplateRequest(_message.Message):
     __slots__ = ("tool_template_id",)
@@ -252,16 +273,37 @@ class RemoveToolTemplateResponse(_message.Message):
     def __init__(self) -> None: ...
 
 class ListToolInstancesRequest(_message.Message):
-    __slots__ = ("workflow_id",)
+    __slots__ = ("workflow_id", "page_size", "page_token", "ids", "fields")
     WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
     workflow_id: str
-    def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListToolInstancesResponse(_message.Message):
-    __slots__ = ("tool_instances",)
+    __slots__ = ("tool_instances", "next_page_token")
     TOOL_INSTANCES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     tool_instances: _containers.RepeatedCompositeFieldContainer[ToolInstance]
-    def __init__(self, tool_instances: _Optional[_Iterable[_Union[ToolInstance, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self,
+        tool_instances: _Optional[_Iterable[_Union[ToolInstance, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
+    ) -> None: ...
 
 class GetToolInstanceRequest(_message.Message):
     __slots__ = ("tool_instance_id",)
@@ -436,16 +478,35 @@ class ToolInstance(_message.Message):
     ) -> None: ...
 
 class ListAgentsRequest(_message.Message):
-    __slots__ = ("workflow_id",)
+    __slots__ = ("workflow_id", "page_size", "page_token", "ids", "fields")
     WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
     workflow_id: str
-    def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListAgentsResponse(_message.Message):
-    __slots__ = ("agents",)
+    __slots__ = ("agents", "next_page_token")
     AGENTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     agents: _containers.RepeatedCompositeFieldContainer[AgentMetadata]
-    def __init__(self, agents: _Optional[_Iterable[_Union[AgentMetadata, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self, agents: _Optional[_Iterable[_Union[AgentMetadata, _Mapping]]] = ..., next_page_token: _Optional[str] = ...
+    ) -> None: ...
 
 class GetAgentRequest(_message.Message):
     __slots__ = ("agent_id",)
@@ -668,14 +729,32 @@ class AddWorkflowResponse(_message.Message):
     def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
 
 class ListWorkflowsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("page_size", "page_token", "ids", "fields")
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListWorkflowsResponse(_message.Message):
-    __slots__ = ("workflows",)
+    __slots__ = ("workflows", "next_page_token")
     WORKFLOWS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     workflows: _containers.RepeatedCompositeFieldContainer[Workflow]
-    def __init__(self, workflows: _Optional[_Iterable[_Union[Workflow, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self, workflows: _Optional[_Iterable[_Union[Workflow, _Mapping]]] = ..., next_page_token: _Optional[str] = ...
+    ) -> None: ...
 
 class GetWorkflowRequest(_message.Message):
     __slots__ = ("workflow_id",)
@@ -765,12 +844,16 @@ class TestWorkflowRequest(_message.Message):
     ) -> None: ...
 
 class TestWorkflowResponse(_message.Message):
-    __slots__ = ("message", "trace_id")
+    __slots__ = ("message", "trace_id", "queue_position")
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
     TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    QUEUE_POSITION_FIELD_NUMBER: _ClassVar[int]
     message: str
     trace_id: str
-    def __init__(self, message: _Optional[str] = ..., trace_id: _Optional[str] = ...) -> None: ...
+    queue_position: int
+    def __init__(
+        self, message: _Optional[str] = ..., trace_id: _Optional[str] = ..., queue_position: _Optional[int] = ...
+    ) -> None: ...
 
 class DeployWorkflowRequest(_message.Message):
     __slots__ = (
@@ -874,6 +957,7 @@ class DeployedWorkflow(_message.Message):
         "application_status",
         "application_deep_link",
         "model_deep_link",
+        "status_age",
     )
     DEPLOYED_WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
     WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
@@ -885,6 +969,7 @@ class DeployedWorkflow(_message.Message):
     APPLICATION_STATUS_FIELD_NUMBER: _ClassVar[int]
     APPLICATION_DEEP_LINK_FIELD_NUMBER: _ClassVar[int]
     MODEL_DEEP_LINK_FIELD_NUMBER: _ClassVar[int]
+    STATUS_AGE_FIELD_NUMBER: _ClassVar[int]
     deployed_workflow_id: str
     workflow_id: str
     workflow_name: str
@@ -895,6 +980,7 @@ class DeployedWorkflow(_message.Message):
     application_status: str
     application_deep_link: str
     model_deep_link: str
+    status_age: int
     def __init__(
         self,
         deployed_workflow_id: _Optional[str] = ...,
@@ -907,6 +993,7 @@ class DeployedWorkflow(_message.Message):
         application_status: _Optional[str] = ...,
         application_deep_link: _Optional[str] = ...,
         model_deep_link: _Optional[str] = ...,
+        status_age: _Optional[int] = ...,
     ) -> None: ...
 
 class Workflow(_message.Message):
@@ -998,16 +1085,37 @@ class AddTaskResponse(_message.Message):
     def __init__(self, task_id: _Optional[str] = ...) -> None: ...
 
 class ListTasksRequest(_message.Message):
-    __slots__ = ("workflow_id",)
+    __slots__ = ("workflow_id", "page_size", "page_token", "ids", "fields")
     WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
     workflow_id: str
-    def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListTasksResponse(_message.Message):
-    __slots__ = ("tasks",)
+    __slots__ = ("tasks", "next_page_token")
     TASKS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     tasks: _containers.RepeatedCompositeFieldContainer[CrewAITaskMetadata]
-    def __init__(self, tasks: _Optional[_Iterable[_Union[CrewAITaskMetadata, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self,
+        tasks: _Optional[_Iterable[_Union[CrewAITaskMetadata, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
+    ) -> None: ...
 
 class GetTaskRequest(_message.Message):
     __slots__ = ("task_id",)
@@ -1175,17 +1283,36 @@ class GetParentProjectDetailsResponse(_message.Message):
     def __init__(self, project_base: _Optional[str] = ..., studio_subdirectory: _Optional[str] = ...) -> None: ...
 
 class ListAgentTemplatesRequest(_message.Message):
-    __slots__ = ("workflow_template_id",)
+    __slots__ = ("workflow_template_id", "page_size", "page_token", "ids", "fields")
     WORKFLOW_TEMPLATE_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
     workflow_template_id: str
-    def __init__(self, workflow_template_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_template_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListAgentTemplatesResponse(_message.Message):
-    __slots__ = ("agent_templates",)
+    __slots__ = ("agent_templates", "next_page_token")
     AGENT_TEMPLATES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     agent_templates: _containers.RepeatedCompositeFieldContainer[AgentTemplateMetadata]
+    next_page_token: str
     def __init__(
-        self, agent_templates: _Optional[_Iterable[_Union[AgentTemplateMetadata, _Mapping]]] = ...
+        self,
+        agent_templates: _Optional[_Iterable[_Union[AgentTemplateMetadata, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
     ) -> None: ...
 
 class GetAgentTemplateRequest(_message.Message):
@@ -1408,15 +1535,33 @@ class AgentTemplateMetadata(_message.Message):
     ) -> None: ...
 
 class ListWorkflowTemplatesRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("page_size", "page_token", "ids", "fields")
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListWorkflowTemplatesResponse(_message.Message):
-    __slots__ = ("workflow_templates",)
+    __slots__ = ("workflow_templates", "next_page_token")
     WORKFLOW_TEMPLATES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     workflow_templates: _containers.RepeatedCompositeFieldContainer[WorkflowTemplateMetadata]
+    next_page_token: str
     def __init__(
-        self, workflow_templates: _Optional[_Iterable[_Union[WorkflowTemplateMetadata, _Mapping]]] = ...
+        self,
+        workflow_templates: _Optional[_Iterable[_Union[WorkflowTemplateMetadata, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
     ) -> None: ...
 
 class GetWorkflowTemplateRequest(_message.Message):
@@ -1562,16 +1707,37 @@ class ImportWorkflowTemplateResponse(_message.Message):
     def __init__(self, id: _Optional[str] = ...) -> None: ...
 
 class ListTaskTemplatesRequest(_message.Message):
-    __slots__ = ("workflow_template_id",)
+    __slots__ = ("workflow_template_id", "page_size", "page_token", "ids", "fields")
     WORKFLOW_TEMPLATE_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
     workflow_template_id: str
-    def __init__(self, workflow_template_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    ids: _containers.RepeatedScalarFieldContainer[str]
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_template_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        ids: _Optional[_Iterable[str]] = ...,
+        fields: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListTaskTemplatesResponse(_message.Message):
-    __slots__ = ("task_templates",)
+    __slots__ = ("task_templates", "next_page_token")
     TASK_TEMPLATES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     task_templates: _containers.RepeatedCompositeFieldContainer[TaskTemplateMetadata]
-    def __init__(self, task_templates: _Optional[_Iterable[_Union[TaskTemplateMetadata, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self,
+        task_templates: _Optional[_Iterable[_Union[TaskTemplateMetadata, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
+    ) -> None: ...
 
 class GetTaskTemplateRequest(_message.Message):
     __slots__ = ("id",)
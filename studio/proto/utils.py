@@ -1,4 +1,8 @@
+import base64
+from typing import Any, Iterable, List, Tuple, Type
+
 from google.protobuf.message import Message
+from sqlalchemy.orm import Query
 
 
 def is_field_set(message: Message, field_name: str) -> bool:
@@ -24,3 +28,82 @@ def is_field_set(message: Message, field_name: str) -> bool:
 
     # For singular fields, check if it's explicitly set
     return field_name in {field.name for field, _ in message.ListFields()}
+
+
+def decode_page_token(page_token: str) -> int:
+    """
+    Offset of the first item of the page a list request's page_token points to.
+    """
+    if not page_token:
+        return 0
+    try:
+        offset = int(base64.urlsafe_b64decode(page_token.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(f"Invalid page token '{page_token}'.")
+    if offset < 0:
+        raise ValueError(f"Invalid page token '{page_token}'.")
+    return offset
+
+
+def encode_page_token(offset: int) -> str:
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def paginate_query(query: Query, request: Message, order_by: Any) -> Tuple[List[Any], str]:
+    """
+    Run a query for the page of results selected by the page_size and
+    page_token fields of a list request. Returns the rows of the page and the
+    token of the next page, which is empty on the last page. All rows are
+    returned if the request does not set a page size.
+
+    :param query: SQLAlchemy query of all the items to list.
+    :param request: List request with page_size and page_token fields.
+    :param order_by: Column that gives the items a stable order across pages.
+    """
+    if request.page_size < 0:
+        raise ValueError("Page size must not be negative.")
+    offset = decode_page_token(request.page_token)
+    if not request.page_size and not offset:
+        return query.all(), ""
+
+    query = query.order_by(order_by).offset(offset)
+    if not request.page_size:
+        return query.all(), ""
+    # Fetch one more row to find out whether there is a next page.
+    rows = query.limit(request.page_size + 1).all()
+    if len(rows) > request.page_size:
+        return rows[: request.page_size], encode_page_token(offset + request.page_size)
+    return rows, ""
+
+
+def is_field_requested(request: Message, field_name: str) -> bool:
+    """
+    Checks if the field mask of a list request includes a field of the listed
+    items. An empty field mask includes all fields.
+    """
+    return not request.fields or field_name in request.fields
+
+
+def apply_field_mask(messages: Iterable[Message], message_type: Type[Message], fields: Iterable[str]) -> None:
+    """
+    Clears all the fields of the listed messages that are not in the field
+    mask of a list request. Messages are left untouched if the mask is empty.
+
+    :param messages: Protobuf messages to apply the field mask to.
+    :param message_type: Protobuf message class of the listed messages.
+    :param fields: Names of the top level fields to keep.
+    """
+    fields = set(fields)
+    if not fields:
+        return
+
+    field_names = set(message_type.DESCRIPTOR.fields_by_name)
+    unknown_fields = fields - field_names
+    if unknown_fields:
+        raise ValueError(
+            f"Unknown fields in field mask for {message_type.DESCRIPTOR.name}: {', '.join(sorted(unknown_fields))}."
+        )
+
+    for message in messages:
+        for field_name in field_names - fields:
+            message.ClearField(field_name)
@@ -1,16 +1,56 @@
 from studio.ops import get_ops_endpoint
+from studio.ops_events import is_terminal_event
 import requests
 import os
+import json
 
 
-def get_crew_events(trace_id: str) -> dict:
+def get_crew_events(trace_id: str, offset: int = 0) -> list:
     """
-    Get all "descendants" spanning events for the global trace that corresponds
-    to a local trace ID. Returns a dict with keys "projectId" and "events".
+    Get the events of a workflow run from the given offset on. Reading does
+    not consume the events, so this can be called any number of times and
+    alongside other readers of the same run (like the Agent Studio UI).
     """
-    ops_endpoint = f"{get_ops_endpoint()}/events?trace_id={trace_id}"
+    ops_endpoint = f"{get_ops_endpoint()}/events"
+    headers = {"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"}
 
-    response = requests.get(ops_endpoint, headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"})
-    events = response.json()
+    events = []
+    while True:
+        response = requests.get(ops_endpoint, params={"trace_id": trace_id, "offset": offset}, headers=headers)
+        response.raise_for_status()
+        page = response.json()
+        events.extend(page["events"])
+        if not page["events"]:
+            return events
+        offset = page["next_since"]
 
-    return events
+
+def stream_crew_events(trace_id: str, since: int = 0):
+    """
+    Stream the events of a workflow run as they arrive, instead of polling
+    get_crew_events(). Yields event dicts and returns after the workflow's
+    final event. Reconnects from the last received event if the ops
+    server closes the stream early.
+    """
+    headers = {"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"}
+    ops_endpoint = f"{get_ops_endpoint()}/events/stream"
+    while True:
+        with requests.get(
+            ops_endpoint,
+            params={"trace_id": trace_id, "since": since},
+            headers=headers,
+            stream=True,
+            timeout=60,
+        ) as response:
+            response.raise_for_status()
+            data = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("id: "):
+                    since = int(line[len("id: ") :])
+                elif line.startswith("data: "):
+                    data = json.loads(line[len("data: ") :])
+                elif line == "" and data is not None:
+                    yield data
+                    if is_terminal_event(data):
+                        return
+                    data = None
@@ -105,6 +105,9 @@ def run_workflow(workflow_name: str = None, workflow_id: str = None, inputs: dic
     response = out.json()
     if not response["success"]:
         raise ValueError("Workflow was unable to kick off successfully.", response)
+    if "retry_after" in response["response"]:
+        # The deployed workflow is at capacity and rejected the kickoff.
+        raise ValueError(response["response"]["error"], response["response"])
 
     return response["response"]["trace_id"]
 
@@ -38,6 +38,11 @@ from studio.cross_cutting.methods import (
     health_check,
 )
 from studio.cross_cutting.global_thread_pool import initialize_thread_pool, cleanup_thread_pool
+from studio.workflow.runners import initialize_workflow_runner_dispatcher, cleanup_workflow_runner_dispatcher
+from studio.workflow.deployed_workflow_status import (
+    initialize_deployed_workflow_status_cache,
+    cleanup_deployed_workflow_status_cache,
+)
 from studio.agents.test_agents import (
     agent_test,
 )
@@ -127,6 +132,8 @@ class AgentStudioApp(AgentStudioServicer):
                     self.logger.info("API key rotation successful")
 
             initialize_thread_pool()
+            initialize_workflow_runner_dispatcher()
+            initialize_deployed_workflow_status_cache()
 
             # Load environment variables
             self.project_id = os.getenv("CDSW_PROJECT_ID")
@@ -138,6 +145,8 @@ class AgentStudioApp(AgentStudioServicer):
         except Exception as e:
             self.logger.error(f"Failed to initialize Agent Studio App: {str(e)}")
             cleanup_thread_pool()
+            cleanup_workflow_runner_dispatcher()
+            cleanup_deployed_workflow_status_cache()
             raise
 
     # Model-related gRPC methods
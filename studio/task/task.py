@@ -7,7 +7,7 @@ from studio.api import *
 from cmlapi import CMLServiceApi
 import re
 from studio.workflow.utils import invalidate_workflow
-from studio.proto.utils import is_field_set
+from studio.proto.utils import apply_field_mask, is_field_set, paginate_query
 
 
 def add_task(request: AddTaskRequest, cml: CMLServiceApi, dao: AgentStudioDao = None) -> AddTaskResponse:
@@ -92,22 +92,32 @@ def list_tasks(request: ListTasksRequest, cml: CMLServiceApi, dao: AgentStudioDa
     List all tasks with metadata, ensuring assigned agent IDs exist or are empty.
     """
     try:
-        with dao.get_session() as session:
-            tasks: List[db_model.Task] = session.query(db_model.Task).all()
-            if not tasks:
-                return ListTasksResponse(tasks=[])
-
+        with dao.get_read_session() as session:
+            query = session.query(db_model.Task)
             # Filter by workflow id
             if is_field_set(request, "workflow_id"):
-                tasks = list(filter(lambda x: x.workflow_id == request.workflow_id, tasks))
+                query = query.filter_by(workflow_id=request.workflow_id)
+            if request.ids:
+                query = query.filter(db_model.Task.id.in_(request.ids))
+            tasks, next_page_token = paginate_query(query, request, db_model.Task.id)
+
+            # Check which assigned agent IDs exist, all at once
+            assigned_agent_ids = {task.assigned_agent_id for task in tasks if task.assigned_agent_id}
+            existing_agent_ids = set()
+            if assigned_agent_ids:
+                existing_agent_ids = {
+                    agent_id
+                    for (agent_id,) in session.query(db_model.Agent.id)
+                    .filter(db_model.Agent.id.in_(assigned_agent_ids))
+                    .all()
+                }
 
             task_list = []
             for task in tasks:
                 is_valid = True  # Default to true if assigned_agent_id is empty
                 # Validate assigned agent ID only if it's not an empty string
                 if task.assigned_agent_id:
-                    agent_exists = session.query(db_model.Agent).filter_by(id=task.assigned_agent_id).one_or_none()
-                    is_valid = bool(agent_exists)
+                    is_valid = task.assigned_agent_id in existing_agent_ids
 
                 task_list.append(
                     CrewAITaskMetadata(
@@ -121,7 +131,8 @@ def list_tasks(request: ListTasksRequest, cml: CMLServiceApi, dao: AgentStudioDa
                     )
                 )
 
-            return ListTasksResponse(tasks=task_list)
+            apply_field_mask(task_list, CrewAITaskMetadata, request.fields)
+            return ListTasksResponse(tasks=task_list, next_page_token=next_page_token)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to list tasks: {str(e)}")
 
@@ -134,7 +145,7 @@ def get_task(request: GetTaskRequest, cml: CMLServiceApi, dao: AgentStudioDao =
         if not request.task_id:
             raise ValueError("Task ID is required.")
 
-        with dao.get_session() as session:
+        with dao.get_read_session() as session:
             task = session.query(db_model.Task).filter_by(id=request.task_id).one_or_none()
             if not task:
                 raise ValueError(f"Task with ID '{request.task_id}' not found.")
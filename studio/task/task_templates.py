@@ -1,4 +1,3 @@
-from typing import List
 from uuid import uuid4
 from google.protobuf.json_format import MessageToDict
 
@@ -7,24 +6,25 @@ from cmlapi import CMLServiceApi
 from studio.db.dao import AgentStudioDao
 from studio.api import *
 from studio.db import model as db_model, DbSession
-from studio.proto.utils import is_field_set
+from studio.proto.utils import apply_field_mask, is_field_set, paginate_query
 
 
 def list_task_templates(
     request: ListTaskTemplatesRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> ListTaskTemplatesResponse:
     with dao.get_session() as session:
-        task_templates: List[db_model.TaskTemplate] = session.query(db_model.TaskTemplate).all()
+        query = session.query(db_model.TaskTemplate)
 
         # Filter by workflow template
         if is_field_set(request, "workflow_template_id"):
-            task_templates = list(
-                filter(lambda x: x.workflow_template_id == request.workflow_template_id, task_templates)
-            )
+            query = query.filter_by(workflow_template_id=request.workflow_template_id)
+        if request.ids:
+            query = query.filter(db_model.TaskTemplate.id.in_(request.ids))
+        task_templates, next_page_token = paginate_query(query, request, db_model.TaskTemplate.id)
 
-        return ListTaskTemplatesResponse(
-            task_templates=[task_template.to_protobuf() for task_template in task_templates]
-        )
+        task_template_list = [task_template.to_protobuf() for task_template in task_templates]
+        apply_field_mask(task_template_list, TaskTemplateMetadata, request.fields)
+        return ListTaskTemplatesResponse(task_templates=task_template_list, next_page_token=next_page_token)
 
 
 def get_task_template(
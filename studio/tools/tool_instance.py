@@ -8,9 +8,11 @@ from cmlapi import CMLServiceApi
 import json
 import os
 import studio.tools.utils as tool_utils
+from studio.proto.utils import apply_field_mask, is_field_requested, paginate_query
 from studio.cross_cutting.global_thread_pool import get_thread_pool
 import studio.consts as consts
 import studio.cross_cutting.utils as cc_utils
+from studio.workflow.utils import invalidate_collated_input_on_commit
 
 # Import engine code manually. Eventually when this code becomes
 # a separate git repo, or a custom runtime image, this path call
@@ -18,7 +20,8 @@ import studio.cross_cutting.utils as cc_utils
 import sys
 
 sys.path.append("studio/workflow_engine/src/")
-from engine.crewai.tools import prepare_virtual_env_for_tool
+from engine.crewai.tool_files import read_tool_file
+from engine.crewai.venvs import prepare_virtual_env_for_tool, release_virtual_env_for_tool
 
 
 def create_tool_instance(
@@ -48,13 +51,15 @@ def _create_tool_instance_impl(request: CreateToolInstanceRequest, session: DbSe
     """
     Implementation of tool instance creation logic
     """
+    # The template and workflow are looked up by primary key, so that ones
+    # already loaded in the session are not queried again for every instance.
     associated_tool_template: Optional[db_model.ToolTemplate] = None
     if request.tool_template_id:
-        associated_tool_template = session.query(db_model.ToolTemplate).filter_by(id=request.tool_template_id).first()
+        associated_tool_template = session.get(db_model.ToolTemplate, request.tool_template_id)
         if not associated_tool_template:
             raise ValueError(f"ToolTemplate with id {request.tool_template_id} not found")
 
-    workflow_obj = session.query(db_model.Workflow).filter_by(id=request.workflow_id).first()
+    workflow_obj = session.get(db_model.Workflow, request.workflow_id)
     if not workflow_obj:
         raise ValueError(f"Workflow with id {request.workflow_id} not found")
     workflow_dir = workflow_obj.directory
@@ -160,6 +165,7 @@ def _update_tool_instance_impl(request: UpdateToolInstanceRequest, session: DbSe
         shutil.copy(request.tmp_tool_image_path, tool_image_path)
         tool_instance.tool_image_path = tool_image_path
         os.remove(request.tmp_tool_image_path)
+    invalidate_collated_input_on_commit(session, tool_instance.workflow_id)
     get_thread_pool().submit(
         prepare_virtual_env_for_tool,
         tool_instance.source_folder_path,
@@ -179,7 +185,7 @@ def get_tool_instance(
     """
     try:
         if dao is not None:
-            with dao.get_session() as session:
+            with dao.get_read_session() as session:
                 return _get_tool_instance_impl(request, session)
         else:
             session = preexisting_db_session
@@ -197,15 +203,16 @@ def _get_tool_instance_impl(request: GetToolInstanceRequest, session: DbSession)
         raise ValueError(f"Tool Instance with id '{request.tool_instance_id}' not found")
 
     tool_instance_dir = tool_instance.source_folder_path
-    with open(os.path.join(tool_instance_dir, tool_instance.python_code_file_name), "r") as f:
-        tool_code = f.read()
-    with open(os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name), "r") as f:
-        tool_requirements = f.read()
+    tool_code_path = os.path.join(tool_instance_dir, tool_instance.python_code_file_name)
+    tool_code = read_tool_file(tool_code_path)
+    tool_requirements = read_tool_file(
+        os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name)
+    )
 
     # is_valid, validation_errors = tool_utils.validate_tool_code(tool_code)
     user_params = []
     try:
-        user_params = tool_utils.extract_user_params_from_code(tool_code)
+        user_params = tool_utils.extract_user_params_from_file(tool_code_path)
     except Exception as e:
         is_valid = False
         # validation_errors.append(f"Error extracting user parameters from python code: {e}")
@@ -242,7 +249,7 @@ def list_tool_instances(
     """
     try:
         if dao is not None:
-            with dao.get_session() as session:
+            with dao.get_read_session() as session:
                 return _list_tool_instances_impl(request, session)
         else:
             session = preexisting_db_session
@@ -255,26 +262,34 @@ def _list_tool_instances_impl(request: ListToolInstancesRequest, session: DbSess
     """
     Implementation of list tool instances logic
     """
+    query = session.query(db_model.ToolInstance)
     if request.workflow_id:
-        tool_instances = session.query(db_model.ToolInstance).filter_by(workflow_id=request.workflow_id).all()
-    else:
-        tool_instances = session.query(db_model.ToolInstance).all()
+        query = query.filter_by(workflow_id=request.workflow_id)
+    if request.ids:
+        query = query.filter(db_model.ToolInstance.id.in_(request.ids))
+    tool_instances, next_page_token = paginate_query(query, request, db_model.ToolInstance.id)
 
     tool_instances_response = []
     for tool_instance in tool_instances:
         tool_instance_dir = tool_instance.source_folder_path
-        with open(os.path.join(tool_instance_dir, tool_instance.python_code_file_name), "r") as f:
-            tool_code = f.read()
-        with open(os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name), "r") as f:
-            tool_requirements = f.read()
+        tool_code_path = os.path.join(tool_instance_dir, tool_instance.python_code_file_name)
+        tool_code = ""
+        if is_field_requested(request, "python_code"):
+            tool_code = read_tool_file(tool_code_path)
+        tool_requirements = ""
+        if is_field_requested(request, "python_requirements"):
+            tool_requirements = read_tool_file(
+                os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name)
+            )
 
         # is_valid, validation_errors = tool_utils.validate_tool_code(tool_code)
         user_params = []
-        try:
-            user_params = tool_utils.extract_user_params_from_code(tool_code)
-        except Exception as e:
-            is_valid = False
-            # validation_errors.append(f"Error extracting user parameters from python code: {e}")
+        if is_field_requested(request, "tool_metadata"):
+            try:
+                user_params = tool_utils.extract_user_params_from_file(tool_code_path)
+            except Exception as e:
+                is_valid = False
+                # validation_errors.append(f"Error extracting user parameters from python code: {e}")
 
         tool_image_uri = ""
         if tool_instance.tool_image_path:
@@ -295,12 +310,14 @@ def _list_tool_instances_impl(request: ListToolInstancesRequest, session: DbSess
                 is_venv_tool=tool_instance.is_venv_tool,
             )
         )
-    return ListToolInstancesResponse(tool_instances=tool_instances_response)
+    apply_field_mask(tool_instances_response, ToolInstance, request.fields)
+    return ListToolInstancesResponse(tool_instances=tool_instances_response, next_page_token=next_page_token)
 
 
 def _delete_tool_instance_directory(source_folder_path: str):
     try:
         if os.path.exists(source_folder_path):
+            release_virtual_env_for_tool(source_folder_path)
             shutil.rmtree(source_folder_path)
             print(f"Deleted tool instance directory: {source_folder_path}")
     except Exception as e:
@@ -353,4 +370,5 @@ def _remove_tool_instance_impl(
             print(f"Failed to delete tool instance image: {e}")
 
     session.delete(tool_instance)
+    invalidate_collated_input_on_commit(session, tool_instance.workflow_id)
     return RemoveToolInstanceResponse()
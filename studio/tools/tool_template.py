@@ -1,15 +1,15 @@
 import os
 import re
 from uuid import uuid4
-from typing import List
 from sqlalchemy.exc import SQLAlchemyError
 from studio.db.dao import AgentStudioDao
 from studio.db import model as db_model
 from studio.api import *
 import studio.consts as consts
 import studio.tools.utils as tool_utils
+from engine.crewai.tool_files import read_tool_file
 import studio.cross_cutting.utils as cc_utils
-from studio.proto.utils import is_field_set
+from studio.proto.utils import apply_field_mask, is_field_set, is_field_requested, paginate_query
 from cmlapi import CMLServiceApi
 import json
 import shutil
@@ -23,11 +23,21 @@ def list_tool_templates(
     """
     try:
         with dao.get_session() as session:
-            templates: List[db_model.ToolTemplate] = session.query(db_model.ToolTemplate).all()
+            query = session.query(db_model.ToolTemplate)
 
             # Filter by workflow template
             if is_field_set(request, "workflow_template_id"):
-                templates = list(filter(lambda x: x.workflow_template_id == request.workflow_template_id, templates))
+                query = query.filter_by(workflow_template_id=request.workflow_template_id)
+            if request.ids:
+                query = query.filter(db_model.ToolTemplate.id.in_(request.ids))
+            templates, next_page_token = paginate_query(query, request, db_model.ToolTemplate.id)
+
+            # Tool files only need to be read if their contents, or whether
+            # they can be read at all, are part of the response.
+            read_python_code = is_field_requested(request, "python_code") or is_field_requested(request, "is_valid")
+            read_python_requirements = is_field_requested(request, "python_requirements") or is_field_requested(
+                request, "is_valid"
+            )
 
             response_templates = []
             for template in templates:
@@ -37,12 +47,14 @@ def list_tool_templates(
                 is_valid = True
 
                 # Attempt to read the Python code
-                try:
-                    python_code_file_path = os.path.join(template.source_folder_path, template.python_code_file_name)
-                    with open(python_code_file_path, "r") as file:
-                        python_code = file.read()
-                except Exception:
-                    is_valid = False
+                if read_python_code:
+                    try:
+                        python_code_file_path = os.path.join(
+                            template.source_folder_path, template.python_code_file_name
+                        )
+                        python_code = read_tool_file(python_code_file_path)
+                    except Exception:
+                        is_valid = False
 
                 # Validate the Python code if successfully read
                 # NOTE: with tools v2, there is no need to validate tool code. Tool code
@@ -53,14 +65,14 @@ def list_tool_templates(
                 #     is_valid, validation_errors = tool_utils.validate_tool_code(python_code)
 
                 # Attempt to read the Python requirements
-                try:
-                    python_requirements_file_path = os.path.join(
-                        template.source_folder_path, template.python_requirements_file_name
-                    )
-                    with open(python_requirements_file_path, "r") as file:
-                        python_requirements = file.read()
-                except Exception:
-                    is_valid = False
+                if read_python_requirements:
+                    try:
+                        python_requirements_file_path = os.path.join(
+                            template.source_folder_path, template.python_requirements_file_name
+                        )
+                        python_requirements = read_tool_file(python_requirements_file_path)
+                    except Exception:
+                        is_valid = False
 
                 # tool_metadata = json.dumps({"validation_errors": validation_errors})
 
@@ -85,7 +97,8 @@ def list_tool_templates(
                     )
                 )
 
-            return ListToolTemplatesResponse(templates=response_templates)
+            apply_field_mask(response_templates, ToolTemplate, request.fields)
+            return ListToolTemplatesResponse(templates=response_templates, next_page_token=next_page_token)
 
     except SQLAlchemyError as e:
         raise RuntimeError(f"Database error while listing tool templates: {e}")
@@ -114,8 +127,7 @@ def get_tool_template(
             # Attempt to read the Python code
             try:
                 python_code_file_path = os.path.join(template.source_folder_path, template.python_code_file_name)
-                with open(python_code_file_path, "r") as file:
-                    python_code = file.read()
+                python_code = read_tool_file(python_code_file_path)
             except Exception:
                 is_valid = False
 
@@ -129,8 +141,7 @@ def get_tool_template(
                 python_requirements_file_path = os.path.join(
                     template.source_folder_path, template.python_requirements_file_name
                 )
-                with open(python_requirements_file_path, "r") as file:
-                    python_requirements = file.read()
+                python_requirements = read_tool_file(python_requirements_file_path)
             except Exception:
                 is_valid = False
 
@@ -8,6 +8,8 @@ import sys
 
 sys.path.append("studio/workflow_engine/src/")
 
+from engine.crewai.tool_files import get_tool_file_metadata
+
 
 def extract_user_params_from_code(code: str) -> List[str]:
     """
@@ -35,6 +37,14 @@ def extract_user_params_from_code(code: str) -> List[str]:
         raise ValueError(f"Error parsing Python code: {e}")
 
 
+def extract_user_params_from_file(file_path: str) -> List[str]:
+    """
+    Extract the user parameters from a tool code file. The file is only read
+    and parsed again once it changes on disk.
+    """
+    return list(get_tool_file_metadata(file_path, "user_params", extract_user_params_from_code))
+
+
 def validate_tool_code(code: str) -> Tuple[bool, List[str]]:
     errors: List[str] = []
     try:
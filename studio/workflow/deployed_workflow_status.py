@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from studio.consts import (
+    DEFAULT_DEPLOYED_WORKFLOW_STATUS_MAX_AGE_SECONDS,
+    DEFAULT_DEPLOYED_WORKFLOW_STATUS_TTL_SECONDS,
+    DEFAULT_DEPLOYED_WORKFLOW_STATUS_WORKERS,
+)
+
+
+def get_deployed_workflow_status_ttl() -> float:
+    return float(os.getenv("AGENT_STUDIO_DEPLOYED_WORKFLOW_STATUS_TTL", DEFAULT_DEPLOYED_WORKFLOW_STATUS_TTL_SECONDS))
+
+
+def get_deployed_workflow_status_max_age() -> float:
+    return float(
+        os.getenv("AGENT_STUDIO_DEPLOYED_WORKFLOW_STATUS_MAX_AGE", DEFAULT_DEPLOYED_WORKFLOW_STATUS_MAX_AGE_SECONDS)
+    )
+
+
+def get_deployed_workflow_status_workers() -> int:
+    return int(os.getenv("AGENT_STUDIO_DEPLOYED_WORKFLOW_STATUS_WORKERS", DEFAULT_DEPLOYED_WORKFLOW_STATUS_WORKERS))
+
+
+class DeployedWorkflowStatusCache:
+    """
+    Cache of the CML lookups behind ListDeployedWorkflows (the status of
+    every deployed model, the project's models and applications), shared by
+    all callers of the RPC.
+
+    Lookups that are not cached yet run concurrently on a bounded pool and
+    are waited for. Cached values are served right away: once they are older
+    than ``ttl`` seconds they are refreshed in the background, so the next
+    call sees the new value. Values older than ``max_age`` seconds (e.g.
+    because refreshes keep failing) are not served anymore and are fetched
+    again like uncached ones. There is at most one lookup in flight per key.
+
+    Invalidating a key bumps its generation. A lookup that was started
+    before that does not update the cache anymore, and the next call starts
+    a new one.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DEPLOYED_WORKFLOW_STATUS_TTL_SECONDS,
+        max_age: float = DEFAULT_DEPLOYED_WORKFLOW_STATUS_MAX_AGE_SECONDS,
+        max_workers: int = DEFAULT_DEPLOYED_WORKFLOW_STATUS_WORKERS,
+    ):
+        self.ttl = ttl
+        self.max_age = max_age
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deployed_workflow_status_")
+        self._lock = threading.Lock()
+        # Value and time it was fetched at, by key.
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._generations: Dict[str, int] = {}
+
+    def _fetch(self, key: str, fetch: Callable[[], Any], generation: int) -> Any:
+        try:
+            value = fetch()
+            with self._lock:
+                if self._generations.get(key, 0) == generation:
+                    self._entries[key] = (value, time.time())
+            return value
+        except Exception as e:
+            print(f"Failed to fetch deployed workflow status '{key}': {e}")
+            raise
+        finally:
+            with self._lock:
+                # A lookup started after an invalidation is left in flight.
+                if self._generations.get(key, 0) == generation:
+                    self._in_flight.pop(key, None)
+
+    def get_many(self, fetchers: Dict[str, Callable[[], Any]]) -> Dict[str, Tuple[Any, float]]:
+        """
+        Return the value and age in seconds of every key, calling its
+        fetcher if the key is not cached, or has to be refreshed. Raises the
+        error of the fetcher of a key that could not be served from the cache.
+        Keys that are invalidated while this runs may be missing.
+        """
+        now = time.time()
+        waiting: Dict[str, Future] = {}
+        with self._lock:
+            for key, fetch in fetchers.items():
+                entry = self._entries.get(key)
+                age = now - entry[1] if entry else None
+                if age is not None and age < self.ttl:
+                    continue
+                future = self._in_flight.get(key)
+                if future is None:
+                    future = self._executor.submit(self._fetch, key, fetch, self._generations.get(key, 0))
+                    self._in_flight[key] = future
+                if age is None or age >= self.max_age:
+                    waiting[key] = future
+
+        values = {}
+        for key, future in waiting.items():
+            values[key] = (future.result(), 0.0)
+
+        now = time.time()
+        with self._lock:
+            for key in fetchers:
+                entry = self._entries.get(key)
+                # Keys invalidated in the meantime are left out.
+                if key not in values and entry is not None:
+                    value, fetched_at = entry
+                    values[key] = (value, max(now - fetched_at, 0.0))
+        return values
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            keys = set(self._entries) | set(self._in_flight) if key is None else {key}
+            for invalidated_key in keys:
+                self._entries.pop(invalidated_key, None)
+                self._in_flight.pop(invalidated_key, None)
+                self._generations[invalidated_key] = self._generations.get(invalidated_key, 0) + 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_deployed_workflow_status_cache: Optional[DeployedWorkflowStatusCache] = None
+
+
+def get_deployed_workflow_status_cache() -> DeployedWorkflowStatusCache:
+    global _deployed_workflow_status_cache
+    if _deployed_workflow_status_cache is None:
+        raise RuntimeError("Deployed workflow status cache not initialized")
+    return _deployed_workflow_status_cache
+
+
+def initialize_deployed_workflow_status_cache():
+    global _deployed_workflow_status_cache
+    _deployed_workflow_status_cache = DeployedWorkflowStatusCache(
+        ttl=get_deployed_workflow_status_ttl(),
+        max_age=get_deployed_workflow_status_max_age(),
+        max_workers=get_deployed_workflow_status_workers(),
+    )
+
+
+def invalidate_deployed_workflow_status(*keys: str) -> None:
+    """
+    Drop cached lookups after a deployment changes, so the next listing
+    fetches them again. Does nothing if the cache is not initialized.
+    """
+    if _deployed_workflow_status_cache:
+        for key in keys:
+            _deployed_workflow_status_cache.invalidate(key)
+
+
+def cleanup_deployed_workflow_status_cache():
+    global _deployed_workflow_status_cache
+    if _deployed_workflow_status_cache:
+        _deployed_workflow_status_cache.shutdown()
+        _deployed_workflow_status_cache = None
@@ -1,13 +1,37 @@
-import requests
+import http.server
+import json
 import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+import requests
 
-from studio.consts import DEFAULT_AS_WORKFLOW_RUNNER_STARTING_PORT
+from studio.ops import get_ops_endpoint
+from studio.consts import (
+    DEFAULT_AS_WORKFLOW_RUNNER_STARTING_PORT,
+    DEFAULT_AS_WORKFLOW_DISPATCHER_PORT,
+    DEFAULT_WORKFLOW_RUNNER_QUEUE_DEPTH,
+    DEFAULT_WORKFLOW_RUNNER_LEASE_TTL_SECONDS,
+    DEFAULT_WORKFLOW_RUNNER_QUEUE_TIMEOUT_SECONDS,
+)
 
 
 def get_num_workfow_runners() -> int:
     return int(os.getenv("AGENT_STUDIO_NUM_WORKFLOW_RUNNERS", 0))
 
 
+def get_workflow_runner_queue_depth() -> int:
+    return int(os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_QUEUE_DEPTH", DEFAULT_WORKFLOW_RUNNER_QUEUE_DEPTH))
+
+
+def get_workflow_runner_queue_timeout() -> int:
+    return int(
+        os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_QUEUE_TIMEOUT", DEFAULT_WORKFLOW_RUNNER_QUEUE_TIMEOUT_SECONDS)
+    )
+
+
 def get_workflow_runner_endpoints() -> list[str]:
     num_runners = get_num_workfow_runners()
     starting_port = DEFAULT_AS_WORKFLOW_RUNNER_STARTING_PORT
@@ -17,13 +41,362 @@ def get_workflow_runner_endpoints() -> list[str]:
     return runner_endpoints
 
 
+def get_workflow_dispatcher_callback_url() -> str:
+    return f"http://localhost:{DEFAULT_AS_WORKFLOW_DISPATCHER_PORT}/runner-events"
+
+
 def get_workflow_runners() -> list[dict]:
     endpoints = get_workflow_runner_endpoints()
     workflow_runners = []
     for endpoint in endpoints:
         try:
-            busy = requests.get(url=f"{endpoint}/status").json().get("busy", True)
+            status = requests.get(url=f"{endpoint}/status").json()
+            busy = status.get("busy", True)
+            free_slots = status.get("free_slots", 0 if busy else 1)
         except Exception as e:
-            busy = True
-        workflow_runners.append({"endpoint": endpoint, "busy": busy})
+            busy, free_slots = True, 0
+        workflow_runners.append({"endpoint": endpoint, "busy": busy, "free_slots": free_slots})
     return workflow_runners
+
+
+class WorkflowRunnerDispatcher:
+    """
+    Dispatches test workflow kickoffs to the workflow runners. Rather than
+    polling every runner's /status for each kickoff, the dispatcher keeps
+    its own view of runner occupancy:
+
+      - every kickoff sent to a runner takes a lease on one of its slots,
+      - runners push a notification to the dispatcher's callback endpoint
+        when a run finishes, which releases the lease, and
+      - leases that are never released (for example if a runner restarted)
+        expire after a TTL, at which point the runner's /status is used to
+        reconcile the dispatcher's view.
+
+    A runner only runs one workflow at a time, so a runner with free slots
+    only takes kickoffs of the workflow it is already running. Kickoffs
+    that cannot be placed immediately wait in a bounded queue and are
+    dispatched as soon as a slot frees up. The whole queue is scanned for
+    kickoffs that can be placed, so a kickoff waiting for a runner to
+    finish another workflow does not hold up the kickoffs behind it; the
+    kickoffs of one workflow are dispatched in FIFO order. Kickoffs that
+    wait longer than the queue timeout are dropped and reported as failed
+    to the ops server, so the UI polling for the trace's events gets an
+    answer.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        max_queue_depth: int = DEFAULT_WORKFLOW_RUNNER_QUEUE_DEPTH,
+        lease_ttl: float = DEFAULT_WORKFLOW_RUNNER_LEASE_TTL_SECONDS,
+        queue_timeout: float = DEFAULT_WORKFLOW_RUNNER_QUEUE_TIMEOUT_SECONDS,
+        callback_url: Optional[str] = None,
+        on_kickoff_failed: Optional[Callable[[dict, str], None]] = None,
+    ):
+        self.max_queue_depth = max_queue_depth
+        self.lease_ttl = lease_ttl
+        self.queue_timeout = queue_timeout
+        self.on_kickoff_failed = on_kickoff_failed
+        self.callback_url = callback_url
+        self._runners: Dict[str, dict] = {endpoint: {"slots": None, "leases": {}} for endpoint in endpoints}
+        self._queue: Deque[dict] = deque()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="workflow_runner_dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, payload: dict) -> int:
+        """
+        Queue a kickoff payload for dispatch. Returns the position of the
+        kickoff in the queue at submission time, where 0 means that it is
+        being dispatched to a runner right away.
+        """
+        if not self._runners:
+            raise RuntimeError("No workflow runners currently available to test workflow!")
+        with self._condition:
+            if len(self._queue) >= self.max_queue_depth:
+                raise RuntimeError(
+                    f"Workflow runner queue is full ({self.max_queue_depth} pending test runs). Try again later."
+                )
+            workflow_name = payload.get("workflow_name")
+            has_free_slot = not any(
+                entry["payload"].get("workflow_name") == workflow_name for entry in self._queue
+            ) and any(self._free_slots_for(r, workflow_name) != 0 for r in self._runners.values())
+            self._queue.append({"payload": payload, "queued_at": time.monotonic()})
+            self._condition.notify_all()
+            return 0 if has_free_slot else len(self._queue)
+
+    def release(self, trace_id: str) -> None:
+        """
+        Release the lease held for a run. Called when a runner notifies us
+        that the run has finished.
+        """
+        with self._condition:
+            for runner in self._runners.values():
+                runner["leases"].pop(trace_id, None)
+            self._condition.notify_all()
+
+    def get_queue_position(self, trace_id: str) -> int:
+        with self._condition:
+            for i, entry in enumerate(self._queue):
+                if entry["payload"]["events_trace_id"] == trace_id:
+                    return i + 1
+        return 0
+
+    def status(self) -> dict:
+        with self._condition:
+            return {
+                "queue_depth": len(self._queue),
+                "runners": {
+                    endpoint: {"slots": runner["slots"], "leases": len(runner["leases"])}
+                    for endpoint, runner in self._runners.items()
+                },
+            }
+
+    @staticmethod
+    def _free_slots(runner: dict) -> Optional[int]:
+        # Unknown capacity is reported as None so we go ask the runner.
+        if runner["slots"] is None:
+            return None
+        return runner["slots"] - len(runner["leases"])
+
+    @classmethod
+    def _free_slots_for(cls, runner: dict, workflow_name: Optional[str]) -> Optional[int]:
+        # A runner busy with another workflow has no slots for this one.
+        free_slots = cls._free_slots(runner)
+        if free_slots and any(lease["workflow_name"] != workflow_name for lease in runner["leases"].values()):
+            return 0
+        return free_slots
+
+    def _reconcile(self, endpoint: str) -> None:
+        """
+        Refresh our view of a runner from its /status endpoint. Only used
+        when we do not know the runner's capacity yet, after it turned down
+        a kickoff, or when one of its leases expired.
+        """
+        try:
+            status = requests.get(url=f"{endpoint}/status", timeout=5).json()
+        except Exception as e:
+            print(f"Failed to get status of workflow runner {endpoint}: {e}")
+            with self._condition:
+                self._runners[endpoint] = {"slots": None, "leases": {}}
+            return
+        slots = status.get("slots", 1)
+        running = {w["trace_id"]: w.get("workflow_name") for w in status.get("workflows", []) if w.get("trace_id")}
+        if not running and status.get("busy") and "free_slots" not in status:
+            # Older runners only report a busy flag.
+            running = {"unknown": None}
+        expires_at = time.monotonic() + self.lease_ttl
+        with self._condition:
+            self._runners[endpoint] = {
+                "slots": slots,
+                "leases": {
+                    trace_id: {"expires_at": expires_at, "workflow_name": workflow_name}
+                    for trace_id, workflow_name in running.items()
+                },
+            }
+
+    def _expire_leases(self) -> None:
+        now = time.monotonic()
+        with self._condition:
+            stale = [
+                endpoint
+                for endpoint, runner in self._runners.items()
+                if any(lease["expires_at"] < now for lease in runner["leases"].values())
+            ]
+        for endpoint in stale:
+            self._reconcile(endpoint)
+
+    def _try_dispatch(self, payload: dict) -> bool:
+        workflow_name = payload.get("workflow_name")
+
+        def free_slots_of(endpoint: str) -> Optional[int]:
+            return self._free_slots_for(self._runners[endpoint], workflow_name)
+
+        with self._condition:
+            candidates = sorted(
+                self._runners.keys(),
+                key=lambda e: -1 if free_slots_of(e) is None else free_slots_of(e),
+                reverse=True,
+            )
+        for endpoint in candidates:
+            with self._condition:
+                free_slots = free_slots_of(endpoint)
+            if free_slots is None:
+                self._reconcile(endpoint)
+                with self._condition:
+                    free_slots = free_slots_of(endpoint)
+            if not free_slots:
+                continue
+
+            with self._condition:
+                self._runners[endpoint]["leases"][payload["events_trace_id"]] = {
+                    "expires_at": time.monotonic() + self.lease_ttl,
+                    "workflow_name": workflow_name,
+                }
+            try:
+                resp = requests.post(
+                    url=f"{endpoint}/kickoff",
+                    json={**payload, "callback_url": self.callback_url},
+                    timeout=30,
+                )
+            except Exception as e:
+                print(f"Failed to kick off workflow on runner {endpoint}: {e}")
+                resp = None
+            if resp is not None and resp.status_code < 400:
+                return True
+
+            # The runner turned the kickoff down. Drop the lease and refresh
+            # our view of the runner before moving on to the next one.
+            self.release(payload["events_trace_id"])
+            self._reconcile(endpoint)
+        return False
+
+    def _dispatch_queued(self) -> bool:
+        """
+        Dispatch the first queued kickoff that a runner can take. Once a
+        kickoff of a workflow could not be placed, the later kickoffs of the
+        same workflow are skipped, so that they keep their order.
+        """
+        with self._condition:
+            entries = list(self._queue)
+        blocked_workflows = set()
+        for entry in entries:
+            workflow_name = entry["payload"].get("workflow_name")
+            if workflow_name in blocked_workflows:
+                continue
+            if self._try_dispatch(entry["payload"]):
+                with self._condition:
+                    self._queue.remove(entry)
+                return True
+            blocked_workflows.add(workflow_name)
+        return False
+
+    def _expire_queued(self) -> bool:
+        now = time.monotonic()
+        with self._condition:
+            expired = [entry for entry in self._queue if now - entry["queued_at"] > self.queue_timeout]
+            for entry in expired:
+                self._queue.remove(entry)
+        for entry in expired:
+            if self.on_kickoff_failed:
+                self.on_kickoff_failed(
+                    entry["payload"],
+                    f"No workflow runner became available within {self.queue_timeout} seconds.",
+                )
+        return bool(expired)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._shutdown:
+                    return
+            self._expire_leases()
+
+            if self._dispatch_queued():
+                continue
+            if self._expire_queued():
+                continue
+
+            with self._condition:
+                if self._shutdown:
+                    return
+                # Wait for a push notification (or a new kickoff) and
+                # periodically wake up to expire stale leases.
+                self._condition.wait(timeout=5 if self._queue else 60)
+
+
+class _DispatcherCallbackHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Receives push notifications from the workflow runners.
+    """
+
+    def do_POST(self):
+        if not self.path.startswith("/runner-events"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        content_length = int(self.headers.get("Content-Length", 0))
+        try:
+            data = json.loads(self.rfile.read(content_length))
+            trace_id = data["trace_id"]
+        except (json.JSONDecodeError, KeyError):
+            self.send_response(400)
+            self.end_headers()
+            return
+        if _workflow_runner_dispatcher is not None:
+            _workflow_runner_dispatcher.release(trace_id)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+_workflow_runner_dispatcher: Optional[WorkflowRunnerDispatcher] = None
+_callback_server: Optional[http.server.ThreadingHTTPServer] = None
+
+
+def _post_kickoff_failed_event(payload: dict, error: str) -> None:
+    try:
+        requests.post(
+            url=f"{get_ops_endpoint()}/events",
+            headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
+            json={
+                "trace_id": payload["events_trace_id"],
+                "event": {"type": "crew_kickoff_failed", "error": error},
+            },
+            timeout=10,
+        )
+    except Exception as e:
+        print(f"Failed to send kickoff failure event: {e}")
+
+
+def get_workflow_runner_dispatcher() -> WorkflowRunnerDispatcher:
+    global _workflow_runner_dispatcher
+    if _workflow_runner_dispatcher is None:
+        raise RuntimeError("Workflow runner dispatcher not initialized")
+    return _workflow_runner_dispatcher
+
+
+def initialize_workflow_runner_dispatcher():
+    global _workflow_runner_dispatcher, _callback_server
+    _workflow_runner_dispatcher = WorkflowRunnerDispatcher(
+        get_workflow_runner_endpoints(),
+        max_queue_depth=get_workflow_runner_queue_depth(),
+        queue_timeout=get_workflow_runner_queue_timeout(),
+        callback_url=get_workflow_dispatcher_callback_url(),
+        on_kickoff_failed=_post_kickoff_failed_event,
+    )
+    _workflow_runner_dispatcher.start()
+    try:
+        _callback_server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", int(DEFAULT_AS_WORKFLOW_DISPATCHER_PORT)), _DispatcherCallbackHandler
+        )
+        threading.Thread(target=_callback_server.serve_forever, name="workflow_runner_callbacks", daemon=True).start()
+    except OSError as e:
+        # Without push notifications, leases are still released by the TTL.
+        print(f"Failed to start workflow runner callback server: {e}")
+        _callback_server = None
+
+
+def cleanup_workflow_runner_dispatcher():
+    global _workflow_runner_dispatcher, _callback_server
+    if _callback_server:
+        _callback_server.shutdown()
+        _callback_server.server_close()
+        _callback_server = None
+    if _workflow_runner_dispatcher:
+        _workflow_runner_dispatcher.stop()
+        _workflow_runner_dispatcher = None
@@ -1,25 +1,38 @@
+import functools
 import json
 import os
+import re
 import shutil
+import subprocess
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from uuid import uuid4
 import cmlapi
-from typing import Union, List, Optional
+from typing import Dict, Union, List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 import requests
 from google.protobuf.json_format import MessageToDict
-import json
 from cmlapi import CMLServiceApi
 
 from studio.db.dao import AgentStudioDao
 from studio.api import *
 from studio.db import model as db_model
-from studio.models.utils import get_studio_default_model_id
+from studio.models.utils import get_model_api_keys_from_env, get_studio_default_model_id
 import studio.cross_cutting.utils as cc_utils
 from studio.proto.utils import is_field_set
 from studio.cross_cutting.utils import get_studio_subdirectory
 import studio.consts as consts
-from studio.workflow.utils import is_custom_model_root_dir_feature_enabled
-from studio.workflow.runners import get_workflow_runners
+from studio.workflow.utils import (
+    cache_collated_input,
+    get_cached_collated_input,
+    get_collated_input_cache_generation,
+    is_custom_model_root_dir_feature_enabled,
+)
+from studio.workflow.runners import get_workflow_runner_dispatcher
+from studio.cross_cutting.global_thread_pool import get_thread_pool
+from studio.workflow.deployed_workflow_status import (
+    get_deployed_workflow_status_cache,
+    invalidate_deployed_workflow_status,
+)
 
 # Import engine code manually. Eventually when this code becomes
 # a separate git repo, or a custom runtime image, this path call
@@ -29,24 +42,33 @@ import sys
 sys.path.append("studio/worfklow_engine/src")
 
 from engine.ops import get_ops_endpoint
+from engine.application_directory import get_application_directory, invalidate_application_directory
+from engine.crewai.venvs import build_wheelhouses_for_tools
+from engine.consts import DEPLOYED_WORKFLOW_WHEELHOUSE_DIR
 import engine.types as input_types
 
 
-def _create_collated_input(
-    request: Union[TestWorkflowRequest, DeployWorkflowRequest], cml: CMLServiceApi = None, dao: AgentStudioDao = None
-) -> input_types.CollatedInput:
+def _get_generation_config(request: Union[TestWorkflowRequest, DeployWorkflowRequest]) -> dict:
     # For now, we only allow one a singular generation config
     # shared across all LLMs. This can be updated in the future
     # if we need it to be.
-    llm_generation_config = consts.DEFAULT_GENERATION_CONFIG
+    llm_generation_config = dict(consts.DEFAULT_GENERATION_CONFIG)
     if is_field_set(request, "generation_config"):
         request_dict = MessageToDict(request, preserving_proto_field_name=True)
         llm_generation_config.update(json.loads(request_dict["generation_config"]))
+    return llm_generation_config
+
 
+def _build_collated_input(workflow_id: str, dao: AgentStudioDao) -> input_types.CollatedInput:
+    """
+    Build the collated input of a workflow from the studio database. The
+    deployment ID and the generation config of the language models are
+    request specific and are filled in by _create_collated_input.
+    """
     with dao.get_session() as session:
-        workflow = session.query(db_model.Workflow).filter(db_model.Workflow.id == request.workflow_id).first()
+        workflow = session.query(db_model.Workflow).filter(db_model.Workflow.id == workflow_id).first()
         if not workflow:
-            raise ValueError(f"Workflow with ID '{request.workflow_id}' not found.")
+            raise ValueError(f"Workflow with ID '{workflow_id}' not found.")
         default_llm = session.query(db_model.Model).filter_by(is_studio_default=True).one_or_none()
         if not default_llm:
             raise ValueError(f"Default model not found.")
@@ -60,10 +82,12 @@ def _create_collated_input(
         if workflow.crew_ai_llm_provider_model_id:
             language_model_ids.add(workflow.crew_ai_llm_provider_model_id)
 
-        task_db_models = session.query(db_model.Task).filter(db_model.Task.id.in_(task_ids)).all()
+        task_db_models = {
+            t.id: t for t in session.query(db_model.Task).filter(db_model.Task.id.in_(task_ids)).all()
+        }
         task_inputs: List[input_types.Input__Task] = []
         for task_id in task_ids:
-            task_db_model = next((t for t in task_db_models if t.id == task_id), None)
+            task_db_model = task_db_models.get(task_id)
             if not task_db_model:
                 raise ValueError(f"Task with ID '{task_id}' not found.")
             task_inputs.append(
@@ -77,10 +101,12 @@ def _create_collated_input(
             if task_db_model.assigned_agent_id:
                 agent_ids.add(task_db_model.assigned_agent_id)
 
-        agent_db_models = session.query(db_model.Agent).filter(db_model.Agent.id.in_(agent_ids)).all()
+        agent_db_models = {
+            a.id: a for a in session.query(db_model.Agent).filter(db_model.Agent.id.in_(agent_ids)).all()
+        }
         agent_inputs: List[input_types.Input__Agent] = []
         for agent_id in agent_ids:
-            agent_db_model = next((a for a in agent_db_models if a.id == agent_id), None)
+            agent_db_model = agent_db_models.get(agent_id)
             if not agent_db_model:
                 raise ValueError(f"Agent with ID '{agent_id}' not found.")
             agent_inputs.append(
@@ -108,12 +134,13 @@ def _create_collated_input(
                 language_model_ids.add(agent_db_model.llm_provider_model_id)
             tool_instance_ids.update(list(agent_db_model.tool_ids))
 
-        tool_instance_db_models = (
-            session.query(db_model.ToolInstance).filter(db_model.ToolInstance.id.in_(tool_instance_ids)).all()
-        )
+        tool_instance_db_models = {
+            t.id: t
+            for t in session.query(db_model.ToolInstance).filter(db_model.ToolInstance.id.in_(tool_instance_ids)).all()
+        }
         tool_instance_inputs: List[input_types.Input__ToolInstance] = []
         for t_id in tool_instance_ids:
-            tool_instance_db_model = next((t for t in tool_instance_db_models if t.id == t_id), None)
+            tool_instance_db_model = tool_instance_db_models.get(t_id)
             if not tool_instance_db_model:
                 raise ValueError(f"Tool Instance with ID '{t_id}' not found.")
             tool_instance_inputs.append(
@@ -132,12 +159,13 @@ def _create_collated_input(
                 )
             )
 
-        language_model_db_models = (
-            session.query(db_model.Model).filter(db_model.Model.model_id.in_(language_model_ids)).all()
-        )
+        language_model_db_models = {
+            lm.model_id: lm
+            for lm in session.query(db_model.Model).filter(db_model.Model.model_id.in_(language_model_ids)).all()
+        }
         language_model_inputs: List[input_types.Input__LanguageModel] = []
         for lm_id in language_model_ids:
-            language_model_db_model = next((lm for lm in language_model_db_models if lm.model_id == lm_id), None)
+            language_model_db_model = language_model_db_models.get(lm_id)
             if not language_model_db_model:
                 raise ValueError(f"Language Model with ID '{lm_id}' not found.")
             language_model_inputs.append(
@@ -148,14 +176,11 @@ def _create_collated_input(
                         provider_model=language_model_db_model.provider_model,
                         model_type=language_model_db_model.model_type,
                         api_base=language_model_db_model.api_base or None,
-                        api_key=language_model_db_model.api_key or None,
                     ),
-                    generation_config=llm_generation_config,
+                    generation_config=dict(consts.DEFAULT_GENERATION_CONFIG),
                 )
             )
 
-        deployed_workflow_instance_id = cc_utils.get_random_compact_string()
-
         # If we have a default manager, assign to the default model for testing.
         llm_provider_model_id = ""
         if workflow.crew_ai_process == "hierarchical" and not workflow.crew_ai_manager_agent:
@@ -168,7 +193,7 @@ def _create_collated_input(
             id=workflow.id,
             name=workflow.name,
             description=workflow.description,
-            deployment_id=deployed_workflow_instance_id,
+            deployment_id="",
             crew_ai_process=workflow.crew_ai_process,
             agent_ids=list(workflow.crew_ai_agents) if workflow.crew_ai_agents else [],
             task_ids=list(workflow.crew_ai_tasks) if workflow.crew_ai_tasks else [],
@@ -188,6 +213,32 @@ def _create_collated_input(
         return collated_input
 
 
+def _create_collated_input(
+    request: Union[TestWorkflowRequest, DeployWorkflowRequest], cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> input_types.CollatedInput:
+    """
+    Collated input of the requested workflow. The database is only walked
+    when the workflow (or anything it is built from) changed since it was
+    last collated, see invalidate_collated_input.
+    """
+    collated_input = get_cached_collated_input(request.workflow_id)
+    if collated_input is None:
+        generation = get_collated_input_cache_generation()
+        collated_input = _build_collated_input(request.workflow_id, dao)
+        cache_collated_input(request.workflow_id, collated_input, generation)
+
+    collated_input.workflow.deployment_id = cc_utils.get_random_compact_string()
+    llm_generation_config = _get_generation_config(request)
+    # API keys are kept in the project environment rather than the studio
+    # database, and are never cached. The environment is read once for all
+    # language models.
+    api_keys = get_model_api_keys_from_env([lm.model_id for lm in collated_input.language_models], cml)
+    for lm in collated_input.language_models:
+        lm.generation_config = dict(llm_generation_config)
+        lm.config.api_key = api_keys[lm.model_id] or None
+    return collated_input
+
+
 def test_workflow(
     request: TestWorkflowRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> TestWorkflowResponse:
@@ -203,28 +254,22 @@ def test_workflow(
         }
         events_trace_id = str(uuid4())
 
-        workflow_runners = get_workflow_runners()
-        available_workflow_runners = list(filter(lambda x: not x["busy"], workflow_runners))
-        if not available_workflow_runners:
-            raise RuntimeError("No workflow runners currently available to test workflow!")
-
-        # Use the first available runner
-        workflow_runner = available_workflow_runners[0]
-
-        resp = requests.post(
-            url=f"{workflow_runner['endpoint']}/kickoff",
-            json={
+        # Kickoffs are queued with the runner dispatcher, which places them
+        # on a runner as soon as a slot is free.
+        queue_position = get_workflow_runner_dispatcher().submit(
+            {
                 "workflow_name": f"Test Workflow - {collated_input.workflow.name}",
                 "collated_input": collated_input.model_dump(),
                 "tool_user_params": tool_user_params_kv,
                 "inputs": dict(request.inputs),
                 "events_trace_id": events_trace_id,
-            },
+            }
         )
 
         return TestWorkflowResponse(
             message="",  # Return empty message since execution is async
             trace_id=events_trace_id,
+            queue_position=queue_position,
         )
 
     except ValueError as e:
@@ -254,6 +299,7 @@ def cleanup_deployed_workflow_application(cml: CMLServiceApi, application: cmlap
     """
     try:
         cml.delete_application(os.getenv("CDSW_PROJECT_ID"), application.id)
+        invalidate_application_directory()
     except Exception as e:
         print(f"Failed to clean up workflow application with ID {application.id}: {str(e)}")
 
@@ -272,10 +318,8 @@ def get_application_for_deployed_workflow(
     """
     Get the CML application tied to a specific workflow.
     """
-    resp: cmlapi.ListApplicationsResponse = cml.list_applications(os.getenv("CDSW_PROJECT_ID"), page_size=5000)
-    applications: list[cmlapi.Application] = resp.applications
-    applications = list(
-        filter(lambda x: x.name == get_application_name_for_deployed_workflow(deployed_workflow), applications)
+    applications: list[cmlapi.Application] = get_application_directory().find(
+        cml, get_application_name_for_deployed_workflow(deployed_workflow), versions=False
     )
     assert len(applications) == 1
     application: cmlapi.Application = applications[0]
@@ -320,6 +364,7 @@ def create_application_for_deployed_workflow(
         ),
         project_id=os.environ.get("CDSW_PROJECT_ID"),
     )
+    invalidate_application_directory()
 
     return application
 
@@ -343,6 +388,87 @@ def get_deployed_workflow_config(deployable_workflow_dir: str) -> dict:
         }
 
 
+def is_prebake_tool_wheels_enabled() -> bool:
+    return os.getenv("AGENT_STUDIO_PREBAKE_TOOL_WHEELS", "true").lower() == "true"
+
+
+# Seconds a deployment waits for its wheelhouses before the model is
+# deployed without them.
+DEFAULT_PREBAKE_TOOL_WHEELS_TIMEOUT = 600
+
+
+def get_prebake_tool_wheels_timeout() -> float:
+    return float(os.getenv("AGENT_STUDIO_PREBAKE_TOOL_WHEELS_TIMEOUT", DEFAULT_PREBAKE_TOOL_WHEELS_TIMEOUT))
+
+
+def _get_runtime_python_version(runtime_identifier: Optional[str]) -> Optional[str]:
+    """
+    Python version ("3.10") of a runtime image, from its identifier (for example
+    "docker.repository.cloudera.com/cloudera/cdsw/ml-runtime-pbj-jupyterlab-python3.10-standard:2025.01.3-b8").
+    """
+    match = re.search(r"python(\d+\.\d+)", runtime_identifier or "")
+    return match.group(1) if match else None
+
+
+def _build_deployed_workflow_wheelhouses(
+    deployable_workflow_dir: str, collated_input: input_types.CollatedInput, python_version: Optional[str] = None
+) -> None:
+    """
+    Bake the wheels of every tool's requirements, and of cmlapi, into the
+    deployed workflow directory, so that the deployed model prepares its
+    tool venvs with offline installs instead of resolving and downloading
+    every requirement at startup. Tool wheels are built for the python
+    version of the deployed model's runtime. Failures are not fatal: the
+    model falls back to installing from the package index.
+    """
+    results = build_wheelhouses_for_tools(
+        [
+            (os.path.join(deployable_workflow_dir, t.source_folder_path), t.python_requirements_file_name)
+            for t in collated_input.tool_instances
+        ],
+        python_version=python_version,
+    )
+    for tool_instance, result in zip(collated_input.tool_instances, results):
+        print(f"Wheelhouse for tool {tool_instance.name}: {result}")
+
+    # cmlapi and its dependencies are pure python, so their wheels do not
+    # depend on the interpreter.
+    try:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "wheel",
+                "--wheel-dir",
+                os.path.join(deployable_workflow_dir, DEPLOYED_WORKFLOW_WHEELHOUSE_DIR),
+                f"https://{os.getenv('CDSW_DOMAIN')}/api/v2/python.tar.gz",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"Failed to build the cmlapi wheel for the deployed workflow: {e}: {e.stderr}")
+
+
+def _wait_for_deployed_workflow_wheelhouses(wheelhouses_build: Optional[Future]) -> None:
+    """
+    Wait for the wheelhouses built in the background to be complete before
+    the model build picks up the deployed workflow directory. A build that
+    takes too long is left running and the model installs from the package
+    index instead: wheelhouses are only used once they are complete.
+    """
+    if wheelhouses_build is None:
+        return
+    try:
+        wheelhouses_build.result(timeout=get_prebake_tool_wheels_timeout())
+    except FutureTimeoutError:
+        print("Timed out waiting for the wheelhouses of the deployed workflow, deploying without them.")
+    except Exception as e:
+        print(f"Failed to build the wheelhouses of the deployed workflow: {e}")
+
+
 def deploy_workflow(
     request: DeployWorkflowRequest, cml: CMLServiceApi, dao: AgentStudioDao = None
 ) -> DeployWorkflowResponse:
@@ -439,6 +565,18 @@ def deploy_workflow(
             "studio-data", os.path.join(deployable_workflow_dir, "studio-data"), ignore=studio_data_workflow_ignore
         )
 
+        # The wheelhouses are built on the thread pool while the rest of the
+        # deployment is prepared.
+        runtime_identifier = cc_utils.get_deployed_workflow_runtime_identifier(cml)
+        wheelhouses_build = None
+        if is_prebake_tool_wheels_enabled():
+            wheelhouses_build = get_thread_pool().submit(
+                _build_deployed_workflow_wheelhouses,
+                deployable_workflow_dir,
+                collated_input,
+                _get_runtime_python_version(runtime_identifier),
+            )
+
         # Get some deployed workflow configuration parameters based on the version
         # of workbench running, deployment pattern, and entitlements that are currently enabled
         deployed_workflow_config = get_deployed_workflow_config(deployable_workflow_dir)
@@ -455,6 +593,7 @@ def deploy_workflow(
         )
         env_vars_for_cml_model.update(env_variable_overrides)
 
+        _wait_for_deployed_workflow_wheelhouses(wheelhouses_build)
         cml_model_id, model_build_id = cc_utils.deploy_cml_model(
             cml=cml,
             model_name=cml_model_name,
@@ -463,7 +602,7 @@ def deploy_workflow(
             model_root_dir=deployed_workflow_config["model_root_dir"],
             model_file_path=deployed_workflow_config["model_file_path"],
             function_name="api_wrapper",
-            runtime_identifier=cc_utils.get_deployed_workflow_runtime_identifier(cml),
+            runtime_identifier=runtime_identifier,
             deployment_config=cmlapi.ShortCreateModelDeployment(
                 cpu=1,
                 memory=2,
@@ -487,6 +626,7 @@ def deploy_workflow(
 
         session.add(deployed_workflow_instance)
         session.commit()
+        invalidate_deployed_workflow_status("model_urls", "applications")
 
         return DeployWorkflowResponse(
             deployed_workflow_name=deployed_workflow_instance_name,
@@ -545,6 +685,7 @@ def undeploy_workflow(
 
             session.delete(deployed_workflow_instance)
             session.commit()
+            invalidate_deployed_workflow_status(f"model_status/{cml_model_id}", "model_urls", "applications")
             deployable_workflow_dir = os.path.join(consts.DEPLOYABLE_WORKFLOWS_LOCATION, deployed_workflow_instance.id)
             if os.path.exists(deployable_workflow_dir):
                 shutil.rmtree(deployable_workflow_dir)
@@ -557,50 +698,105 @@ def undeploy_workflow(
         raise RuntimeError(f"Unexpected error occurred while undeploying workflow: {str(e)}")
 
 
+def _list_cml_model_urls() -> Dict[str, str]:
+    """
+    Deep links of all the CML models of the project, by model ID.
+    """
+    project_num, project_id = cc_utils.get_cml_project_number_and_id()
+    cdsw_ds_api_url = os.environ.get("CDSW_DS_API_URL").replace("/ds", "")
+    cdsw_api_key = os.environ.get("CDSW_API_KEY")
+
+    list_url = f"{cdsw_ds_api_url}/models/list-models"
+    headers = {"Content-Type": "application/json"}
+    list_resp = requests.post(
+        list_url,
+        headers=headers,
+        json={"latestModelBuild": True, "projectId": int(project_num), "latestModelDeployment": True},
+        auth=(cdsw_api_key, ""),
+    )
+    if list_resp.status_code != 200:
+        raise RuntimeError(f"Failed to list models: {list_resp.text}")
+
+    model_list = list_resp.json()
+    return {m["crn"].split("/")[-1]: m["htmlUrl"] for m in model_list if "crn" in m and "htmlUrl" in m}
+
+
+def _list_cml_applications() -> List[dict]:
+    """
+    All the CML applications of the project.
+    """
+    project_url = os.getenv("CDSW_PROJECT_URL")
+    if not project_url:
+        raise RuntimeError("CDSW_PROJECT_URL environment variable not found")
+
+    apps_url = f"{project_url}/applications"
+    apps_resp = requests.get(
+        apps_url,
+        headers={"Content-Type": "application/json"},
+        auth=(os.environ.get("CDSW_API_KEY"), ""),
+    )
+    if apps_resp.status_code != 200:
+        raise RuntimeError(f"Failed to list applications: {apps_resp.text}")
+    return apps_resp.json()
+
+
+def _get_cml_model_status(cml: CMLServiceApi, model_id: str) -> str:
+    """
+    Status of the first deployment of a CML model that is neither stopped
+    nor failed, "stopped" if there is none, or "error" if the status can
+    not be determined.
+    """
+    model_status = "stopped"
+    try:
+        # Fetch model builds
+        model_builds = cml.list_model_builds(project_id=os.getenv("CDSW_PROJECT_ID"), model_id=model_id).model_builds
+
+        for build in model_builds:
+            # Fetch model deployments for each build
+            model_deployments = cml.list_model_deployments(
+                project_id=os.getenv("CDSW_PROJECT_ID"),
+                model_id=model_id,
+                build_id=build.id,
+            ).model_deployments
+
+            # Check each deployment's status
+            for deployment in model_deployments:
+                deployment_status = deployment.status.lower()
+                if deployment_status not in ["stopped", "failed"]:
+                    model_status = deployment_status
+                    break
+            if model_status != "stopped":
+                break
+
+    except Exception as e:
+        print(f"Failed to get model status for model {model_id}: {str(e)}")
+        model_status = "error"
+    return model_status
+
+
 def list_deployed_workflows(
     request: ListDeployedWorkflowsRequest, cml: CMLServiceApi, dao: AgentStudioDao = None
 ) -> ListDeployedWorkflowsResponse:
     try:
-        # Get all models first for deep links
-        project_num, project_id = cc_utils.get_cml_project_number_and_id()
-        cdsw_ds_api_url = os.environ.get("CDSW_DS_API_URL").replace("/ds", "")
-        cdsw_api_key = os.environ.get("CDSW_API_KEY")
-
-        # Get list of all models
-        list_url = f"{cdsw_ds_api_url}/models/list-models"
-        headers = {"Content-Type": "application/json"}
-        list_resp = requests.post(
-            list_url,
-            headers=headers,
-            json={"latestModelBuild": True, "projectId": int(project_num), "latestModelDeployment": True},
-            auth=(cdsw_api_key, ""),
-        )
-        if list_resp.status_code != 200:
-            raise RuntimeError(f"Failed to list models: {list_resp.text}")
-
-        model_list = list_resp.json()
-        model_urls = {m["crn"].split("/")[-1]: m["htmlUrl"] for m in model_list if "crn" in m and "htmlUrl" in m}
-
-        # Get list of all applications using CDSW_PROJECT_URL
-        project_url = os.getenv("CDSW_PROJECT_URL")
-        if not project_url:
-            raise RuntimeError("CDSW_PROJECT_URL environment variable not found")
-
-        apps_url = f"{project_url}/applications"
-        apps_resp = requests.get(
-            apps_url,
-            headers=headers,
-            auth=(cdsw_api_key, ""),
-        )
-        if apps_resp.status_code != 200:
-            raise RuntimeError(f"Failed to list applications: {apps_resp.text}")
-
-        applications = apps_resp.json()
-
         with dao.get_session() as session:
             deployed_workflows: List[db_model.DeployedWorkflowInstance] = session.query(
                 db_model.DeployedWorkflowInstance
             ).all()
+
+            # Look up the project's models and applications and the status of
+            # every deployed model concurrently. Recently fetched results are
+            # served from the shared status cache, and refreshed in the background.
+            fetchers = {
+                "model_urls": _list_cml_model_urls,
+                "applications": _list_cml_applications,
+            }
+            for deployed_workflow in deployed_workflows:
+                model_id = deployed_workflow.cml_deployed_model_id
+                fetchers[f"model_status/{model_id}"] = functools.partial(_get_cml_model_status, cml, model_id)
+            statuses = get_deployed_workflow_status_cache().get_many(fetchers)
+            model_urls, _ = statuses.get("model_urls", ({}, 0.0))
+            applications, applications_age = statuses.get("applications", ([], 0.0))
+
             deployed_workflow_instances = []
 
             for deployed_workflow in deployed_workflows:
@@ -612,33 +808,10 @@ def list_deployed_workflows(
                 application_deep_link = ""
 
                 # First check CML model status
-                model_status = "stopped"
-                try:
-                    # Fetch model builds
-                    model_builds = cml.list_model_builds(
-                        project_id=os.getenv("CDSW_PROJECT_ID"), model_id=deployed_workflow.cml_deployed_model_id
-                    ).model_builds
-
-                    for build in model_builds:
-                        # Fetch model deployments for each build
-                        model_deployments = cml.list_model_deployments(
-                            project_id=os.getenv("CDSW_PROJECT_ID"),
-                            model_id=deployed_workflow.cml_deployed_model_id,
-                            build_id=build.id,
-                        ).model_deployments
-
-                        # Check each deployment's status
-                        for deployment in model_deployments:
-                            deployment_status = deployment.status.lower()
-                            if deployment_status not in ["stopped", "failed"]:
-                                model_status = deployment_status
-                                break
-                        if model_status != "stopped":
-                            break
-
-                except Exception as e:
-                    print(f"Failed to get model status for workflow {deployed_workflow.id}: {str(e)}")
-                    model_status = "error"
+                model_status, model_status_age = statuses.get(
+                    f"model_status/{deployed_workflow.cml_deployed_model_id}", ("error", 0.0)
+                )
+                status_age = max(model_status_age, applications_age)
 
                 # Only check application status if model is running
                 if model_status == "deployed":
@@ -690,6 +863,7 @@ def list_deployed_workflows(
                             application_status=application_status,
                             application_deep_link=application_deep_link,
                             model_deep_link=model_deep_link,
+                            status_age=int(status_age),
                         )
                     )
                 except Exception as e:
@@ -1,11 +1,10 @@
 # No top level studio.db imports allowed to support wokrflow model deployment
 
-from typing import List
+from typing import Dict, List, Optional
 import sys
 import os
+import threading
 import requests
-from crewai import Crew
-from crewai.utilities.events import crewai_event_bus
 
 from studio.cross_cutting import utils as cc_utils
 from studio import consts
@@ -17,7 +16,7 @@ import sys
 
 sys.path.append("studio/workflow_engine/src/")
 
-from engine.crewai.events import OpsServerMessageQueueEventListener
+import engine.types as input_types
 
 
 #  Compare two different versions of Cloudera AI Workbench. Workbench
@@ -83,6 +82,78 @@ def get_fresh_workflow_directory(workflow_name: str) -> str:
     return f"{consts.WORKFLOWS_LOCATION}/{cc_utils.create_slug_from_name(workflow_name)}_{cc_utils.get_random_compact_string()}"
 
 
+# Collated inputs of workflows, built from the studio database by the
+# test and deploy paths and keyed by workflow ID. Entries are dropped
+# whenever the workflow, or anything it is built from, changes. The
+# generation is bumped on every invalidation, so that a collated input
+# built while the workflow was being changed is not cached.
+_collated_input_cache: Dict[str, input_types.CollatedInput] = {}
+_collated_input_cache_generation = 0
+_collated_input_cache_lock = threading.Lock()
+
+
+def get_collated_input_cache_generation() -> int:
+    return _collated_input_cache_generation
+
+
+def get_cached_collated_input(workflow_id: str) -> Optional[input_types.CollatedInput]:
+    """
+    Return a copy of the cached collated input of a workflow, if any.
+    """
+    with _collated_input_cache_lock:
+        collated_input = _collated_input_cache.get(workflow_id)
+    return collated_input.model_copy(deep=True) if collated_input else None
+
+
+def cache_collated_input(workflow_id: str, collated_input: input_types.CollatedInput, generation: int) -> None:
+    """
+    Cache a copy of the collated input of a workflow, unless the cache was
+    invalidated since ``generation`` (when the collated input was built).
+    """
+    with _collated_input_cache_lock:
+        if generation == _collated_input_cache_generation:
+            _collated_input_cache[workflow_id] = collated_input.model_copy(deep=True)
+
+
+def invalidate_collated_input(workflow_id: Optional[str] = None) -> None:
+    """
+    Drop the cached collated input of a workflow, or of all workflows if no
+    workflow ID is given (for changes to language models, which any
+    workflow may use).
+    """
+    global _collated_input_cache_generation
+    with _collated_input_cache_lock:
+        _collated_input_cache_generation += 1
+        if workflow_id is None:
+            _collated_input_cache.clear()
+        else:
+            _collated_input_cache.pop(workflow_id, None)
+
+
+# Key of the session.info entry holding the workflows whose collated input
+# is dropped once the session commits.
+_PENDING_COLLATED_INPUT_INVALIDATIONS = "pending_collated_input_invalidations"
+
+
+def _invalidate_pending_collated_inputs(session) -> None:
+    for workflow_id in session.info.pop(_PENDING_COLLATED_INPUT_INVALIDATIONS, ()):
+        invalidate_collated_input(workflow_id)
+
+
+def invalidate_collated_input_on_commit(session, workflow_id: Optional[str] = None) -> None:
+    """
+    Drop the cached collated input of a workflow (or of all workflows) once
+    ``session`` commits. Invalidating before the commit would let a collated
+    input built from the old rows in between be cached as current.
+    """
+    from sqlalchemy import event
+
+    pending = session.info.setdefault(_PENDING_COLLATED_INPUT_INVALIDATIONS, set())
+    if not pending:
+        event.listen(session, "after_commit", _invalidate_pending_collated_inputs, once=True)
+    pending.add(workflow_id)
+
+
 def invalidate_workflow(preexisting_db_session, condition) -> None:
     """
     Move dependent workflows to draft mode and mark any dependent deployed workflows as stale.
@@ -93,6 +164,7 @@ def invalidate_workflow(preexisting_db_session, condition) -> None:
 
     dependent_workflows = session.query(db_model.Workflow).filter(condition).all()
     for workflow in dependent_workflows:
+        invalidate_collated_input_on_commit(session, workflow.id)
         workflow.is_draft = True
         deployed_workflows: List[db_model.DeployedWorkflowInstance] = (
             session.query(db_model.DeployedWorkflowInstance).filter_by(workflow_id=workflow.id).all()
@@ -101,12 +173,3 @@ def invalidate_workflow(preexisting_db_session, condition) -> None:
             deployed_workflow.is_stale = True
     return
 
-
-def run_workflow_with_context(crew: Crew, inputs, trace_id):
-    with crewai_event_bus.scoped_handlers():
-        # Create our message broker
-        print("Creating event listener....")
-        listener = OpsServerMessageQueueEventListener(trace_id)
-
-        print(f"Running workflow {crew.name} with context")
-        return crew.kickoff(inputs=inputs)
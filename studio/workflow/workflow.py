@@ -6,10 +6,10 @@ from sqlalchemy.exc import SQLAlchemyError
 from studio.db.dao import AgentStudioDao
 from studio.db import model as db_model
 from studio.api import *
-from studio.proto.utils import is_field_set
+from studio.proto.utils import apply_field_mask, is_field_set, paginate_query
 from studio.task.task import extract_placeholders
 from studio.task.task import remove_task
-from studio.agents.agent import remove_agent, add_agent
+from studio.agents.agent import remove_agent, _add_agent_from_template
 from studio.tools.tool_instance import remove_tool_instance
 from studio.cross_cutting.global_thread_pool import get_thread_pool
 import studio.workflow.utils as workflow_utils
@@ -23,7 +23,7 @@ from crewai import Process
 import sys
 
 sys.path.append("studio/worfklow_engine/src")
-from engine.crewai.tools import is_venv_prepared_for_tool
+from engine.crewai.venvs import garbage_collect_shared_venvs, is_venv_prepared_for_tool
 
 
 def _validate_agents(metadata: CrewAIWorkflowMetadata, cml: CMLServiceApi, dao: AgentStudioDao = None) -> None:
@@ -32,9 +32,13 @@ def _validate_agents(metadata: CrewAIWorkflowMetadata, cml: CMLServiceApi, dao:
     """
     with dao.get_session() as session:
         # Validate if all agent IDs exist
-        for agent_id in metadata.agent_id:
-            agent: db_model.Agent = session.query(db_model.Agent).filter_by(id=agent_id).one_or_none()
-            if not agent:
+        agent_ids = list(metadata.agent_id)
+        existing_agent_ids = {
+            agent_id
+            for (agent_id,) in session.query(db_model.Agent.id).filter(db_model.Agent.id.in_(agent_ids)).all()
+        }
+        for agent_id in agent_ids:
+            if agent_id not in existing_agent_ids:
                 raise ValueError(f"Agent with ID '{agent_id}' does not exist.")
     return
 
@@ -46,9 +50,11 @@ def _validate_tasks(
     Validate the contents of a workflow metadata object.
     """
     with dao.get_session() as session:
-        # Validate if all agent IDs exist
-        for i, task_id in enumerate(metadata.task_id):
-            task = session.query(db_model.Task).filter_by(id=task_id).one_or_none()
+        # Validate if all task IDs exist
+        task_ids = list(metadata.task_id)
+        tasks = {task.id: task for task in session.query(db_model.Task).filter(db_model.Task.id.in_(task_ids)).all()}
+        for i, task_id in enumerate(task_ids):
+            task = tasks.get(task_id)
             if not task:
                 raise ValueError(f"Task with ID '{task_id}' does not exist.")
 
@@ -142,30 +148,58 @@ def add_workflow_from_template(
         # Create workflow pre-emptively in the database.
         session.add(workflow)
 
+        # Fetch all of the templates the workflow is made of up front.
+        agent_template_ids = list(workflow_template.agent_template_ids)
+        agent_templates: dict[str, db_model.AgentTemplate] = {
+            agent_template.id: agent_template
+            for agent_template in session.query(db_model.AgentTemplate)
+            .filter(db_model.AgentTemplate.id.in_(agent_template_ids))
+            .all()
+        }
+        tool_template_ids = {
+            tool_template_id
+            for agent_template in agent_templates.values()
+            for tool_template_id in agent_template.tool_template_ids or []
+        }
+        tool_templates: dict[str, db_model.ToolTemplate] = {
+            tool_template.id: tool_template
+            for tool_template in session.query(db_model.ToolTemplate)
+            .filter(db_model.ToolTemplate.id.in_(tool_template_ids))
+            .all()
+        }
+        task_template_ids = list(workflow_template.task_template_ids)
+        task_templates: dict[str, db_model.TaskTemplate] = {
+            task_template.id: task_template
+            for task_template in session.query(db_model.TaskTemplate)
+            .filter(db_model.TaskTemplate.id.in_(task_template_ids))
+            .all()
+        }
+
         # Create all agents
         agent_templates_to_created_agent_id: dict[str, str] = {}
-        for agent_template_id in list(workflow_template.agent_template_ids):
-            agent_template: db_model.AgentTemplate = (
-                session.query(db_model.AgentTemplate).filter_by(id=agent_template_id).one()
-            )
+        for agent_template_id in agent_template_ids:
+            agent_template = agent_templates.get(agent_template_id)
+            if not agent_template:
+                raise ValueError(f"Agent template with ID '{agent_template_id}' not found.")
 
-            add_agent_resp = add_agent(
+            add_agent_resp = _add_agent_from_template(
                 AddAgentRequest(
                     template_id=agent_template_id,
                     workflow_id=workflow_id,
                 ),
                 cml=cml,
-                dao=None,
-                preexisting_db_session=session,
+                db_session=session,
+                agent_template=agent_template,
+                tool_templates=tool_templates,
             )
             agent_templates_to_created_agent_id[agent_template_id] = add_agent_resp.agent_id
 
         # Create all associated tasks
         tasks: list[db_model.Task] = []
-        for task_template_id in list(workflow_template.task_template_ids):
-            task_template: db_model.TaskTemplate = (
-                session.query(db_model.TaskTemplate).filter_by(id=task_template_id).one()
-            )
+        for task_template_id in task_template_ids:
+            task_template = task_templates.get(task_template_id)
+            if not task_template:
+                raise ValueError(f"Task template with ID '{task_template_id}' not found.")
             task: db_model.Task = db_model.Task(
                 id=str(uuid4()),
                 name=task_template.name,
@@ -270,10 +304,11 @@ def list_workflows(
     and extract unique placeholders from task descriptions.
     """
     try:
-        with dao.get_session() as session:
-            workflows: List[db_model.Workflow] = session.query(db_model.Workflow).all()
-            if not workflows:
-                return ListWorkflowsResponse(workflows=[])
+        with dao.get_read_session() as session:
+            query = session.query(db_model.Workflow)
+            if request.ids:
+                query = query.filter(db_model.Workflow.id.in_(request.ids))
+            workflows, next_page_token = paginate_query(query, request, db_model.Workflow.id)
 
             workflow_list = []
             for workflow in workflows:
@@ -297,7 +332,8 @@ def list_workflows(
                         directory=workflow.directory,
                     )
                 )
-            return ListWorkflowsResponse(workflows=workflow_list)
+            apply_field_mask(workflow_list, Workflow, request.fields)
+            return ListWorkflowsResponse(workflows=workflow_list, next_page_token=next_page_token)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to list workflows: {str(e)}")
 
@@ -311,7 +347,7 @@ def get_workflow(request: GetWorkflowRequest, cml: CMLServiceApi, dao: AgentStud
         if not request.workflow_id:
             raise ValueError("Workflow ID is required.")
 
-        with dao.get_session() as session:
+        with dao.get_read_session() as session:
             workflow = session.query(db_model.Workflow).filter_by(id=request.workflow_id).one_or_none()
             if not workflow:
                 raise ValueError(f"Workflow with ID '{request.workflow_id}' not found.")
@@ -434,6 +470,7 @@ def update_workflow(
             # Workflow enters draft mode after committing a change to the workflow. If the
             # workflow is published, that published workflow then goes stale.
             workflow.is_draft = True
+            workflow_utils.invalidate_collated_input_on_commit(session, workflow.id)
 
             # Any deployed workflow instances have now entered a stale state.
             deployed_workflow_instances = (
@@ -457,6 +494,8 @@ def _delete_workflow_directory(directory: str):
         if os.path.exists(directory):
             shutil.rmtree(directory)
             print(f"Deleted workflow directory: {directory}")
+            # Drop the shared venvs only the workflow's tools were using.
+            garbage_collect_shared_venvs()
     except Exception as e:
         print(f"Failed to delete workflow directory: {e}")
 
@@ -507,6 +546,7 @@ def remove_workflow(
             )
 
             session.delete(workflow)
+            workflow_utils.invalidate_collated_input_on_commit(session, request.workflow_id)
             return RemoveWorkflowResponse()
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to remove workflow: {str(e)}")
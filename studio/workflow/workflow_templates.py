@@ -15,7 +15,7 @@ from studio.db import model as db_model
 from studio.agents.agent_templates import remove_agent_template
 from studio.task.task_templates import remove_task_template, add_task_template
 from studio.tools.tool_template import remove_tool_template
-from studio.proto.utils import is_field_set
+from studio.proto.utils import apply_field_mask, is_field_set, paginate_query
 import studio.db.utils as db_utils
 import studio.consts as consts
 import studio.cross_cutting.utils as cc_utils
@@ -27,9 +27,15 @@ def list_workflow_templates(
     request: ListWorkflowTemplatesRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> ListWorkflowTemplatesResponse:
     with dao.get_session() as session:
-        workflow_templates: List[db_model.WorkflowTemplate] = session.query(db_model.WorkflowTemplate).all()
+        query = session.query(db_model.WorkflowTemplate)
+        if request.ids:
+            query = query.filter(db_model.WorkflowTemplate.id.in_(request.ids))
+        workflow_templates, next_page_token = paginate_query(query, request, db_model.WorkflowTemplate.id)
+
+        workflow_template_list = [workflow_template.to_protobuf() for workflow_template in workflow_templates]
+        apply_field_mask(workflow_template_list, WorkflowTemplateMetadata, request.fields)
         return ListWorkflowTemplatesResponse(
-            workflow_templates=[workflow_template.to_protobuf() for workflow_template in workflow_templates]
+            workflow_templates=workflow_template_list, next_page_token=next_page_token
         )
 
 
@@ -56,6 +62,30 @@ def add_workflow_template_from_workflow(
         # Get the actual workflow
         workflow: db_model.Workflow = session.query(db_model.Workflow).filter_by(id=workflow_id).one()
 
+        # Fetch everything the workflow is made of up front, with one query per table.
+        agent_ids = list(workflow.crew_ai_agents or [])
+        if workflow.crew_ai_manager_agent:
+            agent_ids.append(workflow.crew_ai_manager_agent)
+        agents: dict[str, db_model.Agent] = {
+            agent.id: agent for agent in session.query(db_model.Agent).filter(db_model.Agent.id.in_(agent_ids)).all()
+        }
+        tool_instance_ids = [tool_instance_id for agent in agents.values() for tool_instance_id in agent.tool_ids or []]
+        tool_instances: dict[str, db_model.ToolInstance] = {
+            tool_instance.id: tool_instance
+            for tool_instance in session.query(db_model.ToolInstance)
+            .filter(db_model.ToolInstance.id.in_(tool_instance_ids))
+            .all()
+        }
+        task_ids = list(workflow.crew_ai_tasks or [])
+        tasks: dict[str, db_model.Task] = {
+            task.id: task for task in session.query(db_model.Task).filter(db_model.Task.id.in_(task_ids)).all()
+        }
+
+        def get_prefetched(rows: dict, row_id: str, kind: str):
+            if row_id not in rows:
+                raise ValueError(f"{kind} with ID '{row_id}' not found.")
+            return rows[row_id]
+
         # Create a baseline workflow template
         workflow_template: db_model.WorkflowTemplate = db_model.WorkflowTemplate(id=workflow_template_id)
         # TODO: might want to override name with the request in some way
@@ -72,7 +102,7 @@ def add_workflow_template_from_workflow(
         # and add it to the workflow template.
         # NOTE: manager agents do not have tools, so no need to check.
         if workflow.crew_ai_manager_agent and not workflow.crew_ai_llm_provider_model_id:
-            agent: db_model.Agent = session.query(db_model.Agent).filter_by(id=workflow.crew_ai_manager_agent).one()
+            agent: db_model.Agent = get_prefetched(agents, workflow.crew_ai_manager_agent, "Agent")
             agent_template_id = str(uuid4())
             agent_template: db_model.AgentTemplate = db_model.AgentTemplate(
                 id=agent_template_id,
@@ -97,7 +127,7 @@ def add_workflow_template_from_workflow(
         agent_template_ids = []
         agent_to_agent_template = {}
         for agent_id in list(workflow.crew_ai_agents):
-            agent: db_model.Agent = session.query(db_model.Agent).filter_by(id=agent_id).one()
+            agent: db_model.Agent = get_prefetched(agents, agent_id, "Agent")
             agent_template_image_path = ""
             agent_template_id = str(uuid4())
             if agent.agent_image_path:
@@ -128,8 +158,8 @@ def add_workflow_template_from_workflow(
             # Add tools
             tool_template_ids = []
             for tool_instance_id in list(agent.tool_ids):
-                tool_instance: db_model.ToolInstance = (
-                    session.query(db_model.ToolInstance).filter_by(id=tool_instance_id).one()
+                tool_instance: db_model.ToolInstance = get_prefetched(
+                    tool_instances, tool_instance_id, "Tool Instance"
                 )
 
                 tool_template_id = str(uuid4())
@@ -184,7 +214,7 @@ def add_workflow_template_from_workflow(
         # Add all tasks as task templates that are owned by this workflow template
         task_template_ids = []
         for task_id in list(workflow.crew_ai_tasks):
-            task: db_model.Task = session.query(db_model.Task).filter_by(id=task_id).one()
+            task: db_model.Task = get_prefetched(tasks, task_id, "Task")
             response: AddTaskTemplateResponse = add_task_template(
                 AddTaskTemplateRequest(
                     name=task.name,
@@ -10,3 +10,9 @@ python -m pip install uv
 
 # Install engine code
 pip install .
+
+# Install the cmlapi from the wheel baked in at deploy time, so the model
+# does not need to download it from the workbench at startup.
+if [ -d wheelhouse ]; then
+    pip install --no-index --find-links wheelhouse cmlapi
+fi
@@ -0,0 +1,139 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import asyncio
+import math
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+
+# Workflow runs a deployed workflow model executes at the same time.
+DEFAULT_WORKFLOW_MAX_IN_FLIGHT = 8
+
+# Admitted workflow runs that may wait for a free slot. Kickoffs beyond
+# this are rejected.
+DEFAULT_WORKFLOW_MAX_QUEUED = 64
+
+# Expected duration of a workflow run until the first runs complete, used
+# for the retry-after hint of rejected kickoffs.
+DEFAULT_WORKFLOW_RUN_SECONDS = 60
+
+# Weight of the latest run in the average run duration.
+RUN_SECONDS_SMOOTHING = 0.2
+
+
+def get_workflow_max_in_flight() -> int:
+    return int(os.getenv("AGENT_STUDIO_WORKFLOW_MAX_IN_FLIGHT", DEFAULT_WORKFLOW_MAX_IN_FLIGHT))
+
+
+def get_workflow_max_queued() -> int:
+    return int(os.getenv("AGENT_STUDIO_WORKFLOW_MAX_QUEUED", DEFAULT_WORKFLOW_MAX_QUEUED))
+
+
+class WorkflowRunRejectedError(Exception):
+    """
+    Raised when a kickoff is rejected because all slots are busy and the wait
+    queue is full. ``retry_after`` is the number of seconds after which a
+    retry is likely to be admitted.
+    """
+
+    status_code = 429
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Too many workflow runs in progress, retry after {retry_after} seconds.")
+        self.retry_after = retry_after
+
+
+class WorkflowRunAdmission:
+    """
+    Admission control of the workflow runs of a process: at most
+    ``max_in_flight`` runs execute at the same time, at most ``max_queued``
+    admitted runs wait for a slot, and further kickoffs are rejected right
+    away instead of piling up unbounded work.
+
+    A kickoff is admitted with admit() when it is received, and its run then
+    executes within slot(). The in-flight and queued gauges and the
+    admitted/rejected counters are reported by stats().
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_WORKFLOW_MAX_IN_FLIGHT,
+        max_queued: int = DEFAULT_WORKFLOW_MAX_QUEUED,
+    ):
+        self.max_in_flight = max(max_in_flight, 1)
+        self.max_queued = max(max_queued, 0)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._queued = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._run_seconds = float(DEFAULT_WORKFLOW_RUN_SECONDS)
+        # Created on first use, in the event loop of the runs.
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def retry_after(self) -> int:
+        """
+        Seconds until a queued run is likely to get a slot, which frees a
+        place in the queue.
+        """
+        with self._lock:
+            return max(math.ceil(self._run_seconds / self.max_in_flight), 1)
+
+    def admit(self) -> None:
+        """
+        Admit a run, or raise WorkflowRunRejectedError if all slots are busy
+        and the wait queue is full. An admitted run must then execute within
+        slot().
+        """
+        with self._lock:
+            if self._in_flight + self._queued >= self.max_in_flight + self.max_queued:
+                self._rejected += 1
+                rejected = True
+            else:
+                self._queued += 1
+                self._admitted += 1
+                rejected = False
+        if rejected:
+            raise WorkflowRunRejectedError(self.retry_after())
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Wait for a free slot for an admitted run, and hold it while the run
+        executes.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        try:
+            await self._slots.acquire()
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+        with self._lock:
+            self._queued -= 1
+            self._in_flight += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            run_seconds = time.monotonic() - started
+            with self._lock:
+                self._in_flight -= 1
+                self._run_seconds += RUN_SECONDS_SMOOTHING * (run_seconds - self._run_seconds)
+            self._slots.release()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "max_in_flight": self.max_in_flight,
+                "max_queued": self.max_queued,
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "average_run_seconds": round(self._run_seconds, 3),
+            }
@@ -0,0 +1,152 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cmlapi
+
+
+DEFAULT_APPLICATION_DIRECTORY_TTL = 30
+
+
+def get_application_directory_ttl() -> float:
+    return float(os.getenv("AGENT_STUDIO_APPLICATION_DIRECTORY_TTL", DEFAULT_APPLICATION_DIRECTORY_TTL))
+
+
+class _ApplicationListing:
+    def __init__(self, applications: List[cmlapi.Application]):
+        self.applications = applications
+        self.fetched_at = time.monotonic()
+        self.by_name: Dict[str, List[cmlapi.Application]] = {}
+        for application in applications:
+            self.by_name.setdefault(application.name, []).append(application)
+
+
+class ApplicationDirectory:
+    """
+    Process-wide cache of the CML applications of a project, indexed by
+    name, for the name lookups done on hot paths (discovering the ops
+    endpoint, deploying and undeploying workflows).
+
+    A listing is reused for ``ttl`` seconds, and dropped explicitly with
+    invalidate() after applications are created, deleted, stopped or
+    restarted. A lookup that finds nothing in a cached listing fetches it
+    again before giving up, so applications created by other processes are
+    not missed either.
+
+    ``metrics_hook``, if given, is called with "upstream_call" for every
+    listing fetched from CML and with "upstream_call_saved" for every lookup
+    served from the cache. The same counts are reported by stats().
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_APPLICATION_DIRECTORY_TTL,
+        metrics_hook: Optional[Callable[[str], None]] = None,
+    ):
+        self.ttl = ttl
+        self.metrics_hook = metrics_hook
+        self._listings: Dict[str, _ApplicationListing] = {}
+        self._lock = threading.Lock()
+        self._stats = {"upstream_call": 0, "upstream_call_saved": 0}
+
+    def _record(self, event: str) -> None:
+        with self._lock:
+            self._stats[event] += 1
+        if self.metrics_hook:
+            try:
+                self.metrics_hook(event)
+            except Exception as e:
+                print(f"Application directory metrics hook failed: {e}")
+
+    def _get_listing(
+        self, cml: cmlapi.CMLServiceApi, project_id: Optional[str], refresh: bool = False
+    ) -> Tuple[_ApplicationListing, bool]:
+        project_id = project_id or os.getenv("CDSW_PROJECT_ID")
+        if not refresh:
+            with self._lock:
+                listing = self._listings.get(project_id)
+            if listing is not None and time.monotonic() - listing.fetched_at < self.ttl:
+                self._record("upstream_call_saved")
+                return listing, True
+
+        applications: List[cmlapi.Application] = cml.list_applications(
+            project_id=project_id,
+            page_size=5000,
+        ).applications
+        self._record("upstream_call")
+        listing = _ApplicationListing(applications)
+        with self._lock:
+            self._listings[project_id] = listing
+        return listing, False
+
+    def list_applications(
+        self, cml: cmlapi.CMLServiceApi, project_id: Optional[str] = None, refresh: bool = False
+    ) -> List[cmlapi.Application]:
+        """
+        All applications of the project (CDSW_PROJECT_ID by default). With
+        ``refresh``, the listing is fetched from CML and cached for the
+        following lookups. The returned list must not be modified.
+        """
+        listing, _ = self._get_listing(cml, project_id, refresh=refresh)
+        return listing.applications
+
+    def find(
+        self,
+        cml: cmlapi.CMLServiceApi,
+        name: str,
+        versions: bool = True,
+        accept: Optional[Callable[[cmlapi.Application], bool]] = None,
+        project_id: Optional[str] = None,
+    ) -> List[cmlapi.Application]:
+        """
+        Applications named ``name`` or, with ``versions``, a version of it
+        ("<name> vX.Y"), that are accepted by ``accept`` if given.
+        """
+
+        def match(listing: _ApplicationListing) -> List[cmlapi.Application]:
+            names = [
+                app_name for app_name in listing.by_name if app_name == name or (versions and (name + " v") in app_name)
+            ]
+            applications = [application for app_name in names for application in listing.by_name[app_name]]
+            return [application for application in applications if accept is None or accept(application)]
+
+        listing, cached = self._get_listing(cml, project_id)
+        applications = match(listing)
+        if not applications and cached:
+            listing, _ = self._get_listing(cml, project_id, refresh=True)
+            applications = match(listing)
+        return applications
+
+    def invalidate(self, project_id: Optional[str] = None) -> None:
+        with self._lock:
+            if project_id is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(project_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_application_directory: Optional[ApplicationDirectory] = None
+_application_directory_lock = threading.Lock()
+
+
+def get_application_directory() -> ApplicationDirectory:
+    global _application_directory
+    with _application_directory_lock:
+        if _application_directory is None:
+            _application_directory = ApplicationDirectory(ttl=get_application_directory_ttl())
+        return _application_directory
+
+
+def invalidate_application_directory() -> None:
+    """
+    Drop the cached application listings, after creating, deleting, stopping
+    or restarting an application.
+    """
+    get_application_directory().invalidate()
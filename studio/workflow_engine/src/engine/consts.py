@@ -1,5 +1,8 @@
 ALL_STUDIO_DATA_LOCATION = "studio-data"
 DYNAMIC_ASSETS_LOCATION = f"{ALL_STUDIO_DATA_LOCATION}/dynamic_assets"
+# Wheels of the engine's own runtime dependencies (cmlapi), relative to the
+# deployed workflow directory.
+DEPLOYED_WORKFLOW_WHEELHOUSE_DIR = "wheelhouse"
 AGENT_STUDIO_OPS_APPLICATION_NAME = "Agent Studio - Agent Ops & Metrics"
 
 START_TRACE_ID_KEY = "<start_trace_id>"
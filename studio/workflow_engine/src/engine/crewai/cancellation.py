@@ -0,0 +1,153 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+from crewai.utilities.events import (
+    AgentExecutionStartedEvent,
+    LLMCallStartedEvent,
+    TaskStartedEvent,
+    ToolUsageErrorEvent,
+    ToolUsageStartedEvent,
+    crewai_event_bus,
+)
+
+from engine.crewai.event_shipper import get_event_shipper
+from engine.crewai.trace_context import get_trace_id
+
+
+# Error message of the terminal event of a cancelled run.
+WORKFLOW_RUN_CANCELLED_MESSAGE = "Workflow run was cancelled."
+
+
+class WorkflowRunCancelledError(Exception):
+    """
+    Raised in a workflow run's thread at the next step (task, agent
+    execution, LLM call or tool call) once the run has been cancelled.
+    """
+
+    def __init__(self, trace_id: str):
+        super().__init__(WORKFLOW_RUN_CANCELLED_MESSAGE)
+        self.trace_id = trace_id
+
+
+class _WorkflowRun:
+    def __init__(self):
+        self.cancelled = threading.Event()
+        # Callbacks that stop the in-flight work of the run (e.g. kill a tool
+        # subprocess), by registration ID.
+        self.on_cancel: Dict[int, Callable[[], None]] = {}
+        self.next_id = 0
+
+
+_runs: Dict[str, _WorkflowRun] = {}
+_runs_lock = threading.Lock()
+
+
+def register_workflow_run(trace_id: str) -> None:
+    """
+    Make a run cancellable. Registering a run twice is a no-op, so the run can
+    be registered as soon as it is accepted, before it starts.
+    """
+    with _runs_lock:
+        _runs.setdefault(trace_id, _WorkflowRun())
+
+
+def unregister_workflow_run(trace_id: str) -> None:
+    with _runs_lock:
+        _runs.pop(trace_id, None)
+
+
+def cancel_workflow_run(trace_id: str) -> bool:
+    """
+    Cancel a run: the run stops at its next step, and its in-flight tool
+    calls are killed. Returns False if no such run is registered.
+    """
+    with _runs_lock:
+        run = _runs.get(trace_id)
+        if run is None:
+            return False
+        run.cancelled.set()
+        callbacks = list(run.on_cancel.values())
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            print(f"Failed to stop in-flight work of cancelled run {trace_id}: {e}")
+    return True
+
+
+def ship_workflow_run_cancelled_event(trace_id: str) -> None:
+    """
+    Ship the terminal event of a cancelled run. The events the run emits
+    while it stops are dropped, so this is the last event of the run.
+    """
+    event_shipper = get_event_shipper()
+    event_shipper.ship(
+        trace_id,
+        {"type": "crew_kickoff_failed", "error": WORKFLOW_RUN_CANCELLED_MESSAGE, "cancelled": True},
+    )
+    if not event_shipper.flush():
+        print("Failed to send cancellation event")
+
+
+def is_workflow_run_cancelled(trace_id: Optional[str] = None) -> bool:
+    """
+    Whether a run (by default the one of the current thread) was cancelled.
+    """
+    with _runs_lock:
+        run = _runs.get(trace_id or get_trace_id())
+    return run is not None and run.cancelled.is_set()
+
+
+def raise_if_workflow_run_cancelled(trace_id: Optional[str] = None) -> None:
+    trace_id = trace_id or get_trace_id()
+    if is_workflow_run_cancelled(trace_id):
+        raise WorkflowRunCancelledError(trace_id)
+
+
+@contextmanager
+def on_workflow_run_cancelled(callback: Callable[[], None]) -> Iterator[None]:
+    """
+    Call ``callback`` if the run of the current thread is cancelled while the
+    block executes. Raises WorkflowRunCancelledError right away if the run is
+    already cancelled. Outside of a registered run, this does nothing.
+    """
+    trace_id = get_trace_id()
+    with _runs_lock:
+        run = _runs.get(trace_id)
+        if run is not None:
+            if run.cancelled.is_set():
+                raise WorkflowRunCancelledError(trace_id)
+            callback_id = run.next_id
+            run.next_id += 1
+            run.on_cancel[callback_id] = callback
+    try:
+        yield
+    finally:
+        if run is not None:
+            with _runs_lock:
+                run.on_cancel.pop(callback_id, None)
+
+
+def _raise_if_cancelled(source, event) -> None:
+    raise_if_workflow_run_cancelled()
+
+
+# Events emitted by CrewAI right before each step of a run. Raising from
+# their handlers stops the run before the step starts. CrewAI turns tool
+# errors into a retry or an answer for the agent, so the error event of a
+# tool call killed by the cancellation is a checkpoint too.
+CANCELLATION_CHECKPOINT_EVENTS = (
+    TaskStartedEvent,
+    AgentExecutionStartedEvent,
+    LLMCallStartedEvent,
+    ToolUsageStartedEvent,
+    ToolUsageErrorEvent,
+)
+
+
+def register_cancellation_handlers() -> None:
+    for event_cls in CANCELLATION_CHECKPOINT_EVENTS:
+        crewai_event_bus.on(event_cls)(_raise_if_cancelled)
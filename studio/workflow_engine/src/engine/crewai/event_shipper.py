@@ -0,0 +1,204 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import requests
+
+
+DEFAULT_EVENT_BUFFER_SIZE = 10000
+DEFAULT_EVENT_BATCH_SIZE = 100
+DEFAULT_EVENT_FLUSH_INTERVAL = 0.25
+DEFAULT_EVENT_MAX_RETRIES = 3
+
+
+def get_event_buffer_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_EVENT_BUFFER_SIZE", DEFAULT_EVENT_BUFFER_SIZE))
+
+
+def get_event_batch_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_EVENT_BATCH_SIZE", DEFAULT_EVENT_BATCH_SIZE))
+
+
+def get_event_flush_interval() -> float:
+    return float(os.getenv("AGENT_STUDIO_EVENT_FLUSH_INTERVAL", DEFAULT_EVENT_FLUSH_INTERVAL))
+
+
+class EventShipper:
+    """
+    Ships workflow events to the ops server from a background thread, so
+    agent execution never waits on the network. Events are appended to a
+    bounded in-memory buffer and posted in batches to the ops server's
+    /events endpoint, either once a full batch is available or after the
+    flush interval, over a single keep-alive session.
+
+    If the ops server cannot keep up and the buffer fills, the oldest
+    events are dropped. Drops, batch failures and the buffer high-water
+    mark are reported by stats().
+    """
+
+    def __init__(
+        self,
+        get_endpoint: Callable[[], str],
+        invalidate_endpoint: Optional[Callable[[], None]] = None,
+        buffer_size: int = DEFAULT_EVENT_BUFFER_SIZE,
+        batch_size: int = DEFAULT_EVENT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_EVENT_FLUSH_INTERVAL,
+        max_retries: int = DEFAULT_EVENT_MAX_RETRIES,
+    ):
+        self.get_endpoint = get_endpoint
+        self.invalidate_endpoint = invalidate_endpoint
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self._buffer: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        self._condition = threading.Condition()
+        self._session = requests.Session()
+        self._thread: Optional[threading.Thread] = None
+        self._shutdown = False
+        # Sequence numbers of the last enqueued and the last handled event,
+        # and of the last event a flush() is waiting for.
+        self._enqueued_seq = 0
+        self._handled_seq = 0
+        self._flush_seq = 0
+        self._stats = {
+            "enqueued": 0,
+            "shipped": 0,
+            "dropped": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "max_buffered": 0,
+        }
+
+    def ship(self, trace_id: str, event: Dict[str, Any]) -> None:
+        """
+        Queue an event for the given trace ID. Never blocks on the network.
+        """
+        with self._condition:
+            self._ensure_started()
+            if len(self._buffer) >= self.buffer_size:
+                self._buffer.popleft()
+                self._stats["dropped"] += 1
+            self._enqueued_seq += 1
+            self._buffer.append((self._enqueued_seq, {"trace_id": trace_id, "event": event}))
+            self._stats["enqueued"] += 1
+            self._stats["max_buffered"] = max(self._stats["max_buffered"], len(self._buffer))
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify_all()
+
+    def flush(self, timeout: float = 10) -> bool:
+        """
+        Wait until every event queued before this call has been shipped (or
+        given up on). Returns False if that did not happen within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            target_seq = self._enqueued_seq
+            self._flush_seq = max(self._flush_seq, target_seq)
+            self._condition.notify_all()
+            while self._handled_seq < target_seq:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._thread is None:
+                    return False
+                self._condition.wait(timeout=remaining)
+        return True
+
+    def shutdown(self, timeout: float = 10) -> None:
+        self.flush(timeout=timeout)
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread:
+            thread.join(timeout=timeout)
+        self._session.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {**self._stats, "buffered": len(self._buffer)}
+
+    def _ensure_started(self) -> None:
+        if self._thread is None and not self._shutdown:
+            self._thread = threading.Thread(target=self._run, name="event_shipper", daemon=True)
+            self._thread.start()
+
+    def _post_batch(self, batch) -> bool:
+        for attempt in range(self.max_retries):
+            try:
+                resp = self._session.post(
+                    url=f"{self.get_endpoint()}/events",
+                    headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
+                    json={"events": batch},
+                    timeout=10,
+                )
+                if resp.status_code < 400:
+                    return True
+                print(f"Failed to ship {len(batch)} events: HTTP {resp.status_code}")
+            except requests.exceptions.ConnectionError as e:
+                print(f"Failed to ship {len(batch)} events: {e}")
+                # The ops server may have moved, look it up again.
+                if self.invalidate_endpoint:
+                    self.invalidate_endpoint()
+            except Exception as e:
+                print(f"Failed to ship {len(batch)} events: {e}")
+            time.sleep(min(0.5 * 2**attempt, 5))
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._buffer:
+                    if self._shutdown:
+                        return
+                    self._condition.wait()
+                    continue
+                flush_pending = self._flush_seq > self._handled_seq
+                if len(self._buffer) < self.batch_size and not self._shutdown and not flush_pending:
+                    # Give a partial batch a chance to fill up, unless
+                    # somebody is waiting on a flush.
+                    self._condition.wait(timeout=self.flush_interval)
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            if not batch:
+                continue
+
+            shipped = self._post_batch([event for _, event in batch])
+            with self._condition:
+                self._stats["batches"] += 1
+                if shipped:
+                    self._stats["shipped"] += len(batch)
+                else:
+                    self._stats["failed_batches"] += 1
+                    self._stats["dropped"] += len(batch)
+                self._handled_seq = max(self._handled_seq, batch[-1][0])
+                self._condition.notify_all()
+
+
+_event_shipper: Optional[EventShipper] = None
+_event_shipper_lock = threading.Lock()
+
+
+def get_event_shipper() -> EventShipper:
+    """
+    Process-wide event shipper, shared by all workflow runs of this process.
+    """
+    global _event_shipper
+    with _event_shipper_lock:
+        if _event_shipper is None:
+            # Imported here so that the shipper itself has no dependency
+            # on the CML API client.
+            from engine.ops import get_ops_endpoint, invalidate_ops_endpoint
+
+            _event_shipper = EventShipper(
+                get_ops_endpoint,
+                invalidate_endpoint=invalidate_ops_endpoint,
+                buffer_size=get_event_buffer_size(),
+                batch_size=get_event_batch_size(),
+                flush_interval=get_event_flush_interval(),
+            )
+            atexit.register(_event_shipper.shutdown)
+        return _event_shipper
@@ -1,11 +1,8 @@
-import requests
-import os
-import json
-
 from crewai.utilities.events import *
 
 from engine.crewai.trace_context import get_trace_id
-from engine.ops import get_ops_endpoint
+from engine.crewai.event_shipper import get_event_shipper
+from engine.crewai.cancellation import is_workflow_run_cancelled
 
 
 # List of event processors. These are lambdas that 
@@ -61,7 +58,7 @@ EVENT_PROCESSORS = {
     ToolUsageErrorEvent: lambda x: {
         "tool_name": x.tool_name,
         "tool_class": x.tool_class,
-        "error": x.error,
+        "error": str(x.error),
         "tool_args": x.tool_args,
         "run_attempts": x.run_attempts,
         "delegations": x.delegations,
@@ -100,9 +97,16 @@ def post_event(source, event):
     Post a specific event to a specific queue in the Ops & Metrics
     message broker (Kombu). The queu is the trace ID, which is a
     context variable set specifically for the async workflow task.
+    Events are handed to the process-wide event shipper, which posts
+    them in batches from a background thread.
     """
     trace_id = get_trace_id()
 
+    # A cancelled run already got its terminal event. Whatever the run
+    # emits while it stops would only confuse the consumers of its events.
+    if is_workflow_run_cancelled(trace_id):
+        return
+
     # Maintain baseline event information 
     # across all event types. Optionally, many of our crewAI classes
     # are inherited base classes with an appended agent_studio_id
@@ -116,12 +120,8 @@ def post_event(source, event):
 
     # Process the event given the specific event type
     event_dict.update(process_event(event))
-    
-    requests.post(
-        url=f"{get_ops_endpoint()}/events",
-        headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
-        json={"trace_id": trace_id, "event": event_dict},
-    )
+
+    get_event_shipper().ship(trace_id, event_dict)
     
 
 # Globalsafety flag to avoid double registration
@@ -3,10 +3,11 @@ import asyncio
 
 from typing import Dict, Any
 from opentelemetry.context import attach, detach
-from crewai.utilities.events import crewai_event_bus
 
-from engine.crewai.events import OpsServerMessageQueueEventListener
+from engine.crewai.trace_context import set_trace_id
 from engine.crewai.crew import create_crewai_objects
+from engine.crewai.event_shipper import get_event_shipper
+from engine.crewai.cancellation import raise_if_workflow_run_cancelled, unregister_workflow_run
 
 
 def run_workflow(
@@ -25,19 +26,24 @@ def run_workflow(
         token = attach(parent_context)
 
         try:
-            with crewai_event_bus.scoped_handlers():
-                # Create our message broker
-                print("Creating event listener....")
-                listener = OpsServerMessageQueueEventListener(events_trace_id)
+            # Events are posted by the globally registered handlers, which
+            # route them to the trace ID set on this thread's context.
+            set_trace_id(events_trace_id)
 
-                # Run the actual workflow logic within the propagated context
-                crewai_objects = create_crewai_objects(collated_input, tool_user_params)
-                crew = crewai_objects.crews[collated_input.workflow.id]
+            # Run the actual workflow logic within the propagated context
+            crewai_objects = create_crewai_objects(collated_input, tool_user_params)
+            crew = crewai_objects.crews[collated_input.workflow.id]
 
-                # Perform the kickoff
-                crew.kickoff(inputs=dict(inputs))
+            # The run may have been cancelled while its objects were built.
+            raise_if_workflow_run_cancelled(events_trace_id)
+
+            # Perform the kickoff
+            crew.kickoff(inputs=dict(inputs))
 
         finally:
+            # Make sure all events of this run reach the ops server
+            # before the run is reported as done.
+            get_event_shipper().flush()
             # Detach the context when done
             detach(token)
 
@@ -54,6 +60,7 @@ async def run_workflow_async(
 ) -> None:
     """
     Run the workflow task in the background using the parent context.
+    The run is unregistered from cancellation once it is done.
     """
 
     def executor_task():
@@ -61,22 +68,30 @@ async def run_workflow_async(
         token = attach(parent_context)
 
         try:
-            with crewai_event_bus.scoped_handlers():
-                # Create our message broker
-                print("Creating event listener....")
-                listener = OpsServerMessageQueueEventListener(events_trace_id)
+            # Events are posted by the globally registered handlers, which
+            # route them to the trace ID set on this thread's context.
+            set_trace_id(events_trace_id)
+
+            # Run the actual workflow logic within the propagated context
+            crewai_objects = create_crewai_objects(collated_input, tool_user_params)
+            crew = crewai_objects.crews[collated_input.workflow.id]
 
-                # Run the actual workflow logic within the propagated context
-                crewai_objects = create_crewai_objects(collated_input, tool_user_params)
-                crew = crewai_objects.crews[collated_input.workflow.id]
+            # The run may have been cancelled while its objects were built.
+            raise_if_workflow_run_cancelled(events_trace_id)
 
-                # Perform the kickoff
-                crew.kickoff(inputs=dict(inputs))
+            # Perform the kickoff
+            crew.kickoff(inputs=dict(inputs))
 
         finally:
+            # Make sure all events of this run reach the ops server
+            # before the run is reported as done.
+            get_event_shipper().flush()
             # Detach the context when done
             detach(token)
 
     # Run the task in a dedicated thread
     loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, executor_task)
+    try:
+        await loop.run_in_executor(None, executor_task)
+    finally:
+        unregister_workflow_run(events_trace_id)
@@ -0,0 +1,158 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+DEFAULT_TOOL_FILE_CACHE_SIZE = 2048
+
+
+def is_tool_file_cache_enabled() -> bool:
+    return os.getenv("AGENT_STUDIO_TOOL_FILE_CACHE", "true").lower() not in ("false", "0", "no")
+
+
+def get_tool_file_cache_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_TOOL_FILE_CACHE_SIZE", DEFAULT_TOOL_FILE_CACHE_SIZE))
+
+
+class _CachedToolFile:
+    def __init__(self, signature: Optional[Tuple[int, int, int]], content: str):
+        self.signature = signature
+        self.content = content
+        # Parsed metadata of this version of the file, by name. Values are
+        # ("ok", result) or ("error", exception) so that broken tool code is
+        # not parsed again on every call either.
+        self.metadata: Dict[str, Tuple[str, Any]] = {}
+
+
+def _copy_exception(e: Exception) -> Exception:
+    """
+    A copy of a cached exception to raise, without the traceback and
+    context of the call that raised it first. Exceptions that can not be
+    copied are raised again with their traceback cleared.
+    """
+    try:
+        return copy.copy(e).with_traceback(None)
+    except Exception:
+        return e.with_traceback(None)
+
+
+class ToolFileCache:
+    """
+    In-process LRU cache of tool code and requirements files, and of the
+    metadata parsed from them (user parameters, OUTPUT_KEY, the
+    ToolParameters schema).
+
+    Entries are validated against the modification time, size and inode of
+    the file on every lookup, so a single stat() replaces reading and
+    parsing the file as long as it does not change. Edits through the
+    studio, copies of tool templates and files replaced on disk are all
+    picked up without explicit invalidation.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_TOOL_FILE_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, _CachedToolFile]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_entry(self, file_path: str) -> _CachedToolFile:
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Nothing to validate a cached copy against; read the file
+            # directly and let open() surface the error, if any.
+            with open(path, "r") as f:
+                return _CachedToolFile(None, f.read())
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.signature == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        with open(path, "r") as f:
+            content = f.read()
+        entry = _CachedToolFile(signature, content)
+        with self._lock:
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def read(self, file_path: str) -> str:
+        return self._get_entry(file_path).content
+
+    def get_metadata(self, file_path: str, name: str, parse: Callable[[str], Any]) -> Any:
+        """
+        Return ``parse(content)`` for the current content of the file,
+        parsing it only once per version of the file. Exceptions raised by
+        ``parse`` are cached, and a copy of them is raised again. Results
+        are shared between callers and must not be modified.
+        """
+        entry = self._get_entry(file_path)
+        with self._lock:
+            cached = entry.metadata.get(name)
+        if cached is None:
+            try:
+                cached = ("ok", parse(entry.content))
+            except Exception as e:
+                cached = ("error", e.with_traceback(None))
+            with self._lock:
+                entry.metadata.setdefault(name, cached)
+        status, value = cached
+        if status == "error":
+            raise _copy_exception(value)
+        return value
+
+    def invalidate(self, file_path: Optional[str] = None) -> None:
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(file_path), None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_tool_file_cache: Optional[ToolFileCache] = None
+_tool_file_cache_lock = threading.Lock()
+
+
+def get_tool_file_cache() -> ToolFileCache:
+    global _tool_file_cache
+    with _tool_file_cache_lock:
+        if _tool_file_cache is None:
+            _tool_file_cache = ToolFileCache(max_size=get_tool_file_cache_size())
+        return _tool_file_cache
+
+
+def read_tool_file(file_path: str) -> str:
+    """
+    Read a tool code or requirements file, from the cache if the file has
+    not changed since it was last read.
+    """
+    if not is_tool_file_cache_enabled():
+        with open(file_path, "r") as f:
+            return f.read()
+    return get_tool_file_cache().read(file_path)
+
+
+def get_tool_file_metadata(file_path: str, name: str, parse: Callable[[str], Any]) -> Any:
+    """
+    Metadata ``name`` parsed from a tool file with ``parse``, cached for as
+    long as the file does not change.
+    """
+    if not is_tool_file_cache_enabled():
+        return parse(read_tool_file(file_path))
+    return get_tool_file_cache().get_metadata(file_path, name, parse)
@@ -0,0 +1,243 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import ast
+import os
+import subprocess
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from engine.crewai.cancellation import (
+    is_workflow_run_cancelled,
+    on_workflow_run_cancelled,
+    raise_if_workflow_run_cancelled,
+)
+from engine.crewai.event_shipper import get_event_shipper
+from engine.crewai.tool_files import get_tool_file_metadata
+from engine.crewai.trace_context import get_trace_id
+from engine.crewai.tool_worker import (
+    is_cpu_limit_exit,
+    kill_process_group,
+    set_process_cpu_limit,
+    set_process_memory_limit,
+    signal_process_group,
+)
+
+
+# Wall-clock seconds a single tool call may take. 0 disables the timeout.
+DEFAULT_TOOL_TIMEOUT = 300
+
+# Address space cap of a tool process, in megabytes. 0 disables the cap.
+DEFAULT_TOOL_MEMORY_LIMIT_MB = 0
+
+# Seconds of CPU time a single tool call may use. 0 disables the cap.
+DEFAULT_TOOL_CPU_LIMIT = 0
+
+# Module level constants of a tool's code that override the defaults above
+# for that tool, e.g. TOOL_TIMEOUT = 60.
+TOOL_LIMIT_CONSTANTS = {
+    "TOOL_TIMEOUT": "timeout",
+    "TOOL_MEMORY_LIMIT_MB": "memory_limit_mb",
+    "TOOL_CPU_LIMIT": "cpu_limit",
+}
+
+
+def get_tool_timeout() -> float:
+    return float(os.getenv("AGENT_STUDIO_TOOL_TIMEOUT", DEFAULT_TOOL_TIMEOUT))
+
+
+def get_tool_memory_limit_mb() -> int:
+    return int(os.getenv("AGENT_STUDIO_TOOL_MEMORY_LIMIT_MB", DEFAULT_TOOL_MEMORY_LIMIT_MB))
+
+
+def get_tool_cpu_limit() -> float:
+    return float(os.getenv("AGENT_STUDIO_TOOL_CPU_LIMIT", DEFAULT_TOOL_CPU_LIMIT))
+
+
+class ToolLimits:
+    """
+    Limits of a single tool call. A limit of 0 (or None) is disabled.
+    """
+
+    def __init__(self, timeout: float = 0, memory_limit_mb: int = 0, cpu_limit: float = 0):
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_limit = cpu_limit
+
+    def __repr__(self) -> str:
+        return (
+            f"ToolLimits(timeout={self.timeout}, memory_limit_mb={self.memory_limit_mb}, cpu_limit={self.cpu_limit})"
+        )
+
+
+def get_tool_limit_overrides(code: str) -> Dict[str, float]:
+    """
+    Parse the code with ast, look for module level lines like:
+        TOOL_TIMEOUT = 60
+    Return the limits they set, by ToolLimits attribute.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        raise ValueError(f"Error parsing Python code: {e}")
+
+    overrides: Dict[str, float] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id in TOOL_LIMIT_CONSTANTS:
+                # Make sure it's assigned a number literal
+                if isinstance(node.value, ast.Constant) and isinstance(node.value.value, (int, float)):
+                    overrides[TOOL_LIMIT_CONSTANTS[target.id]] = node.value.value
+    return overrides
+
+
+def get_tool_limits(tool_file_path: Optional[str] = None, code: Optional[str] = None) -> ToolLimits:
+    """
+    Limits of a tool: the AGENT_STUDIO_TOOL_TIMEOUT,
+    AGENT_STUDIO_TOOL_MEMORY_LIMIT_MB and AGENT_STUDIO_TOOL_CPU_LIMIT defaults,
+    overridden by the TOOL_* constants of the tool's code, read from
+    ``tool_file_path`` or given as ``code``.
+    """
+    limits = ToolLimits(
+        timeout=get_tool_timeout(),
+        memory_limit_mb=get_tool_memory_limit_mb(),
+        cpu_limit=get_tool_cpu_limit(),
+    )
+    try:
+        if code is not None:
+            overrides = get_tool_limit_overrides(code)
+        else:
+            overrides = get_tool_file_metadata(tool_file_path, "limits", get_tool_limit_overrides)
+    except (OSError, ValueError) as e:
+        print(f"Failed to read the limits of tool '{tool_file_path}', using the defaults: {e}")
+        overrides = {}
+    for name, value in overrides.items():
+        setattr(limits, name, value)
+    return limits
+
+
+class ToolExecutionLimitError(Exception):
+    """
+    Raised when a tool call exceeds one of its limits. ``reason`` is
+    "timeout", "cpu" or "memory". Tools turn it into their result with
+    tool_limit_error_result(), so that CrewAI does not retry the call.
+    """
+
+    def __init__(self, tool_name: str, reason: str, message: str):
+        super().__init__(f"Tool '{tool_name}' was stopped: {message}")
+        self.tool_name = tool_name
+        self.reason = reason
+
+
+# Number of tool calls that exceeded a limit, by tool and by reason.
+_tool_limit_counters: Dict[str, Dict[str, int]] = {}
+_tool_limit_counters_lock = threading.Lock()
+
+
+def tool_limit_exceeded(tool_id: str, tool_name: str, reason: str, message: str) -> ToolExecutionLimitError:
+    """
+    Count a tool call that exceeded a limit, post a tool_limit_exceeded
+    event to the run's events, and return the error to raise.
+    """
+    with _tool_limit_counters_lock:
+        counters = _tool_limit_counters.setdefault(tool_id, {})
+        counters[reason] = counters.get(reason, 0) + 1
+    print(f"Tool '{tool_name}' ({tool_id}) exceeded its {reason} limit: {message}")
+    error = ToolExecutionLimitError(tool_name, reason, message)
+
+    trace_id = get_trace_id()
+    if not is_workflow_run_cancelled(trace_id):
+        get_event_shipper().ship(
+            trace_id,
+            {
+                "timestamp": str(datetime.now()),
+                "type": "tool_limit_exceeded",
+                "agent_studio_id": tool_id,
+                "tool_name": tool_name,
+                "reason": reason,
+                "error": str(error),
+            },
+        )
+    return error
+
+
+def tool_limit_error_result(error: ToolExecutionLimitError) -> str:
+    """
+    Result of a tool call stopped for exceeding a limit. CrewAI retries tool
+    calls that raise, which would run into the same limit again, so the
+    error is returned to the agent as the final result of the call instead.
+    """
+    return f"Tool call failed: {error}"
+
+
+def get_tool_limit_stats() -> Dict[str, Dict[str, int]]:
+    with _tool_limit_counters_lock:
+        return {tool_id: dict(counters) for tool_id, counters in _tool_limit_counters.items()}
+
+
+def is_memory_error(limits: ToolLimits, error: Optional[str]) -> bool:
+    """
+    Whether a tool failed because it hit its memory cap. Python raises
+    MemoryError when an allocation fails past RLIMIT_AS.
+    """
+    return bool(limits.memory_limit_mb) and bool(error) and "MemoryError" in error
+
+
+def _stop_tool_subprocess(proc: subprocess.Popen) -> None:
+    kill_process_group(proc)
+    try:
+        # Drain the pipes. A process that left the group can keep them
+        # open, so do not wait for it for long.
+        proc.communicate(timeout=5)
+    except (subprocess.TimeoutExpired, ValueError, OSError):
+        pass
+
+
+def run_tool_subprocess(
+    args: List[str],
+    limits: ToolLimits,
+    tool_id: str,
+    tool_name: str,
+    input: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess:
+    """
+    Like subprocess.run(args, capture_output=True, text=True), within the
+    limits of a tool. The process runs in its own process group, which is
+    killed as a whole when the call times out or the workflow run is
+    cancelled. Raises ToolExecutionLimitError if a limit is exceeded, and
+    WorkflowRunCancelledError if the run was cancelled.
+    """
+    proc = subprocess.Popen(
+        args,
+        stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        start_new_session=True,
+    )
+    try:
+        with on_workflow_run_cancelled(lambda: signal_process_group(proc.pid)):
+            set_process_memory_limit(proc.pid, limits.memory_limit_mb)
+            set_process_cpu_limit(proc.pid, limits.cpu_limit)
+            stdout, stderr = proc.communicate(input, timeout=limits.timeout or None)
+    except subprocess.TimeoutExpired:
+        _stop_tool_subprocess(proc)
+        raise tool_limit_exceeded(tool_id, tool_name, "timeout", f"Tool call timed out after {limits.timeout} seconds.")
+    except BaseException:
+        _stop_tool_subprocess(proc)
+        raise
+
+    raise_if_workflow_run_cancelled()
+    if limits.cpu_limit and is_cpu_limit_exit(proc.returncode):
+        raise tool_limit_exceeded(
+            tool_id, tool_name, "cpu", f"Tool call used more than {limits.cpu_limit} seconds of CPU time."
+        )
+    if is_memory_error(limits, stderr):
+        raise tool_limit_exceeded(
+            tool_id, tool_name, "memory", f"Tool call ran out of its {limits.memory_limit_mb} MB of memory."
+        )
+    return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
@@ -0,0 +1,643 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+#
+# NOTE: this module is executed directly by each tool's own virtual environment
+# python interpreter (as the worker process), so it must only depend on the
+# python standard library.
+
+import argparse
+import atexit
+import fcntl
+import importlib.util
+import io
+import json
+import os
+import resource
+import select
+import signal
+import struct
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Seconds a worker may sit without receiving a call before it exits on its own.
+DEFAULT_TOOL_WORKER_IDLE_TIMEOUT = 300
+
+# Number of calls a worker serves before it is recycled for a fresh process.
+DEFAULT_TOOL_WORKER_MAX_CALLS = 200
+
+# Workers started per tool, so that concurrent workflow runs calling the
+# same tool do not wait for each other.
+DEFAULT_TOOL_WORKER_POOL_SIZE = 4
+
+# Seconds we wait for a worker to import its tool module and report ready.
+DEFAULT_TOOL_WORKER_STARTUP_TIMEOUT = 120
+
+# Workers that are this close to their idle timeout are restarted by the
+# caller rather than racing the worker's own idle exit.
+_IDLE_TIMEOUT_GRACE = 2
+
+_HEADER = struct.Struct(">I")
+
+# Suffix of the file next to a shared venv that the workers running from
+# the venv hold a shared lock on, so that it is not removed under them.
+VENV_IN_USE_LOCK_SUFFIX = ".inuse"
+
+
+class ToolWorkerError(Exception):
+    """
+    Raised when a tool worker process dies or breaks the wire protocol.
+    """
+
+
+class ToolWorkerLimitError(ToolWorkerError):
+    """
+    Raised when a tool call exceeds one of its limits ("timeout" or "cpu").
+    The worker is killed, with every process it started.
+    """
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+class ToolWorkerUnsupportedError(ToolWorkerError):
+    """
+    Raised when a tool module does not follow the standard venv tool
+    layout (UserParameters, ToolParameters, run_tool) and can therefore
+    only be executed with a one-off subprocess.
+    """
+
+
+def is_tool_worker_enabled() -> bool:
+    return os.getenv("AGENT_STUDIO_TOOL_WORKER_ENABLED", "true").lower() == "true"
+
+
+def get_tool_worker_idle_timeout() -> float:
+    return float(os.getenv("AGENT_STUDIO_TOOL_WORKER_IDLE_TIMEOUT", DEFAULT_TOOL_WORKER_IDLE_TIMEOUT))
+
+
+def get_tool_worker_max_calls() -> int:
+    return int(os.getenv("AGENT_STUDIO_TOOL_WORKER_MAX_CALLS", DEFAULT_TOOL_WORKER_MAX_CALLS))
+
+
+def get_tool_worker_pool_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_TOOL_WORKER_POOL_SIZE", DEFAULT_TOOL_WORKER_POOL_SIZE))
+
+
+def get_linked_venv_dir(python_executable: str) -> Optional[str]:
+    """
+    The directory a tool's .venv links to, if the python executable belongs
+    to a linked (shared) venv.
+    """
+    venv_dir = os.path.dirname(os.path.dirname(os.path.abspath(python_executable)))
+    if not os.path.islink(venv_dir):
+        return None
+    return os.path.realpath(venv_dir)
+
+
+def _lock_venv_in_use(venv_dir: str) -> IO:
+    lock_file = open(f"{venv_dir}{VENV_IN_USE_LOCK_SUFFIX}", "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_SH)
+    except OSError:
+        lock_file.close()
+        raise
+    return lock_file
+
+
+# ---------------------------
+# Process Limits
+# ---------------------------
+
+# Seconds of CPU time a process may use past its soft CPU limit (SIGXCPU)
+# before the kernel kills it (SIGKILL).
+_CPU_LIMIT_GRACE = 5
+
+
+def set_process_memory_limit(pid: int, memory_limit_mb: Optional[int]) -> None:
+    """
+    Cap the address space of a running process, in megabytes. Does nothing
+    if no limit is given.
+    """
+    if memory_limit_mb:
+        limit = int(memory_limit_mb) * 1024 * 1024
+        resource.prlimit(pid, resource.RLIMIT_AS, (limit, limit))
+
+
+def set_process_cpu_limit(pid: int, cpu_limit: Optional[float]) -> None:
+    """
+    Cap the CPU time of a running process, in seconds. Does nothing if no
+    limit is given.
+    """
+    if cpu_limit:
+        limit = max(int(cpu_limit), 1)
+        resource.prlimit(pid, resource.RLIMIT_CPU, (limit, limit + _CPU_LIMIT_GRACE))
+
+
+def is_cpu_limit_exit(returncode: Optional[int]) -> bool:
+    """
+    Whether a process was stopped by its soft CPU limit. SIGKILL is not
+    counted: it is also sent by timeouts, cancellations and the OOM killer.
+    """
+    return returncode == -signal.SIGXCPU
+
+
+def signal_process_group(pid: int, sig: int = signal.SIGKILL) -> None:
+    """
+    Send a signal to a process started with start_new_session=True and to
+    every process it started (browsers, shells, ...).
+    """
+    try:
+        os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def kill_process_group(proc: subprocess.Popen) -> None:
+    """
+    Kill a process started with start_new_session=True together with every
+    process it started, and reap it.
+    """
+    signal_process_group(proc.pid)
+    try:
+        proc.kill()
+    except OSError:
+        pass
+    proc.wait()
+
+
+# ---------------------------
+# Wire Protocol
+# ---------------------------
+
+
+def _read_exact(fd: int, n: int, deadline: Optional[float] = None) -> bytes:
+    """
+    Read exactly n bytes from a file descriptor. Raises EOFError if the
+    other end closes the pipe, and TimeoutError if the (monotonic) deadline
+    passes before all bytes arrive.
+    """
+    chunks = []
+    remaining = n
+    while remaining > 0:
+        if deadline is not None:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                raise TimeoutError("Timed out reading from tool worker pipe.")
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                raise TimeoutError("Timed out reading from tool worker pipe.")
+        chunk = os.read(fd, remaining)
+        if not chunk:
+            raise EOFError("Tool worker pipe closed.")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_message(fd: int, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Read one length-prefixed JSON message (4-byte big-endian length followed
+    by a UTF-8 encoded JSON body) from a file descriptor.
+    """
+    (length,) = _HEADER.unpack(_read_exact(fd, _HEADER.size, deadline))
+    return json.loads(_read_exact(fd, length, deadline).decode("utf-8"))
+
+
+def write_message(fd: int, message: Dict[str, Any]) -> None:
+    """
+    Write one length-prefixed JSON message to a file descriptor.
+    """
+    body = json.dumps(message).encode("utf-8")
+    data = _HEADER.pack(len(body)) + body
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+# ---------------------------
+# Client (workflow engine side)
+# ---------------------------
+
+
+class ToolWorker:
+    """
+    A long-lived python process, running inside a tool's virtual environment,
+    that imports the tool module once and then serves tool calls over its
+    stdin/stdout pipes. Calls are serialized per worker. The worker exits on
+    its own after an idle timeout, is recycled after a fixed number of calls,
+    and is transparently restarted if it crashes.
+    """
+
+    def __init__(
+        self,
+        python_executable: str,
+        python_file: str,
+        idle_timeout: Optional[float] = None,
+        max_calls: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+    ):
+        self.python_executable = python_executable
+        self.python_file = python_file
+        self.idle_timeout = idle_timeout if idle_timeout is not None else get_tool_worker_idle_timeout()
+        self.max_calls = max_calls if max_calls is not None else get_tool_worker_max_calls()
+        self.memory_limit_mb = memory_limit_mb
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._calls = 0
+        self._last_used = 0.0
+        self._source_mtime: Optional[float] = None
+        self._started_memory_limit_mb: Optional[int] = None
+        # Shared venv the running process was started from, and the lock
+        # that keeps it in use until the process is stopped.
+        self.venv_dir: Optional[str] = None
+        self._venv_lock: Optional[IO] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._proc.pid if self._proc else None
+
+    def _get_source_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.python_file).st_mtime
+        except OSError:
+            return None
+
+    def _release_venv(self) -> None:
+        venv_lock, self._venv_lock = self._venv_lock, None
+        if venv_lock is not None:
+            venv_lock.close()
+
+    def _start(self) -> None:
+        self._source_mtime = self._get_source_mtime()
+        self.venv_dir = get_linked_venv_dir(self.python_executable)
+        if self.venv_dir:
+            self._venv_lock = _lock_venv_in_use(self.venv_dir)
+        try:
+            self._proc = subprocess.Popen(
+                [
+                    self.python_executable,
+                    os.path.abspath(__file__),
+                    "--tool-file",
+                    os.path.abspath(self.python_file),
+                    "--idle-timeout",
+                    str(self.idle_timeout),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                # Own process group, so that the worker can be killed together
+                # with everything the tool started.
+                start_new_session=True,
+            )
+        except OSError:
+            self._release_venv()
+            raise
+        self._started_memory_limit_mb = self.memory_limit_mb
+        try:
+            set_process_memory_limit(self._proc.pid, self.memory_limit_mb)
+        except (OSError, ValueError) as e:
+            self._stop()
+            raise ToolWorkerError(f"Failed to limit the memory of the tool worker for '{self.python_file}': {e}")
+        self._calls = 0
+        self._last_used = time.monotonic()
+        try:
+            ready = read_message(self._proc.stdout.fileno(), time.monotonic() + DEFAULT_TOOL_WORKER_STARTUP_TIMEOUT)
+        except (EOFError, TimeoutError, ValueError) as e:
+            self._stop()
+            raise ToolWorkerError(f"Tool worker for '{self.python_file}' failed to start: {e}")
+        if not ready.get("ok"):
+            self._stop()
+            if ready.get("unsupported"):
+                raise ToolWorkerUnsupportedError(ready.get("error", ""))
+            raise ToolWorkerError(f"Tool worker for '{self.python_file}' failed to start: {ready.get('error')}")
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            self._release_venv()
+            return
+        try:
+            if proc.poll() is None:
+                try:
+                    write_message(proc.stdin.fileno(), {"shutdown": True})
+                except OSError:
+                    pass
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    kill_process_group(proc)
+        finally:
+            for pipe in (proc.stdin, proc.stdout):
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+            self._release_venv()
+
+    def _needs_restart(self) -> bool:
+        if self._proc is None or self._proc.poll() is not None:
+            return True
+        if self._calls >= self.max_calls:
+            return True
+        if self.memory_limit_mb != self._started_memory_limit_mb:
+            return True
+        # The tool code was edited since the worker imported it.
+        if self._get_source_mtime() != self._source_mtime:
+            return True
+        return time.monotonic() - self._last_used >= self.idle_timeout - _IDLE_TIMEOUT_GRACE
+
+    def call(
+        self,
+        user_params: Dict[str, Any],
+        tool_params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        cpu_limit: Optional[float] = None,
+        started: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the tool once with the given user and tool parameters. Returns the
+        worker's response, which contains "ok" and either "output" and "stderr"
+        or "error". Raises ToolWorkerLimitError if the call takes longer than
+        ``timeout`` seconds, or more than ``cpu_limit`` seconds of CPU time.
+        The time spent waiting for the worker, since ``started`` (a
+        time.monotonic() value, now by default), counts towards the timeout;
+        the time it takes to (re)start the worker does not.
+        """
+        request = {"user_params": user_params, "tool_params": tool_params, "cpu_limit": cpu_limit}
+        started = started if started is not None else time.monotonic()
+        if timeout:
+            acquired = self._lock.acquire(timeout=max(started + timeout - time.monotonic(), 0))
+        else:
+            acquired = self._lock.acquire()
+        if not acquired:
+            raise ToolWorkerLimitError("timeout", f"Tool call timed out after {timeout} seconds.")
+        try:
+            waited = time.monotonic() - started
+            if self._needs_restart():
+                self._stop()
+                self._start()
+            try:
+                write_message(self._proc.stdin.fileno(), request)
+            except OSError:
+                # The worker died between calls. Nothing was executed yet, so
+                # it is safe to restart and send the request again.
+                self._stop()
+                self._start()
+                write_message(self._proc.stdin.fileno(), request)
+            deadline = time.monotonic() + timeout - waited if timeout else None
+            try:
+                response = read_message(self._proc.stdout.fileno(), deadline)
+            except TimeoutError:
+                kill_process_group(self._proc)
+                self._stop()
+                raise ToolWorkerLimitError("timeout", f"Tool call timed out after {timeout} seconds.")
+            except (EOFError, ValueError) as e:
+                try:
+                    returncode = self._proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    returncode = None
+                self._stop()
+                if cpu_limit and is_cpu_limit_exit(returncode):
+                    raise ToolWorkerLimitError("cpu", f"Tool call used more than {cpu_limit} seconds of CPU time.")
+                raise ToolWorkerError(f"Tool worker crashed during call (exit code {returncode}): {e}")
+            self._calls += 1
+            self._last_used = time.monotonic()
+            return response
+        finally:
+            self._lock.release()
+
+    def kill(self) -> None:
+        """
+        Kill the worker and everything it started, even in the middle of a
+        call, which then fails with a ToolWorkerError. Safe to call from any
+        thread.
+        """
+        proc = self._proc
+        if proc is not None:
+            signal_process_group(proc.pid)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._stop()
+
+
+class ToolWorkerPool:
+    """
+    The workers of one tool. Every call checks out a worker of its own, so
+    concurrent workflow runs calling the same tool do not wait for each
+    other, and cancelling a run only kills the worker serving that run.
+    Up to ``max_workers`` workers are started; calls beyond that wait for
+    a free one.
+    """
+
+    def __init__(
+        self,
+        python_executable: str,
+        python_file: str,
+        max_workers: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+    ):
+        self.python_executable = python_executable
+        self.python_file = python_file
+        self.max_workers = max(max_workers if max_workers is not None else get_tool_worker_pool_size(), 1)
+        self.memory_limit_mb = memory_limit_mb
+        self._condition = threading.Condition()
+        self._workers: List[ToolWorker] = []
+        self._idle: List[ToolWorker] = []
+
+    @property
+    def workers(self) -> List[ToolWorker]:
+        with self._condition:
+            return list(self._workers)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None, started: Optional[float] = None) -> Iterator[ToolWorker]:
+        """
+        Check out a free worker for one call, waiting for one if all
+        ``max_workers`` are busy. Raises ToolWorkerLimitError if none frees
+        up within ``timeout`` seconds of ``started`` (now by default).
+        """
+        started = started if started is not None else time.monotonic()
+        with self._condition:
+            while True:
+                if self._idle:
+                    # The most recently used worker is the least likely to
+                    # have exited on its idle timeout.
+                    worker = self._idle.pop()
+                    break
+                if len(self._workers) < self.max_workers:
+                    worker = ToolWorker(self.python_executable, self.python_file)
+                    self._workers.append(worker)
+                    break
+                remaining = started + timeout - time.monotonic() if timeout else None
+                if remaining is not None and remaining <= 0:
+                    raise ToolWorkerLimitError("timeout", f"Tool call timed out after {timeout} seconds.")
+                self._condition.wait(remaining)
+            worker.memory_limit_mb = self.memory_limit_mb
+        try:
+            yield worker
+        finally:
+            with self._condition:
+                self._idle.append(worker)
+                self._condition.notify()
+
+    def shutdown(self) -> None:
+        for worker in self.workers:
+            worker.shutdown()
+
+
+_tool_workers: Dict[Tuple[str, str], ToolWorkerPool] = {}
+_unsupported_tools: set = set()
+_tool_workers_lock = threading.Lock()
+
+
+def get_tool_worker_pool(
+    python_executable: str, python_file: str, memory_limit_mb: Optional[int] = None
+) -> Optional[ToolWorkerPool]:
+    """
+    Get the shared worker pool for a tool, creating it if needed. Returns
+    None if this tool has previously been found to be incompatible with
+    workers. Workers whose memory limit changed are restarted on their next
+    call.
+    """
+    key = (os.path.abspath(python_executable), os.path.abspath(python_file))
+    with _tool_workers_lock:
+        if key in _unsupported_tools:
+            return None
+        if key not in _tool_workers:
+            _tool_workers[key] = ToolWorkerPool(python_executable, python_file, memory_limit_mb=memory_limit_mb)
+        pool = _tool_workers[key]
+        pool.memory_limit_mb = memory_limit_mb
+        return pool
+
+
+def mark_tool_worker_unsupported(python_executable: str, python_file: str) -> None:
+    key = (os.path.abspath(python_executable), os.path.abspath(python_file))
+    with _tool_workers_lock:
+        _unsupported_tools.add(key)
+        pool = _tool_workers.pop(key, None)
+    if pool:
+        pool.shutdown()
+
+
+def shutdown_tool_workers() -> None:
+    """
+    Stop every worker started by this process.
+    """
+    with _tool_workers_lock:
+        pools = list(_tool_workers.values())
+        _tool_workers.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def shutdown_tool_workers_in_venv(venv_dir: str) -> None:
+    """
+    Stop the workers of this process that run from the given shared venv,
+    waiting for calls in progress to finish.
+    """
+    venv_dir = os.path.realpath(venv_dir)
+    with _tool_workers_lock:
+        pools = list(_tool_workers.values())
+    for pool in pools:
+        for worker in pool.workers:
+            if worker.venv_dir == venv_dir:
+                worker.shutdown()
+
+
+atexit.register(shutdown_tool_workers)
+
+
+# ---------------------------
+# Worker (tool venv side)
+# ---------------------------
+
+
+def _load_tool_module(tool_file: str):
+    tool_dir = os.path.dirname(tool_file)
+    module_name = os.path.splitext(os.path.basename(tool_file))[0]
+    sys.path.insert(0, tool_dir)
+    spec = importlib.util.spec_from_file_location(module_name, tool_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _limit_call_cpu_time(cpu_limit: Optional[float]) -> None:
+    """
+    RLIMIT_CPU counts the CPU time of the whole process, so the limit of a
+    call is set relative to what the worker used so far. Without a limit,
+    the one of a previous call is lifted.
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if cpu_limit:
+        soft = int(usage.ru_utime + usage.ru_stime + max(cpu_limit, 1))
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    else:
+        soft = hard
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _serve(tool_file: str, idle_timeout: float) -> None:
+    in_fd = sys.stdin.fileno()
+    # Keep the original stdout for the protocol and point fd 1 at stderr, so
+    # that anything the tool (or a C extension) prints can never corrupt
+    # the message stream.
+    out_fd = os.dup(sys.stdout.fileno())
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    try:
+        module = _load_tool_module(tool_file)
+    except Exception:
+        write_message(out_fd, {"ok": False, "error": traceback.format_exc()})
+        return
+    missing = [attr for attr in ("UserParameters", "ToolParameters", "run_tool") if not hasattr(module, attr)]
+    if missing:
+        write_message(
+            out_fd, {"ok": False, "unsupported": True, "error": f"Tool module is missing: {', '.join(missing)}"}
+        )
+        return
+    write_message(out_fd, {"ok": True, "pid": os.getpid()})
+
+    while True:
+        ready, _, _ = select.select([in_fd], [], [], idle_timeout)
+        if not ready:
+            return
+        try:
+            request = read_message(in_fd)
+        except EOFError:
+            return
+        if request.get("shutdown"):
+            return
+
+        stdout_buf, stderr_buf = io.StringIO(), io.StringIO()
+        try:
+            _limit_call_cpu_time(request.get("cpu_limit"))
+            with redirect_stdout(stdout_buf), redirect_stderr(stderr_buf):
+                config = module.UserParameters(**request.get("user_params", {}))
+                args = module.ToolParameters(**request.get("tool_params", {}))
+                output = module.run_tool(config, args)
+            response = {"ok": True, "output": str(output), "stderr": stderr_buf.getvalue()}
+        except Exception:
+            response = {"ok": False, "error": traceback.format_exc()}
+        write_message(out_fd, response)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tool-file", required=True, help="Path to the tool's python file")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_TOOL_WORKER_IDLE_TIMEOUT)
+    args = parser.parse_args()
+    _serve(args.tool_file, args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
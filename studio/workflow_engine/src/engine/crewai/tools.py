@@ -9,17 +9,39 @@ import importlib
 from crewai.tools import BaseTool
 import ast
 from typing import Optional
-import subprocess
 import json
-from textwrap import dedent, indent
 import threading
-import hashlib
+import time
 import re
-import shutil
-import venv
+import hashlib
+import inspect
+from collections import OrderedDict
 
 import engine.types as input_types
 from engine.types import *
+from engine.crewai.cancellation import (
+    WorkflowRunCancelledError,
+    on_workflow_run_cancelled,
+    raise_if_workflow_run_cancelled,
+)
+from engine.crewai.tool_limits import (
+    ToolExecutionLimitError,
+    ToolLimits,
+    get_tool_limits,
+    is_memory_error,
+    run_tool_subprocess,
+    tool_limit_error_result,
+    tool_limit_exceeded,
+)
+from engine.crewai.tool_worker import (
+    ToolWorkerLimitError,
+    ToolWorkerUnsupportedError,
+    get_tool_worker_pool,
+    is_tool_worker_enabled,
+    mark_tool_worker_unsupported,
+)
+from engine.crewai.tool_files import get_tool_file_metadata, read_tool_file
+from engine.crewai.venvs import is_venv_prepared_for_tool
 
 
 def _import_module_with_isolation(module_name: str, module_path: str):
@@ -245,68 +267,149 @@ def run_code_in_thread(code):
     return result
 
 
-def get_tool_instance_proxy(tool_instance: Input__ToolInstance, user_params_kv: Dict[str, str]) -> BaseTool:
+# Bound on the number of compiled legacy tool proxies kept in memory. Every
+# edit of the code of a tool renders a new one.
+DEFAULT_LEGACY_TOOL_PROXY_CACHE_SIZE = 256
+
+# Inserted into the code of a legacy tool to run it in a subprocess. Reads the
+# call from stdin and keeps the original stdout for the JSON result only, so
+# that whatever the tool prints does not get mixed with it. Kept on a single
+# line so that line numbers in tracebacks are only off by one.
+_LEGACY_TOOL_RUNNER_PRELUDE = (
+    "import json as _studio_json, os as _studio_os, sys as _studio_sys; "
+    "_studio_call = _studio_json.loads(_studio_sys.stdin.read()); "
+    '_studio_result_file = _studio_os.fdopen(_studio_os.dup(1), "w"); '
+    "_studio_os.dup2(_studio_os.open(_studio_os.devnull, _studio_os.O_WRONLY), 1)\n"
+)
+
+_LEGACY_TOOL_RUNNER_EPILOGUE = """
+
+_studio_tool = {tool_class_name}(user_parameters=_studio_call["user_kwargs"])
+_studio_json.dump(_studio_tool._run(**_studio_call["tool_kwargs"]), _studio_result_file)
+_studio_result_file.flush()
+"""
+
+
+def _insert_legacy_tool_runner_prelude(tool_code: str) -> str:
     """
-    Get the tool instance proxy callable for the tool instance.
+    The code of a legacy tool with the runner prelude inserted after its
+    module docstring and __future__ imports, which must come first.
     """
+    prelude_line = 0
+    for index, node in enumerate(ast.parse(tool_code).body):
+        is_docstring = (
+            index == 0
+            and isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        )
+        if not is_docstring and not (isinstance(node, ast.ImportFrom) and node.module == "__future__"):
+            break
+        prelude_line = node.end_lineno
 
-    if not is_venv_prepared_for_tool(tool_instance.source_folder_path, tool_instance.python_requirements_file_name):
-        raise ValueError(f"Virtual environment not prepared for tool '{tool_instance.name}'.")
+    lines = tool_code.splitlines(keepends=True)
+    head = "".join(lines[:prelude_line])
+    if head and not head.endswith("\n"):
+        head += "\n"
+    return head + _LEGACY_TOOL_RUNNER_PRELUDE + "".join(lines[prelude_line:])
 
-    tool_file_path = os.path.join(tool_instance.source_folder_path, tool_instance.python_code_file_name)
-    with open(tool_file_path, "r") as tool_file:
-        tool_code = tool_file.read()
-    tool_class_name = extract_tool_class_name(tool_code)
-    python_executable = os.path.join(tool_instance.source_folder_path, ".venv", "bin", "python")
-    path_to_add = os.path.join(tool_instance.source_folder_path, ".venv", "bin")
 
-    skeleton_tool_code = _get_skeleton_tool_code(tool_code)
-
-    replacement_code = f"""
-    function_arguments = {{k: v for k, v in locals().items() if k != 'self'}}
-    tool_class_name = self.__class__.__name__
-    tool_file = "{tool_file_path}"
-    python_executable = "{python_executable}"
-    path_to_add = "{path_to_add}"
-    user_kwargs = {user_params_kv}
-
-    with tempfile.NamedTemporaryFile(mode="w+", delete=True, dir="/tmp") as tmp_file:
-        tmp_file_name = tmp_file.name
-        with open(tool_file, "r") as file:
-            tool_code = file.read()
-            augmented_tool_code = (
-                tool_code + "\\n\\n"
-                + "import json\\n\\n"
-                + f"user_kwargs = {{user_kwargs}}\\n"
-                + f"tool_kwargs = {{function_arguments}}\\n"
-                + f"_tool_obj = {{tool_class_name}}(user_parameters=user_kwargs)\\n"
-                + f"with open('{{tmp_file_name}}', 'w') as output_file:\\n"
-                + "    json.dump(_tool_obj._run(**tool_kwargs), output_file)\\n"
-            )
+class _LegacyToolProxy:
+    """
+    What proxies of a legacy (non-venv) tool need from its code: the name,
+    description, arguments and _run signature of the tool, taken from its
+    skeleton compiled in-process, and the script that runs the actual tool in
+    the tool's virtual environment.
+    """
+
+    def __init__(self, tool_code: str):
+        tool_class_name = extract_tool_class_name(tool_code)
+        skeleton_tool: BaseTool = run_code_in_thread(
+            _get_skeleton_tool_code(tool_code) + f"\n\nresult = {tool_class_name}()"
+        )
+        self.name = skeleton_tool.name
+        self.description = skeleton_tool.description
+        self.args_schema = skeleton_tool.args_schema
+        self.run_signature = inspect.signature(skeleton_tool._run)
+        runner_code = _insert_legacy_tool_runner_prelude(tool_code)
+        self.runner_script = runner_code + _LEGACY_TOOL_RUNNER_EPILOGUE.format(tool_class_name=tool_class_name)
+
+    def run(
+        self,
+        tool: BaseTool,
+        python_executable: str,
+        path_to_add: str,
+        user_kwargs: Dict[str, str],
+        limits: ToolLimits,
+        *args,
+        **kwargs,
+    ):
+        # Same arguments as the locals() of the tool's _run, minus self.
+        function_arguments = dict(self.run_signature.bind(*args, **kwargs).arguments)
         new_envs = os.environ.copy()
         new_envs["PATH"] = path_to_add + ":" + new_envs["PATH"]
-        result = subprocess.run([python_executable, "-c", augmented_tool_code], capture_output=True, text=True, check=False, env=new_envs)
+        result = run_tool_subprocess(
+            [python_executable, "-c", self.runner_script],
+            limits,
+            tool.agent_studio_id,
+            tool.name,
+            input=json.dumps({"user_kwargs": user_kwargs, "tool_kwargs": function_arguments}),
+            env=new_envs,
+        )
         if result.stderr:
-            raise ValueError(f"Error in executing tool: {{result.stderr}}")
-        with open(tmp_file_name, "r") as output_file:
-            output = json.load(output_file)
-        return output
+            raise ValueError(f"Error in executing tool: {result.stderr}")
+        return json.loads(result.stdout)
+
+
+_legacy_tool_proxies: "OrderedDict[str, _LegacyToolProxy]" = OrderedDict()
+_legacy_tool_proxies_lock = threading.Lock()
+
+
+def _get_legacy_tool_proxy(tool_code: str) -> _LegacyToolProxy:
+    """
+    Compiled proxy of a legacy tool, cached by the hash of the tool's code.
     """
+    code_hash = hashlib.sha256(tool_code.encode()).hexdigest()
+    with _legacy_tool_proxies_lock:
+        proxy = _legacy_tool_proxies.get(code_hash)
+        if proxy is not None:
+            _legacy_tool_proxies.move_to_end(code_hash)
+            return proxy
 
-    proxy_code = "import os, json, subprocess, tempfile\n" + skeleton_tool_code.replace(
-        "        pass", indent(dedent(replacement_code), "        ")
-    )
+    proxy = _LegacyToolProxy(tool_code)
+    with _legacy_tool_proxies_lock:
+        _legacy_tool_proxies[code_hash] = proxy
+        while len(_legacy_tool_proxies) > DEFAULT_LEGACY_TOOL_PROXY_CACHE_SIZE:
+            _legacy_tool_proxies.popitem(last=False)
+    return proxy
+
+
+def get_tool_instance_proxy(tool_instance: Input__ToolInstance, user_params_kv: Dict[str, str]) -> BaseTool:
+    """
+    Get the tool instance proxy callable for the tool instance.
+    """
 
-    _tool: BaseTool = run_code_in_thread(proxy_code + f"\n\nresult = {tool_class_name}()")
+    if not is_venv_prepared_for_tool(tool_instance.source_folder_path, tool_instance.python_requirements_file_name):
+        raise ValueError(f"Virtual environment not prepared for tool '{tool_instance.name}'.")
+
+    tool_file_path = os.path.join(tool_instance.source_folder_path, tool_instance.python_code_file_name)
+    proxy = _get_legacy_tool_proxy(read_tool_file(tool_file_path))
+    limits = get_tool_limits(tool_file_path)
+    python_executable = os.path.join(tool_instance.source_folder_path, ".venv", "bin", "python")
+    path_to_add = os.path.join(tool_instance.source_folder_path, ".venv", "bin")
+    user_kwargs = dict(user_params_kv)
 
     class EmbeddedCrewAITool(BaseTool):
         agent_studio_id: str = tool_instance.id
-        name: str = _tool.name
-        description: str = _tool.description
-        args_schema: Type[BaseModel] = _tool.args_schema
+        name: str = proxy.name
+        description: str = proxy.description
+        args_schema: Type[BaseModel] = proxy.args_schema
 
         def _run(self, *args, **kwargs):
-            return _tool._run(*args, **kwargs)
+            try:
+                return proxy.run(self, python_executable, path_to_add, user_kwargs, limits, *args, **kwargs)
+            except ToolExecutionLimitError as e:
+                return tool_limit_error_result(e)
 
     crewai_tool: BaseTool = EmbeddedCrewAITool()
     print(str(crewai_tool))
@@ -317,94 +420,6 @@ def get_tool_instance_proxy(tool_instance: Input__ToolInstance, user_params_kv:
     return crewai_tool
 
 
-def is_venv_prepared_for_tool(source_folder_path: str, requirements_file_name: str) -> bool:
-    venv_dir = os.path.join(source_folder_path, ".venv")
-    if not os.path.exists(venv_dir):
-        return False
-    hash_file_path = os.path.join(source_folder_path, ".requirements_hash.txt")
-    if not os.path.exists(hash_file_path):
-        return False
-    with open(hash_file_path, "r") as hash_file:
-        previous_hash = hash_file.read().strip()
-    with open(os.path.join(source_folder_path, requirements_file_name), "r") as requirements_file:
-        requirements_content = requirements_file.read()
-        requirements_hash = hashlib.md5(requirements_content.encode()).hexdigest()
-    return requirements_hash == previous_hash
-
-
-def _prepare_virtual_env_for_tool_impl(
-    source_folder_path: str, requirements_file_name: str, with_: Literal["venv", "uv"]
-):
-    venv_dir = os.path.join(source_folder_path, ".venv")
-    uv_bin = shutil.which("uv")
-
-    try:
-        if with_ == "uv":
-            uv_venv_setup_command = [uv_bin, "venv", venv_dir]
-            out = subprocess.run(
-                uv_venv_setup_command,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            print(f"stdout for uv venv setup for tool {source_folder_path}: {out.stdout}")
-            print(f"stderr for uv venv setup for tool {source_folder_path}: {out.stderr}")
-        else:
-            venv.create(venv_dir, with_pip=True)
-    except Exception as e:
-        print(f"Error creating virtual environment for tool directory {source_folder_path}: {e.with_traceback()}")
-        return
-
-    # Check for previous requirements file hash
-    hash_file_path = os.path.join(source_folder_path, ".requirements_hash.txt")
-    previous_hash = ""
-    if os.path.exists(hash_file_path):
-        with open(hash_file_path, "r") as hash_file:
-            previous_hash = hash_file.read().strip()
-
-    # Calculate the hash of the requirements file
-    requirements_file_path = os.path.join(source_folder_path, requirements_file_name)
-    with open(requirements_file_path, "r") as requirements_file:
-        requirements_content = requirements_file.read()
-        requirements_hash = hashlib.md5(requirements_content.encode()).hexdigest()
-
-    # If the hash has changed, install the requirements
-    try:
-        if requirements_hash != previous_hash:
-            if with_ == "uv":
-                pip_install_command = [uv_bin, "pip", "install", "-r", requirements_file_path]
-            else:
-                python_exe = os.path.join(venv_dir, "bin", "python")
-                pip_install_command = [
-                    python_exe,
-                    "-m",
-                    "pip",
-                    "install",
-                    "--no-user",
-                    "-r",
-                    requirements_file_path,
-                ]
-            out = subprocess.run(
-                pip_install_command,
-                check=True,
-                capture_output=True,
-                text=True,
-                env={"VIRTUAL_ENV": venv_dir} if with_ == "uv" else None,
-            )
-            print(f"stdout for pip install for tool {source_folder_path}: {out.stdout}")
-            print(f"stderr for pip install for tool {source_folder_path}: {out.stderr}")
-
-            with open(hash_file_path, "w") as hash_file:
-                hash_file.write(requirements_hash)
-    except subprocess.CalledProcessError as e:
-        # We're not raising error as this will bring down the whole studio, as it's running in a thread
-        print(f"Error installing venv requirements for tool directory {source_folder_path}: {e.with_traceback()}")
-
-
-def prepare_virtual_env_for_tool(source_folder_path: str, requirements_file_name: str):
-    return _prepare_virtual_env_for_tool_impl(source_folder_path, requirements_file_name, "venv")
-
-
 def get_venv_tool_output_key(code: str) -> Optional[str]:
     """
     Parse the code with ast, look for a line like:
@@ -508,22 +523,71 @@ def get_venv_tool_tool_parameters_type(code: str) -> Type[BaseModel]:
 
 def get_venv_tool(tool_instance: input_types.Input__ToolInstance, user_params_kv: Dict[str, str]) -> BaseTool:
     relative_module_dir = os.path.abspath(tool_instance.source_folder_path)
-    with open(os.path.join(relative_module_dir, tool_instance.python_code_file_name), "r") as code_file:
-        tool_code = code_file.read()
+    tool_code_path = os.path.join(relative_module_dir, tool_instance.python_code_file_name)
+    tool_output_key = get_tool_file_metadata(tool_code_path, "output_key", get_venv_tool_output_key)
+    tool_args_schema = get_tool_file_metadata(
+        tool_code_path, "tool_parameters_type", get_venv_tool_tool_parameters_type
+    )
+    limits = get_tool_limits(tool_code_path)
     user_params = user_params_kv
 
     class AgentStudioCrewAIVenvTool(BaseTool):
         agent_studio_id: str = tool_instance.id
-        output_key: Optional[str] = get_venv_tool_output_key(tool_code)
+        output_key: Optional[str] = tool_output_key
         python_executable: str = get_venv_tool_python_executable(tool_instance)
         python_file: str = os.path.join(tool_instance.source_folder_path, tool_instance.python_code_file_name)
         name: str = tool_instance.name
         description: str = ""  # eventually tool_instance.description
-        args_schema: Type[BaseModel] = get_venv_tool_tool_parameters_type(tool_code)
+        args_schema: Type[BaseModel] = tool_args_schema
 
         def _run(self, *args, **kwargs):
             try:
-                result = subprocess.run(
+                return self._call(**kwargs)
+            except ToolExecutionLimitError as e:
+                return tool_limit_error_result(e)
+
+        def _call(self, **kwargs):
+            if is_tool_worker_enabled():
+                pool = get_tool_worker_pool(self.python_executable, self.python_file, limits.memory_limit_mb)
+                if pool is not None:
+                    started = time.monotonic()
+                    try:
+                        with pool.checkout(limits.timeout, started) as worker, on_workflow_run_cancelled(worker.kill):
+                            response = worker.call(
+                                dict(user_params),
+                                dict(kwargs),
+                                timeout=limits.timeout,
+                                cpu_limit=limits.cpu_limit,
+                                started=started,
+                            )
+                    except ToolWorkerUnsupportedError:
+                        mark_tool_worker_unsupported(self.python_executable, self.python_file)
+                    except ToolWorkerLimitError as e:
+                        raise tool_limit_exceeded(self.agent_studio_id, self.name, e.reason, str(e))
+                    except WorkflowRunCancelledError:
+                        raise
+                    except Exception as e:
+                        # The worker was killed because the run was cancelled.
+                        raise_if_workflow_run_cancelled()
+                        return f"Tool call failed: {e}"
+                    else:
+                        if not response.get("ok") and is_memory_error(limits, response.get("error")):
+                            raise tool_limit_exceeded(
+                                self.agent_studio_id,
+                                self.name,
+                                "memory",
+                                f"Tool call ran out of its {limits.memory_limit_mb} MB of memory.",
+                            )
+                        if not response.get("ok"):
+                            return f"Error: {response.get('error') or 'No error details found'}"
+                        if response.get("stderr"):
+                            return f"Error: {response['stderr']}"
+                        return response.get("output", "")
+            return self._run_in_subprocess(**kwargs)
+
+        def _run_in_subprocess(self, **kwargs):
+            try:
+                result = run_tool_subprocess(
                     [
                         self.python_executable,
                         self.python_file,
@@ -532,9 +596,12 @@ def get_venv_tool(tool_instance: input_types.Input__ToolInstance, user_params_kv
                         "--tool-params",
                         json.dumps(dict(kwargs)),
                     ],
-                    capture_output=True,
-                    text=True,
+                    limits,
+                    self.agent_studio_id,
+                    self.name,
                 )
+            except (ToolExecutionLimitError, WorkflowRunCancelledError):
+                raise
             except Exception as e:
                 return f"Tool call failed: {e}"
             if result.returncode != 0:
@@ -1,6 +1,7 @@
 import openinference.instrumentation.crewai as crewaiinst
 from openinference.instrumentation.litellm import LiteLLMInstrumentor
 import sys
+import threading
 
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
@@ -23,3 +24,24 @@ def reset_crewai_instrumentation():
     # Add logic to un-instrument or reset the instrumentors
     crewaiinst.CrewAIInstrumentor().uninstrument()  # Check if this method exists
     LiteLLMInstrumentor().uninstrument()  # Check if this method exists
+
+
+_instrumentation_lock = threading.Lock()
+_instrumented_workflow_name = None
+_instrumented_tracer_provider = None
+
+
+def get_or_instrument_crewai_workflow(workflow_name: str):
+    """
+    Return the tracer provider for a workflow, instrumenting CrewAI only if
+    the process is not already instrumented for this workflow. Repeated
+    runs of the same workflow reuse the existing instrumentation instead of
+    uninstrumenting and reinstrumenting OpenTelemetry on every run.
+    """
+    global _instrumented_workflow_name, _instrumented_tracer_provider
+    with _instrumentation_lock:
+        if _instrumented_tracer_provider is None or _instrumented_workflow_name != workflow_name:
+            reset_crewai_instrumentation()
+            _instrumented_tracer_provider = instrument_crewai_workflow(workflow_name)
+            _instrumented_workflow_name = workflow_name
+        return _instrumented_tracer_provider
@@ -0,0 +1,557 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+import fcntl
+import hashlib
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import venv
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Literal, Optional, Tuple
+
+from engine.crewai.tool_worker import VENV_IN_USE_LOCK_SUFFIX, shutdown_tool_workers_in_venv
+
+
+DEFAULT_VENV_PREP_CONCURRENCY = 4
+DEFAULT_VENV_CACHE_DIR = os.path.join("~", ".cache", "agent_studio")
+# Directory, inside a tool's source folder, with the wheels of all of its
+# requirements. Deployed workflows ship it so tools install offline.
+WHEELHOUSE_DIR_NAME = ".wheelhouse"
+# Oldest glibc minor version (manylinux_2_<minor>) of the binary wheels
+# downloaded for another interpreter than the running one.
+DEFAULT_WHEELHOUSE_MIN_GLIBC_MINOR = 17
+DEFAULT_WHEELHOUSE_MAX_GLIBC_MINOR = 28
+
+
+def get_venv_backend() -> Literal["venv", "uv"]:
+    """
+    Tool venvs are created with uv when it is available, as it installs
+    requirements much faster than pip. Set AGENT_STUDIO_VENV_BACKEND to
+    "venv" to use the standard library venv and pip instead.
+    """
+    backend = os.getenv("AGENT_STUDIO_VENV_BACKEND")
+    if backend in ("venv", "uv"):
+        return backend
+    return "uv" if shutil.which("uv") else "venv"
+
+
+def get_venv_cache_dir() -> str:
+    """
+    Download/wheel cache shared by all tool venvs of the project, so the
+    same packages are not downloaded and built again for every tool.
+    """
+    return os.path.expanduser(os.getenv("AGENT_STUDIO_VENV_CACHE_DIR", DEFAULT_VENV_CACHE_DIR))
+
+
+def is_shared_venvs_enabled() -> bool:
+    """
+    Tool instances with identical requirements share one venv from a
+    content-addressed store, instead of each having a venv of its own.
+    """
+    return os.getenv("AGENT_STUDIO_SHARED_VENVS", "true").lower() == "true"
+
+
+def get_shared_venvs_dir() -> str:
+    return os.path.expanduser(os.getenv("AGENT_STUDIO_SHARED_VENVS_DIR", os.path.join(get_venv_cache_dir(), "venvs")))
+
+
+def get_shared_venv_key(requirements_hash: str) -> str:
+    """
+    Shared venvs are keyed by the requirements hash and the interpreter
+    version (for example "<md5>-cpython-311").
+    """
+    return f"{requirements_hash}-{sys.implementation.cache_tag}"
+
+
+def get_venv_prep_concurrency() -> int:
+    return int(os.getenv("AGENT_STUDIO_VENV_PREP_CONCURRENCY", DEFAULT_VENV_PREP_CONCURRENCY))
+
+
+# Bounds the number of tool venvs prepared at the same time across the
+# whole process, no matter who asks for them.
+_venv_prep_slots = threading.BoundedSemaphore(get_venv_prep_concurrency())
+# Per tool directory locks, so the same venv is never prepared twice at once.
+_venv_dir_locks: Dict[str, threading.Lock] = {}
+_venv_dir_locks_lock = threading.Lock()
+
+
+def _get_venv_dir_lock(source_folder_path: str) -> threading.Lock:
+    with _venv_dir_locks_lock:
+        return _venv_dir_locks.setdefault(os.path.abspath(source_folder_path), threading.Lock())
+
+
+def get_requirements_hash(source_folder_path: str, requirements_file_name: str) -> str:
+    with open(os.path.join(source_folder_path, requirements_file_name), "r") as requirements_file:
+        return hashlib.md5(requirements_file.read().encode()).hexdigest()
+
+
+def is_venv_prepared_for_tool(source_folder_path: str, requirements_file_name: str) -> bool:
+    venv_dir = os.path.join(source_folder_path, ".venv")
+    if not os.path.exists(venv_dir):
+        return False
+    hash_file_path = os.path.join(source_folder_path, ".requirements_hash.txt")
+    if not os.path.exists(hash_file_path):
+        return False
+    with open(hash_file_path, "r") as hash_file:
+        previous_hash = hash_file.read().strip()
+    return get_requirements_hash(source_folder_path, requirements_file_name) == previous_hash
+
+
+def _run(command: List[str], source_folder_path: str, step: str) -> None:
+    out = subprocess.run(command, check=True, capture_output=True, text=True)
+    print(f"stdout for {step} for tool {source_folder_path}: {out.stdout}")
+    print(f"stderr for {step} for tool {source_folder_path}: {out.stderr}")
+
+
+def _create_virtual_env(venv_dir: str, source_folder_path: str, with_: Literal["venv", "uv"]) -> None:
+    if with_ == "uv":
+        _run([shutil.which("uv"), "venv", "--python", sys.executable, venv_dir], source_folder_path, "uv venv setup")
+    else:
+        venv.create(venv_dir, with_pip=True)
+
+
+def get_wheelhouse_dir(source_folder_path: str) -> str:
+    return os.path.join(source_folder_path, WHEELHOUSE_DIR_NAME)
+
+
+def get_running_python_version() -> str:
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def get_wheelhouse_platforms() -> List[str]:
+    """
+    Platform tags of the binary wheels downloaded for another interpreter
+    than the running one, on the architecture of this machine. Set
+    AGENT_STUDIO_WHEELHOUSE_PLATFORMS (comma separated) to override them.
+    """
+    platforms = os.getenv("AGENT_STUDIO_WHEELHOUSE_PLATFORMS")
+    if platforms:
+        return [p.strip() for p in platforms.split(",") if p.strip()]
+    machine = platform.machine()
+    return [
+        f"manylinux_2_{minor}_{machine}"
+        for minor in range(DEFAULT_WHEELHOUSE_MAX_GLIBC_MINOR, DEFAULT_WHEELHOUSE_MIN_GLIBC_MINOR - 1, -1)
+    ] + [f"manylinux2014_{machine}", f"linux_{machine}"]
+
+
+def get_wheelhouse_key(requirements_hash: str, python_version: Optional[str] = None) -> str:
+    """
+    Wheelhouses are keyed by the requirements hash and the interpreter
+    version they were built for (for example "<md5>-cp311"), so that a
+    wheelhouse built for another interpreter is not installed from.
+    """
+    python_version = python_version or get_running_python_version()
+    return f"{requirements_hash}-cp{python_version.replace('.', '')}"
+
+
+def is_wheelhouse_built_for_tool(
+    source_folder_path: str, requirements_file_name: str, python_version: Optional[str] = None
+) -> bool:
+    """
+    Whether the tool's wheelhouse covers its current requirements, for the
+    given interpreter version (the running one by default).
+    """
+    hash_file_path = os.path.join(get_wheelhouse_dir(source_folder_path), ".requirements_hash.txt")
+    if not os.path.exists(hash_file_path):
+        return False
+    with open(hash_file_path, "r") as hash_file:
+        previous_key = hash_file.read().strip()
+    requirements_hash = get_requirements_hash(source_folder_path, requirements_file_name)
+    return get_wheelhouse_key(requirements_hash, python_version) == previous_key
+
+
+def _install_requirements(
+    venv_dir: str, source_folder_path: str, requirements_file_name: str, with_: Literal["venv", "uv"]
+) -> None:
+    python_exe = os.path.join(venv_dir, "bin", "python")
+    requirements_file_path = os.path.join(source_folder_path, requirements_file_name)
+    cache_dir = get_venv_cache_dir()
+    if with_ == "uv":
+        pip_install_command = [
+            shutil.which("uv"),
+            "pip",
+            "install",
+            "--python",
+            python_exe,
+            "--cache-dir",
+            os.path.join(cache_dir, "uv"),
+            "-r",
+            requirements_file_path,
+        ]
+    else:
+        pip_install_command = [
+            python_exe,
+            "-m",
+            "pip",
+            "install",
+            "--no-user",
+            "--cache-dir",
+            os.path.join(cache_dir, "pip"),
+            "-r",
+            requirements_file_path,
+        ]
+
+    if is_wheelhouse_built_for_tool(source_folder_path, requirements_file_name):
+        offline_install_command = pip_install_command + [
+            "--no-index",
+            "--find-links",
+            get_wheelhouse_dir(source_folder_path),
+        ]
+        try:
+            _run(offline_install_command, source_folder_path, "offline pip install")
+            return
+        except subprocess.CalledProcessError as e:
+            print(
+                f"Offline install from the wheelhouse failed for tool {source_folder_path}, "
+                f"installing from the package index instead: {e}: {e.stderr}"
+            )
+    _run(pip_install_command, source_folder_path, "pip install")
+
+
+def _prepare_virtual_env_for_tool_impl(
+    source_folder_path: str, requirements_file_name: str, with_: Literal["venv", "uv"]
+) -> Dict:
+    venv_dir = os.path.join(source_folder_path, ".venv")
+    result = {"source_folder_path": source_folder_path, "backend": with_, "ok": False, "installed": False}
+
+    try:
+        if os.path.islink(venv_dir):
+            # The tool used a shared venv before, give it its own again.
+            release_virtual_env_for_tool(source_folder_path)
+        if not os.path.exists(os.path.join(venv_dir, "bin", "python")):
+            _create_virtual_env(venv_dir, source_folder_path, with_)
+    except Exception as e:
+        print(f"Error creating virtual environment for tool directory {source_folder_path}: {e}")
+        result["error"] = str(e)
+        return result
+
+    # Check for previous requirements file hash
+    hash_file_path = os.path.join(source_folder_path, ".requirements_hash.txt")
+    previous_hash = ""
+    if os.path.exists(hash_file_path):
+        with open(hash_file_path, "r") as hash_file:
+            previous_hash = hash_file.read().strip()
+
+    # Calculate the hash of the requirements file
+    requirements_hash = get_requirements_hash(source_folder_path, requirements_file_name)
+
+    # If the hash has changed, install the requirements
+    try:
+        if requirements_hash != previous_hash:
+            _install_requirements(venv_dir, source_folder_path, requirements_file_name, with_)
+            result["installed"] = True
+
+            with open(hash_file_path, "w") as hash_file:
+                hash_file.write(requirements_hash)
+    except subprocess.CalledProcessError as e:
+        # We're not raising error as this will bring down the whole studio, as it's running in a thread
+        print(f"Error installing venv requirements for tool directory {source_folder_path}: {e}: {e.stderr}")
+        result["error"] = str(e)
+        return result
+
+    result["ok"] = True
+    return result
+
+
+@contextmanager
+def _shared_venv_lock(shared_venv_dir: str):
+    """
+    Inter-process lock on a shared venv, held while it is built and while
+    references to it are added or removed.
+    """
+    os.makedirs(os.path.dirname(shared_venv_dir), exist_ok=True)
+    with open(f"{shared_venv_dir}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _get_ref_path(shared_venv_dir: str, source_folder_path: str) -> str:
+    ref_name = hashlib.md5(os.path.abspath(source_folder_path).encode()).hexdigest()
+    return os.path.join(shared_venv_dir, ".refs", ref_name)
+
+
+def _get_refs(shared_venv_dir: str) -> Dict[str, str]:
+    """
+    References to a shared venv, as {ref file path: tool source folder path}.
+    """
+    refs_dir = os.path.join(shared_venv_dir, ".refs")
+    refs = {}
+    for ref_name in os.listdir(refs_dir) if os.path.isdir(refs_dir) else []:
+        with open(os.path.join(refs_dir, ref_name), "r") as ref_file:
+            refs[os.path.join(refs_dir, ref_name)] = ref_file.read().strip()
+    return refs
+
+
+def _get_linked_shared_venv(source_folder_path: str) -> Optional[str]:
+    venv_link = os.path.join(source_folder_path, ".venv")
+    if not os.path.islink(venv_link):
+        return None
+    target = os.path.realpath(venv_link)
+    if os.path.dirname(target) != os.path.realpath(get_shared_venvs_dir()):
+        return None
+    return target
+
+
+def _remove_shared_venv_if_unused(shared_venv_dir: str) -> bool:
+    """
+    Must be called with the shared venv's lock held. The tool workers of
+    this process that still run from the venv are shut down first. A venv
+    that tool workers of other processes still run from is kept, and is
+    removed by a later garbage collection.
+    """
+    if _get_refs(shared_venv_dir):
+        return False
+    shutdown_tool_workers_in_venv(shared_venv_dir)
+    in_use_lock_path = f"{shared_venv_dir}{VENV_IN_USE_LOCK_SUFFIX}"
+    with open(in_use_lock_path, "a") as in_use_lock_file:
+        try:
+            fcntl.flock(in_use_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print(f"Kept unused shared venv {shared_venv_dir}, tool workers still run from it")
+            return False
+        shutil.rmtree(shared_venv_dir, ignore_errors=True)
+        os.remove(in_use_lock_path)
+    print(f"Removed unused shared venv {shared_venv_dir}")
+    return True
+
+
+def _prepare_shared_virtual_env_for_tool_impl(
+    source_folder_path: str, requirements_file_name: str, with_: Literal["venv", "uv"]
+) -> Dict:
+    requirements_hash = get_requirements_hash(source_folder_path, requirements_file_name)
+    shared_venv_dir = os.path.join(get_shared_venvs_dir(), get_shared_venv_key(requirements_hash))
+    result = {
+        "source_folder_path": source_folder_path,
+        "backend": with_,
+        "ok": False,
+        "installed": False,
+        "shared_venv": shared_venv_dir,
+    }
+    venv_link = os.path.join(source_folder_path, ".venv")
+    previous_shared_venv_dir = _get_linked_shared_venv(source_folder_path)
+
+    try:
+        with _shared_venv_lock(shared_venv_dir):
+            # Venvs are not relocatable, so they are built in place. A venv
+            # without the completion marker is a leftover of a failed build.
+            if not os.path.exists(os.path.join(shared_venv_dir, ".complete")):
+                shutil.rmtree(shared_venv_dir, ignore_errors=True)
+                _create_virtual_env(shared_venv_dir, source_folder_path, with_)
+                _install_requirements(shared_venv_dir, source_folder_path, requirements_file_name, with_)
+                open(os.path.join(shared_venv_dir, ".complete"), "w").close()
+                result["installed"] = True
+
+            ref_path = _get_ref_path(shared_venv_dir, source_folder_path)
+            os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+            with open(ref_path, "w") as ref_file:
+                ref_file.write(os.path.abspath(source_folder_path))
+
+            if previous_shared_venv_dir != shared_venv_dir:
+                tmp_link = f"{venv_link}.tmp"
+                if os.path.lexists(tmp_link):
+                    os.remove(tmp_link)
+                os.symlink(shared_venv_dir, tmp_link)
+                if os.path.isdir(venv_link) and not os.path.islink(venv_link):
+                    # Replace a venv of the tool's own.
+                    shutil.rmtree(venv_link)
+                os.replace(tmp_link, venv_link)
+
+            with open(os.path.join(source_folder_path, ".requirements_hash.txt"), "w") as hash_file:
+                hash_file.write(requirements_hash)
+    except Exception as e:
+        # We're not raising error as this will bring down the whole studio, as it's running in a thread
+        print(f"Error preparing shared venv for tool directory {source_folder_path}: {e}")
+        result["error"] = str(e)
+        return result
+
+    if previous_shared_venv_dir and previous_shared_venv_dir != shared_venv_dir:
+        with _shared_venv_lock(previous_shared_venv_dir):
+            ref_path = _get_ref_path(previous_shared_venv_dir, source_folder_path)
+            if os.path.exists(ref_path):
+                os.remove(ref_path)
+            _remove_shared_venv_if_unused(previous_shared_venv_dir)
+
+    result["ok"] = True
+    return result
+
+
+def release_virtual_env_for_tool(source_folder_path: str) -> None:
+    """
+    Drop a tool's reference to its shared venv (for example before the
+    tool instance is deleted), removing the shared venv if no other tool
+    uses it anymore.
+    """
+    shared_venv_dir = _get_linked_shared_venv(source_folder_path)
+    venv_link = os.path.join(source_folder_path, ".venv")
+    if os.path.islink(venv_link):
+        os.remove(venv_link)
+    if not shared_venv_dir:
+        return
+    with _shared_venv_lock(shared_venv_dir):
+        ref_path = _get_ref_path(shared_venv_dir, source_folder_path)
+        if os.path.exists(ref_path):
+            os.remove(ref_path)
+        _remove_shared_venv_if_unused(shared_venv_dir)
+
+
+def garbage_collect_shared_venvs() -> List[str]:
+    """
+    Drop the references of tools that no longer use a shared venv (for
+    example because their directory was deleted with the whole workflow)
+    and remove the shared venvs nobody references. Returns the removed
+    shared venv directories.
+    """
+    shared_venvs_dir = get_shared_venvs_dir()
+    if not os.path.isdir(shared_venvs_dir):
+        return []
+    removed = []
+    for name in os.listdir(shared_venvs_dir):
+        shared_venv_dir = os.path.join(shared_venvs_dir, name)
+        if not os.path.isdir(shared_venv_dir):
+            continue
+        with _shared_venv_lock(shared_venv_dir):
+            for ref_path, source_folder_path in _get_refs(shared_venv_dir).items():
+                if _get_linked_shared_venv(source_folder_path) != os.path.realpath(shared_venv_dir):
+                    os.remove(ref_path)
+            if _remove_shared_venv_if_unused(shared_venv_dir):
+                removed.append(shared_venv_dir)
+    return removed
+
+
+def prepare_virtual_env_for_tool(
+    source_folder_path: str, requirements_file_name: str, with_: Optional[Literal["venv", "uv"]] = None
+) -> Dict:
+    """
+    Create the tool's venv if needed and install its requirements if they
+    changed since the last install. With shared venvs enabled, the tool's
+    .venv links to the shared venv of its requirements instead. Returns a
+    report with the outcome and the time spent waiting for a free
+    preparation slot and preparing.
+    """
+    with_ = with_ or get_venv_backend()
+    queued_at = time.monotonic()
+    with _venv_prep_slots, _get_venv_dir_lock(source_folder_path):
+        started_at = time.monotonic()
+        if is_shared_venvs_enabled():
+            result = _prepare_shared_virtual_env_for_tool_impl(source_folder_path, requirements_file_name, with_)
+        else:
+            result = _prepare_virtual_env_for_tool_impl(source_folder_path, requirements_file_name, with_)
+    result["wait_seconds"] = round(started_at - queued_at, 3)
+    result["seconds"] = round(time.monotonic() - started_at, 3)
+    print(
+        f"Prepared venv for tool {source_folder_path} with {with_} in {result['seconds']}s "
+        f"(waited {result['wait_seconds']}s, installed: {result['installed']}, ok: {result['ok']})"
+    )
+    return result
+
+
+def prepare_virtual_envs_for_tools(tools: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Prepare the venvs of several tools, given as (source folder path,
+    requirements file name) pairs, in parallel. Returns the per-tool
+    reports of prepare_virtual_env_for_tool in the order of the tools.
+    """
+    if not tools:
+        return []
+    max_workers = max_workers or get_venv_prep_concurrency()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="venv_prep_") as executor:
+        return list(executor.map(lambda tool: prepare_virtual_env_for_tool(*tool), tools))
+
+
+def _get_wheelhouse_command(
+    source_folder_path: str, requirements_file_name: str, python_version: Optional[str]
+) -> List[str]:
+    wheelhouse_dir = get_wheelhouse_dir(source_folder_path)
+    requirements_file_path = os.path.join(source_folder_path, requirements_file_name)
+    pip_cache_dir = os.path.join(get_venv_cache_dir(), "pip")
+    if not python_version or python_version == get_running_python_version():
+        return [
+            sys.executable,
+            "-m",
+            "pip",
+            "wheel",
+            "--cache-dir",
+            pip_cache_dir,
+            "--wheel-dir",
+            wheelhouse_dir,
+            "-r",
+            requirements_file_path,
+        ]
+    # Wheels of other interpreters can not be built here, so only existing
+    # binary wheels for the target interpreter and platform are downloaded.
+    command = [
+        sys.executable,
+        "-m",
+        "pip",
+        "download",
+        "--cache-dir",
+        pip_cache_dir,
+        "--dest",
+        wheelhouse_dir,
+        "--only-binary=:all:",
+        "--implementation",
+        "cp",
+        "--python-version",
+        python_version,
+    ]
+    for platform_tag in get_wheelhouse_platforms():
+        command += ["--platform", platform_tag]
+    return command + ["-r", requirements_file_path]
+
+
+def build_wheelhouse_for_tool(
+    source_folder_path: str, requirements_file_name: str, python_version: Optional[str] = None
+) -> Dict:
+    """
+    Build the wheels of all of a tool's requirements (and their
+    dependencies) into the tool's wheelhouse, so that its venv can later be
+    prepared without access to a package index. Wheels are built for the
+    given interpreter version ("3.11"), which defaults to the running
+    interpreter. For another interpreter, the binary wheels of the
+    requirements are downloaded instead, and requirements without one fail
+    the build.
+    """
+    wheelhouse_dir = get_wheelhouse_dir(source_folder_path)
+    result = {"source_folder_path": source_folder_path, "ok": False, "built": False}
+    try:
+        if not is_wheelhouse_built_for_tool(source_folder_path, requirements_file_name, python_version):
+            shutil.rmtree(wheelhouse_dir, ignore_errors=True)
+            _run(
+                _get_wheelhouse_command(source_folder_path, requirements_file_name, python_version),
+                source_folder_path,
+                "pip wheel",
+            )
+            requirements_hash = get_requirements_hash(source_folder_path, requirements_file_name)
+            with open(os.path.join(wheelhouse_dir, ".requirements_hash.txt"), "w") as hash_file:
+                hash_file.write(get_wheelhouse_key(requirements_hash, python_version))
+            result["built"] = True
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error building wheelhouse for tool directory {source_folder_path}: {e}")
+        result["error"] = str(e)
+        return result
+
+    result["ok"] = True
+    return result
+
+
+def build_wheelhouses_for_tools(
+    tools: List[Tuple[str, str]], max_workers: Optional[int] = None, python_version: Optional[str] = None
+) -> List[Dict]:
+    """
+    Build the wheelhouses of several tools, given as (source folder path,
+    requirements file name) pairs, in parallel, for the given interpreter
+    version.
+    """
+    if not tools:
+        return []
+    max_workers = max_workers or get_venv_prep_concurrency()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="wheelhouse_") as executor:
+        return list(executor.map(lambda tool: build_wheelhouse_for_tool(*tool, python_version), tools))
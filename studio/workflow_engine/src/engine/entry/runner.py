@@ -5,7 +5,9 @@ import os
 import sys
 import traceback
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, Optional
 from opentelemetry.context import get_current
 import subprocess 
 
@@ -22,20 +24,39 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 workflow_engine_src_dir = os.path.abspath(os.path.join(current_dir, "..", ".."))
 sys.path.append(workflow_engine_src_dir)
 
-# Import CrewAI modules.
-import engine.types as input_types
-from engine.crewai.run import run_workflow
-from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation
-from engine.ops import get_ops_endpoint
-from engine.crewai.events import register_global_handlers
+# Import CrewAI modules. They need the sqlite3 patch and the engine source
+# directory on the path, so they come after both.
+import engine.types as input_types  # noqa: E402
+from engine.crewai.run import run_workflow  # noqa: E402
+from engine.crewai.tracing import get_or_instrument_crewai_workflow  # noqa: E402
+from engine.crewai.events import register_global_handlers  # noqa: E402
+from engine.crewai.event_shipper import get_event_shipper  # noqa: E402
+from engine.crewai.cancellation import (  # noqa: E402
+    cancel_workflow_run,
+    is_workflow_run_cancelled,
+    register_cancellation_handlers,
+    register_workflow_run,
+    ship_workflow_run_cancelled_event,
+    unregister_workflow_run,
+)
 
 app = FastAPI()
 
-# Global asynchronous lock to allow only one workflow at a time.
-global_lock = asyncio.Lock()
+# Number of workflows this runner can execute at the same time. Each
+# workflow runs in its own thread of the executor below, and events are
+# routed per run through the trace ID context variable.
+NUM_WORKFLOW_SLOTS = int(os.getenv("AGENT_STUDIO_WORKFLOW_RUNNER_SLOTS", 1))
 
-# Global reference to the running workflow
-running_workflow = None
+# A cancelled run frees its slot right away, but its thread keeps going
+# until the run reaches its next step. The spare threads let new runs start
+# in the meantime.
+workflow_executor = ThreadPoolExecutor(max_workers=NUM_WORKFLOW_SLOTS * 2, thread_name_prefix="workflow_runner_slot_")
+
+# Global references to the running workflows, keyed by events trace ID.
+running_workflows: Dict[str, dict] = {}
+
+# Kickoff payloads of the running workflows, keyed by events trace ID.
+running_payloads: Dict[str, "KickoffPayload"] = {}
 
 
 # Pydantic model for the incoming JSON payload.
@@ -45,6 +66,13 @@ class KickoffPayload(BaseModel):
     tool_user_params: dict
     inputs: dict
     events_trace_id: str
+    # Optional endpoint to notify once the workflow finishes and its
+    # slot is free again (used by the studio's runner dispatcher).
+    callback_url: Optional[str] = None
+
+
+class CancelPayload(BaseModel):
+    trace_id: str
 
 
 # Register our handlers. This can occur globally
@@ -52,18 +80,16 @@ class KickoffPayload(BaseModel):
 # we run, the event handlers can remain the same (since
 # trace ID is written as a contextvar on each async task)
 register_global_handlers()
+register_cancellation_handlers()
 
 
 def run_workflow_task(payload: KickoffPayload) -> None:
-    global running_workflow
-
     """
     Task definiton to be ran asynchronously.
     Any exceptions are caught and posted to the ops endpoint.
     """
     try:
-        reset_crewai_instrumentation()
-        tracer_provider = instrument_crewai_workflow(payload.workflow_name)
+        tracer_provider = get_or_instrument_crewai_workflow(payload.workflow_name)
         tracer = tracer_provider.get_tracer("opentelemetry.agentstudio.workflow.model")
         current_time = datetime.now()
         formatted_time = current_time.strftime("%b %d, %H:%M:%S.%f")[:-3]
@@ -90,71 +116,123 @@ def run_workflow_task(payload: KickoffPayload) -> None:
 
         print("Workflow finished successfully")
     except Exception as e:
-        running_workflow = None
+        if is_workflow_run_cancelled(payload.events_trace_id):
+            # The terminal event was shipped by the cancel endpoint.
+            print("Workflow cancelled")
+            return
         print("Workflow failed:", e)
         traceback.print_exc()
-        try:
-            requests.post(
-                url=f"{get_ops_endpoint()}/events",
-                headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
-                json={
-                    "trace_id": payload.events_trace_id,
-                    "event": {"type": "crew_kickoff_failed", "error": str(e), "trace": traceback.format_exc()},
-                },
-            )
-        except Exception as post_ex:
-            print("Failed to send error event:", post_ex)
+        event_shipper = get_event_shipper()
+        event_shipper.ship(
+            payload.events_trace_id,
+            {"type": "crew_kickoff_failed", "error": str(e), "trace": traceback.format_exc()},
+        )
+        if not event_shipper.flush():
+            print("Failed to send error event")
 
 
 async def run_workflow_background(payload: KickoffPayload) -> None:
-    global running_workflow
-
     """
     This asynchronous wrapper schedules the synchronous workflow to run
-    in an executor. When done, it ensures the global lock is released.
+    in one of the runner's slots. When done, it ensures the slot is freed.
     """
+    loop = asyncio.get_running_loop()
     try:
-        loop = asyncio.get_running_loop()
         # Running the blocking workflow code in a separate thread.
-        await loop.run_in_executor(None, run_workflow_task, payload)
+        await loop.run_in_executor(workflow_executor, run_workflow_task, payload)
     finally:
-        global_lock.release()
-        running_workflow = None
+        unregister_workflow_run(payload.events_trace_id)
+        # A cancelled run already freed its slot.
+        if running_workflows.pop(payload.events_trace_id, None) is not None:
+            running_payloads.pop(payload.events_trace_id, None)
+            if payload.callback_url:
+                await loop.run_in_executor(None, notify_slot_freed, payload)
+
+
+def notify_slot_freed(payload: KickoffPayload) -> None:
+    try:
+        requests.post(url=payload.callback_url, json={"trace_id": payload.events_trace_id}, timeout=5)
+    except Exception as e:
+        print("Failed to notify workflow dispatcher:", e)
+
+
+def get_free_slots() -> int:
+    return max(NUM_WORKFLOW_SLOTS - len(running_workflows), 0)
 
 
 @app.post("/kickoff")
 async def kickoff(payload: KickoffPayload):
-    global running_workflow
-
     """
     POST endpoint to start a Crew workflow.
 
     It will:
-      - Check if another workflow is already running.
-      - If not, acquire the lock, schedule the workflow to run asynchronously, and respond immediately.
-      - If the lock is already held, return HTTP 409 "Runner is busy".
+      - Check if there is a free execution slot on this runner.
+      - If so, claim the slot, schedule the workflow to run asynchronously, and respond immediately.
+      - If all slots are taken, return HTTP 409 "Runner is busy".
+
+    The runner's OpenTelemetry instrumentation is bound to a single workflow
+    (Phoenix project) at a time, so concurrent runs must all belong to the
+    same workflow. Kickoffs of a different workflow are rejected as busy
+    until the running ones finish.
     """
-    if global_lock.locked():
+    if get_free_slots() == 0:
         raise HTTPException(status_code=409, detail="Runner is busy")
-
-    # Acquire the lock so that no other workflow starts.
-    await global_lock.acquire()
-    running_workflow = {"name": payload.workflow_name, "id": payload.collated_input["workflow"]["id"]}
+    if any(w["workflow_name"] != payload.workflow_name for w in running_workflows.values()):
+        raise HTTPException(status_code=409, detail="Runner is busy with another workflow")
+
+    # Claim the slot so that no other workflow can take it.
+    running_workflows[payload.events_trace_id] = {
+        "name": payload.collated_input["workflow"]["name"],
+        "id": payload.collated_input["workflow"]["id"],
+        "workflow_name": payload.workflow_name,
+        "trace_id": payload.events_trace_id,
+    }
+    running_payloads[payload.events_trace_id] = payload
+    register_workflow_run(payload.events_trace_id)
     # Launch the background workflow process.
     asyncio.create_task(run_workflow_background(payload))
     return {"status": "Workflow kickoff started"}
 
 
+@app.post("/cancel")
+async def cancel(payload: CancelPayload):
+    """
+    POST endpoint to cancel a running workflow.
+
+    The run stops at its next step (task, agent execution, LLM call or tool
+    call) and its in-flight tool calls are killed. Its terminal
+    crew_kickoff_failed event is shipped and its slot is freed right away,
+    without waiting for the run to stop. Returns HTTP 404 if the workflow is
+    not running on this runner.
+    """
+    if payload.trace_id not in running_workflows or not cancel_workflow_run(payload.trace_id):
+        raise HTTPException(status_code=404, detail="Workflow is not running")
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, ship_workflow_run_cancelled_event, payload.trace_id)
+    running_workflows.pop(payload.trace_id, None)
+    kickoff_payload = running_payloads.pop(payload.trace_id, None)
+    if kickoff_payload and kickoff_payload.callback_url:
+        await loop.run_in_executor(None, notify_slot_freed, kickoff_payload)
+    return {"status": "Workflow cancelled"}
+
+
 @app.get("/status")
 async def status():
-    global running_workflow
-
     """
-    GET endpoint to report the runner's busy status.
+    GET endpoint to report the runner's capacity.
 
-    It returns a JSON indicating whether a workflow is currently running.
+    It returns a JSON with the number of total and free execution slots,
+    the workflows currently running and the event shipper's backpressure
+    counters.
+    "busy" is kept for clients that only need to know whether a kickoff
+    would be accepted.
     """
-    if global_lock.locked():
-        return {"busy": True, "workflow": running_workflow}
-    else:
-        return {"busy": False}
+    free_slots = get_free_slots()
+    return {
+        "busy": free_slots == 0,
+        "slots": NUM_WORKFLOW_SLOTS,
+        "free_slots": free_slots,
+        "workflows": list(running_workflows.values()),
+        "events": get_event_shipper().stats(),
+    }
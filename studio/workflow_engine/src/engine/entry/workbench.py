@@ -1,16 +1,34 @@
+import importlib.util
 import os
 import sys
 import subprocess
 
+from engine.consts import DEPLOYED_WORKFLOW_WHEELHOUSE_DIR
+
 # Extract workflow parameters from the environment
 WORKFLOW_ARTIFACT_TYPE = os.environ.get("AGENT_STUDIO_WORKFLOW_ARTIFACT_TYPE", "config_file")
 WORFKLOW_ARTIFACT = os.environ.get("AGENT_STUDIO_WORKFLOW_ARTIFACT", "/home/cdsw/workflow/config.json")
 WORKFLOW_NAME = os.getenv("AGENT_STUDIO_WORKFLOW_NAME")
 CDSW_DOMAIN = os.getenv("CDSW_DOMAIN")
 
+# Deployed workflow directory, holding the workflow config and the wheels baked in at deploy time.
+DEPLOYED_WORKFLOW_DIR = os.path.dirname(os.path.dirname(WORFKLOW_ARTIFACT))
+
+
 # Install the cmlapi. This is a required dependency for cross-cutting util modules
-# and ops modules that are used in a workflow.
-subprocess.call(["pip", "install", f"https://{CDSW_DOMAIN}/api/v2/python.tar.gz"])
+# and ops modules that are used in a workflow. It is usually installed by the model
+# build already, otherwise prefer the wheel baked into the deployed workflow.
+def _install_cmlapi():
+    if importlib.util.find_spec("cmlapi"):
+        return
+    wheelhouse_dir = os.path.join(DEPLOYED_WORKFLOW_DIR, DEPLOYED_WORKFLOW_WHEELHOUSE_DIR)
+    if os.path.isdir(wheelhouse_dir):
+        if subprocess.call(["pip", "install", "--no-index", "--find-links", wheelhouse_dir, "cmlapi"]) == 0:
+            return
+    subprocess.call(["pip", "install", f"https://{CDSW_DOMAIN}/api/v2/python.tar.gz"])
+
+
+_install_cmlapi()
 
 # Manual patch required for CrewAI compatability
 __import__("pysqlite3")
@@ -24,11 +42,27 @@ from pydantic import ValidationError
 import json
 import base64
 
-import engine.types as input_types
-from engine import consts
-from engine.crewai.run import run_workflow_async
-from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation
-from engine.crewai.tools import prepare_virtual_env_for_tool
+# Engine modules import CrewAI, which needs the sqlite3 patch above.
+import engine.types as input_types  # noqa: E402
+from engine import consts  # noqa: E402
+from engine.admission_control import (  # noqa: E402
+    WorkflowRunAdmission,
+    WorkflowRunRejectedError,
+    get_workflow_max_in_flight,
+    get_workflow_max_queued,
+)
+from engine.crewai.run import run_workflow_async  # noqa: E402
+from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation  # noqa: E402
+from engine.crewai.venvs import prepare_virtual_envs_for_tools  # noqa: E402
+from engine.crewai.events import register_global_handlers  # noqa: E402
+from engine.crewai.cancellation import (  # noqa: E402
+    cancel_workflow_run,
+    is_workflow_run_cancelled,
+    register_cancellation_handlers,
+    register_workflow_run,
+    ship_workflow_run_cancelled_event,
+    unregister_workflow_run,
+)
 
 import cml.models_v1 as cml_models
 
@@ -36,9 +70,12 @@ import cml.models_v1 as cml_models
 # Currently the only artifact type supported for import is directory.
 # the collated input requirements are all relative to the workflow import path.
 def _install_python_requirements(collated_input: input_types.CollatedInput):
-    for tool_instance in collated_input.tool_instances:
-        print(f"PREPARING VIRTUAL ENV FOR {tool_instance.name}")
-        prepare_virtual_env_for_tool(tool_instance.source_folder_path, tool_instance.python_requirements_file_name)
+    print(f"PREPARING VIRTUAL ENVS FOR {[t.name for t in collated_input.tool_instances]}")
+    results = prepare_virtual_envs_for_tools(
+        [(t.source_folder_path, t.python_requirements_file_name) for t in collated_input.tool_instances]
+    )
+    for tool_instance, result in zip(collated_input.tool_instances, results):
+        print(f"VIRTUAL ENV FOR {tool_instance.name}: {result}")
 
 
 if WORKFLOW_ARTIFACT_TYPE == "config_file":
@@ -49,6 +86,54 @@ else:
     raise ValueError("currently only AGENT_STUDIO_WORKFLOW_ARTIFACT_TYPE=config_file is supported.")
 
 
+def _get_tool_user_params(collated_input: input_types.CollatedInput) -> Dict[str, Dict[str, str]]:
+    """
+    User parameters of the tool instances, from the
+    TOOL_<tool instance ID>_USER_PARAMS_<parameter> environment variables.
+    """
+    prefixes = {f"TOOL_{t.id.replace('-', '_')}_USER_PARAMS_": t.id for t in collated_input.tool_instances}
+    tool_user_params: Dict[str, Dict[str, str]] = {t.id: {} for t in collated_input.tool_instances}
+    for key, value in os.environ.items():
+        for prefix, t_id in prefixes.items():
+            if key.startswith(prefix):
+                tool_user_params[t_id][key[len(prefix) :]] = value
+    return tool_user_params
+
+
+def _get_run_collated_input(collated_input: input_types.CollatedInput) -> input_types.CollatedInput:
+    """
+    Copy of the collated input with the language model configs of the
+    MODEL_<model ID>_CONFIG environment variables. The configs hold API keys,
+    so they are not put in the collated input returned by get-configuration.
+    """
+    run_collated_input = collated_input.model_copy(deep=True)
+    for lm in run_collated_input.language_models:
+        env_var_key_name = f"MODEL_{lm.model_id.replace('-', '_')}_CONFIG"
+        lm_config: Optional[input_types.Input__LanguageModelConfig] = None
+        try:
+            lm_config_str = os.getenv(env_var_key_name)
+            if lm_config_str:
+                lm_config = input_types.Input__LanguageModelConfig.model_validate(json.loads(lm_config_str))
+        except (ValidationError, json.JSONDecodeError) as e:
+            raise ValueError(f"Error validating language model config for {lm.model_name}: {e}")
+        lm.config = lm_config
+    return run_collated_input
+
+
+# The environment of the model does not change after it starts, so the
+# collated input and tool user parameters of the runs are resolved once here.
+# Every kickoff shares them and only binds its inputs and trace ID, so they
+# must be treated as read-only. A config error fails the kickoffs, but not
+# the other actions of the model.
+run_tool_user_params = _get_tool_user_params(collated_input)
+run_collated_input: Optional[input_types.CollatedInput] = None
+run_collated_input_error: Optional[ValueError] = None
+try:
+    run_collated_input = _get_run_collated_input(collated_input)
+except ValueError as e:
+    run_collated_input_error = e
+
+
 def base64_decode(encoded_str: str):
     decoded_bytes = base64.b64decode(encoded_str)
     return json.loads(decoded_bytes.decode("utf-8"))
@@ -60,6 +145,30 @@ reset_crewai_instrumentation()
 tracer_provider = instrument_crewai_workflow(f"{WORKFLOW_NAME}")
 tracer = tracer_provider.get_tracer("opentelemetry.agentstudio.workflow.model")
 
+# Register our event handlers once for the whole model process. Each
+# workflow run routes its events with a trace ID context variable.
+register_global_handlers()
+register_cancellation_handlers()
+
+# Bound the runs of this model replica, so that a burst of kickoffs is
+# rejected quickly instead of queueing unbounded work.
+workflow_run_admission = WorkflowRunAdmission(get_workflow_max_in_flight(), get_workflow_max_queued())
+
+
+async def run_admitted_workflow(
+    collated_input: input_types.CollatedInput,
+    tool_user_params: Dict[str, Dict[str, str]],
+    inputs: Dict,
+    parent_context,
+    trace_id: str,
+) -> None:
+    async with workflow_run_admission.slot():
+        # The run may have been cancelled while it was queued.
+        if is_workflow_run_cancelled(trace_id):
+            unregister_workflow_run(trace_id)
+            return
+        await run_workflow_async(collated_input, tool_user_params, inputs, parent_context, trace_id)
+
 
 @cml_models.cml_model
 def api_wrapper(args: Union[dict, str]) -> str:
@@ -68,33 +177,16 @@ def api_wrapper(args: Union[dict, str]) -> str:
         dict_args = json.loads(args)
     serve_workflow_parameters = input_types.ServeWorkflowParameters.model_validate(dict_args)
     if serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.KICKOFF.value:
+        if run_collated_input_error is not None:
+            raise run_collated_input_error
         inputs = (
             base64_decode(serve_workflow_parameters.kickoff_inputs) if serve_workflow_parameters.kickoff_inputs else {}
         )
-        collated_input_copy = collated_input.model_copy(deep=True)
-
-        tool_user_params: Dict[str, Dict[str, str]] = {}
-        for tool_instance in collated_input_copy.tool_instances:
-            t_id = tool_instance.id
-            prefix = f"TOOL_{t_id.replace('-', '_')}_USER_PARAMS_"
-            user_param_kv = {}
-            for key, value in os.environ.items():
-                if key.startswith(prefix):
-                    param_name = key[len(prefix) :]
-                    user_param_kv[param_name] = value
-            tool_user_params[t_id] = user_param_kv
-
-        # Retrieve the language model config from the environment variables and validate it, and put it back in the collated input.
-        for lm in collated_input_copy.language_models:
-            env_var_key_name = f"MODEL_{lm.model_id.replace('-', '_')}_CONFIG"
-            lm_config: Optional[input_types.Input__LanguageModelConfig] = None
-            try:
-                lm_config_str = os.getenv(env_var_key_name)
-                if lm_config_str:
-                    lm_config = input_types.Input__LanguageModelConfig.model_validate(json.loads(lm_config_str))
-            except (ValidationError, json.JSONDecodeError) as e:
-                raise ValueError(f"Error validating language model config for {lm.model_name}: {e}")
-            lm.config = lm_config
+
+        try:
+            workflow_run_admission.admit()
+        except WorkflowRunRejectedError as e:
+            return {"error": str(e), "status_code": e.status_code, "retry_after": e.retry_after}
 
         current_time = datetime.now()
         formatted_time = current_time.strftime("%b %d, %H:%M:%S.%f")[:-3]
@@ -111,8 +203,9 @@ def api_wrapper(args: Union[dict, str]) -> str:
             parent_context = get_current()
 
             # Start the workflow in the background using the parent context
+            register_workflow_run(trace_id)
             asyncio.create_task(
-                run_workflow_async(collated_input_copy, tool_user_params, inputs, parent_context, trace_id)
+                run_admitted_workflow(run_collated_input, run_tool_user_params, inputs, parent_context, trace_id)
             )
 
         return {"trace_id": str(trace_id)}
@@ -141,5 +234,14 @@ def api_wrapper(args: Union[dict, str]) -> str:
                 asset_data[asset_uri] = base64.b64encode(asset_file.read()).decode()
                 # Decode at the destination with: base64.b64decode(asset_data[asset_uri])
         return {"asset_data": asset_data, "unavailable_assets": unavailable_assets}
+    elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_STATUS.value:
+        return {"runs": workflow_run_admission.stats()}
+    elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.CANCEL.value:
+        if not serve_workflow_parameters.cancel_trace_id:
+            raise ValueError("cancel_trace_id is required to cancel a workflow run.")
+        cancelled = cancel_workflow_run(serve_workflow_parameters.cancel_trace_id)
+        if cancelled:
+            ship_workflow_run_cancelled_event(serve_workflow_parameters.cancel_trace_id)
+        return {"cancelled": cancelled}
     else:
         raise ValueError("Invalid action type.")
@@ -1,4 +1,7 @@
 import sys
+import threading
+import time
+from typing import Optional
 
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
@@ -11,6 +14,29 @@ import cmlapi
 import os
 
 
+DEFAULT_OPS_ENDPOINT_TTL = 300
+
+# Process-wide cache of the discovered ops endpoint.
+_ops_endpoint: Optional[str] = None
+_ops_endpoint_expires_at: float = 0
+_ops_endpoint_lock = threading.Lock()
+
+
+def get_ops_endpoint_ttl() -> int:
+    return int(os.getenv("AGENT_STUDIO_OPS_ENDPOINT_TTL", DEFAULT_OPS_ENDPOINT_TTL))
+
+
+def invalidate_ops_endpoint() -> None:
+    """
+    Drop the cached ops endpoint, for example after failing to connect
+    to it, so that the next call to get_ops_endpoint discovers it again.
+    """
+    global _ops_endpoint, _ops_endpoint_expires_at
+    with _ops_endpoint_lock:
+        _ops_endpoint = None
+        _ops_endpoint_expires_at = 0
+
+
 def get_ops_provider() -> str:
     return os.getenv("AGENT_STUDIO_OPS_PROVIDER", "phoenix")
 
@@ -23,7 +49,23 @@ def get_ops_endpoint() -> str:
     env variable does not exist, extract the endpoint information
     from the running ops application directly. This env var override
     option is to make sure CML models can also reach the ops endpoint.
+
+    Discovering the ops application lists the project's applications, so
+    the result is cached for AGENT_STUDIO_OPS_ENDPOINT_TTL seconds.
     """
+    global _ops_endpoint, _ops_endpoint_expires_at
+    if os.getenv("AGENT_STUDIO_OPS_ENDPOINT"):
+        return os.getenv("AGENT_STUDIO_OPS_ENDPOINT")
+
+    with _ops_endpoint_lock:
+        if _ops_endpoint and time.monotonic() < _ops_endpoint_expires_at:
+            return _ops_endpoint
+        _ops_endpoint = _discover_ops_endpoint()
+        _ops_endpoint_expires_at = time.monotonic() + get_ops_endpoint_ttl()
+        return _ops_endpoint
+
+
+def _discover_ops_endpoint() -> str:
     # Check for required environment variables
     domain = os.getenv('CDSW_DOMAIN')
     api_key = os.getenv('CDSW_APIV2_KEY')
@@ -91,9 +91,12 @@ class DeployedWorkflowActions(str, Enum):
     KICKOFF = "kickoff"
     GET_CONFIGURATION = "get-configuration"
     GET_ASSET_DATA = "get-asset-data"
+    CANCEL = "cancel"
+    GET_STATUS = "get-status"
 
 
 class ServeWorkflowParameters(BaseModel):
     action_type: DeployedWorkflowActions
     kickoff_inputs: Optional[str] = None
     get_asset_data_inputs: List[str] = list()
+    cancel_trace_id: Optional[str] = None
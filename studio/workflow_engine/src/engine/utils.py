@@ -1,6 +1,7 @@
-import os
 import cmlapi
 
+from engine.application_directory import get_application_directory
+
 
 def get_application_by_name(cml: cmlapi.CMLServiceApi, name: str, only_running: bool = True) -> cmlapi.Application:
     """
@@ -13,23 +14,14 @@ def get_application_by_name(cml: cmlapi.CMLServiceApi, name: str, only_running:
     Raises:
         ValueError: If no running application is found
     """
-    applications: list[cmlapi.Application] = cml.list_applications(
-        project_id=os.getenv("CDSW_PROJECT_ID"),
-        page_size=5000,
-    ).applications
-
     # Filter for applications that:
     # 1. Match the base name
     # 2. Have "running" in their status
-    if only_running:
-        running_apps = [
-            app
-            for app in applications
-            if ((app.name == name) or (name + " v") in app.name)
-            and "running" in app.status.lower()  # Changed to check if "running" is in status
-        ]
-    else:
-        running_apps = [app for app in applications if ((app.name == name) or (name + " v") in app.name)]
+    running_apps = get_application_directory().find(
+        cml,
+        name,
+        accept=(lambda app: "running" in app.status.lower()) if only_running else None,
+    )
 
     if not running_apps:
         raise ValueError(f"No running applications found matching '{name}'")
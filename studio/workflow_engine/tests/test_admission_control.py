@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from engine.admission_control import WorkflowRunAdmission, WorkflowRunRejectedError
+
+
+def test_kickoffs_beyond_queue_are_rejected():
+    admission = WorkflowRunAdmission(max_in_flight=2, max_queued=1)
+    for _ in range(3):
+        admission.admit()
+    with pytest.raises(WorkflowRunRejectedError) as e:
+        admission.admit()
+    assert e.value.status_code == 429
+    assert e.value.retry_after >= 1
+
+    stats = admission.stats()
+    assert (stats["queued"], stats["in_flight"], stats["admitted"], stats["rejected"]) == (3, 0, 3, 1)
+
+
+def test_slots_bound_runs_in_flight():
+    admission = WorkflowRunAdmission(max_in_flight=2, max_queued=2)
+    running = []
+    peak = []
+
+    async def run():
+        async with admission.slot():
+            running.append(1)
+            peak.append(admission.stats()["in_flight"])
+            await asyncio.sleep(0.05)
+            running.pop()
+
+    async def main():
+        tasks = []
+        for _ in range(4):
+            admission.admit()
+            tasks.append(asyncio.create_task(run()))
+        await asyncio.sleep(0.01)
+        assert admission.stats()["queued"] == 2
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert max(peak) == 2
+    stats = admission.stats()
+    assert (stats["queued"], stats["in_flight"]) == (0, 0)
+    # Slots are free again.
+    admission.admit()
+
+
+def test_retry_after_follows_run_duration():
+    admission = WorkflowRunAdmission(max_in_flight=1, max_queued=0)
+
+    async def main():
+        admission.admit()
+        async with admission.slot():
+            pass
+
+    asyncio.run(main())
+    # The short run pulls the average duration down from its default.
+    assert admission.stats()["average_run_seconds"] < 60
+    assert admission.retry_after() < 60
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock, patch
+
+from engine.application_directory import ApplicationDirectory
+from engine.utils import get_application_by_name
+
+
+def _application(name, status="running"):
+    application = MagicMock()
+    application.name = name
+    application.status = status
+    return application
+
+
+def _is_running(application):
+    return "running" in application.status.lower()
+
+
+def _cml(*applications):
+    cml = MagicMock()
+    cml.list_applications.return_value.applications = list(applications)
+    return cml
+
+
+def test_lookups_share_one_listing():
+    events = []
+    directory = ApplicationDirectory(metrics_hook=events.append)
+    cml = _cml(_application("Agent Studio v1.0"), _application("Workflow: Foo"))
+
+    assert [app.name for app in directory.find(cml, "Agent Studio")] == ["Agent Studio v1.0"]
+    assert [app.name for app in directory.find(cml, "Workflow: Foo", versions=False)] == ["Workflow: Foo"]
+    assert cml.list_applications.call_count == 1
+    assert directory.stats() == {"upstream_call": 1, "upstream_call_saved": 1}
+    assert events == ["upstream_call", "upstream_call_saved"]
+
+
+def test_versions_are_only_matched_when_asked():
+    directory = ApplicationDirectory()
+    cml = _cml(_application("Workflow: Foo v2"))
+    assert directory.find(cml, "Workflow: Foo", versions=False) == []
+    assert len(directory.find(cml, "Workflow: Foo")) == 1
+
+
+def test_listing_expires():
+    directory = ApplicationDirectory(ttl=0)
+    cml = _cml(_application("Agent Studio"))
+    directory.find(cml, "Agent Studio")
+    directory.find(cml, "Agent Studio")
+    assert cml.list_applications.call_count == 2
+
+
+def test_invalidate_drops_listing():
+    directory = ApplicationDirectory()
+    cml = _cml(_application("Agent Studio"))
+    directory.find(cml, "Agent Studio")
+    directory.invalidate()
+    directory.find(cml, "Agent Studio")
+    assert cml.list_applications.call_count == 2
+
+
+def test_missing_application_is_looked_up_again():
+    directory = ApplicationDirectory()
+    cml = _cml(_application("Agent Studio", status="starting"))
+    assert directory.find(cml, "Agent Studio", accept=_is_running) == []
+
+    cml.list_applications.return_value.applications = [_application("Agent Studio")]
+    assert len(directory.find(cml, "Agent Studio", accept=_is_running)) == 1
+    assert cml.list_applications.call_count == 2
+
+
+def test_running_application_lookups_use_the_cached_listing():
+    directory = ApplicationDirectory()
+    cml = _cml(_application("Agent Studio"))
+    with patch("engine.utils.get_application_directory", return_value=directory):
+        assert get_application_by_name(cml, "Agent Studio").status == "running"
+        assert get_application_by_name(cml, "Agent Studio").status == "running"
+        assert cml.list_applications.call_count == 1
+
+        # A cached application that is no longer running is looked up again.
+        directory.invalidate()
+        cml.list_applications.return_value.applications = [_application("Agent Studio", status="stopped")]
+        assert get_application_by_name(cml, "Agent Studio", only_running=False).status == "stopped"
+        cml.list_applications.return_value.applications = [_application("Agent Studio")]
+        assert get_application_by_name(cml, "Agent Studio").status == "running"
+    assert cml.list_applications.call_count == 3
@@ -0,0 +1,69 @@
+import sys
+import threading
+import time
+
+import pytest
+
+from engine.crewai.cancellation import (
+    WorkflowRunCancelledError,
+    cancel_workflow_run,
+    is_workflow_run_cancelled,
+    on_workflow_run_cancelled,
+    raise_if_workflow_run_cancelled,
+    register_workflow_run,
+    unregister_workflow_run,
+)
+from engine.crewai.tool_limits import ToolLimits, run_tool_subprocess
+from engine.crewai.trace_context import set_trace_id
+
+
+@pytest.fixture
+def trace_id():
+    trace_id = f"trace-{time.monotonic_ns()}"
+    register_workflow_run(trace_id)
+    set_trace_id(trace_id)
+    yield trace_id
+    unregister_workflow_run(trace_id)
+
+
+def test_cancel_unknown_run():
+    assert cancel_workflow_run("unknown") is False
+    assert is_workflow_run_cancelled("unknown") is False
+
+
+def test_cancel_run(trace_id):
+    raise_if_workflow_run_cancelled()
+    assert cancel_workflow_run(trace_id) is True
+    assert is_workflow_run_cancelled()
+    with pytest.raises(WorkflowRunCancelledError):
+        raise_if_workflow_run_cancelled()
+
+
+def test_cancel_calls_in_flight_callbacks(trace_id):
+    called = []
+    with on_workflow_run_cancelled(lambda: called.append("in flight")):
+        cancel_workflow_run(trace_id)
+    assert called == ["in flight"]
+
+    with pytest.raises(WorkflowRunCancelledError):
+        with on_workflow_run_cancelled(lambda: called.append("too late")):
+            pass
+    assert called == ["in flight"]
+
+
+def test_finished_callbacks_are_not_called(trace_id):
+    called = []
+    with on_workflow_run_cancelled(lambda: called.append("done")):
+        pass
+    cancel_workflow_run(trace_id)
+    assert called == []
+
+
+def test_cancel_kills_tool_subprocess(trace_id):
+    threading.Timer(0.5, cancel_workflow_run, args=(trace_id,)).start()
+    started = time.monotonic()
+    with pytest.raises(WorkflowRunCancelledError):
+        run_tool_subprocess(
+            [sys.executable, "-c", "import time; time.sleep(60)"], ToolLimits(timeout=30), "tool_id", "Tool"
+        )
+    assert time.monotonic() - started < 10
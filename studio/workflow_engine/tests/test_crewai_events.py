@@ -39,13 +39,9 @@ def test_process_event_type_happy_path():
 
 @patch("engine.crewai.events.get_trace_id")
 @patch("engine.crewai.events.process_event")
-@patch("engine.crewai.events.get_ops_endpoint")
-@patch("engine.crewai.events.requests.post")
-@patch("engine.crewai.events.os.getenv")
-def test_post_event_happy_path(m_getenv, m_post, m_get_ops_endpoint, m_process_event, m_get_trace_id):
+@patch("engine.crewai.events.get_event_shipper")
+def test_post_event_happy_path(m_get_event_shipper, m_process_event, m_get_trace_id):
     m_get_trace_id.return_value = "trace_id"
-    m_get_ops_endpoint.return_value = "ops_endpoint"
-    m_getenv.return_value = "api_key"
     m_process_event.return_value = {"extra": "field"}
     
     class CustomSource(BaseModel):
@@ -65,15 +61,14 @@ def test_post_event_happy_path(m_getenv, m_post, m_get_ops_endpoint, m_process_e
         )
     )
     
-    m_post.assert_called_with(
-        url="ops_endpoint/events",
-        headers={"Authorization": "Bearer api_key"},
-        json={"trace_id": "trace_id", "event": {
+    m_get_event_shipper.return_value.ship.assert_called_with(
+        "trace_id",
+        {
             "agent_studio_id": "agent_studio_id",
             "timestamp": "timestamp",
             "type": "custom_event_type",
             "extra": "field"
-        }}
+        }
     )
 
 
@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock
+
+from engine.crewai.event_shipper import EventShipper
+
+
+def _shipper(status_code=200, **kwargs):
+    shipper = EventShipper(lambda: "ops_endpoint", max_retries=1, **kwargs)
+    shipper._session = MagicMock()
+    shipper._session.post.return_value = MagicMock(status_code=status_code)
+    return shipper
+
+
+def _posted_events(shipper):
+    return [e for call in shipper._session.post.call_args_list for e in call.kwargs["json"]["events"]]
+
+
+def test_ship_and_flush_batches_events():
+    shipper = _shipper(batch_size=2, flush_interval=10)
+    try:
+        for i in range(3):
+            shipper.ship("trace", {"type": "event", "i": i})
+        assert shipper.flush(timeout=5)
+
+        assert [e["event"]["i"] for e in _posted_events(shipper)] == [0, 1, 2]
+        assert shipper._session.post.call_count == 2
+        assert shipper._session.post.call_args.kwargs["url"] == "ops_endpoint/events"
+        assert shipper.stats()["shipped"] == 3
+    finally:
+        shipper.shutdown()
+
+
+def test_partial_batch_is_shipped_after_flush_interval():
+    shipper = _shipper(batch_size=100, flush_interval=0.01)
+    try:
+        shipper.ship("trace", {"type": "event"})
+        assert shipper.flush(timeout=5)
+        assert _posted_events(shipper) == [{"trace_id": "trace", "event": {"type": "event"}}]
+    finally:
+        shipper.shutdown()
+
+
+def test_full_buffer_drops_oldest_events():
+    shipper = _shipper(buffer_size=2, batch_size=100, flush_interval=10)
+    # Keep the background thread from draining the buffer.
+    shipper._ensure_started = MagicMock()
+    for i in range(3):
+        shipper.ship("trace", {"i": i})
+
+    stats = shipper.stats()
+    assert stats["dropped"] == 1
+    assert stats["buffered"] == 2
+    assert [e["event"]["i"] for _, e in shipper._buffer] == [1, 2]
+
+
+def test_failed_batches_are_counted():
+    shipper = _shipper(status_code=500, batch_size=1, flush_interval=0.01)
+    try:
+        shipper.ship("trace", {"type": "event"})
+        assert shipper.flush(timeout=5)
+        stats = shipper.stats()
+        assert stats["failed_batches"] == 1
+        assert stats["dropped"] == 1
+        assert stats["shipped"] == 0
+    finally:
+        shipper.shutdown()
@@ -0,0 +1,80 @@
+import os
+import sys
+from unittest.mock import patch
+
+from engine.crewai import tools
+from engine.types import Input__ToolInstance
+
+
+TOOL_CODE = '''
+from typing import Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool as StudioBaseTool
+
+
+class UserParameters(BaseModel):
+    greeting: str
+
+
+class GreetingTool(StudioBaseTool):
+    class ToolParameters(BaseModel):
+        person: str = Field(description="Who to greet")
+
+    name: str = "Greeting tool"
+    description: str = "Greets someone"
+    args_schema: Type[BaseModel] = ToolParameters
+    user_parameters: UserParameters
+
+    def _run(self, person: str):
+        print("Greeting", person)
+        return {"message": f"{self.user_parameters.greeting}, {person}!"}
+'''
+
+
+def _tool_instance(tmp_path):
+    (tmp_path / "tool.py").write_text(TOOL_CODE)
+    (tmp_path / ".venv" / "bin").mkdir(parents=True)
+    os.symlink(sys.executable, tmp_path / ".venv" / "bin" / "python")
+    return Input__ToolInstance(
+        id="tool_instance",
+        name="Greeter",
+        python_code_file_name="tool.py",
+        python_requirements_file_name="requirements.txt",
+        source_folder_path=str(tmp_path),
+        tool_metadata="{}",
+    )
+
+
+@patch("engine.crewai.tools.is_venv_prepared_for_tool", return_value=True)
+def test_legacy_tool_proxy_is_compiled_once(_, tmp_path):
+    tool_instance = _tool_instance(tmp_path)
+    tools._legacy_tool_proxies.clear()
+
+    with patch("engine.crewai.tools._LegacyToolProxy", wraps=tools._LegacyToolProxy) as m_proxy:
+        tools.get_tool_instance_proxy(tool_instance, {"greeting": "Hi"})
+        tool = tools.get_tool_instance_proxy(tool_instance, {"greeting": "Hello"})
+    assert m_proxy.call_count == 1
+    assert tool.name == "Greeter"
+    assert tool.args_schema.model_fields.keys() == {"person"}
+
+    # Output printed by the tool does not get mixed with the result.
+    assert tool._run(person="Ada") == {"message": "Hello, Ada!"}
+    assert tool._run("Grace") == {"message": "Hello, Grace!"}
+
+
+@patch("engine.crewai.tools.is_venv_prepared_for_tool", return_value=True)
+def test_legacy_tool_proxy_is_compiled_again_after_edits(_, tmp_path):
+    tool_instance = _tool_instance(tmp_path)
+    tools.get_tool_instance_proxy(tool_instance, {"greeting": "Hi"})
+
+    (tmp_path / "tool.py").write_text(TOOL_CODE.replace('"Greets someone"', '"Greets someone politely"'))
+    tool = tools.get_tool_instance_proxy(tool_instance, {"greeting": "Hi"})
+    assert "Greets someone politely" in tool.description
+
+
+@patch("engine.crewai.tools.is_venv_prepared_for_tool", return_value=True)
+def test_legacy_tool_with_future_imports(_, tmp_path):
+    tool_instance = _tool_instance(tmp_path)
+    (tmp_path / "tool.py").write_text('"""Greets people."""\nfrom __future__ import annotations\n' + TOOL_CODE)
+    tool = tools.get_tool_instance_proxy(tool_instance, {"greeting": "Hi"})
+    assert tool._run(person="Ada") == {"message": "Hi, Ada!"}
@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import patch
+
+import engine.ops as ops
+
+
+@pytest.fixture(autouse=True)
+def reset_ops_endpoint(monkeypatch):
+    monkeypatch.delenv("AGENT_STUDIO_OPS_ENDPOINT", raising=False)
+    ops.invalidate_ops_endpoint()
+    yield
+    ops.invalidate_ops_endpoint()
+
+
+@patch("engine.ops._discover_ops_endpoint")
+def test_get_ops_endpoint_env_override(m_discover, monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_OPS_ENDPOINT", "http://ops")
+    assert ops.get_ops_endpoint() == "http://ops"
+    m_discover.assert_not_called()
+
+
+@patch("engine.ops._discover_ops_endpoint")
+def test_get_ops_endpoint_is_cached(m_discover):
+    m_discover.return_value = "https://ops.domain"
+    assert ops.get_ops_endpoint() == "https://ops.domain"
+    assert ops.get_ops_endpoint() == "https://ops.domain"
+    assert m_discover.call_count == 1
+
+
+@patch("engine.ops._discover_ops_endpoint")
+def test_get_ops_endpoint_expires(m_discover, monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_OPS_ENDPOINT_TTL", "0")
+    m_discover.return_value = "https://ops.domain"
+    ops.get_ops_endpoint()
+    ops.get_ops_endpoint()
+    assert m_discover.call_count == 2
+
+
+@patch("engine.ops._discover_ops_endpoint")
+def test_invalidate_ops_endpoint(m_discover):
+    m_discover.side_effect = ["https://old.domain", "https://new.domain"]
+    assert ops.get_ops_endpoint() == "https://old.domain"
+    ops.invalidate_ops_endpoint()
+    assert ops.get_ops_endpoint() == "https://new.domain"
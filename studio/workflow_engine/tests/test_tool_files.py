@@ -0,0 +1,93 @@
+import os
+import traceback
+
+import pytest
+
+from engine.crewai.tool_files import ToolFileCache
+
+
+def _parse(calls):
+    def parse(content):
+        calls.append(content)
+        if "invalid" in content:
+            raise ValueError("Error parsing Python code")
+        return content.upper()
+
+    return parse
+
+
+def test_unchanged_file_is_read_once(tmp_path):
+    cache = ToolFileCache()
+    tool_file = tmp_path / "tool.py"
+    tool_file.write_text("code")
+
+    assert cache.read(str(tool_file)) == "code"
+    assert cache.read(str(tool_file)) == "code"
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_changed_file_is_read_again(tmp_path):
+    cache = ToolFileCache()
+    tool_file = tmp_path / "tool.py"
+    tool_file.write_text("code")
+    assert cache.read(str(tool_file)) == "code"
+
+    tool_file.write_text("new code")
+    assert cache.read(str(tool_file)) == "new code"
+
+    # Same size, only the modification time differs.
+    tool_file.write_text("old code")
+    stat = os.stat(tool_file)
+    os.utime(tool_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cache.read(str(tool_file)) == "old code"
+
+
+def test_metadata_is_parsed_once_per_version(tmp_path):
+    cache = ToolFileCache()
+    calls = []
+    tool_file = tmp_path / "tool.py"
+    tool_file.write_text("code")
+
+    assert cache.get_metadata(str(tool_file), "upper", _parse(calls)) == "CODE"
+    assert cache.get_metadata(str(tool_file), "upper", _parse(calls)) == "CODE"
+    assert calls == ["code"]
+
+    tool_file.write_text("new code")
+    assert cache.get_metadata(str(tool_file), "upper", _parse(calls)) == "NEW CODE"
+    assert calls == ["code", "new code"]
+
+
+def test_parse_errors_are_cached(tmp_path):
+    cache = ToolFileCache()
+    calls = []
+    tool_file = tmp_path / "tool.py"
+    tool_file.write_text("invalid")
+
+    errors = []
+    for _ in range(3):
+        with pytest.raises(ValueError) as e:
+            cache.get_metadata(str(tool_file), "upper", _parse(calls))
+        errors.append(e.value)
+    assert calls == ["invalid"]
+    # Every caller gets an exception of its own, whose traceback does not
+    # grow with the number of times it was raised.
+    assert len({id(error) for error in errors}) == 3
+    assert len(traceback.extract_tb(errors[1].__traceback__)) == len(traceback.extract_tb(errors[2].__traceback__))
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    cache = ToolFileCache(max_size=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_text(name)
+        paths.append(str(tmp_path / name))
+        cache.read(paths[-1])
+
+    assert cache.stats()["entries"] == 2
+    cache.read(paths[0])
+    assert cache.stats()["misses"] == 4
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ToolFileCache().read(str(tmp_path / "missing.py"))
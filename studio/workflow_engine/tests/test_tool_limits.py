@@ -0,0 +1,166 @@
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from crewai.agents.tools_handler import ToolsHandler
+from crewai.tools.tool_calling import ToolCalling
+from crewai.tools.tool_usage import ToolUsage
+from crewai.utilities import I18N
+
+from engine.crewai.tool_limits import (
+    ToolExecutionLimitError,
+    ToolLimits,
+    get_tool_limit_stats,
+    get_tool_limits,
+    run_tool_subprocess,
+)
+from engine.crewai.tools import get_tool_instance_proxy
+from engine.types import Input__ToolInstance
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def test_tool_limits_defaults_and_overrides(monkeypatch, tmp_path):
+    monkeypatch.setenv("AGENT_STUDIO_TOOL_TIMEOUT", "30")
+    monkeypatch.setenv("AGENT_STUDIO_TOOL_MEMORY_LIMIT_MB", "1024")
+    tool_file = tmp_path / "tool.py"
+    tool_file.write_text("TOOL_TIMEOUT = 5\nTOOL_CPU_LIMIT = 2.5\n\ndef run_tool(config, args):\n    TOOL_TIMEOUT = 1\n")
+
+    limits = get_tool_limits(str(tool_file))
+    assert (limits.timeout, limits.memory_limit_mb, limits.cpu_limit) == (5, 1024, 2.5)
+
+    limits = get_tool_limits(code="print('no limits')")
+    assert (limits.timeout, limits.memory_limit_mb, limits.cpu_limit) == (30, 1024, 0)
+
+
+def test_run_tool_subprocess(tmp_path):
+    result = run_tool_subprocess(
+        [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+        ToolLimits(timeout=30),
+        "tool_id",
+        "Tool",
+        input="hello",
+    )
+    assert result.returncode == 0
+    assert result.stdout.strip() == "HELLO"
+
+
+def test_run_tool_subprocess_timeout_kills_process_group(tmp_path):
+    pid_file = tmp_path / "pid"
+    code = (
+        "import subprocess, time\n"
+        "child = subprocess.Popen(['sleep', '60'])\n"
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+        "time.sleep(60)\n"
+    )
+
+    started = time.monotonic()
+    with pytest.raises(ToolExecutionLimitError) as e:
+        run_tool_subprocess([sys.executable, "-c", code], ToolLimits(timeout=1), "slow_tool", "Slow tool")
+    assert e.value.reason == "timeout"
+    assert time.monotonic() - started < 10
+    assert get_tool_limit_stats()["slow_tool"]["timeout"] >= 1
+
+    child_pid = int(pid_file.read_text())
+    deadline = time.monotonic() + 5
+    while _is_running(child_pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _is_running(child_pid)
+
+
+def test_run_tool_subprocess_memory_limit():
+    with pytest.raises(ToolExecutionLimitError) as e:
+        run_tool_subprocess(
+            [sys.executable, "-c", "data = bytearray(1024 * 1024 * 1024)"],
+            ToolLimits(timeout=30, memory_limit_mb=256),
+            "hungry_tool",
+            "Hungry tool",
+        )
+    assert e.value.reason == "memory"
+
+
+def test_run_tool_subprocess_cpu_limit():
+    with pytest.raises(ToolExecutionLimitError) as e:
+        run_tool_subprocess(
+            [sys.executable, "-c", "while True: pass"],
+            ToolLimits(timeout=30, cpu_limit=1),
+            "busy_tool",
+            "Busy tool",
+        )
+    assert e.value.reason == "cpu"
+
+
+SLOW_TOOL_CODE = '''
+import time
+from typing import Type
+from pydantic import BaseModel, Field
+from crewai.tools import BaseTool as StudioBaseTool
+
+TOOL_TIMEOUT = 1
+
+
+class UserParameters(BaseModel):
+    pass
+
+
+class SlowTool(StudioBaseTool):
+    class ToolParameters(BaseModel):
+        person: str = Field(description="Who to wait for")
+
+    name: str = "Slow tool"
+    description: str = "Waits"
+    args_schema: Type[BaseModel] = ToolParameters
+    user_parameters: UserParameters
+
+    def _run(self, person: str):
+        time.sleep(60)
+'''
+
+
+@patch("engine.crewai.tools.is_venv_prepared_for_tool", return_value=True)
+def test_tool_limit_is_not_retried_by_crewai(_, tmp_path, monkeypatch):
+    monkeypatch.setenv("CREWAI_DISABLE_TELEMETRY", "true")
+    monkeypatch.setenv("OTEL_SDK_DISABLED", "true")
+    (tmp_path / "tool.py").write_text(SLOW_TOOL_CODE)
+    (tmp_path / ".venv" / "bin").mkdir(parents=True)
+    os.symlink(sys.executable, tmp_path / ".venv" / "bin" / "python")
+    tool_instance = Input__ToolInstance(
+        id="slow_legacy_tool",
+        name="Slow tool",
+        python_code_file_name="tool.py",
+        python_requirements_file_name="requirements.txt",
+        source_folder_path=str(tmp_path),
+        tool_metadata="{}",
+    )
+    tool = get_tool_instance_proxy(tool_instance, {}).to_structured_tool()
+
+    agent = MagicMock()
+    agent.i18n = I18N()
+    agent.key, agent.role, agent._original_role, agent.verbose = "agent", "Agent", None, False
+    task = MagicMock(delegations=0, used_tools=0)
+    tool_usage = ToolUsage(
+        tools_handler=ToolsHandler(),
+        tools=[tool],
+        original_tools=[tool],
+        tools_description="",
+        tools_names=tool.name,
+        task=task,
+        function_calling_llm=None,
+        agent=agent,
+        action=MagicMock(),
+    )
+
+    started = time.monotonic()
+    result = tool_usage.use(ToolCalling(tool_name=tool.name, arguments={"person": "Ada"}), "")
+    assert "timed out" in result
+    # A single call within its limit, not one per CrewAI retry.
+    assert time.monotonic() - started < 3
+    assert get_tool_limit_stats()["slow_legacy_tool"] == {"timeout": 1}
@@ -0,0 +1,257 @@
+import fcntl
+import os
+import signal
+import sys
+import threading
+import time
+import pytest
+
+from engine.crewai.tool_worker import (
+    ToolWorker,
+    ToolWorkerPool,
+    ToolWorkerLimitError,
+    ToolWorkerUnsupportedError,
+    get_tool_worker_pool,
+    is_cpu_limit_exit,
+    read_message,
+    shutdown_tool_workers,
+    shutdown_tool_workers_in_venv,
+    write_message,
+)
+
+
+TOOL_CODE = """
+import os
+import time
+
+class UserParameters:
+    def __init__(self, prefix=""):
+        self.prefix = prefix
+
+class ToolParameters:
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+def run_tool(config, args):
+    print("this should not break the protocol")
+    if args.a == "crash":
+        os._exit(1)
+    if args.a == "raise":
+        raise ValueError("bad input")
+    if args.a == "sleep":
+        time.sleep(60)
+    if args.a == "nap":
+        time.sleep(args.b)
+        return "rested"
+    if args.a == "spin":
+        while True:
+            pass
+    return f"{config.prefix}{args.a + args.b}:{os.getpid()}"
+
+OUTPUT_KEY = "tool_output"
+"""
+
+
+@pytest.fixture
+def tool_file(tmp_path):
+    path = tmp_path / "tool.py"
+    path.write_text(TOOL_CODE)
+    return str(path)
+
+
+def test_message_round_trip():
+    read_fd, write_fd = os.pipe()
+    try:
+        write_message(write_fd, {"hello": ["world", 1]})
+        assert read_message(read_fd) == {"hello": ["world", 1]}
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_read_message_eof():
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)
+    try:
+        with pytest.raises(EOFError):
+            read_message(read_fd)
+    finally:
+        os.close(read_fd)
+
+
+def test_tool_worker_reuses_process(tool_file):
+    worker = ToolWorker(sys.executable, tool_file, idle_timeout=30, max_calls=10)
+    try:
+        first = worker.call({"prefix": "="}, {"a": 1, "b": 2})
+        second = worker.call({"prefix": "="}, {"a": 3, "b": 4})
+        assert first["ok"] and second["ok"]
+        assert first["output"].startswith("=3:")
+        assert second["output"].startswith("=7:")
+        assert first["output"].split(":")[1] == second["output"].split(":")[1]
+    finally:
+        worker.shutdown()
+
+
+def test_tool_worker_recycles_after_max_calls(tool_file):
+    worker = ToolWorker(sys.executable, tool_file, idle_timeout=30, max_calls=1)
+    try:
+        first = worker.call({}, {"a": 1, "b": 2})
+        second = worker.call({}, {"a": 1, "b": 2})
+        assert first["output"].split(":")[1] != second["output"].split(":")[1]
+    finally:
+        worker.shutdown()
+
+
+def test_tool_worker_reports_tool_exceptions(tool_file):
+    worker = ToolWorker(sys.executable, tool_file, idle_timeout=30, max_calls=10)
+    try:
+        response = worker.call({}, {"a": "raise", "b": ""})
+        assert not response["ok"]
+        assert "bad input" in response["error"]
+    finally:
+        worker.shutdown()
+
+
+def test_tool_worker_restarts_after_crash(tool_file):
+    worker = ToolWorker(sys.executable, tool_file, idle_timeout=30, max_calls=10)
+    try:
+        with pytest.raises(Exception):
+            worker.call({}, {"a": "crash", "b": ""})
+        response = worker.call({}, {"a": 1, "b": 1})
+        assert response["ok"]
+    finally:
+        worker.shutdown()
+
+
+def test_tool_worker_unsupported_tool(tmp_path):
+    path = tmp_path / "tool.py"
+    path.write_text("print('legacy tool')\n")
+    worker = ToolWorker(sys.executable, str(path), idle_timeout=30, max_calls=10)
+    with pytest.raises(ToolWorkerUnsupportedError):
+        worker.call({}, {})
+
+
+def test_tool_worker_restarts_when_tool_code_changes(tool_file):
+    worker = ToolWorker(sys.executable, tool_file, idle_timeout=30, max_calls=10)
+    try:
+        assert worker.call({}, {"a": 1, "b": 2})["output"].startswith("3:")
+        with open(tool_file, "a") as f:
+            f.write("\n\ndef run_tool(config, args):\n    return 'edited'\n")
+        os.utime(tool_file, (os.stat(tool_file).st_atime, os.stat(tool_file).st_mtime + 10))
+        assert worker.call({}, {"a": 1, "b": 2})["output"] == "edited"
+    finally:
+        worker.shutdown()
+
+
+def test_tool_worker_times_out(tool_file):
+    worker = ToolWorker(sys.executable, tool_file, idle_timeout=30, max_calls=10)
+    try:
+        first_pid = worker.call({}, {"a": 1, "b": 1})["output"].split(":")[1]
+        with pytest.raises(ToolWorkerLimitError) as e:
+            worker.call({}, {"a": "sleep", "b": ""}, timeout=0.5)
+        assert e.value.reason == "timeout"
+        assert worker.pid is None
+
+        # The next call gets a fresh worker.
+        response = worker.call({}, {"a": 1, "b": 1}, timeout=30)
+        assert response["ok"]
+        assert response["output"].split(":")[1] != first_pid
+    finally:
+        worker.shutdown()
+
+
+def test_tool_worker_cpu_limit(tool_file):
+    worker = ToolWorker(sys.executable, tool_file, idle_timeout=30, max_calls=10)
+    try:
+        # The limit is per call, not for the lifetime of the worker.
+        for _ in range(2):
+            assert worker.call({}, {"a": 1, "b": 1}, cpu_limit=1)["ok"]
+        with pytest.raises(ToolWorkerLimitError) as e:
+            worker.call({}, {"a": "spin", "b": ""}, timeout=30, cpu_limit=1)
+        assert e.value.reason == "cpu"
+    finally:
+        worker.shutdown()
+
+
+def test_only_sigxcpu_is_a_cpu_limit_exit():
+    assert is_cpu_limit_exit(-signal.SIGXCPU)
+    assert not is_cpu_limit_exit(-signal.SIGKILL)
+    assert not is_cpu_limit_exit(1)
+    assert not is_cpu_limit_exit(None)
+
+
+def test_tool_worker_holds_its_shared_venv(tmp_path, tool_file):
+    shared_venv = tmp_path / "shared_venv"
+    (shared_venv / "bin").mkdir(parents=True)
+    os.symlink(sys.executable, shared_venv / "bin" / "python")
+    os.symlink(shared_venv, tmp_path / ".venv")
+
+    def is_in_use():
+        with open(f"{shared_venv}.inuse", "a") as in_use_lock_file:
+            try:
+                fcntl.flock(in_use_lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return True
+            return False
+
+    pool = get_tool_worker_pool(str(tmp_path / ".venv" / "bin" / "python"), tool_file)
+    try:
+        with pool.checkout() as worker:
+            assert worker.call({}, {"a": 1, "b": 2})["ok"]
+        assert worker.venv_dir == str(shared_venv)
+        assert is_in_use()
+
+        shutdown_tool_workers_in_venv(str(shared_venv))
+        assert worker.pid is None
+        assert not is_in_use()
+    finally:
+        shutdown_tool_workers()
+
+
+def test_tool_worker_pool_serves_concurrent_calls(tool_file):
+    pool = ToolWorkerPool(sys.executable, tool_file, max_workers=2)
+    responses = []
+
+    def call():
+        with pool.checkout() as worker:
+            responses.append(worker.call({}, {"a": "nap", "b": 1}))
+
+    try:
+        started = time.monotonic()
+        threads = [threading.Thread(target=call) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(r["ok"] for r in responses)
+        # Each call got a worker of its own.
+        assert time.monotonic() - started < 1.9
+        assert len({w.pid for w in pool.workers}) == 2
+    finally:
+        pool.shutdown()
+
+
+def test_waiting_for_a_worker_counts_towards_the_timeout(tool_file):
+    pool = ToolWorkerPool(sys.executable, tool_file, max_workers=1)
+    with pool.checkout() as worker:
+        # Start the worker, so that its startup is not part of the wait.
+        assert worker.call({}, {"a": 1, "b": 2})["ok"]
+    busy = threading.Thread(target=lambda: worker.call({}, {"a": "nap", "b": 2}))
+    try:
+        with pool.checkout():
+            busy.start()
+            time.sleep(0.2)
+            started = time.monotonic()
+            # The worker is busy with another call.
+            with pytest.raises(ToolWorkerLimitError) as e:
+                worker.call({}, {"a": 1, "b": 2}, timeout=0.5)
+            assert e.value.reason == "timeout"
+            # All workers of the pool are checked out.
+            with pytest.raises(ToolWorkerLimitError):
+                with pool.checkout(timeout=0.5):
+                    pass
+        assert time.monotonic() - started < 1.5
+    finally:
+        busy.join()
+        pool.shutdown()
@@ -0,0 +1,229 @@
+import fcntl
+import os
+import shutil
+import subprocess
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from engine.crewai.venvs import (
+    build_wheelhouse_for_tool,
+    garbage_collect_shared_venvs,
+    get_requirements_hash,
+    get_venv_backend,
+    get_wheelhouse_key,
+    is_venv_prepared_for_tool,
+    is_wheelhouse_built_for_tool,
+    prepare_virtual_env_for_tool,
+    prepare_virtual_envs_for_tools,
+    release_virtual_env_for_tool,
+)
+
+
+@pytest.fixture(autouse=True)
+def shared_venvs_dir(tmp_path, monkeypatch):
+    shared_venvs_dir = tmp_path / "shared_venvs"
+    monkeypatch.setenv("AGENT_STUDIO_SHARED_VENVS_DIR", str(shared_venvs_dir))
+    return shared_venvs_dir
+
+
+def _fake_venv_create(venv_dir, **kwargs):
+    os.makedirs(os.path.join(venv_dir, "bin"))
+
+
+def _make_tool(path, requirements):
+    path.mkdir()
+    (path / "requirements.txt").write_text(requirements)
+    return str(path)
+
+
+def test_get_venv_backend(monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_VENV_BACKEND", "venv")
+    assert get_venv_backend() == "venv"
+    monkeypatch.delenv("AGENT_STUDIO_VENV_BACKEND")
+    with patch("engine.crewai.venvs.shutil.which", return_value="/usr/bin/uv"):
+        assert get_venv_backend() == "uv"
+    with patch("engine.crewai.venvs.shutil.which", return_value=None):
+        assert get_venv_backend() == "venv"
+
+
+@pytest.mark.parametrize("shared", ["true", "false"])
+def test_is_venv_prepared_for_tool(tmp_path, monkeypatch, shared):
+    monkeypatch.setenv("AGENT_STUDIO_SHARED_VENVS", shared)
+    tool = _make_tool(tmp_path / "tool", "requests\n")
+    assert not is_venv_prepared_for_tool(tool, "requirements.txt")
+
+    os.mkdir(os.path.join(tool, ".venv"))
+    (tmp_path / "tool" / ".requirements_hash.txt").write_text("stale")
+    assert not is_venv_prepared_for_tool(tool, "requirements.txt")
+
+    with patch("engine.crewai.venvs.subprocess.run"), patch(
+        "engine.crewai.venvs.venv.create", side_effect=_fake_venv_create
+    ):
+        result = prepare_virtual_env_for_tool(tool, "requirements.txt", with_="venv")
+    assert result["ok"] and result["installed"]
+    assert is_venv_prepared_for_tool(tool, "requirements.txt")
+
+    # Nothing to install the second time around.
+    with patch("engine.crewai.venvs.subprocess.run") as m_run, patch("engine.crewai.venvs.venv.create"):
+        result = prepare_virtual_env_for_tool(tool, "requirements.txt", with_="venv")
+    assert result["ok"] and not result["installed"]
+    m_run.assert_not_called()
+
+
+@patch("engine.crewai.venvs.venv.create", side_effect=_fake_venv_create)
+@patch("engine.crewai.venvs.subprocess.run")
+def test_tools_with_same_requirements_share_a_venv(m_run, m_create, tmp_path, shared_venvs_dir):
+    tool_a = _make_tool(tmp_path / "tool_a", "requests\n")
+    tool_b = _make_tool(tmp_path / "tool_b", "requests\n")
+
+    result_a = prepare_virtual_env_for_tool(tool_a, "requirements.txt", with_="venv")
+    result_b = prepare_virtual_env_for_tool(tool_b, "requirements.txt", with_="venv")
+
+    assert result_a["installed"] and not result_b["installed"]
+    assert m_create.call_count == 1 and m_run.call_count == 1
+    shared_venv = result_a["shared_venv"]
+    assert result_b["shared_venv"] == shared_venv
+    assert os.path.realpath(os.path.join(tool_a, ".venv")) == os.path.realpath(shared_venv)
+    assert os.path.realpath(os.path.join(tool_b, ".venv")) == os.path.realpath(shared_venv)
+
+    # The shared venv is kept as long as a tool still uses it.
+    release_virtual_env_for_tool(tool_a)
+    assert not os.path.lexists(os.path.join(tool_a, ".venv"))
+    assert os.path.isdir(shared_venv)
+    release_virtual_env_for_tool(tool_b)
+    assert not os.path.exists(shared_venv)
+
+
+@patch("engine.crewai.venvs.venv.create", side_effect=_fake_venv_create)
+@patch("engine.crewai.venvs.subprocess.run")
+def test_changed_requirements_move_the_tool_to_another_venv(m_run, m_create, tmp_path):
+    tool = _make_tool(tmp_path / "tool", "requests\n")
+    old_venv = prepare_virtual_env_for_tool(tool, "requirements.txt", with_="venv")["shared_venv"]
+
+    (tmp_path / "tool" / "requirements.txt").write_text("requests\npandas\n")
+    new_venv = prepare_virtual_env_for_tool(tool, "requirements.txt", with_="venv")["shared_venv"]
+
+    assert new_venv != old_venv
+    assert not os.path.exists(old_venv)
+    assert is_venv_prepared_for_tool(tool, "requirements.txt")
+
+
+@patch("engine.crewai.venvs.venv.create", side_effect=_fake_venv_create)
+@patch("engine.crewai.venvs.subprocess.run")
+def test_garbage_collect_shared_venvs(m_run, m_create, tmp_path):
+    tool_a = _make_tool(tmp_path / "tool_a", "requests\n")
+    tool_b = _make_tool(tmp_path / "tool_b", "pandas\n")
+    venv_a = prepare_virtual_env_for_tool(tool_a, "requirements.txt", with_="venv")["shared_venv"]
+    venv_b = prepare_virtual_env_for_tool(tool_b, "requirements.txt", with_="venv")["shared_venv"]
+
+    # Deleted without releasing its venv, like the tools of a deleted workflow.
+    shutil.rmtree(tool_a)
+
+    assert garbage_collect_shared_venvs() == [venv_a]
+    assert not os.path.exists(venv_a)
+    assert os.path.isdir(venv_b)
+
+
+@patch("engine.crewai.venvs.venv.create", side_effect=_fake_venv_create)
+@patch("engine.crewai.venvs.subprocess.run")
+def test_garbage_collect_keeps_shared_venvs_in_use(m_run, m_create, tmp_path):
+    tool = _make_tool(tmp_path / "tool", "requests\n")
+    shared_venv = prepare_virtual_env_for_tool(tool, "requirements.txt", with_="venv")["shared_venv"]
+    shutil.rmtree(tool)
+
+    # A tool worker of another process still runs from the venv.
+    with open(f"{shared_venv}.inuse", "a") as in_use_lock_file:
+        fcntl.flock(in_use_lock_file, fcntl.LOCK_SH)
+        with patch("engine.crewai.venvs.shutdown_tool_workers_in_venv") as m_shutdown:
+            assert garbage_collect_shared_venvs() == []
+        m_shutdown.assert_called_once_with(shared_venv)
+        assert os.path.isdir(shared_venv)
+
+    assert garbage_collect_shared_venvs() == [shared_venv]
+    assert not os.path.exists(shared_venv)
+
+
+def test_prepare_virtual_envs_for_tools_runs_in_parallel(monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_SHARED_VENVS", "false")
+    running, max_running = [0], [0]
+    lock = threading.Lock()
+
+    def fake_prepare(source_folder_path, requirements_file_name, with_):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return {"source_folder_path": source_folder_path, "ok": True, "installed": True}
+
+    tools = [(f"tool_{i}", "requirements.txt") for i in range(6)]
+    with patch("engine.crewai.venvs._prepare_virtual_env_for_tool_impl", side_effect=fake_prepare):
+        results = prepare_virtual_envs_for_tools(tools, max_workers=3)
+
+    assert [r["source_folder_path"] for r in results] == [t[0] for t in tools]
+    assert all("seconds" in r and "wait_seconds" in r for r in results)
+    assert 1 < max_running[0] <= 3
+
+
+@patch("engine.crewai.venvs.venv.create", side_effect=_fake_venv_create)
+@patch("engine.crewai.venvs.subprocess.run")
+def test_install_from_wheelhouse(m_run, m_create, tmp_path):
+    tool = _make_tool(tmp_path / "tool", "requests\n")
+
+    def fake_pip_wheel(command, **kwargs):
+        os.makedirs(command[command.index("--wheel-dir") + 1])
+        return MagicMock()
+
+    m_run.side_effect = fake_pip_wheel
+    assert build_wheelhouse_for_tool(tool, "requirements.txt")["built"]
+    assert is_wheelhouse_built_for_tool(tool, "requirements.txt")
+
+    m_run.side_effect = None
+    assert prepare_virtual_env_for_tool(tool, "requirements.txt", with_="venv")["ok"]
+    install_command = m_run.call_args.args[0]
+    assert install_command[-3:] == ["--no-index", "--find-links", os.path.join(tool, ".wheelhouse")]
+
+    # Changed requirements are no longer covered by the wheelhouse.
+    (tmp_path / "tool" / "requirements.txt").write_text("pandas\n")
+    assert not is_wheelhouse_built_for_tool(tool, "requirements.txt")
+
+
+@patch("engine.crewai.venvs.venv.create", side_effect=_fake_venv_create)
+@patch("engine.crewai.venvs.subprocess.run")
+def test_failed_offline_install_falls_back_to_index(m_run, m_create, tmp_path):
+    tool = _make_tool(tmp_path / "tool", "requests\n")
+    os.makedirs(os.path.join(tool, ".wheelhouse"))
+    (tmp_path / "tool" / ".wheelhouse" / ".requirements_hash.txt").write_text(
+        get_wheelhouse_key(get_requirements_hash(tool, "requirements.txt"))
+    )
+    m_run.side_effect = [subprocess.CalledProcessError(1, "pip", stderr="no matching distribution"), MagicMock()]
+
+    assert prepare_virtual_env_for_tool(tool, "requirements.txt", with_="venv")["ok"]
+    assert "--no-index" in m_run.call_args_list[0].args[0]
+    assert "--no-index" not in m_run.call_args_list[1].args[0]
+
+
+@patch("engine.crewai.venvs.subprocess.run")
+def test_wheelhouse_for_another_interpreter(m_run, tmp_path, monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_WHEELHOUSE_PLATFORMS", "manylinux_2_17_x86_64")
+    tool = _make_tool(tmp_path / "tool", "requests\n")
+
+    def fake_pip_download(command, **kwargs):
+        os.makedirs(command[command.index("--dest") + 1])
+        return MagicMock()
+
+    m_run.side_effect = fake_pip_download
+    assert build_wheelhouse_for_tool(tool, "requirements.txt", python_version="2.7")["built"]
+    command = m_run.call_args.args[0]
+    assert command[3] == "download"
+    assert "--only-binary=:all:" in command
+    assert command[command.index("--python-version") + 1] == "2.7"
+    assert command[command.index("--platform") + 1] == "manylinux_2_17_x86_64"
+
+    # The wheelhouse is not used by interpreters it was not built for.
+    assert is_wheelhouse_built_for_tool(tool, "requirements.txt", python_version="2.7")
+    assert not is_wheelhouse_built_for_tool(tool, "requirements.txt")
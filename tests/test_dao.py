@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+
+
+def _model(model_id):
+    return db_model.Model(
+        model_id=model_id, model_name=model_id, provider_model="gpt-4o", model_type="OPENAI", is_studio_default=False
+    )
+
+
+def test_file_database_is_tuned(tmp_path):
+    dao = AgentStudioDao(engine_url=f"sqlite+pysqlite:///{tmp_path}/state.db")
+    with dao.get_session() as session:
+        assert session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert session.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert session.execute(text("PRAGMA busy_timeout")).scalar() > 0
+
+
+def test_read_session_refuses_writes(tmp_path):
+    dao = AgentStudioDao(engine_url=f"sqlite+pysqlite:///{tmp_path}/state.db")
+    with dao.get_session() as session:
+        session.add(_model("model_1"))
+
+    with dao.get_read_session() as session:
+        assert session.query(db_model.Model).count() == 1
+        session.add(_model("model_2"))
+        with pytest.raises(OperationalError):
+            session.flush()
+
+
+def test_read_session_does_not_wait_for_writer(tmp_path):
+    dao = AgentStudioDao(engine_url=f"sqlite+pysqlite:///{tmp_path}/state.db")
+    with dao.get_session() as session:
+        session.add(_model("model_1"))
+
+    with dao.get_session() as write_session:
+        write_session.query(db_model.Model).filter_by(model_id="model_1").update({"model_name": "renamed"})
+        write_session.flush()
+        # The uncommitted write is neither visible to nor blocking readers.
+        with dao.get_read_session() as read_session:
+            assert read_session.query(db_model.Model).one().model_name == "model_1"
+
+
+def test_in_memory_read_session_shares_the_database():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:")
+    with dao.get_session() as session:
+        session.add(_model("model_1"))
+    with dao.get_read_session() as session:
+        assert session.query(db_model.Model).count() == 1
@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+
+from studio.workflow.deployed_workflow_status import DeployedWorkflowStatusCache
+
+
+@pytest.fixture
+def make_cache():
+    caches = []
+
+    def make_cache(**kwargs):
+        cache = DeployedWorkflowStatusCache(**kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make_cache
+    for cache in caches:
+        cache.shutdown()
+
+
+def test_uncached_lookups_run_concurrently(make_cache):
+    cache = make_cache(max_workers=3)
+    running, max_running = [0], [0]
+    lock = threading.Lock()
+
+    def fetch(value):
+        def _fetch():
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return value
+
+        return _fetch
+
+    statuses = cache.get_many({f"model_status/{i}": fetch(i) for i in range(6)})
+
+    assert {key: value for key, (value, _) in statuses.items()} == {f"model_status/{i}": i for i in range(6)}
+    assert 1 < max_running[0] <= 3
+
+
+def test_fresh_lookups_are_cached(make_cache):
+    cache = make_cache(ttl=60)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return "deployed"
+
+    cache.get_many({"model_status/model": fetch})
+    value, age = cache.get_many({"model_status/model": fetch})["model_status/model"]
+
+    assert value == "deployed"
+    assert age >= 0
+    assert len(calls) == 1
+
+
+def test_stale_lookups_are_refreshed_in_the_background(make_cache):
+    cache = make_cache(ttl=0, max_age=60)
+    cache.get_many({"model_status/model": lambda: "deploying"})
+
+    release = threading.Event()
+
+    def slow_fetch():
+        release.wait(5)
+        return "deployed"
+
+    # The stale status is returned right away, without waiting for the refresh.
+    value, _ = cache.get_many({"model_status/model": slow_fetch})["model_status/model"]
+    assert value == "deploying"
+
+    release.set()
+    deadline = time.time() + 5
+    while cache._in_flight and time.time() < deadline:
+        time.sleep(0.01)
+    value, _ = cache.get_many({"model_status/model": lambda: "stopped"})["model_status/model"]
+    assert value in ("deployed", "stopped")
+
+
+def test_lookups_older_than_max_age_are_waited_for(make_cache):
+    cache = make_cache(ttl=0, max_age=0)
+    cache.get_many({"applications": lambda: ["old"]})
+    value, age = cache.get_many({"applications": lambda: ["new"]})["applications"]
+    assert value == ["new"]
+    assert age == 0
+
+
+def test_failed_uncached_lookup_raises(make_cache):
+    cache = make_cache()
+
+    def fetch():
+        raise RuntimeError("Failed to list applications")
+
+    with pytest.raises(RuntimeError, match="Failed to list applications"):
+        cache.get_many({"applications": fetch})
+    assert not cache._in_flight
+
+
+def test_lookup_in_flight_during_invalidation_is_dropped(make_cache):
+    cache = make_cache(ttl=60)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(5)
+        return "before deploy"
+
+    thread = threading.Thread(target=cache.get_many, args=({"applications": slow_fetch},))
+    thread.start()
+    started.wait(5)
+    cache.invalidate("applications")
+    release.set()
+    thread.join()
+
+    # The lookup started before the invalidation did not fill the cache.
+    value, age = cache.get_many({"applications": lambda: "after deploy"})["applications"]
+    assert value == "after deploy"
+    assert age == 0.0
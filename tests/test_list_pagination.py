@@ -0,0 +1,122 @@
+import pytest
+
+from studio.api import ListToolInstancesRequest, ListToolTemplatesRequest, ListWorkflowsRequest, ToolTemplate
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.proto.utils import apply_field_mask, decode_page_token
+from studio.tools.tool_instance import list_tool_instances
+from studio.tools.tool_template import list_tool_templates
+from studio.workflow.workflow import list_workflows
+
+
+@pytest.fixture
+def dao():
+    return AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+
+def _add_workflows(dao: AgentStudioDao, num_workflows: int) -> None:
+    with dao.get_session() as session:
+        for i in range(num_workflows):
+            session.add(
+                db_model.Workflow(
+                    id=f"workflow_{i}", name=f"Workflow {i}", description=f"Description {i}", directory=f"workflow_{i}"
+                )
+            )
+
+
+def _add_tool_templates(dao: AgentStudioDao, tmp_path, num_templates: int) -> None:
+    with dao.get_session() as session:
+        for i in range(num_templates):
+            tool_dir = tmp_path / f"tool_{i}"
+            tool_dir.mkdir()
+            (tool_dir / "tool.py").write_text(f"# tool {i}")
+            (tool_dir / "requirements.txt").write_text("requests")
+            session.add(
+                db_model.ToolTemplate(
+                    id=f"tool_{i}",
+                    name=f"Tool {i}",
+                    python_code_file_name="tool.py",
+                    python_requirements_file_name="requirements.txt",
+                    source_folder_path=str(tool_dir),
+                    pre_built=False,
+                    tool_image_path="",
+                    is_venv_tool=True,
+                )
+            )
+
+
+def test_list_workflows_pages(dao):
+    _add_workflows(dao, 5)
+
+    workflow_ids, page_token, pages = [], "", 0
+    while True:
+        res = list_workflows(ListWorkflowsRequest(page_size=2, page_token=page_token), cml=None, dao=dao)
+        workflow_ids += [workflow.workflow_id for workflow in res.workflows]
+        pages += 1
+        page_token = res.next_page_token
+        if not page_token:
+            break
+
+    assert pages == 3
+    assert workflow_ids == [f"workflow_{i}" for i in range(5)]
+
+
+def test_list_workflows_without_page_size_returns_everything(dao):
+    _add_workflows(dao, 5)
+    res = list_workflows(ListWorkflowsRequest(), cml=None, dao=dao)
+    assert len(res.workflows) == 5
+    assert res.next_page_token == ""
+
+
+def test_list_workflows_filters_and_masks(dao):
+    _add_workflows(dao, 3)
+    res = list_workflows(
+        ListWorkflowsRequest(ids=["workflow_0", "workflow_2"], fields=["workflow_id", "name"]), cml=None, dao=dao
+    )
+    assert [(workflow.workflow_id, workflow.name) for workflow in res.workflows] == [
+        ("workflow_0", "Workflow 0"),
+        ("workflow_2", "Workflow 2"),
+    ]
+    assert all(workflow.description == "" for workflow in res.workflows)
+    assert not any(workflow.HasField("crew_ai_workflow_metadata") for workflow in res.workflows)
+
+
+def test_list_tool_templates_without_code(dao, tmp_path):
+    _add_tool_templates(dao, tmp_path, 2)
+
+    res = list_tool_templates(ListToolTemplatesRequest(fields=["id", "name"]), cml=None, dao=dao)
+    assert [(template.id, template.name) for template in res.templates] == [("tool_0", "Tool 0"), ("tool_1", "Tool 1")]
+    assert all(template.python_code == "" and template.python_requirements == "" for template in res.templates)
+
+    res = list_tool_templates(ListToolTemplatesRequest(ids=["tool_1"]), cml=None, dao=dao)
+    assert [template.python_code for template in res.templates] == ["# tool 1"]
+
+
+def test_list_tool_instances_without_code_does_not_read_tool_files(dao):
+    with dao.get_session() as session:
+        session.add(
+            db_model.ToolInstance(
+                id="tool_instance",
+                workflow_id="workflow",
+                name="Tool",
+                python_code_file_name="tool.py",
+                python_requirements_file_name="requirements.txt",
+                source_folder_path="/does/not/exist",
+                tool_image_path="",
+            )
+        )
+
+    res = list_tool_instances(
+        ListToolInstancesRequest(workflow_id="workflow", fields=["id", "name"]), cml=None, dao=dao
+    )
+    assert [tool_instance.name for tool_instance in res.tool_instances] == ["Tool"]
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match="python_source"):
+        apply_field_mask([ToolTemplate()], ToolTemplate, ["id", "python_source"])
+
+
+def test_invalid_page_token():
+    with pytest.raises(ValueError):
+        decode_page_token("not a token")
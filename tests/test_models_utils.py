@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch, PropertyMock
 from studio.models.utils import (
     get_studio_default_model_id,
     get_model_api_key_from_env,
+    get_model_api_keys_from_env,
     update_model_api_key_in_env,
     remove_model_api_key_from_env,
     _encode_value,
@@ -47,6 +48,18 @@ def test_get_model_api_key_from_env(mock_cml_api, mock_getenv):
     api_key = get_model_api_key_from_env("model-id-123", mock_cml)
     assert api_key == test_api_key
 
+@patch('os.getenv', return_value="test_project_id")
+def test_get_model_api_keys_from_env_reads_project_once(mock_getenv):
+    mock_cml = MagicMock()
+    mock_cml.get_project.return_value.environment = json.dumps({
+        _get_env_key("model-1"): _encode_value("key-1"),
+        _get_env_key("model-2"): _encode_value("key-2"),
+    })
+
+    api_keys = get_model_api_keys_from_env(["model-1", "model-2", "model-3"], mock_cml)
+    assert api_keys == {"model-1": "key-1", "model-2": "key-2", "model-3": None}
+    assert mock_cml.get_project.call_count == 1
+
 @patch('os.getenv', return_value=None)
 def test_get_model_api_key_from_env_no_project_id(mock_getenv):
     mock_cml = MagicMock()
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import studio.ops as ops
+from engine.application_directory import ApplicationDirectory
+
+
+@pytest.fixture(autouse=True)
+def reset_ops_endpoint(monkeypatch):
+    monkeypatch.delenv("AGENT_STUDIO_OPS_ENDPOINT", raising=False)
+    monkeypatch.setenv("CDSW_DOMAIN", "domain")
+    ops.invalidate_ops_endpoint()
+    yield
+    ops.invalidate_ops_endpoint()
+
+
+def _ops_application():
+    application = MagicMock()
+    application.name = ops.AGENT_STUDIO_OPS_APPLICATION_NAME
+    application.status = "running"
+    application.subdomain = "ops"
+    return application
+
+
+@patch("studio.ops.cmlapi.default_client")
+def test_get_ops_endpoint_lists_applications_once(m_default_client):
+    cml = m_default_client.return_value
+    cml.list_applications.return_value.applications = [_ops_application()]
+    with patch("studio.cross_cutting.utils.get_application_directory", return_value=ApplicationDirectory()):
+        assert ops.get_ops_endpoint() == "https://ops.domain"
+        assert ops.get_ops_endpoint() == "https://ops.domain"
+    m_default_client.assert_called_once()
+    cml.list_applications.assert_called_once()
+
+
+@patch("studio.ops._discover_ops_endpoint")
+def test_get_ops_endpoint_env_override(m_discover, monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_OPS_ENDPOINT", "http://ops")
+    assert ops.get_ops_endpoint() == "http://ops"
+    m_discover.assert_not_called()
+
+
+@patch("studio.ops._discover_ops_endpoint")
+def test_get_ops_endpoint_is_rediscovered_after_invalidation(m_discover):
+    m_discover.return_value = "https://ops.domain"
+    ops.get_ops_endpoint()
+    ops.invalidate_ops_endpoint()
+    ops.get_ops_endpoint()
+    assert m_discover.call_count == 2
@@ -0,0 +1,145 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from studio.ops_events import TraceEventLog, is_terminal_event
+
+
+def test_read_from_offset():
+    log = TraceEventLog()
+    log.append("trace", [{"i": 0}, {"i": 1}])
+    log.append("trace", [{"i": 2}])
+
+    assert log.read("trace", 0) == ([{"i": 0}, {"i": 1}, {"i": 2}], 3)
+    assert log.read("trace", 2) == ([{"i": 2}], 3)
+    assert log.read("trace", 3) == ([], 3)
+    assert log.read("unknown", 0) == ([], 0)
+
+
+def test_read_waits_for_new_events():
+    log = TraceEventLog()
+    threading.Timer(0.05, log.append, args=("trace", [{"i": 0}])).start()
+
+    start = time.monotonic()
+    events, next_since = log.read("trace", 0, timeout=5)
+    assert events == [{"i": 0}]
+    assert next_since == 1
+    assert time.monotonic() - start < 5
+
+
+def test_read_times_out():
+    log = TraceEventLog()
+    assert log.read("trace", 0, timeout=0.01) == ([], 0)
+
+
+def test_drain_returns_events_once():
+    log = TraceEventLog()
+    log.append("trace", [{"i": 0}])
+    assert log.drain("trace") == [{"i": 0}]
+    assert log.drain("trace") == []
+    log.append("trace", [{"i": 1}])
+    assert log.drain("trace") == [{"i": 1}]
+    # Cursor reads are not affected by draining.
+    assert log.read("trace", 0)[0] == [{"i": 0}, {"i": 1}]
+
+
+def test_is_terminal_event():
+    assert is_terminal_event({"type": "crew_kickoff_completed"})
+    assert is_terminal_event({"type": "crew_kickoff_failed"})
+    assert not is_terminal_event({"type": "llm_call_started"})
+    assert not is_terminal_event(None)
+
+
+def test_max_events_per_trace_drops_oldest():
+    log = TraceEventLog(max_events_per_trace=2)
+    log.append("trace", [{"i": 0}, {"i": 1}, {"i": 2}])
+
+    # Offsets of the kept events do not change.
+    assert log.read("trace", 0) == ([{"i": 1}, {"i": 2}], 3)
+    assert log.read("trace", 2) == ([{"i": 2}], 3)
+    assert log.drain("trace") == [{"i": 1}, {"i": 2}]
+    stats = log.stats()
+    assert stats["overflowed_events"] == 1
+    assert stats["largest_traces"][0]["overflow"] == 1
+
+
+def test_expire_traces():
+    log = TraceEventLog(trace_ttl=0)
+    log.append("trace", [{"i": 0}])
+    time.sleep(0.01)
+
+    assert log.expire_traces() == 1
+    assert log.read("trace", 0) == ([], 0)
+    assert log.stats()["traces"] == 0
+    assert log.stats()["bytes"] == 0
+
+
+def test_max_total_bytes_evicts_least_recently_active_traces():
+    log = TraceEventLog(max_total_bytes=25)
+    log.append("old", [{"i": 0}])
+    log.append("new", [{"i": 1}])
+    log.append("old", [{"i": 2}])
+    log.append("newest", [{"i": 3}])
+
+    stats = log.stats()
+    assert stats["evicted_traces"] == 1
+    assert {t["trace_id"] for t in stats["largest_traces"]} == {"old", "newest"}
+    assert stats["bytes"] <= 25
+
+
+def test_event_log_survives_restart(tmp_path):
+    location = str(tmp_path / "events.db")
+    log = TraceEventLog(location=location, max_events_per_trace=2)
+    log.append("trace", [{"i": 0}, {"i": 1}, {"i": 2}])
+    assert log.drain("trace") == [{"i": 1}, {"i": 2}]
+    log.close()
+
+    log = TraceEventLog(location=location, max_events_per_trace=2)
+    assert log.read("trace", 0) == ([{"i": 1}, {"i": 2}], 3)
+    assert log.drain("trace") == []
+    log.append("trace", [{"i": 3}])
+    assert log.read("trace", 2) == ([{"i": 2}, {"i": 3}], 4)
+    assert log.stats()["largest_traces"][0]["overflow"] == 2
+    log.close()
+
+
+def test_read_limit():
+    log = TraceEventLog()
+    log.append("trace", [{"i": i} for i in range(5)])
+    assert log.read("trace", 1, limit=2) == ([{"i": 1}, {"i": 2}], 3)
+
+
+def test_failed_append_leaves_log_unchanged():
+    log = TraceEventLog()
+    log.append("trace", [{"i": 0}])
+    before = log.stats()
+    # A stray row makes the next append fail on the offset it takes.
+    log._db.execute("INSERT INTO trace_events (trace_id, event_offset, event) VALUES ('trace', 2, '{}')")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        log.append("trace", [{"i": 1}, {"i": 2}])
+    assert log.stats()["events"] == before["events"]
+    assert log.stats()["bytes"] == before["bytes"]
+
+    log._db.execute("DELETE FROM trace_events WHERE trace_id = 'trace' AND event_offset = 2")
+    log.append("trace", [{"i": 1}, {"i": 2}])
+    assert log.read("trace", 0) == ([{"i": 0}, {"i": 1}, {"i": 2}], 3)
+
+
+def test_append_many_commits_once():
+    log = TraceEventLog()
+    statements = []
+    log._db.set_trace_callback(statements.append)
+
+    log.append_many([("a", [{"i": 0}, {"i": 1}]), ("b", [{"i": 0}]), ("a", [{"i": 2}])])
+    assert statements.count("COMMIT") == 1
+    assert log.read("a", 0) == ([{"i": 0}, {"i": 1}, {"i": 2}], 3)
+    assert log.read("b", 0) == ([{"i": 0}], 1)
+
+
+def test_drain_unknown_trace_does_not_create_it():
+    log = TraceEventLog()
+    assert log.drain("unknown") == []
+    assert log.stats()["traces"] == 0
@@ -0,0 +1,204 @@
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from studio.api import AddWorkflowRequest, CrewAIWorkflowMetadata, ListAgentsRequest, ListTasksRequest
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.agents.agent import list_agents
+from studio.task.task import list_tasks
+from studio.workflow.workflow import _validate_agents, _validate_tasks, add_workflow_from_template
+from studio.workflow.workflow_templates import add_workflow_template_from_workflow
+
+
+# Query counts of the RPCs below must not grow with the size of the workflow.
+
+
+@contextmanager
+def count_queries(dao: AgentStudioDao):
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(dao.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(dao.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _create_workflow(dao: AgentStudioDao, num_agents: int) -> None:
+    with dao.get_session() as session:
+        agent_ids, task_ids = [], []
+        for i in range(num_agents):
+            session.add(
+                db_model.Model(
+                    model_id=f"model_{i}",
+                    model_name=f"model_{i}",
+                    provider_model="gpt-4o",
+                    model_type="OPENAI",
+                    is_studio_default=i == 0,
+                )
+            )
+            session.add(
+                db_model.ToolInstance(
+                    id=f"tool_{i}",
+                    workflow_id="workflow",
+                    name=f"tool_{i}",
+                    python_code_file_name="tool.py",
+                    python_requirements_file_name="requirements.txt",
+                    source_folder_path=f"tools/tool_{i}",
+                    tool_image_path="",
+                )
+            )
+            session.add(
+                db_model.Agent(
+                    id=f"agent_{i}",
+                    workflow_id="workflow",
+                    name=f"agent_{i}",
+                    llm_provider_model_id=f"model_{i}",
+                    crew_ai_role="role",
+                    crew_ai_backstory="backstory",
+                    crew_ai_goal="goal",
+                    tool_ids=[f"tool_{i}"],
+                )
+            )
+            session.add(
+                db_model.Task(
+                    id=f"task_{i}",
+                    workflow_id="workflow",
+                    description="description",
+                    expected_output="output",
+                    assigned_agent_id=f"agent_{i}",
+                )
+            )
+            agent_ids.append(f"agent_{i}")
+            task_ids.append(f"task_{i}")
+        session.add(
+            db_model.Workflow(
+                id="workflow",
+                name="workflow",
+                crew_ai_process="sequential",
+                crew_ai_agents=agent_ids,
+                crew_ai_tasks=task_ids,
+                is_conversational=False,
+                directory="workflows/workflow",
+            )
+        )
+
+
+def _create_workflow_template(dao: AgentStudioDao, num_agents: int) -> None:
+    with dao.get_session() as session:
+        agent_template_ids, task_template_ids = [], []
+        for i in range(num_agents):
+            session.add(
+                db_model.ToolTemplate(
+                    id=f"tool_template_{i}",
+                    name=f"tool_template_{i}",
+                    python_code_file_name="tool.py",
+                    python_requirements_file_name="requirements.txt",
+                    source_folder_path=f"tool_templates/tool_template_{i}",
+                    tool_image_path="",
+                )
+            )
+            session.add(
+                db_model.AgentTemplate(
+                    id=f"agent_template_{i}",
+                    name=f"agent_template_{i}",
+                    role="role",
+                    backstory="backstory",
+                    goal="goal",
+                    tool_template_ids=[f"tool_template_{i}"],
+                )
+            )
+            session.add(
+                db_model.TaskTemplate(
+                    id=f"task_template_{i}",
+                    description="description",
+                    expected_output="output",
+                    assigned_agent_template_id=f"agent_template_{i}",
+                )
+            )
+            agent_template_ids.append(f"agent_template_{i}")
+            task_template_ids.append(f"task_template_{i}")
+        session.add(
+            db_model.WorkflowTemplate(
+                id="workflow_template",
+                name="workflow_template",
+                process="sequential",
+                agent_template_ids=agent_template_ids,
+                task_template_ids=task_template_ids,
+            )
+        )
+
+
+def _query_counts(rpc, create=_create_workflow):
+    """
+    Number of SELECTs the RPC runs against a workflow (or whatever ``create``
+    builds) of 1 and of 5 agents.
+    """
+    counts = []
+    for num_agents in (1, 5):
+        dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+        create(dao, num_agents)
+        with count_queries(dao) as queries:
+            rpc(dao, num_agents)
+        counts.append(len([q for q in queries if q.lstrip().upper().startswith("SELECT")]))
+    return counts
+
+
+def test_list_agents_query_count():
+    small, large = _query_counts(lambda dao, n: list_agents(ListAgentsRequest(workflow_id="workflow"), dao=dao))
+    assert small == large
+
+
+def test_list_tasks_query_count():
+    small, large = _query_counts(lambda dao, n: list_tasks(ListTasksRequest(workflow_id="workflow"), None, dao=dao))
+    assert small == large
+
+
+def test_validate_agents_query_count():
+    small, large = _query_counts(
+        lambda dao, n: _validate_agents(CrewAIWorkflowMetadata(agent_id=[f"agent_{i}" for i in range(n)]), None, dao)
+    )
+    assert small == large
+
+
+def test_validate_tasks_query_count():
+    small, large = _query_counts(
+        lambda dao, n: _validate_tasks(
+            CrewAIWorkflowMetadata(task_id=[f"task_{i}" for i in range(n)]), False, None, dao
+        )
+    )
+    assert small == large
+
+
+@patch("studio.workflow.workflow_templates.shutil")
+@patch("studio.workflow.workflow_templates.os.makedirs")
+def test_add_workflow_template_from_workflow_query_count(mock_makedirs, mock_shutil):
+    small, large = _query_counts(lambda dao, n: add_workflow_template_from_workflow("workflow", dao=dao))
+    assert small == large
+
+
+@patch("studio.tools.tool_instance.get_thread_pool")
+@patch("studio.tools.tool_instance.shutil")
+@patch("studio.tools.tool_instance.os.makedirs")
+@patch("studio.workflow.workflow.os.makedirs")
+def test_add_workflow_from_template_query_count(mock_makedirs, mock_tool_makedirs, mock_shutil, mock_thread_pool):
+    small, large = _query_counts(
+        lambda dao, n: add_workflow_from_template(
+            AddWorkflowRequest(workflow_template_id="workflow_template"), None, dao=dao
+        ),
+        create=_create_workflow_template,
+    )
+    assert small == large
+
+
+def test_validate_agents_rejects_unknown_agent():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    _create_workflow(dao, 2)
+    with pytest.raises(ValueError, match="agent_9"):
+        _validate_agents(CrewAIWorkflowMetadata(agent_id=["agent_0", "agent_9"]), None, dao)
@@ -0,0 +1,111 @@
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+
+from studio.workflow.runners import WorkflowRunnerDispatcher
+
+
+def _payload(trace_id, workflow_name="Test Workflow - wf"):
+    return {"workflow_name": workflow_name, "events_trace_id": trace_id}
+
+
+def _status(slots, workflows=()):
+    resp = MagicMock()
+    resp.json.return_value = {
+        "busy": len(workflows) >= slots,
+        "slots": slots,
+        "free_slots": slots - len(workflows),
+        "workflows": [{"trace_id": t} for t in workflows],
+    }
+    return resp
+
+
+def test_submit_returns_zero_when_runner_may_be_free():
+    dispatcher = WorkflowRunnerDispatcher(["http://runner"], max_queue_depth=2)
+    assert dispatcher.submit(_payload("t1")) == 0
+    assert dispatcher.get_queue_position("t1") == 1
+
+
+def test_submit_rejects_when_queue_full():
+    dispatcher = WorkflowRunnerDispatcher(["http://runner"], max_queue_depth=1)
+    dispatcher.submit(_payload("t1"))
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(_payload("t2"))
+
+
+def test_submit_without_runners():
+    dispatcher = WorkflowRunnerDispatcher([])
+    with pytest.raises(RuntimeError):
+        dispatcher.submit(_payload("t1"))
+
+
+@patch("studio.workflow.runners.requests")
+def test_dispatch_leases_and_releases_slots(m_requests):
+    m_requests.get.return_value = _status(1)
+    m_requests.post.return_value = MagicMock(status_code=200)
+    dispatcher = WorkflowRunnerDispatcher(["http://runner"], callback_url="http://callback")
+
+    assert dispatcher._try_dispatch(_payload("t1"))
+    assert dispatcher.status()["runners"]["http://runner"] == {"slots": 1, "leases": 1}
+    _, kwargs = m_requests.post.call_args
+    assert kwargs["json"]["callback_url"] == "http://callback"
+
+    # The runner is full, so the next kickoff waits without calling the runner.
+    assert dispatcher.submit(_payload("t2")) == 1
+    assert not dispatcher._try_dispatch(_payload("t2"))
+    assert m_requests.post.call_count == 1
+    assert m_requests.get.call_count == 1
+
+    dispatcher.release("t1")
+    assert dispatcher._try_dispatch(_payload("t2"))
+
+
+@patch("studio.workflow.runners.requests")
+def test_dispatch_reconciles_when_runner_rejects(m_requests):
+    m_requests.get.side_effect = [_status(2), _status(2, ["other1", "other2"])]
+    m_requests.post.return_value = MagicMock(status_code=409)
+    dispatcher = WorkflowRunnerDispatcher(["http://runner"])
+
+    assert not dispatcher._try_dispatch(_payload("t1"))
+    assert dispatcher.status()["runners"]["http://runner"] == {"slots": 2, "leases": 2}
+
+
+@patch("studio.workflow.runners.requests")
+def test_queued_kickoff_of_another_workflow_does_not_block_the_queue(m_requests):
+    m_requests.get.return_value = _status(2)
+    m_requests.post.return_value = MagicMock(status_code=200)
+    dispatcher = WorkflowRunnerDispatcher(["http://runner"])
+    assert dispatcher._try_dispatch(_payload("a1", "A"))
+
+    # The runner only runs workflow A until a1 finishes.
+    dispatcher.submit(_payload("b1", "B"))
+    dispatcher.submit(_payload("b2", "B"))
+    dispatcher.submit(_payload("a2", "A"))
+    assert dispatcher._dispatch_queued()
+    assert not dispatcher._dispatch_queued()
+    assert [kwargs["json"]["events_trace_id"] for _, kwargs in m_requests.post.call_args_list] == ["a1", "a2"]
+    assert dispatcher.get_queue_position("b1") == 1
+    assert dispatcher.get_queue_position("b2") == 2
+
+    dispatcher.release("a1")
+    dispatcher.release("a2")
+    assert dispatcher._dispatch_queued()
+    assert m_requests.post.call_args[1]["json"]["events_trace_id"] == "b1"
+
+
+def test_queued_kickoff_times_out():
+    on_kickoff_failed = MagicMock()
+    dispatcher = WorkflowRunnerDispatcher(["http://runner"], queue_timeout=0, on_kickoff_failed=on_kickoff_failed)
+    dispatcher._try_dispatch = MagicMock(return_value=False)
+    dispatcher.submit(_payload("t1"))
+    dispatcher.start()
+    try:
+        for _ in range(100):
+            if on_kickoff_failed.called:
+                break
+            time.sleep(0.01)
+    finally:
+        dispatcher.stop()
+    on_kickoff_failed.assert_called_once()
+    assert on_kickoff_failed.call_args[0][0]["events_trace_id"] == "t1"
+    assert dispatcher.get_queue_position("t1") == 0
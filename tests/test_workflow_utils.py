@@ -0,0 +1,90 @@
+import pytest
+
+import engine.types as input_types
+
+from studio.workflow.utils import (
+    cache_collated_input,
+    get_cached_collated_input,
+    get_collated_input_cache_generation,
+    invalidate_collated_input,
+    invalidate_collated_input_on_commit,
+)
+from studio.db.dao import AgentStudioDao
+
+
+def _collated_input(workflow_id):
+    return input_types.CollatedInput(
+        default_language_model_id="lm",
+        language_models=[],
+        tool_instances=[],
+        agents=[],
+        tasks=[],
+        workflow=input_types.Input__Workflow(
+            id=workflow_id,
+            name="wf",
+            description="",
+            deployment_id="",
+            crew_ai_process="sequential",
+            agent_ids=[],
+            task_ids=[],
+            is_conversational=False,
+        ),
+    )
+
+
+def test_cached_collated_input_is_a_copy():
+    invalidate_collated_input()
+    cache_collated_input("wf", _collated_input("wf"), get_collated_input_cache_generation())
+
+    collated_input = get_cached_collated_input("wf")
+    collated_input.workflow.deployment_id = "changed"
+    assert get_cached_collated_input("wf").workflow.deployment_id == ""
+
+
+def test_invalidate_collated_input():
+    invalidate_collated_input()
+    generation = get_collated_input_cache_generation()
+    cache_collated_input("wf_1", _collated_input("wf_1"), generation)
+    cache_collated_input("wf_2", _collated_input("wf_2"), generation)
+
+    invalidate_collated_input("wf_1")
+    assert get_cached_collated_input("wf_1") is None
+    assert get_cached_collated_input("wf_2") is not None
+
+    invalidate_collated_input()
+    assert get_cached_collated_input("wf_2") is None
+
+
+def test_collated_input_built_before_invalidation_is_not_cached():
+    invalidate_collated_input()
+    generation = get_collated_input_cache_generation()
+    invalidate_collated_input("wf")
+    cache_collated_input("wf", _collated_input("wf"), generation)
+    assert get_cached_collated_input("wf") is None
+
+
+def test_invalidate_collated_input_on_commit():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    invalidate_collated_input()
+    cache_collated_input("wf", _collated_input("wf"), get_collated_input_cache_generation())
+
+    with dao.get_session() as session:
+        invalidate_collated_input_on_commit(session, "wf")
+        # A collated input built before the commit reads the old rows.
+        generation = get_collated_input_cache_generation()
+        assert get_cached_collated_input("wf") is not None
+    assert get_cached_collated_input("wf") is None
+    cache_collated_input("wf", _collated_input("wf"), generation)
+    assert get_cached_collated_input("wf") is None
+
+
+def test_collated_input_is_not_invalidated_on_rollback():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    invalidate_collated_input()
+    cache_collated_input("wf", _collated_input("wf"), get_collated_input_cache_generation())
+
+    with pytest.raises(ValueError):
+        with dao.get_session() as session:
+            invalidate_collated_input_on_commit(session, "wf")
+            raise ValueError("failed change")
+    assert get_cached_collated_input("wf") is not None